@@ -253,14 +253,18 @@ async def main() -> int:
             print('Nothing to do')
             return 0
 
-        # act on all emails concurrently
-        results = await asyncio.gather(*[work_on_one_email(api, e)
-                                         for e in emails],
-                                       return_exceptions=True)
-    err = next((r for r in results if isinstance(r, Exception)), None)
+        # act on all emails concurrently; the number of concurrent tasks is bounded by the concurrency limit of the
+        # session
+        rc = 0
+        err = None
+        async for result in api.bulk.map(lambda e: work_on_one_email(api, e), emails, ordered=False):
+            if result.ok:
+                rc = max(rc, result.result)
+            else:
+                err = err or result.exception
     if err:
         raise err
-    return max(results)
+    return rc
 
 
 if __name__ == '__main__':
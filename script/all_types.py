@@ -72,6 +72,22 @@ def main():
                'wxc_sdk.api_child',
                'wxc_sdk.integration',
                'wxc_sdk.rest',
+               'wxc_sdk.pagination',
+               'wxc_sdk.throttle',
+               'wxc_sdk.cache',
+               'wxc_sdk.directory',
+               'wxc_sdk.single_flight',
+               'wxc_sdk.metrics',
+               'wxc_sdk.json_codec',
+               'wxc_sdk.http2',
+               'wxc_sdk.sync_facade',
+               'wxc_sdk.inventory',
+               'wxc_sdk.settings_reader',
+               'wxc_sdk.settings_reconciler',
+               'wxc_sdk.number_index',
+               'wxc_sdk.job_pipeline',
+               'wxc_sdk.cdr_export',
+               'wxc_sdk.report_pipeline',
                'wxc_sdk.as_rest',
                'wxc_sdk.as_api',
                'wxc_sdk.all_types',
@@ -41,18 +41,26 @@ AS_API_SOURCE = 'as_api.py'
 
 # preamble for autogenerated async API
 PREAMBLE = """# auto-generated. DO NOT EDIT
+import asyncio
 import builtins
+import csv
+import io
+import itertools
 import json
 import logging
 import mimetypes
 import os
+import tempfile
+import time
 import urllib.parse
-from collections.abc import AsyncGenerator
+import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Iterable, Iterator, Sized
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from enum import Enum
 from io import BufferedReader
-from typing import Any, Union, Optional, Literal, Self
+from typing import IO, Any, Union, Optional, Literal, Self
 
 import pytz
 from dateutil import tz
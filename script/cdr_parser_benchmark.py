@@ -0,0 +1,103 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11,<3.14"
+# dependencies = [
+#     "aenum",
+#     "aiohttp",
+#     "pydantic",
+#     "python-dateutil",
+#     "pytz",
+#     "PyYAML",
+#     "requests",
+#     "requests-toolbelt"
+# ]
+# ///
+
+"""
+Benchmark parsing of CDRs
+
+Parses synthetic CDRs with all fields populated (as in a CDR feed response or a Calling Detailed Call History report)
+and prints records per second. No requests are sent.
+"""
+
+# we need to add the parent dir into sys.path so that the import of wxc_sdk can be resolved locally
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, parent_dir)
+
+import time
+import typing
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from wxc_sdk.cdr import CDR
+from wxc_sdk.reports import CallingCDR
+
+
+def cdr_value(annotation: Any, i: int) -> str:
+    """
+    String value for a CDR field as found in the API response
+    """
+    types = [t for t in typing.get_args(annotation) or (annotation,) if t is not type(None)]
+    first = types[0]
+    if first is datetime:
+        return f'2024-05-01T10:{i % 60:02}:{i % 59:02}.123Z'
+    if first is bool:
+        return 'true' if i % 2 else 'false'
+    if first is int:
+        return str(i % 1000)
+    if isinstance(first, type) and issubclass(first, Enum):
+        return list(first)[i % len(first)].value
+    # some string fields are empty
+    return '' if i % 5 == 0 else f'value {i}'
+
+
+def record(i: int) -> dict[str, str]:
+    """
+    CDR with the field names used by the API: space separated words like "Start time"
+    """
+    r = {}
+    for name, field in CDR.model_fields.items():
+        key = field.alias if field.alias and ' ' in field.alias else name.replace('_', ' ').capitalize()
+        r[key] = cdr_value(field.annotation, i)
+    return r
+
+
+def run(records: list[dict[str, str]], parse: Callable[[list[dict[str, str]]], Iterable[CDR]]) -> float:
+    """
+    Parse all records; return CPU time in seconds
+    """
+    start = time.process_time()
+    for _ in parse(records):
+        pass
+    return time.process_time() - start
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=50000, help='number of records (default: %(default)s)')
+    args = parser.parse_args()
+
+    records = [record(i) for i in range(args.records)]
+    cases: list[tuple[str, Callable[[list[dict[str, str]]], Iterable[CDR]]]] = [
+        ('CDR.model_validate', lambda rs: (CDR.model_validate(r) for r in rs)),
+        ('CallingCDR.from_dicts', CallingCDR.from_dicts),
+    ]
+    if hasattr(CDR, 'parse_records'):
+        cases.append(('CDR.parse_records', CDR.parse_records))
+    print(f'{len(records[0])} fields per record')
+    print(f'{"parser":<22} {"CPU [s]":>8} {"records/s":>10} {"relative":>9}')
+    baseline = None
+    for name, parse in cases:
+        cpu = run(records, parse)
+        baseline = baseline or cpu
+        print(f'{name:<22} {cpu:8.3f} {len(records) / cpu:10.0f} {cpu / baseline:9.2f}')
+
+
+if __name__ == '__main__':
+    main()
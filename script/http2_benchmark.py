@@ -0,0 +1,170 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11,<3.14"
+# dependencies = [
+#     "aenum",
+#     "aiohttp",
+#     "pydantic",
+#     "python-dateutil",
+#     "pytz",
+#     "PyYAML",
+#     "requests",
+#     "requests-toolbelt",
+#     "httpx[http2]",
+#     "hypercorn",
+#     "trustme",
+# ]
+# ///
+
+"""
+Benchmark the default HTTP/1.1 transport of RestSession against the HTTP/2 transport
+
+Starts a local HTTPS server supporting HTTP/1.1 and HTTP/2 which answers each request after a fixed latency. For each
+transport and concurrency level a number of GET requests is sent from a thread pool with as many threads as the
+session allows concurrent requests. Reports wall clock time, requests per second, and the number of TCP connections
+the server saw.
+"""
+
+# we need to add the parent dir into sys.path so that the import of wxc_sdk can be resolved locally
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, parent_dir)
+
+import asyncio
+import json
+import logging
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Thread
+
+import trustme
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+
+BODY = json.dumps({'items': [{'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:04d}', 'displayName': f'User {i}'}
+                             for i in range(20)]}).encode()  # fmt: skip
+
+
+class Server:
+    """
+    Local HTTPS server; HTTP/1.1 and HTTP/2 via ALPN
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections: set[tuple[str, int]] = set()
+        self.versions: Counter[str] = Counter()
+        self.port = 0
+
+    def reset(self):
+        self.connections.clear()
+        self.versions.clear()
+
+    async def app(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        self.connections.add(tuple(scope['client']))
+        self.versions[scope['http_version']] += 1
+        await asyncio.sleep(self.latency)
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': BODY})
+
+    @contextmanager
+    def run(self, cert_file: str, key_file: str):
+        config = Config()
+        config.bind = ['127.0.0.1:0']
+        config.certfile = cert_file
+        config.keyfile = key_file
+        config.loglevel = 'WARNING'
+        # don't close connections after 1000 requests: when doing so hypercorn closes the TLS connection while
+        # requests are in flight
+        config.keep_alive_max_requests = 1_000_000
+        loop = asyncio.new_event_loop()
+        stop = asyncio.Event()
+
+        async def main():
+            # serve() binds the socket; get the port from the config's bound sockets
+            sockets = config.create_sockets()
+            self.port = sockets.secure_sockets[0].getsockname()[1]
+            for s in sockets.secure_sockets:
+                s.close()
+            config.bind = [f'127.0.0.1:{self.port}']
+            await serve(self.app, config, shutdown_trigger=stop.wait)
+
+        thread = Thread(target=loop.run_until_complete, args=(main(),), daemon=True)
+        thread.start()
+        while not self.port:
+            time.sleep(0.01)
+        # wait for the server to accept connections
+        time.sleep(0.5)
+        try:
+            yield self
+        finally:
+            loop.call_soon_threadsafe(stop.set)
+            thread.join(timeout=5)
+
+
+def run(server: Server, ca_file: str, http2: bool, concurrency: int, requests: int) -> tuple[float, int, str]:
+    server.reset()
+    url = f'https://localhost:{server.port}/v1/people'
+    with RestSession(
+        tokens=Tokens(access_token='token'), concurrent_requests=concurrency, verify=ca_file, http2=http2
+    ) as session:
+        # REQUESTS_CA_BUNDLE would take precedence over the session's verify setting
+        session.trust_env = False
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda _: session.rest_get(url=url), range(requests)))
+        elapsed = time.perf_counter() - start
+    versions = ', '.join(f'HTTP/{v}' for v in sorted(server.versions))
+    return elapsed, len(server.connections), versions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000, help='number of requests per run (default: %(default)s)')
+    parser.add_argument('--latency', type=float, default=0.05, help='server latency in s (default: %(default)s)')
+    parser.add_argument(
+        '--concurrency', type=int, nargs='+', default=[10, 50, 100], help='concurrency levels (default: %(default)s)'
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    ca = trustme.CA()
+    cert = ca.issue_cert('localhost')
+    server = Server(latency=args.latency)
+    with (
+        ca.cert_pem.tempfile() as ca_file,
+        cert.cert_chain_pems[0].tempfile() as cert_file,
+        cert.private_key_pem.tempfile() as key_file,
+        server.run(cert_file=cert_file, key_file=key_file),
+    ):
+        print(f'{args.requests} requests, server latency {args.latency * 1000:.0f} ms')
+        print(f'{"transport":<10} {"concurrency":>11} {"time [s]":>9} {"req/s":>8} {"connections":>11}  protocol')
+        for concurrency in args.concurrency:
+            for http2 in (False, True):
+                elapsed, connections, versions = run(
+                    server, ca_file=ca_file, http2=http2, concurrency=concurrency, requests=args.requests
+                )
+                print(
+                    f'{"http2" if http2 else "requests":<10} {concurrency:>11} {elapsed:9.2f} '
+                    f'{args.requests / elapsed:8.0f} {connections:>11}  {versions}'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11,<3.14"
+# dependencies = [
+#     "aenum",
+#     "aiohttp",
+#     "pydantic",
+#     "python-dateutil",
+#     "pytz",
+#     "PyYAML",
+#     "requests",
+#     "requests-toolbelt"
+# ]
+# ///
+
+"""
+Benchmark CPU cost of item modes for list requests
+
+Converts synthetic list responses with each item mode and reads two attributes of each item. No requests are sent.
+"""
+
+# we need to add the parent dir into sys.path so that the import of wxc_sdk can be resolved locally
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, parent_dir)
+
+import time
+from argparse import ArgumentParser
+from collections.abc import Callable
+from typing import Any
+
+from wxc_sdk.pagination import ItemMode, item_converter
+from wxc_sdk.people import Person
+from wxc_sdk.telephony import NumberListPhoneNumber
+
+
+def person(i: int) -> dict[str, Any]:
+    return {
+        'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS9{i:016d}',
+        'emails': [f'user{i}@example.com'],
+        'phoneNumbers': [{'type': 'work', 'value': f'+1408555{i % 10000:04d}', 'primary': True}],
+        'extension': f'{i % 10000:04d}',
+        'locationId': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzE',
+        'displayName': f'User {i}',
+        'firstName': 'User',
+        'lastName': f'{i}',
+        'orgId': 'Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi8x',
+        'roles': [],
+        'licenses': ['Y2lzY29zcGFyazovL3VzL0xJQ0VOU0UvMQ', 'Y2lzY29zcGFyazovL3VzL0xJQ0VOU0UvMg'],
+        'created': '2024-01-02T03:04:05.000Z',
+        'lastModified': '2024-02-03T04:05:06.000Z',
+        'status': 'active',
+        'type': 'person',
+    }
+
+
+def number(i: int) -> dict[str, Any]:
+    return {
+        'phoneNumber': f'+1408555{i % 10000:04d}',
+        'extension': f'{i % 10000:04d}',
+        'state': 'ACTIVE',
+        'phoneNumberType': 'PRIMARY',
+        'mainNumber': False,
+        'includedTelephonyTypes': 'PSTN_NUMBER',
+        'tollFreeNumber': False,
+        'isServiceNumber': False,
+        'location': {'id': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzE', 'name': 'HQ'},
+        'owner': {'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS9{i:016d}', 'type': 'PEOPLE', 'firstName': 'User'},
+    }
+
+
+def run(items: list[dict[str, Any]], convert: Callable[[Any], Any], read: Callable[[Any], Any]) -> float:
+    """
+    Convert all items and read two attributes of each item; return CPU time in seconds
+    """
+    start = time.process_time()
+    for item in items:
+        read(convert(item))
+    return time.process_time() - start
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=100000, help='number of items per model (default: %(default)s)')
+    args = parser.parse_args()
+
+    cases = [
+        (Person, person, lambda p: (p.display_name, p.emails), lambda p: (p['displayName'], p['emails'])),
+        (
+            NumberListPhoneNumber,
+            number,
+            lambda n: (n.phone_number, n.location),
+            lambda n: (n['phoneNumber'], n['location']),
+        ),
+    ]
+    print(f'{"model":<22} {"mode":<10} {"CPU [s]":>8} {"µs/item":>8} {"relative":>9}')
+    for model, factory, read_attr, read_key in cases:
+        items = [factory(i) for i in range(args.items)]
+        baseline = None
+        for mode in ItemMode:
+            read = read_key if mode == ItemMode.raw else read_attr
+            cpu = run(items, item_converter(model, mode), read)
+            baseline = baseline or cpu
+            print(
+                f'{model.__name__:<22} {mode.value:<10} {cpu:8.3f} {cpu / len(items) * 1e6:8.2f} {cpu / baseline:9.2f}'
+            )
+        # lazy w/o attribute access: for example if only a few items are ever looked at
+        cpu = run(items, item_converter(model, ItemMode.lazy), lambda _: None)
+        print(f'{model.__name__:<22} {"lazy*":<10} {cpu:8.3f} {cpu / len(items) * 1e6:8.2f} {cpu / baseline:9.2f}')
+    print('lazy*: items not accessed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11,<3.14"
+# dependencies = [
+#     "aenum",
+#     "aiohttp",
+#     "pydantic",
+#     "python-dateutil",
+#     "pytz",
+#     "PyYAML",
+#     "requests",
+#     "requests-toolbelt",
+# ]
+# ///
+
+"""
+Benchmark thread based fan-out with WebexSimpleApi (RestSession) against SyncWebexSimpleApi, the sync facade over the
+async API
+
+Starts a local HTTP server which answers each person details request after a fixed latency. For each concurrency level
+the details of a number of people are read:
+
+* threads: WebexSimpleApi with a thread pool with as many threads as the session allows concurrent requests
+* facade: SyncWebexSimpleApi; api.people.details.batch() runs all calls on the event loop of the facade
+
+Reports wall clock time, requests per second, CPU time, and the number of threads in the process.
+"""
+
+# we need to add the parent dir into sys.path so that the import of wxc_sdk can be resolved locally
+import os
+import sys
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, parent_dir)
+
+import asyncio
+import logging
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Thread
+
+from aiohttp import web
+
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.sync_facade import SyncWebexSimpleApi
+
+
+class Server:
+    """
+    Local HTTP server answering person details requests
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.port = 0
+
+    async def person(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.latency)
+        person_id = request.match_info['person_id']
+        return web.json_response(
+            {'id': person_id, 'emails': [f'{person_id}@example.com'], 'displayName': f'User {person_id}'}
+        )
+
+    @contextmanager
+    def run(self):
+        loop = asyncio.new_event_loop()
+        thread = Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        app = web.Application()
+        app.router.add_get('/v1/people/{person_id}', self.person)
+        runner = web.AppRunner(app, access_log=None)
+
+        async def start():
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0, backlog=1024)
+            await site.start()
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        asyncio.run_coroutine_threadsafe(start(), loop).result()
+        try:
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+
+class ThreadCounter:
+    """
+    Sample the number of threads in the process
+    """
+
+    def __init__(self):
+        self.max_threads = 0
+        self._stop = threading.Event()
+        self._thread = Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(0.01):
+            self.max_threads = max(self.max_threads, threading.active_count() - 1)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_threads(base: str, concurrency: int, person_ids: list[str]) -> None:
+    with WebexSimpleApi(tokens='token', concurrent_requests=concurrency) as api:
+        api.session.BASE = base
+        # ignore proxy settings from the environment
+        api.session.trust_env = False
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            people = list(pool.map(lambda person_id: api.people.details(person_id=person_id), person_ids))
+    assert len(people) == len(person_ids)
+
+
+def run_facade(base: str, concurrency: int, person_ids: list[str]) -> None:
+    with SyncWebexSimpleApi(tokens='token', concurrent_requests=concurrency) as api:
+        api.async_api.session.BASE = base
+        people = api.people.details.batch(person_ids)
+    assert len(people) == len(person_ids)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000, help='number of requests per run (default: %(default)s)')
+    parser.add_argument('--latency', type=float, default=0.05, help='server latency in s (default: %(default)s)')
+    parser.add_argument(
+        '--concurrency', type=int, nargs='+', default=[10, 50, 100], help='concurrency levels (default: %(default)s)'
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    server = Server(latency=args.latency)
+    person_ids = [f'p{i}' for i in range(args.requests)]
+    with server.run():
+        base = f'http://127.0.0.1:{server.port}/v1'
+        print(f'{args.requests} requests, server latency {args.latency * 1000:.0f} ms')
+        print(f'{"mode":<8} {"concurrency":>11} {"time [s]":>9} {"req/s":>8} {"cpu [s]":>8} {"threads":>8}')
+        for concurrency in args.concurrency:
+            for name, run in (('threads', run_threads), ('facade', run_facade)):
+                with ThreadCounter() as counter:
+                    start = time.perf_counter()
+                    cpu_start = time.process_time()
+                    run(base=base, concurrency=concurrency, person_ids=person_ids)
+                    elapsed = time.perf_counter() - start
+                    cpu = time.process_time() - cpu_start
+                print(
+                    f'{name:<8} {concurrency:>11} {elapsed:9.2f} {args.requests / elapsed:8.0f} {cpu:8.2f} '
+                    f'{counter.max_threads:>8}'
+                )
+
+
+if __name__ == '__main__':
+    main()
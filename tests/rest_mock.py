@@ -0,0 +1,62 @@
+"""
+Offline mock transport for REST session tests
+"""
+
+import json
+import time
+from collections.abc import Callable
+from threading import Lock
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+
+__all__ = ['MockAdapter', 'mock_session']
+
+#: a handler is called with the prepared request and returns status code, headers, and body; bodies other than bytes
+#: are JSON encoded
+MockHandler = Callable[[PreparedRequest], tuple[int, dict, dict | bytes]]
+
+
+class MockAdapter(BaseAdapter):
+    """
+    Transport adapter returning canned responses; the handler is called with the prepared request and returns status
+    code, headers, and body
+    """
+
+    def __init__(self, handler: MockHandler):
+        super().__init__()
+        self.handler = handler
+        self.requests: list[tuple[float, PreparedRequest]] = []
+        self.lock = Lock()
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        with self.lock:
+            self.requests.append((time.monotonic(), request))
+        status, headers, body = self.handler(request)
+        response = Response()
+        response.status_code = status
+        if isinstance(body, bytes):
+            # raw body
+            response.headers.update({'Content-Type': 'application/octet-stream', **headers})
+            response._content = body
+        else:
+            response.headers.update({'Content-Type': 'application/json', **headers})
+            response._content = json.dumps(body).encode()
+        # iter_content() reads from the content
+        response._content_consumed = True
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def mock_session(handler: MockHandler, concurrent_requests: int = 1, **kwargs) -> tuple[RestSession, MockAdapter]:
+    session = RestSession(tokens=Tokens(access_token='token'), concurrent_requests=concurrent_requests, **kwargs)
+    adapter = MockAdapter(handler)
+    session.mount('https://', adapter)
+    return session, adapter
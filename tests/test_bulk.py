@@ -0,0 +1,255 @@
+"""
+Offline tests for the bulk executor
+"""
+
+import asyncio
+import time
+from threading import Event, Lock
+from unittest import TestCase
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.as_api import AsBulkExecutor
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.bulk import BulkExecutor, BulkProgress
+from wxc_sdk.rest import RestError
+from wxc_sdk.tokens import Tokens
+
+
+def ok_handler(request: PreparedRequest):
+    return 200, {}, {'id': request.url.split('/')[-1]}
+
+
+class TestBulkExecutor(TestCase):
+    def test_001_ordered_with_errors(self):
+        session, _ = mock_session(ok_handler, concurrent_requests=4)
+        bulk = BulkExecutor(session=session)
+        self.assertEqual(4, bulk.max_workers)
+
+        def get(i: int):
+            if i % 3 == 0:
+                raise ValueError(i)
+            # later items complete earlier
+            time.sleep(0.01 * (10 - i))
+            return session.rest_get(url=session.ep(f'people/{i}'))['id']
+
+        progress: list[tuple[int, int, int]] = []
+
+        def on_progress(p: BulkProgress):
+            progress.append((p.done, p.failed, p.total))
+
+        results = list(bulk.map(get, range(10), progress=on_progress))
+        self.assertEqual(list(range(10)), [r.index for r in results])
+        self.assertEqual([i % 3 != 0 for i in range(10)], [r.ok for r in results])
+        self.assertEqual([str(i) for i in range(10) if i % 3], [r.result for r in results if r.ok])
+        self.assertIsInstance(results[3].exception, ValueError)
+        self.assertEqual((10, 4, 10), progress[-1])
+
+    def test_002_as_completed_bounded(self):
+        session, _ = mock_session(ok_handler, concurrent_requests=3)
+        lock = Lock()
+        running = 0
+        max_running = 0
+
+        def work(i: int):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05 if i == 0 else 0.01)
+            with lock:
+                running -= 1
+            return i
+
+        # a generator: total is not known
+        results = list(BulkExecutor(session=session).map(work, (i for i in range(12)), ordered=False))
+        self.assertEqual(3, max_running)
+        self.assertEqual(set(range(12)), {r.result for r in results})
+        # the slow first item does not hold back the others
+        self.assertNotEqual(0, results[0].index)
+
+    def test_003_cancel(self):
+        session, _ = mock_session(ok_handler, concurrent_requests=2)
+        cancel = Event()
+        started = []
+
+        def work(i: int):
+            started.append(i)
+            time.sleep(0.01)
+            return i
+
+        results = []
+        for result in BulkExecutor(session=session).map(work, range(100), cancel=cancel):
+            results.append(result)
+            if len(results) == 3:
+                cancel.set()
+        self.assertLess(len(started), 10)
+        # all started items are completed and yielded
+        self.assertEqual(sorted(started), [r.index for r in results])
+
+    def test_004_break(self):
+        session, _ = mock_session(ok_handler, concurrent_requests=2)
+        started = []
+
+        def work(i: int):
+            started.append(i)
+            time.sleep(0.01)
+            return i
+
+        for result in BulkExecutor(session=session).map(work, range(100)):
+            if result.index == 2:
+                break
+        count = len(started)
+        time.sleep(0.05)
+        # no items are started after the caller stopped iterating
+        self.assertEqual(count, len(started))
+        self.assertLess(count, 10)
+
+    def test_005_retry(self):
+        calls = []
+
+        def handler(request: PreparedRequest):
+            calls.append(request.url)
+            item = request.url.split('/')[-1]
+            # 1st request for each item fails with a 503, item 3 always fails with a 404
+            if item == '3':
+                return 404, {}, {'message': 'not found', 'trackingId': 'x'}
+            if calls.count(request.url) == 1:
+                return 503, {}, {'message': 'unavailable', 'trackingId': 'x'}
+            return 200, {}, {'id': item}
+
+        session, _ = mock_session(handler, concurrent_requests=2)
+
+        def retry_on(e: Exception) -> bool:
+            return isinstance(e, RestError) and e.response.status_code >= 500
+
+        results = list(
+            BulkExecutor(session=session).map(
+                lambda i: session.rest_get(url=session.ep(f'people/{i}'))['id'],
+                range(5),
+                retries=2,
+                retry_on=retry_on,
+                retry_delay=0.01,
+            )
+        )
+        self.assertEqual(['0', '1', '2', None, '4'], [r.result for r in results])
+        self.assertEqual([2, 2, 2, 1, 2], [r.attempts for r in results])
+        self.assertEqual(404, results[3].exception.response.status_code)
+
+    def test_006_run(self):
+        session, _ = mock_session(ok_handler, concurrent_requests=4)
+        attempts: dict[int, int] = {}
+
+        def work(i: int):
+            attempts[i] = attempts.get(i, 0) + 1
+            if i % 100 == 0:
+                raise KeyError(i)
+            if i % 10 == 0 and attempts[i] == 1:
+                raise TimeoutError(i)
+            return i
+
+        report = BulkExecutor(session=session).run(
+            work, (i for i in range(1000)), retries=1, retry_on=TimeoutError, retry_delay=0
+        )
+        self.assertFalse(report.ok)
+        self.assertEqual(1000, report.done)
+        self.assertIsNone(report.total)
+        self.assertEqual(990, report.succeeded)
+        self.assertEqual(10, report.failed)
+        self.assertEqual(90, report.retried)
+        self.assertEqual(list(range(0, 1000, 100)), sorted(r.item for r in report.failures))
+        self.assertTrue(all(isinstance(r.exception, KeyError) for r in report.failures))
+
+
+class TestAsBulkExecutor(TestCase):
+    def test_001_map(self):
+        async def test():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=3) as session:
+                bulk = AsBulkExecutor(session=session)
+                running = 0
+                max_running = 0
+
+                async def work(i: int):
+                    nonlocal running, max_running
+                    running += 1
+                    max_running = max(max_running, running)
+                    await asyncio.sleep(0.01 * (10 - i))
+                    running -= 1
+                    if i == 5:
+                        raise ValueError(i)
+                    return i * 2
+
+                ordered = [r async for r in bulk.map(work, range(10))]
+                as_completed = [r async for r in bulk.map(work, range(10), ordered=False)]
+            return ordered, as_completed, max_running
+
+        ordered, as_completed, max_running = asyncio.run(test())
+        self.assertEqual(3, max_running)
+        self.assertEqual(list(range(10)), [r.index for r in ordered])
+        self.assertIsInstance(ordered[5].exception, ValueError)
+        self.assertEqual([i * 2 for i in range(10) if i != 5], [r.result for r in ordered if r.ok])
+        self.assertNotEqual(list(range(10)), [r.index for r in as_completed])
+        self.assertEqual(set(range(10)), {r.index for r in as_completed})
+
+    def test_002_cancel(self):
+        async def test():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=2) as session:
+                cancel = asyncio.Event()
+                started = []
+
+                async def work(i: int):
+                    started.append(i)
+                    await asyncio.sleep(0.01)
+                    return i
+
+                results = []
+                async for result in AsBulkExecutor(session=session).map(work, range(100), cancel=cancel):
+                    results.append(result)
+                    if len(results) == 3:
+                        cancel.set()
+            return started, results
+
+        started, results = asyncio.run(test())
+        self.assertLess(len(started), 10)
+        self.assertEqual(started, [r.index for r in results])
+
+    def test_003_run_retry(self):
+        async def test():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5) as session:
+                attempts: dict[int, int] = {}
+                live = 0
+                max_live = 0
+
+                async def users():
+                    # async iterable; like the result of a list_gen() call
+                    for i in range(200):
+                        await asyncio.sleep(0)
+                        yield i
+
+                async def work(i: int):
+                    nonlocal live, max_live
+                    live += 1
+                    max_live = max(max_live, live)
+                    attempts[i] = attempts.get(i, 0) + 1
+                    await asyncio.sleep(0.001)
+                    live -= 1
+                    if i % 7 == 0 and attempts[i] < 3:
+                        raise ConnectionError(i)
+                    if i == 13:
+                        raise ValueError(i)
+                    return i
+
+                report = await AsBulkExecutor(session=session).run(
+                    work, users(), retries=2, retry_on=(ConnectionError,), retry_delay=0
+                )
+            return report, max_live
+
+        report, max_live = asyncio.run(test())
+        self.assertEqual(5, max_live)
+        self.assertEqual(200, report.done)
+        self.assertEqual(199, report.succeeded)
+        self.assertEqual([13], [r.item for r in report.failures])
+        # 29 items divisible by 7, each retried twice
+        self.assertEqual(58, report.retried)
+        self.assertFalse(report.cancelled)
@@ -0,0 +1,153 @@
+"""
+Offline tests for the columnar CDR export
+"""
+
+import csv
+import importlib.util
+import os
+from datetime import UTC, datetime
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.cdr import CDR
+from wxc_sdk.cdr_export import CDR_COLUMNS, CdrWriter, cdr_batch, cdr_batches, export_cdrs, get_cdr_writer
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def record(i: int) -> dict:
+    """
+    CDR as returned by the CDR feed
+    """
+    return {
+        'Start time': f'2024-05-01T10:{i % 60:02}:00.123Z',
+        'Answer time': f'2024-05-01T10:{i % 60:02}:05.000Z' if i % 2 else '',
+        'Duration': str(i),
+        'Answered': 'true' if i % 2 else 'false',
+        'Direction': 'ORIGINATING',
+        'Call type': 'SIP_NATIONAL',
+        'Client type': 'SIP',
+        'Calling number': f'+1408555{i:04}',
+        'Local SessionID': f's{i}',
+        'Route list calls overage': 'NA',
+        'Some new field': 'x',
+    }
+
+
+class TestCdrBatch(TestCase):
+    def test_001_columns(self):
+        kinds = {column.name: column.kind for column in CDR_COLUMNS}
+        self.assertEqual(list(CDR.model_fields), list(kinds))
+        self.assertEqual('timestamp', kinds['start_time'])
+        self.assertEqual('int', kinds['duration'])
+        self.assertEqual('bool', kinds['answered'])
+        self.assertEqual('category', kinds['call_type'])
+        self.assertEqual('string', kinds['calling_number'])
+
+    def test_002_convert(self):
+        records = [record(1), record(2)]
+        batch = cdr_batch(records)
+        self.assertEqual(2, batch.num_rows)
+        self.assertEqual(0, batch.conversion_errors)
+        columns = batch.columns
+        self.assertEqual(datetime(2024, 5, 1, 10, 1, 0, 123000, tzinfo=UTC), columns['start_time'][0])
+        self.assertEqual([1, 2], columns['duration'])
+        self.assertEqual([True, False], columns['answered'])
+        self.assertEqual([columns['answer_time'][0], None], columns['answer_time'])
+        self.assertEqual(['s1', 's2'], columns['local_session_id'])
+        self.assertEqual([None, None], columns['route_list_calls_overage'])
+        self.assertNotIn('some_new_field', columns)
+
+        # same values as the model
+        cdr = CDR.model_validate(records[0])
+        for name, values in columns.items():
+            value = getattr(cdr, name)
+            self.assertEqual(value, values[0], name)
+
+    def test_003_conversion_errors(self):
+        records = [record(1), {**record(2), 'Duration': 'n/a', 'Answered': 'maybe'}]
+        batch = cdr_batch(records)
+        self.assertEqual(2, batch.conversion_errors)
+        self.assertEqual([1, None], batch.columns['duration'])
+        self.assertEqual([True, None], batch.columns['answered'])
+
+
+class TestCdrExport(TestCase):
+    def setUp(self):
+        self.records = [record(i) for i in range(25)]
+        self.pages = 0
+
+        def handler(request: PreparedRequest):
+            # pages of 10 records; the offset is passed in the link to the next page
+            self.pages += 1
+            url = urlparse(request.url)
+            offset = int(parse_qs(url.query).get('offset', ['0'])[0])
+            headers = {}
+            if offset + 10 < len(self.records):
+                headers['Link'] = f'<https://{url.netloc}{url.path}?offset={offset + 10}>; rel="next"'
+            return 200, headers, {'items': self.records[offset : offset + 10]}
+
+        session, _ = mock_session(handler)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_batches(self):
+        batches = list(cdr_batches(self.api, batch_size=8))
+        self.assertEqual([8, 8, 8, 1], [batch.num_rows for batch in batches])
+        self.assertEqual(list(range(25)), [d for batch in batches for d in batch.columns['duration']])
+        self.assertEqual(3, self.pages)
+
+    def test_002_csv(self):
+        with TemporaryDirectory() as tmp:
+            stats = export_cdrs(self.api, os.path.join(tmp, 'cdrs.csv'), format='csv', batch_size=10)
+            with open(stats.path, newline='') as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual('csv', stats.format)
+        self.assertEqual(25, stats.records)
+        self.assertEqual(3, stats.batches)
+        self.assertEqual(25, len(rows))
+        self.assertEqual([c.name for c in CDR_COLUMNS], list(rows[0]))
+        self.assertEqual('2024-05-01T10:01:00.123000+00:00', rows[1]['start_time'])
+        self.assertEqual(['false', 'true'], [rows[0]['answered'], rows[1]['answered']])
+        self.assertEqual('', rows[0]['answer_time'])
+        self.assertEqual('SIP_NATIONAL', rows[0]['call_type'])
+
+    def test_003_auto(self):
+        with TemporaryDirectory() as tmp:
+            with get_cdr_writer(os.path.join(tmp, 'cdrs.out')) as writer:
+                pass
+            self.assertTrue(os.path.isfile(writer.path))
+        if HAS_PYARROW:
+            self.assertEqual(('parquet', '.parquet'), (writer.format, os.path.splitext(writer.path)[1]))
+        else:
+            self.assertEqual(('csv', '.csv'), (writer.format, os.path.splitext(writer.path)[1]))
+        with self.assertRaises(ValueError):
+            get_cdr_writer('cdrs.xml', 'xml')
+
+    @skipUnless(HAS_PYARROW, 'pyarrow not installed')
+    def test_004_parquet_and_arrow(self):
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        with TemporaryDirectory() as tmp:
+            parquet = export_cdrs(self.api, os.path.join(tmp, 'cdrs.parquet'), format='parquet', batch_size=10)
+            arrow = export_cdrs(self.api, os.path.join(tmp, 'cdrs.arrow'), format='arrow', batch_size=10)
+            tables = [pyarrow.parquet.read_table(parquet.path), pyarrow.ipc.open_file(arrow.path).read_all()]
+        for table in tables:
+            self.assertEqual(25, table.num_rows)
+            self.assertEqual(list(range(25)), table.column('duration').to_pylist())
+            self.assertEqual(pyarrow.timestamp('us', tz='UTC'), table.schema.field('start_time').type)
+            self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('call_type').type))
+
+    def test_005_incomplete_writer(self):
+        class WriteOnly(CdrWriter):
+            def write(self, batch):
+                pass
+
+        # writers have to implement write() and close()
+        with self.assertRaises(TypeError):
+            WriteOnly('cdrs.out')
@@ -0,0 +1,43 @@
+"""
+Offline tests for CDR parsing
+"""
+
+from unittest import TestCase
+
+from wxc_sdk.cdr import CDR
+from wxc_sdk.reports import CallingCDR
+
+
+def record(i: int) -> dict:
+    return {
+        'Start time': '2024-05-01T10:00:00.123Z',
+        'Answer time': '',
+        'Duration': str(i),
+        'Answered': 'false',
+        'Call type': 'SIP_NATIONAL',
+        'Local SessionID': f's{i}',
+        'Route list calls overage': 'NA',
+        'Original Called Party UUID': 'uuid',
+        'Some new field': 'x',
+    }
+
+
+class TestCdrParser(TestCase):
+    def test_001_parse_records(self):
+        records = [record(i) for i in range(3)]
+        cdrs = list(CDR.parse_records(records))
+        self.assertEqual([CDR.model_validate(r) for r in records], cdrs)
+        cdr = cdrs[1]
+        self.assertEqual(1, cdr.duration)
+        self.assertIsNone(cdr.answer_time)
+        self.assertFalse(cdr.answered)
+        self.assertEqual('s1', cdr.local_session_id)
+        self.assertIsNone(cdr.route_list_calls_overage)
+        self.assertEqual('uuid', cdr.original_called_party_uuid)
+        self.assertEqual({'some_new_field': 'x'}, cdr.model_extra)
+
+    def test_002_from_dicts(self):
+        cdrs = list(CallingCDR.from_dicts(record(i) for i in range(3)))
+        self.assertEqual(3, len(cdrs))
+        self.assertTrue(all(isinstance(cdr, CallingCDR) for cdr in cdrs))
+        self.assertEqual([0, 1, 2], [cdr.duration for cdr in cdrs])
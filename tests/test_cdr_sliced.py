@@ -0,0 +1,160 @@
+"""
+Offline tests for time-sliced CDR retrieval
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from dateutil.parser import isoparse
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsDetailedCDRApi
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.cdr import CDR, DetailedCDRApi
+from wxc_sdk.tokens import Tokens
+
+START = datetime(2024, 5, 1, 10, tzinfo=UTC)
+
+
+def record(minute: int, location: str) -> dict:
+    report_time = START + timedelta(minutes=minute)
+    return {
+        'Report time': report_time.isoformat().replace('+00:00', 'Z'),
+        'Location': location,
+        'Correlation ID': f'c{minute}-{location}',
+        'Call ID': f'call{minute}',
+        'Local call ID': f'l{minute}',
+    }
+
+
+# one record per minute and location for one hour; the end of the hour is included
+LOCATIONS = [f'loc{i:02}' for i in range(12)]
+RECORDS = [record(minute, location) for minute in range(61) for location in LOCATIONS]
+
+
+class TestCdrSliced(TestCase):
+    def setUp(self):
+        self.queries: list[tuple[str, str, str]] = []
+        self.sent: list[float] = []
+        self.lock = Lock()
+
+        def handler(request: PreparedRequest):
+            query = parse_qs(urlparse(request.url).query)
+            start, end = query['startTime'][0], query['endTime'][0]
+            locations = query['locations'][0].split(',') if 'locations' in query else LOCATIONS
+            with self.lock:
+                self.queries.append((start, end, ','.join(locations)))
+                self.sent.append(time.monotonic())
+            # both ends of the time window are inclusive: records at slice boundaries are returned twice
+            items = [
+                r
+                for r in RECORDS
+                if isoparse(start) <= isoparse(r['Report time']) <= isoparse(end) and r['Location'] in locations
+            ]
+            return 200, {}, {'items': items}
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_slices(self):
+        cdrs = list(
+            self.api.cdr.get_cdr_history_sliced(
+                start_time=START, end_time=START + timedelta(hours=1), slices=4, initial_interval=0
+            )
+        )
+        self.assertEqual(4, len(self.queries))
+        self.assertEqual(
+            [
+                '2024-05-01T10:00:00.000Z',
+                '2024-05-01T10:15:00.000Z',
+                '2024-05-01T10:30:00.000Z',
+                '2024-05-01T10:45:00.000Z',
+            ],
+            sorted(q[0] for q in self.queries),
+        )
+        self.assertEqual(len(RECORDS), len(cdrs))
+        report_times = [cdr.report_time for cdr in cdrs]
+        self.assertEqual(sorted(report_times), report_times)
+        self.assertEqual(len(RECORDS), len({DetailedCDRApi.cdr_key(cdr) for cdr in cdrs}))
+
+    def test_002_location_groups(self):
+        cdrs = list(
+            self.api.cdr.get_cdr_history_sliced(
+                start_time='2024-05-01T10:00:00Z',
+                end_time='2024-05-01T11:00:00Z',
+                locations=LOCATIONS,
+                slices=3,
+                initial_interval=0,
+            )
+        )
+        # 3 slices, 2 location groups each
+        self.assertEqual(6, len(self.queries))
+        self.assertEqual({10, 2}, {len(q[2].split(',')) for q in self.queries})
+        self.assertEqual(len(RECORDS), len(cdrs))
+        report_times = [cdr.report_time for cdr in cdrs]
+        self.assertEqual(sorted(report_times), report_times)
+
+    def test_003_invalid_slices(self):
+        with self.assertRaises(ValueError):
+            list(self.api.cdr.get_cdr_history_sliced(slices=0))
+
+    def test_004_initial_interval(self):
+        # default: one slice
+        cdrs = list(self.api.cdr.get_cdr_history_sliced(start_time=START, end_time=START + timedelta(hours=1)))
+        self.assertEqual(1, len(self.queries))
+        self.assertEqual(len(RECORDS), len(cdrs))
+        self.queries.clear()
+        self.sent.clear()
+        # initial requests are sent initial_interval seconds apart
+        cdrs = list(
+            self.api.cdr.get_cdr_history_sliced(
+                start_time=START, end_time=START + timedelta(hours=1), slices=3, initial_interval=0.1
+            )
+        )
+        self.assertEqual(3, len(self.queries))
+        self.assertEqual(len(RECORDS), len(cdrs))
+        gaps = [b - a for a, b in zip(self.sent, self.sent[1:], strict=False)]
+        self.assertTrue(all(gap >= 0.09 for gap in gaps), gaps)
+
+
+class TestAsCdrSliced(TestCase):
+    def test_001_slices(self):
+        queries = []
+        sent = []
+
+        async def get_cdr_history(start_time: datetime, end_time: datetime, locations, **kwargs) -> list[CDR]:
+            queries.append((start_time, end_time, locations))
+            sent.append(time.monotonic())
+            await asyncio.sleep(0)
+            return [
+                CDR.model_validate(r)
+                for r in RECORDS
+                if start_time <= isoparse(r['Report time']) <= end_time and r['Location'] in locations
+            ]
+
+        async def test():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=4) as session:
+                api = AsDetailedCDRApi(session=session)
+                api.get_cdr_history = get_cdr_history
+                return await api.get_cdr_history_sliced(
+                    start_time=START,
+                    end_time=START + timedelta(hours=1),
+                    locations=LOCATIONS,
+                    slices=2,
+                    initial_interval=0.05,
+                )
+
+        cdrs = asyncio.run(test())
+        self.assertEqual(4, len(queries))
+        self.assertEqual(len(RECORDS), len(cdrs))
+        report_times = [cdr.report_time for cdr in cdrs]
+        self.assertEqual(sorted(report_times), report_times)
+        # initial requests are sent initial_interval seconds apart
+        gaps = [b - a for a, b in zip(sent, sent[1:], strict=False)]
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
@@ -0,0 +1,171 @@
+"""
+Offline tests for the entity directory
+"""
+
+import time
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.directory import EntityDirectory
+from wxc_sdk.locations import Location
+
+
+class TestEntityDirectory(TestCase):
+    def setUp(self):
+        self.people = [
+            {'id': 'p1', 'emails': ['Alice@example.com'], 'displayName': 'Alice'},
+            {'id': 'p2', 'emails': ['bob@example.com'], 'displayName': 'Bob'},
+        ]
+        self.locations = [{'id': 'l1', 'name': 'Berlin'}, {'id': 'l2', 'name': 'Berlin 2'}]
+        self.workspaces = [{'id': 'w1', 'displayName': 'Lobby'}]
+        self.requests: list[tuple[str, str]] = []
+
+        def handler(request: PreparedRequest):
+            url = urlparse(request.url)
+            path = url.path.removeprefix('/v1/')
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            self.requests.append((request.method, path))
+            if request.method != 'GET':
+                return 200, {}, {}
+            if path == 'people':
+                email = params.get('email', '').lower()
+                return 200, {}, {'items': [p for p in self.people if not email or p['emails'][0].lower() == email]}
+            if path == 'locations':
+                name = params.get('name', '')
+                return 200, {}, {'items': [loc for loc in self.locations if name in loc['name']]}
+            if path == 'workspaces':
+                name = params.get('displayName')
+                return 200, {}, {'items': [w for w in self.workspaces if name in (None, w['displayName'])]}
+            kind, _, entity_id = path.partition('/')
+            entities = {'people': self.people, 'locations': self.locations, 'workspaces': self.workspaces}.get(kind, [])
+            entity = next((e for e in entities if e['id'] == entity_id), None)
+            if entity is not None:
+                return 200, {}, entity
+            return 404, {}, {'message': 'not found', 'trackingId': 'x'}
+
+        self.handler = handler
+
+    def api(self, **kwargs) -> WebexSimpleApi:
+        session, _ = mock_session(self.handler, concurrent_requests=4, **kwargs)
+        return WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_no_directory(self):
+        api = self.api()
+        self.assertIsNone(api.session.directory)
+        self.assertEqual('l1', api.locations.by_name('Berlin').location_id)
+        self.assertEqual('l1', api.locations.by_name('Berlin').location_id)
+        self.assertEqual(2, len(self.requests))
+
+    def test_002_lookups(self):
+        api = self.api(directory=True)
+        directory = api.session.directory
+        self.assertIsInstance(directory, EntityDirectory)
+        self.assertEqual('l1', api.locations.by_name('Berlin').location_id)
+        self.assertEqual('p1', api.people.by_email('alice@EXAMPLE.com').person_id)
+        self.assertEqual('w1', api.workspaces.by_name('Lobby').workspace_id)
+        self.assertIsNone(api.locations.by_name('Paris'))
+        self.assertEqual(4, len(self.requests))
+        # all from the directory; including the negative lookup
+        location = api.locations.by_name('Berlin')
+        self.assertEqual('l1', location.location_id)
+        self.assertEqual('p1', api.people.by_email('Alice@example.com').person_id)
+        self.assertEqual('w1', api.workspaces.by_name('Lobby').workspace_id)
+        self.assertIsNone(api.locations.by_name('Paris'))
+        self.assertEqual(4, len(self.requests))
+        # entities are also cached by ID
+        found, person = directory.get('people', 'id', 'p1')
+        self.assertTrue(found)
+        self.assertEqual('Alice', person.display_name)
+        # callers get their own copy
+        location.name = 'changed'
+        self.assertEqual('Berlin', api.locations.by_name('Berlin').name)
+
+    def test_003_invalidation(self):
+        api = self.api(directory=True)
+        directory = api.session.directory
+        api.locations.by_name('Berlin')
+        api.locations.by_name('Paris')
+        api.people.by_email('bob@example.com')
+        self.requests.clear()
+        # update of a location: entries of l1 and negative entries of locations are removed
+        api.session.rest_put(url=api.session.ep('locations/l1'), json={'name': 'Berlin'})
+        self.assertEqual(
+            (False, None), directory.get('locations', 'name', 'Paris'), 'negative entry should be invalidated'
+        )
+        self.assertFalse(directory.get('locations', 'id', 'l1')[0])
+        # other kinds are not affected
+        self.assertTrue(directory.get('people', 'email', 'bob@example.com')[0])
+        # create a location
+        self.locations.append({'id': 'l3', 'name': 'Paris'})
+        self.assertIsNone(directory.get('locations', 'name', 'Paris')[1])
+        self.assertEqual('l3', api.locations.by_name('Paris').location_id)
+        # updates of other paths are ignored
+        count = len(directory)
+        api.session.rest_put(url=api.session.ep('telephony/config/queues/q1'), json={})
+        self.assertEqual(count, len(directory))
+
+    def test_004_warm_up_ttl_and_size(self):
+        api = self.api(directory=EntityDirectory(ttl=0.05, negative_ttl=0, max_entries=5))
+        directory = api.session.directory
+        self.assertEqual({'people': 2, 'locations': 2, 'workspaces': 1}, directory.warm_up(api))
+        self.assertEqual(5, len(directory))
+        self.requests.clear()
+        # the most recently added entries are kept
+        self.assertEqual('w1', api.workspaces.by_name('Lobby').workspace_id)
+        self.assertEqual([], self.requests)
+        # no negative caching
+        self.assertIsNone(api.workspaces.by_name('foo'))
+        self.assertIsNone(api.workspaces.by_name('foo'))
+        self.assertEqual(2, len(self.requests))
+        time.sleep(0.06)
+        self.requests.clear()
+        self.assertEqual('w1', api.workspaces.by_name('Lobby').workspace_id)
+        self.assertEqual(1, len(self.requests))
+
+    def test_005_in_flight_update(self):
+        directory = EntityDirectory()
+        epoch = directory.epoch
+        directory.invalidate_path('locations/l1')
+        directory.put('locations', 'name', 'Berlin', Location(location_id='l1', name='Berlin'), epoch=epoch)
+        self.assertEqual(0, len(directory))
+
+    def test_006_details(self):
+        api = self.api(directory=True)
+        api.people.by_email('alice@example.com')
+        self.requests.clear()
+        # served from the entry cached by email
+        self.assertEqual('Alice', api.people.details('p1').display_name)
+        self.assertEqual([], self.requests)
+        # details are cached by ID
+        self.assertEqual('Berlin', api.locations.details('l1').name)
+        self.assertEqual('Lobby', api.workspaces.details('w1').display_name)
+        self.assertEqual('Lobby', api.workspaces.details('w1').display_name)
+        self.assertEqual('l1', api.locations.by_name('Berlin').location_id)
+        self.assertEqual([('GET', 'locations/l1'), ('GET', 'workspaces/w1')], self.requests)
+        # calling data and devices are not in the directory
+        api.people.details('p1', calling_data=True)
+        api.workspaces.details('w1', include_devices=True)
+        self.assertEqual(4, len(self.requests))
+        # updates invalidate the entries
+        api.session.rest_put(url=api.session.ep('locations/l1'), json={'name': 'Berlin'})
+        self.locations[0]['name'] = 'Munich'
+        self.assertEqual('Munich', api.locations.details('l1').name)
+
+    def test_007_details_after_org_warm_up(self):
+        api = self.api(directory=True)
+        api.session.directory.warm_up(api, org_id='o1')
+        self.requests.clear()
+        # entities are cached by ID independent of the org ID used to read them
+        self.assertEqual('Alice', api.people.details('p1').display_name)
+        self.assertEqual('Berlin', api.locations.details('l1').name)
+        self.assertEqual('Berlin', api.locations.details('l1', org_id='o1').name)
+        self.assertEqual('Lobby', api.workspaces.details('w1').display_name)
+        # names are still looked up per org
+        self.assertEqual('l1', api.locations.by_name('Berlin', org_id='o1').location_id)
+        self.assertEqual([], self.requests)
+        self.assertEqual('l1', api.locations.by_name('Berlin').location_id)
+        self.assertEqual(1, len(self.requests))
@@ -0,0 +1,83 @@
+"""
+Offline tests for the HTTP/2 transport of RestSession
+"""
+
+import importlib.util
+import json
+from unittest import TestCase, skipUnless
+
+from requests import Timeout
+
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+
+HAS_HTTP2 = all(importlib.util.find_spec(m) is not None for m in ('httpx', 'h2'))
+
+if HAS_HTTP2:
+    import httpx
+
+    from wxc_sdk.http2 import Http2Adapter
+
+
+class Terminated:
+    """
+    Stand-in for a h2 ConnectionTerminated event
+    """
+
+    def __init__(self, error_code: int):
+        self.error_code = error_code
+
+
+@skipUnless(HAS_HTTP2, 'httpx[http2] is not installed')
+class TestHttp2Adapter(TestCase):
+    def session(self, handler) -> tuple[RestSession, list['httpx.Request']]:
+        """
+        RestSession with HTTP/2 transport; requests are answered by the handler
+        """
+        requests = []
+
+        def mock(request: 'httpx.Request') -> 'httpx.Response':
+            requests.append(request)
+            return handler(request)
+
+        session = RestSession(tokens=Tokens(access_token='token'), concurrent_requests=10, http2=True)
+        adapter = session.get_adapter('https://webexapis.com')
+        self.assertIsInstance(adapter, Http2Adapter)
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(mock))
+        self.addCleanup(session.close)
+        return session, requests
+
+    def test_001_request(self):
+        session, requests = self.session(lambda r: httpx.Response(200, json={'echo': json.loads(r.content)}))
+        data = session.rest_post(url=session.ep('people'), json={'displayName': 'Jane'})
+        self.assertEqual({'echo': {'displayName': 'Jane'}}, data)
+        self.assertEqual('Bearer token', requests[0].headers['Authorization'])
+        self.assertEqual('https://webexapis.com/v1/people', str(requests[0].url))
+
+    def test_002_stream(self):
+        body = b'x' * 100000
+        session, _ = self.session(lambda r: httpx.Response(200, content=body))
+        with session.get(session.ep('report'), stream=True) as response:
+            self.assertEqual(body, b''.join(response.iter_content(chunk_size=8192)))
+
+    def test_003_refused_retried(self):
+        def handler(request):
+            if len(requests) == 1:
+                try:
+                    raise RuntimeError(Terminated(error_code=0))
+                except RuntimeError as e:
+                    raise httpx.RemoteProtocolError('terminated') from e
+            return httpx.Response(200, json={'id': 'p1'})
+
+        session, requests = self.session(handler)
+        self.assertEqual({'id': 'p1'}, session.rest_get(url=session.ep('people/p1')))
+        self.assertEqual(2, len(requests))
+        self.assertEqual(1, session.get_adapter('https://webexapis.com').refused_retries)
+
+    def test_004_timeout(self):
+        def handler(request):
+            raise httpx.ReadTimeout('timeout')
+
+        session, _ = self.session(handler)
+        with self.assertRaises(Timeout):
+            session.rest_get(url=session.ep('people'))
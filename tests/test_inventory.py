@@ -0,0 +1,174 @@
+"""
+Offline tests for the org inventory
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from urllib.parse import urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.inventory import COLLECTIONS, Inventory
+from wxc_sdk.people import Person
+from wxc_sdk.rest import RestError
+
+LOCATION = {'id': 'l1', 'name': 'Berlin'}
+
+RESPONSES = {
+    'people': (
+        'items',
+        [
+            {
+                'id': 'p1',
+                'emails': ['Alice@Example.com'],
+                'displayName': 'Alice',
+                'extension': '1001',
+                'locationId': 'l1',
+                'phoneNumbers': [{'type': 'work', 'value': '+49 30 1234'}],
+            },
+            {'id': 'p2', 'emails': ['bob@example.com'], 'displayName': 'Bob', 'extension': '1002', 'locationId': 'l1'},
+            {'id': 'p3', 'emails': ['carol@example.com'], 'displayName': 'Carol', 'locationId': 'l2'},
+        ],
+    ),
+    'locations': ('items', [LOCATION, {'id': 'l2', 'name': 'Paris'}]),
+    'workspaces': ('items', [{'id': 'w1', 'displayName': 'Lobby', 'locationId': 'l1', 'sipAddress': 'Lobby@x.com'}]),
+    'devices': (
+        'items',
+        [
+            {'id': 'd1', 'displayName': 'Phone', 'personId': 'p1', 'locationId': 'l1', 'mac': 'aabbccddeeff'},
+            {'id': 'd2', 'displayName': 'Desk', 'workspaceId': 'w1', 'locationId': 'l1'},
+        ],
+    ),
+    'telephony/config/numbers': (
+        'phoneNumbers',
+        [
+            {
+                'phoneNumber': '+49301234',
+                'extension': '1001',
+                'mainNumber': False,
+                'tollFreeNumber': False,
+                'location': LOCATION,
+                'owner': {'id': 'p1', 'type': 'PEOPLE', 'firstName': 'Alice', 'lastName': 'A'},
+            },
+            {
+                'extension': '2000',
+                'mainNumber': False,
+                'tollFreeNumber': False,
+                'location': LOCATION,
+                'owner': {'id': 'h1', 'type': 'HUNT_GROUP'},
+            },
+        ],
+    ),
+    'telephony/config/virtualLines': (
+        'virtualLines',
+        [{'id': 'v1', 'firstName': 'V', 'lastName': 'L', 'number': {'extension': '3000'}, 'location': LOCATION}],
+    ),
+    'telephony/config/huntGroups': (
+        'huntGroups',
+        [{'id': 'h1', 'name': 'Sales', 'extension': '2000', 'locationId': 'l1', 'enabled': True}],
+    ),
+    'telephony/config/queues': (
+        'queues',
+        [{'id': 'q1', 'name': 'Support', 'phoneNumber': '+49305555', 'locationId': 'l2', 'enabled': True}],
+    ),
+}
+
+
+class TestInventory(TestCase):
+    def setUp(self):
+        self.failing: set[str] = set()
+        self.requested: list[str] = []
+
+        def handler(request: PreparedRequest):
+            path = urlparse(request.url).path.removeprefix('/v1/')
+            self.requested.append(path)
+            if path in self.failing:
+                return 500, {}, {'message': 'failed', 'trackingId': 'x'}
+            item_key, items = RESPONSES[path]
+            return 200, {}, {item_key: items}
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_refresh_and_find(self):
+        with Inventory(api=self.api) as inventory:
+            refreshed = inventory.refresh()
+            self.assertEqual(set(COLLECTIONS), set(refreshed))
+            self.assertIsNotNone(inventory.refreshed('people'))
+            self.assertEqual(['p1'], [i.id for i in inventory.find('email', 'alice@example.COM')])
+            self.assertEqual(['p1'], [i.id for i in inventory.find('e164', '+49 30 1234', collection='people')])
+            self.assertEqual(
+                {('people', 'p1'), ('numbers', '+49301234')},
+                {(i.collection, i.id) for i in inventory.find('e164', '+49301234')},
+            )
+            self.assertEqual(['d1'], [i.id for i in inventory.find('mac', 'AABBCCDDEEFF')])
+            self.assertEqual(['w1'], [i.id for i in inventory.find('sip', 'lobby@x.com')])
+            self.assertEqual(['v1'], [i.id for i in inventory.find('extension', '3000')])
+            numbers = inventory.find('extension', '2000', collection='numbers')
+            self.assertEqual(['l1/2000'], [i.id for i in numbers])
+            self.assertEqual('h1', numbers[0].owner_id)
+            location = inventory.find('location', 'Paris')[0]
+            self.assertEqual(['q1'], [q.id for q in inventory.items('call_queues', location_id=location.id)])
+
+            person = inventory.get('people', 'p1')
+            self.assertIsInstance(person, Person)
+            self.assertEqual('Alice', person.display_name)
+            self.assertIsNone(inventory.get('people', 'missing'))
+            self.assertEqual(3, len(inventory.items('people')))
+
+            # people in Berlin without a device
+            rows = inventory.execute(
+                "SELECT id FROM item p WHERE p.collection = 'people' AND p.location_id = ? AND NOT EXISTS "
+                "(SELECT 1 FROM item d WHERE d.collection = 'devices' AND d.owner_id = p.id)",
+                ('l1',),
+            )
+            self.assertEqual(['p2'], [row['id'] for row in rows])
+
+    def test_002_incremental_refresh(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'inventory.db')
+            with Inventory(api=self.api, path=path) as inventory:
+                inventory.refresh()
+            self.requested.clear()
+            people = RESPONSES['people'][1]
+            RESPONSES['people'][1].append({'id': 'p4', 'emails': ['dave@example.com'], 'locationId': 'l2'})
+            try:
+                with Inventory(api=self.api, path=path) as inventory:
+                    # all collections are recent: nothing to do
+                    self.assertEqual([], inventory.refresh(max_age=3600))
+                    self.assertEqual([], self.requested)
+                    self.assertEqual(3, len(inventory.items('people')))
+                    self.assertEqual(['people'], inventory.refresh(collections=['people']))
+                    self.assertEqual(['people'], self.requested)
+                    self.assertEqual(['p4'], [i.id for i in inventory.find('email', 'dave@example.com')])
+                    self.assertEqual(4, inventory.execute("SELECT count FROM collection WHERE name='people'")[0][0])
+            finally:
+                people.pop()
+
+    def test_003_errors(self):
+        with Inventory(api=self.api) as inventory:
+            with self.assertRaises(ValueError):
+                inventory.refresh(collections=['people', 'foo'])
+            self.failing.add('devices')
+            with self.assertRaises(RestError):
+                inventory.refresh()
+            # other collections are stored even if one collection fails
+            self.assertIsNone(inventory.refreshed('devices'))
+            self.assertEqual(3, len(inventory.items('people')))
+
+    def test_004_duplicates(self):
+        people = RESPONSES['people'][1]
+        # the same person returned twice while pages are read
+        people.append(people[0])
+        try:
+            with Inventory(api=self.api) as inventory:
+                inventory.refresh(collections=['people'])
+                self.assertEqual(['p1'], [i.id for i in inventory.find('email', 'alice@example.com')])
+                self.assertEqual(['p1'], [i.id for i in inventory.find('extension', '1001')])
+                self.assertEqual(3, len(inventory.items('people')))
+                self.assertEqual(3, inventory.execute("SELECT count FROM collection WHERE name='people'")[0][0])
+        finally:
+            people.pop()
@@ -0,0 +1,216 @@
+"""
+Offline tests for the job pipelines
+"""
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from threading import Lock
+from unittest import TestCase
+from urllib.parse import urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.job_pipeline import JobPipeline, JobPipelineReport, MoveNumbersPipeline, MoveUsersPipeline
+from wxc_sdk.telephony.jobs import MoveUser, NumberItem
+
+RUN = {'min_interval': 0.001, 'max_interval': 0.005}
+
+
+class Service:
+    """
+    Simulated job service: each job runs for two status polls; at most `limit` jobs can run at a time
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.lock = Lock()
+        # job ID -> remaining polls
+        self.running: dict[str, int] = {}
+        # job ID -> items of the job
+        self.jobs: dict[str, list] = {}
+        self.max_running = 0
+        self.conflicts = 0
+        # number of status polls per job
+        self.polls: dict[str, int] = {}
+        # items which fail in a job
+        self.failing: set[str] = set()
+
+    def start(self, items: list) -> tuple[int, dict, dict]:
+        with self.lock:
+            if len(self.running) >= self.limit:
+                self.conflicts += 1
+                return 409, {}, {'message': 'job already running', 'trackingId': 'x'}
+            job_id = f'j{len(self.jobs)}'
+            self.jobs[job_id] = items
+            self.running[job_id] = 2
+            self.max_running = max(self.max_running, len(self.running))
+            return 200, {}, {'id': job_id, 'latestExecutionStatus': 'STARTING'}
+
+    def status(self, job_id: str) -> dict:
+        with self.lock:
+            self.polls[job_id] = self.polls.get(job_id, 0) + 1
+            if job_id not in self.running:
+                return {'id': job_id, 'latestExecutionStatus': 'COMPLETED'}
+            self.running[job_id] -= 1
+            if not self.running[job_id]:
+                del self.running[job_id]
+                return {'id': job_id, 'latestExecutionStatus': 'COMPLETED'}
+            return {'id': job_id, 'latestExecutionStatus': 'STARTED'}
+
+    def errors(self, job_id: str) -> dict:
+        return {
+            'items': [
+                {
+                    'item': item,
+                    'itemNumber': i,
+                    'trackingId': 't',
+                    'errorType': 'ERROR',
+                    'error': {'key': '400', 'message': [{'description': 'failed'}]},
+                }
+                for i, item in enumerate(self.jobs[job_id])
+                if item in self.failing
+            ]
+        }
+
+
+class TestJobPipeline(TestCase):
+    def test_001_abstract(self):
+        # subclasses have to implement _start()
+        with self.assertRaises(TypeError):
+            JobPipeline(api=None, jobs_api=None, items=[], chunk_size=1, max_jobs=1)
+
+
+class TestMoveNumbersPipeline(TestCase):
+    def setUp(self):
+        self.service = Service(limit=1)
+
+        def handler(request: PreparedRequest):
+            path = urlparse(request.url).path.removeprefix('/v1/telephony/config/jobs/numbers/manageNumbers')
+            if request.method == 'POST':
+                body = json.loads(request.body)
+                numbers = [n for item in body['numberList'] for n in item['numbers']]
+                return self.service.start(numbers)
+            segments = path.strip('/').split('/')
+            if segments[-1] == 'errors':
+                return 200, {}, self.service.errors(segments[0])
+            return 200, {}, self.service.status(segments[0])
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+        self.numbers = [
+            NumberItem(location_id='l1', numbers=[f'+1408555{i:04}' for i in range(1500)]),
+            NumberItem(location_id='l2', numbers=[f'+1919555{i:04}' for i in range(1000)]),
+        ]
+
+    def test_001_chunks(self):
+        self.service.failing = {'+14085550013', '+19195550999'}
+        with TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, 'checkpoint.json')
+            pipeline = MoveNumbersPipeline(
+                api=self.api, number_list=self.numbers, target_location_id='l3', checkpoint=checkpoint
+            )
+            report = pipeline.run(**RUN)
+            with open(checkpoint) as f:
+                saved = json.load(f)
+        self.assertEqual(3, len(report.chunks))
+        self.assertEqual(3, len(report.completed))
+        self.assertEqual([1000, 1000, 500], [len(items) for items in self.service.jobs.values()])
+        self.assertEqual(1, self.service.max_running)
+        self.assertEqual(['+14085550013', '+19195550999'], sorted(e.item for e in report.errors))
+        self.assertFalse(report.ok)
+        self.assertEqual(['completed'] * 3, [chunk['state'] for chunk in saved['chunks']])
+
+    def test_002_conflict(self):
+        self.service.limit = 2
+        pipeline = MoveNumbersPipeline(
+            api=self.api, number_list=self.numbers, target_location_id='l3', chunk_size=200, max_jobs=4
+        )
+        report = pipeline.run(**RUN)
+        self.assertTrue(report.ok)
+        self.assertEqual(13, len(report.completed))
+        # the configured limit is kept; the run probes for a higher limit after conflicts
+        self.assertEqual(4, pipeline.max_jobs)
+        self.assertEqual(2, self.service.max_running)
+        self.assertLessEqual(1, self.service.conflicts)
+        self.assertGreater(13, self.service.conflicts)
+        # jobs in flight keep their polling state when other jobs complete: no extra polls
+        self.assertEqual({job_id: 2 for job_id in self.service.jobs}, self.service.polls)
+
+    def test_003_resume(self):
+        class Interrupt(Exception):
+            pass
+
+        def interrupt(report: JobPipelineReport):
+            if report.running:
+                raise Interrupt
+
+        with TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, 'checkpoint.json')
+            pipeline = MoveNumbersPipeline(
+                api=self.api, number_list=self.numbers, target_location_id='l3', checkpoint=checkpoint
+            )
+            with self.assertRaises(Interrupt):
+                pipeline.run(progress=interrupt, **RUN)
+            self.assertEqual(['j0'], list(self.service.jobs))
+
+            # the input has to match the checkpoint
+            with self.assertRaises(ValueError):
+                MoveNumbersPipeline(
+                    api=self.api, number_list=self.numbers[:1], target_location_id='l3', checkpoint=checkpoint
+                )
+
+            pipeline = MoveNumbersPipeline(
+                api=self.api, number_list=self.numbers, target_location_id='l3', checkpoint=checkpoint
+            )
+            self.assertEqual('j0', pipeline.chunks[0].job_id)
+            report = pipeline.run(**RUN)
+        self.assertTrue(report.ok)
+        # the job in flight was not started again
+        self.assertEqual(['j0', 'j1', 'j2'], list(self.service.jobs))
+        self.assertEqual(['j0', 'j1', 'j2'], [chunk.job_id for chunk in report.chunks])
+
+
+class TestMoveUsersPipeline(TestCase):
+    def test_001_users(self):
+        service = Service(limit=3)
+
+        def handler(request: PreparedRequest):
+            path = urlparse(request.url).path.removeprefix('/v1/telephony/config/jobs/person/moveLocation')
+            if request.method == 'POST':
+                users = json.loads(request.body)['usersList'][0]['users']
+                user_id = users[0]['userId']
+                if user_id == 'bad':
+                    body = {'usersList': [{'userId': user_id, 'errors': [{'code': 4003, 'message': 'User Not Found'}]}]}
+                    return 200, {}, {'response': body}
+                status, headers, body = service.start([user_id])
+                if status != 200:
+                    return status, headers, body
+                job = {
+                    **body,
+                    'trackingId': 't',
+                    'sourceUserId': 'u',
+                    'sourceCustomerId': 'c',
+                    'targetCustomerId': 'c',
+                    'instanceId': 1,
+                    'jobExecutionStatus': [],
+                }
+                return 200, {}, {'response': {'jobDetails': job}}
+            segments = path.strip('/').split('/')
+            if segments[-1] == 'errors':
+                return 200, {}, service.errors(segments[0])
+            return 200, {}, service.status(segments[0])
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        api = WebexSimpleApi(tokens='token', session=session)
+        users = [MoveUser(user_id=f'u{i}') for i in range(10)] + [MoveUser(user_id='bad')]
+        pipeline = MoveUsersPipeline(api=api, users=users, target_location_id='l3')
+        report = pipeline.run(**RUN)
+        self.assertEqual(11, len(report.chunks))
+        self.assertEqual(10, len(report.completed))
+        self.assertEqual(1, len(report.failed))
+        self.assertIn('User Not Found', report.failed[0].error)
+        self.assertEqual(3, service.max_running)
+        self.assertEqual(5, pipeline.max_jobs)
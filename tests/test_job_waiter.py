@@ -0,0 +1,250 @@
+"""
+Offline tests for the job waiter
+"""
+
+import asyncio
+from unittest import TestCase
+from urllib.parse import urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsJobWaiter
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.job_waiter import WatchedJob
+from wxc_sdk.telephony.jobs import JobErrorItem, NumberJob
+from wxc_sdk.tokens import Tokens
+
+
+def job(job_id: str, status: str, moved: int = None, total: int = 4) -> dict:
+    r: dict = {'id': job_id, 'latestExecutionStatus': status}
+    if moved is not None:
+        r['counts'] = {'totalNumbers': total, 'numbersMoved': moved}
+    return r
+
+
+def start_job(job_id: str, status: str) -> dict:
+    """
+    job details as returned by job APIs using StartJobResponse
+    """
+    return {
+        **job(job_id, status),
+        'trackingId': 't',
+        'sourceUserId': 'u',
+        'sourceCustomerId': 'c',
+        'targetCustomerId': 'c',
+        'instanceId': 1,
+        'jobExecutionStatus': [],
+    }
+
+
+def error(item_number: int) -> dict:
+    return {
+        'itemNumber': item_number,
+        'trackingId': f't{item_number}',
+        'errorType': 'ERROR',
+        'error': {'key': '400', 'message': [{'description': f'error {item_number}', 'code': 'BATCH-1017001'}]},
+    }
+
+
+class TestWatchedJob(TestCase):
+    def test_001_backoff(self):
+        watched = WatchedJob(jobs_api=None, job_id='j1')
+        intervals = []
+        for now in range(5):
+            watched.update(NumberJob(latest_execution_status='STARTED'), now, 1, 3, 1.5)
+            intervals.append(watched.interval)
+        self.assertEqual([1, 1.5, 2.25, 3, 3], intervals)
+        self.assertIsNone(watched.progress)
+        self.assertFalse(watched.done)
+
+    def test_002_progress_estimate(self):
+        watched = WatchedJob(jobs_api=None, job_id='j1', deadline=100)
+        watched.update(NumberJob.model_validate(job('j1', 'STARTED', 1, 10)), 0, 1, 300, 2)
+        self.assertEqual(0.1, watched.progress)
+        self.assertEqual(1, watched.interval)
+        # 10% in 10 seconds -> 80 seconds to go
+        watched.update(NumberJob.model_validate(job('j1', 'STARTED', 2, 10)), 10, 1, 300, 2)
+        self.assertAlmostEqual(80, watched.interval)
+        self.assertAlmostEqual(90, watched.next_poll)
+        # no progress -> backoff
+        watched.update(NumberJob.model_validate(job('j1', 'STARTED', 2, 10)), 20, 1, 300, 2)
+        self.assertAlmostEqual(160, watched.interval)
+        # next poll is capped by the deadline
+        self.assertEqual(100, watched.next_poll)
+        self.assertFalse(watched.check_deadline(99))
+        self.assertTrue(watched.check_deadline(100))
+        self.assertIsInstance(watched.exception, TimeoutError)
+        self.assertTrue(watched.done)
+        self.assertFalse(watched.ok)
+
+    def test_003_job_progress(self):
+        self.assertEqual(0.5, WatchedJob.job_progress(NumberJob.model_validate(job('j', 'STARTED', 2))))
+        self.assertIsNone(WatchedJob.job_progress(NumberJob.model_validate(job('j', 'STARTED'))))
+        self.assertIsNone(WatchedJob.job_progress(NumberJob.model_validate(job('j', 'STARTED', 0, 0))))
+
+
+class TestJobWaiter(TestCase):
+    def setUp(self):
+        # job ID -> status responses; the last one is repeated
+        self.statuses: dict[str, list[dict]] = {}
+        # job ID -> errors per poll; the last one is repeated
+        self.errors: dict[str, list[list[dict]]] = {}
+        self.requests: list[str] = []
+
+        def handler(request: PreparedRequest):
+            path = urlparse(request.url).path.removeprefix('/v1/')
+            self.requests.append(path)
+            segments = path.split('/')
+            if segments[-1] == 'errors':
+                responses = self.errors.get(segments[-2], [[]])
+                body = {'items': responses.pop(0) if len(responses) > 1 else responses[0]}
+                return 200, {}, body
+            # some job APIs have a /status suffix
+            responses = self.statuses.get(segments[-2] if segments[-1] == 'status' else segments[-1])
+            if responses is None:
+                return 404, {}, {'message': 'not found', 'trackingId': 'x'}
+            return 200, {}, responses.pop(0) if len(responses) > 1 else responses[0]
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+        self.jobs_api = self.api.telephony.jobs.manage_numbers
+
+    def test_001_wait(self):
+        self.statuses['j1'] = [
+            job('j1', 'STARTING'),
+            job('j1', 'STARTED', 1),
+            job('j1', 'STARTED', 3),
+            job('j1', 'COMPLETED', 4),
+        ]
+        progress = []
+        result = self.api.job_waiter.wait(
+            self.jobs_api, 'j1', min_interval=0.001, max_interval=0.01, progress=lambda w: progress.append(w.progress)
+        )
+        self.assertIsInstance(result, NumberJob)
+        self.assertEqual('COMPLETED', result.latest_execution_status)
+        self.assertEqual([None, 0.25, 0.75, 1.0], progress)
+        self.assertEqual(4, len(self.requests))
+
+    def test_002_timeout(self):
+        self.statuses['j1'] = [job('j1', 'STARTED')]
+        with self.assertRaises(TimeoutError):
+            self.api.job_waiter.wait(self.jobs_api, 'j1', timeout=0.05, min_interval=0.01)
+
+    def test_003_watch(self):
+        self.statuses['j1'] = [job('j1', 'STARTED'), job('j1', 'STARTED'), job('j1', 'COMPLETED')]
+        self.statuses['j2'] = [job('j2', 'STARTED'), job('j2', 'FAILED')]
+        self.errors['j1'] = [[], [error(1)], [error(1), error(2)]]
+        seen = []
+        done = list(
+            self.api.job_waiter.watch(
+                [(self.jobs_api, 'j1'), (self.jobs_api, 'j2'), (self.jobs_api, 'unknown')],
+                min_interval=0.001,
+                max_interval=0.005,
+                on_error=lambda w, e: seen.append((w.job_id, e.item_number)),
+            )
+        )
+        by_id = {w.job_id: w for w in done}
+        self.assertEqual(3, len(done))
+        self.assertTrue(by_id['j1'].ok)
+        self.assertEqual([1, 2], [e.item_number for e in by_id['j1'].errors])
+        self.assertEqual([('j1', 1), ('j1', 2)], seen)
+        self.assertEqual('FAILED', by_id['j2'].status)
+        self.assertFalse(by_id['j2'].ok)
+        self.assertIsNotNone(by_id['unknown'].exception)
+        self.assertEqual(0, by_id['unknown'].polls)
+
+    def test_004_stream_errors(self):
+        self.statuses['j1'] = [job('j1', 'STARTED'), job('j1', 'STARTED'), job('j1', 'COMPLETED')]
+        self.errors['j1'] = [[error(1)], [error(1), error(2)], [error(1), error(2), error(3)]]
+        errors = list(self.api.job_waiter.errors(self.jobs_api, 'j1', min_interval=0.001))
+        self.assertTrue(all(isinstance(e, JobErrorItem) for e in errors))
+        self.assertEqual([1, 2, 3], [e.item_number for e in errors])
+
+    def test_005_no_org_id(self):
+        # status() of this job API has no org_id parameter; errors() has one
+        jobs_api = self.api.telephony.jobs.dynamic_device_settings
+        self.statuses['j1'] = [start_job('j1', 'STARTED'), start_job('j1', 'COMPLETED')]
+        self.errors['j1'] = [[error(1)]]
+        (watched,) = self.api.job_waiter.watch([(jobs_api, 'j1')], org_id='o1', min_interval=0.001, errors=True)
+        self.assertTrue(watched.ok)
+        self.assertEqual([1], [e.item_number for e in watched.errors])
+        self.assertEqual({'job_id': 'j1'}, watched.params('status'))
+        self.assertEqual({'job_id': 'j1', 'org_id': 'o1'}, watched.params('errors'))
+
+    def test_006_org_id_required(self):
+        # status() and errors() of this job API require an org_id
+        jobs_api = self.api.telephony.jobs.activation_emails
+        self.statuses['j1'] = [start_job('j1', 'STARTED'), start_job('j1', 'COMPLETED')]
+        with self.assertRaises(ValueError):
+            self.api.job_waiter.wait(jobs_api, 'j1', min_interval=0.001)
+        self.assertEqual([], self.requests)
+        result = self.api.job_waiter.wait(jobs_api, 'j1', org_id='o1', min_interval=0.001)
+        self.assertEqual('COMPLETED', result.latest_execution_status)
+        self.assertEqual('identity/organizations/o1/jobs/sendActivationEmails/j1/status', self.requests[-1])
+
+    def test_007_poll(self):
+        self.statuses['j1'] = [job('j1', 'STARTED'), job('j1', 'COMPLETED')]
+        self.statuses['j2'] = [job('j2', 'STARTED'), job('j2', 'STARTED'), job('j2', 'COMPLETED')]
+        j1, j2, j3 = (WatchedJob(jobs_api=self.jobs_api, job_id=job_id) for job_id in ('j1', 'j2', 'j3'))
+        running = [j1, j2]
+
+        def poll() -> set[str]:
+            done = self.api.job_waiter.poll(running, min_interval=10, backoff=2)
+            for watched in done:
+                running.remove(watched)
+            return {watched.job_id for watched in done}
+
+        self.assertEqual(set(), poll())
+        # j3 is polled right away; j1 and j2 keep their polling state and are not due yet
+        self.statuses['j3'] = [job('j3', 'COMPLETED')]
+        running.append(j3)
+        self.assertEqual({'j3'}, poll())
+        self.assertEqual([1, 1, 1], [w.polls for w in (j1, j2, j3)])
+        # make j1 and j2 due
+        j1.next_poll = j2.next_poll = 0
+        self.assertEqual({'j1'}, poll())
+        # the interval of j2 has grown with its second poll
+        self.assertEqual(20, j2.interval)
+
+
+class FakeAsJobsApi:
+    """
+    Async job API with canned status responses
+    """
+
+    def __init__(self, statuses: list[str]):
+        self.statuses = statuses
+
+    async def status(self, job_id: str) -> NumberJob:
+        await asyncio.sleep(0)
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return NumberJob(id=job_id, latest_execution_status=status)
+
+    async def errors(self, job_id: str) -> list[JobErrorItem]:
+        return [JobErrorItem.model_validate(error(1))]
+
+
+class TestAsJobWaiter(TestCase):
+    def test_001_wait_and_watch(self):
+        async def test():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=2) as session:
+                waiter = AsJobWaiter(session=session)
+                job = await waiter.wait(FakeAsJobsApi(['STARTED', 'COMPLETED']), 'j1', min_interval=0.001)
+                done = [
+                    w
+                    async for w in waiter.watch(
+                        [(FakeAsJobsApi(['STARTED', 'FAILED']), 'j2'), (FakeAsJobsApi(['COMPLETED']), 'j3')],
+                        min_interval=0.001,
+                        errors=True,
+                    )
+                ]
+                errors = [e async for e in waiter.errors(FakeAsJobsApi(['COMPLETED']), 'j4')]
+                return job, done, errors
+
+        job, done, errors = asyncio.run(test())
+        self.assertEqual('COMPLETED', job.latest_execution_status)
+        self.assertEqual(['j3', 'j2'], [w.job_id for w in done])
+        self.assertEqual([1, 1], [len(w.errors) for w in done])
+        self.assertEqual(1, len(errors))
@@ -0,0 +1,101 @@
+"""
+Offline tests for the JSON codecs of the REST sessions
+"""
+
+import importlib.util
+import json
+import logging
+from unittest import TestCase, skipIf, skipUnless
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.json_codec import JsonCodec, MsgspecCodec, OrjsonCodec, StdlibCodec, get_codec
+
+HAS_ORJSON = importlib.util.find_spec('orjson') is not None
+HAS_MSGSPEC = importlib.util.find_spec('msgspec') is not None
+
+DATA = {'items': [{'id': 'p1', 'displayName': 'Ünïcode', 'phoneNumbers': [{'value': '+4961007739764'}], 'n': 2**40}]}
+
+
+def echo_handler(request: PreparedRequest):
+    # return the request body
+    return 200, {}, json.loads(request.body) if request.body else {}
+
+
+class TestCodecs(TestCase):
+    def codecs(self) -> list[JsonCodec]:
+        codecs: list[JsonCodec] = [StdlibCodec()]
+        if HAS_ORJSON:
+            codecs.append(OrjsonCodec())
+        if HAS_MSGSPEC:
+            codecs.append(MsgspecCodec())
+        return codecs
+
+    def test_001_round_trip(self):
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(DATA)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(DATA, json.loads(encoded))
+                self.assertEqual(DATA, codec.loads(encoded))
+                self.assertEqual(DATA, codec.loads(encoded.decode('utf-8')))
+                pretty = codec.dumps_pretty(DATA)
+                self.assertEqual(DATA, json.loads(pretty))
+                self.assertIn('\n  "items": [\n', pretty)
+
+    def test_002_invalid(self):
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                with self.assertRaises(ValueError):
+                    codec.loads(b'<html></html>')
+
+    def test_003_get_codec(self):
+        self.assertIsInstance(get_codec('stdlib'), StdlibCodec)
+        codec = StdlibCodec()
+        self.assertIs(codec, get_codec(codec))
+        auto = get_codec('auto')
+        if HAS_ORJSON:
+            self.assertIsInstance(auto, OrjsonCodec)
+        elif HAS_MSGSPEC:
+            self.assertIsInstance(auto, MsgspecCodec)
+        else:
+            self.assertIsInstance(auto, StdlibCodec)
+        with self.assertRaises(ValueError):
+            get_codec('foo')
+
+    @skipIf(HAS_MSGSPEC, 'msgspec is installed')
+    def test_004_not_installed(self):
+        with self.assertRaises(ImportError):
+            get_codec('msgspec')
+
+    def test_005_incomplete_codec(self):
+        class LoadsOnly(JsonCodec):
+            def loads(self, data):
+                return json.loads(data)
+
+        # a codec has to implement all methods
+        with self.assertRaises(TypeError):
+            LoadsOnly()
+
+
+@skipUnless(HAS_ORJSON, 'orjson is not installed')
+class TestSessionCodec(TestCase):
+    def test_001_request_and_response(self):
+        session, adapter = mock_session(echo_handler, json_codec='orjson')
+        self.assertIsInstance(session.json_codec, OrjsonCodec)
+        data = session.rest_post(url=session.ep('people'), json=DATA)
+        self.assertEqual(DATA, data)
+        request = adapter.requests[0][1]
+        # body encoded by orjson: compact
+        self.assertEqual(OrjsonCodec().dumps(DATA), request.body)
+        self.assertTrue(request.headers['Content-Type'].startswith('application/json'))
+
+    def test_002_dump_response(self):
+        session, _ = mock_session(echo_handler, json_codec='orjson')
+        with self.assertLogs('wxc_sdk.rest', level=logging.DEBUG) as logs:
+            session.rest_post(url=session.ep('access_token'), json={'access_token': 'secret', 'expires_in': 1})
+        output = '\n'.join(logs.output)
+        self.assertIn('"access_token": "***"', output)
+        self.assertIn('"expires_in": 1', output)
+        self.assertNotIn('secret', output.split(' Response')[1])
@@ -0,0 +1,90 @@
+"""
+Offline tests for request metrics of the REST sessions
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.metrics import SessionMetrics, endpoint_template
+
+LOCATION_ID = 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzU1'
+QUEUE_ID = 'Y2lzY29zcGFyazovL3VzL0NBTExfUVVFVUUvMTIz'
+
+
+class TestEndpointTemplate(TestCase):
+    def test_templates(self):
+        for path, expected in (
+            (f'telephony/config/locations/{LOCATION_ID}/queues/{QUEUE_ID}/agents',
+             'telephony/config/locations/{id}/queues/{id}/agents'),
+            (f'people/{QUEUE_ID}', 'people/{id}'),
+            ('people', 'people'),
+            ('telephony/config/people/me/settings/personalAssistant',
+             'telephony/config/people/me/settings/personalAssistant'),
+            (f'telephony/config/locations/{LOCATION_ID}/h323', 'telephony/config/locations/{id}/h323'),
+            ('telephony/config/numbers/+14085551234', 'telephony/config/numbers/{id}'),
+            ('identity/scim/5f3c2e2a-1111-2222-3333-444455556666/v2/Users',
+             'identity/scim/{id}/v2/Users'),
+        ):  # fmt: skip
+            with self.subTest(path=path):
+                self.assertEqual(expected, endpoint_template(path))
+
+
+class TestSessionMetrics(TestCase):
+    def test_001_record(self):
+        calls = []
+
+        def handler(request: PreparedRequest):
+            calls.append(request.url)
+            if len(calls) == 2:
+                return 429, {'Retry-After': '1'}, {'message': 'throttled', 'trackingId': 'x'}
+            return 200, {}, {'id': 'x'}
+
+        session, _ = mock_session(handler, metrics=True)
+        for queue_id in ('q1' * 10, 'q2' * 10):
+            session.rest_get(url=session.ep(f'telephony/config/locations/{LOCATION_ID}/queues/{queue_id}'))
+        session.rest_put(url=session.ep(f'telephony/config/locations/{LOCATION_ID}/queues/{QUEUE_ID}'), json={'a': 1})
+        snapshot = session.metrics.snapshot()
+        self.assertEqual(4, snapshot.requests)
+        self.assertEqual(1, snapshot.throttled)
+        self.assertGreaterEqual(snapshot.throttled_seconds, 0.9)
+        by_method = {e.method: e for e in snapshot.endpoints}
+        self.assertEqual({'GET', 'PUT'}, set(by_method))
+        get = by_method['GET']
+        self.assertEqual('telephony/config/locations/{id}/queues/{id}', get.template)
+        self.assertEqual({200: 2, 429: 1}, get.status)
+        self.assertEqual(3, sum(get.buckets))
+        self.assertEqual(2 * len(b'{"id": "x"}') + len(b'{"message": "throttled", "trackingId": "x"}'), get.bytes_in)
+        self.assertEqual(len(b'{"a": 1}'), by_method['PUT'].bytes_out)
+
+    def test_002_semaphore_wait(self):
+        def handler(request: PreparedRequest):
+            time.sleep(0.1)
+            return 200, {}, {}
+
+        session, _ = mock_session(handler, concurrent_requests=1, metrics=True)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(lambda _: session.rest_get(url=session.ep('people')), range(3)))
+        snapshot = session.metrics.snapshot()
+        # 2nd request waited ~0.1 s, 3rd request ~0.2 s
+        self.assertGreaterEqual(snapshot.semaphore_wait_seconds, 0.25)
+        self.assertGreaterEqual(snapshot.endpoints[0].quantile(0.5), 0.1)
+
+    def test_003_prometheus(self):
+        metrics = SessionMetrics()
+        metrics.record_response('GET', f'people/{QUEUE_ID}', 200, 0.07, 100, 0)
+        metrics.record_response('GET', 'people/Y2lzY29zcGFyazovL3VzL1BFT1BMRS8x', 404, 0.3, 50, 0)
+        metrics.record_semaphore_wait(1.5)
+        text = metrics.prometheus(labels={'job': 'test'})
+        lines = text.splitlines()
+        labels = 'method="GET",endpoint="people/{id}"'
+        self.assertIn(f'wxc_sdk_request_duration_seconds_bucket{{{labels},job="test",le="0.1"}} 1', lines)
+        self.assertIn(f'wxc_sdk_request_duration_seconds_bucket{{{labels},job="test",le="+Inf"}} 2', lines)
+        self.assertIn(f'wxc_sdk_responses_total{{{labels},status="404",job="test"}} 1', lines)
+        self.assertIn(f'wxc_sdk_response_bytes_total{{{labels},job="test"}} 150', lines)
+        self.assertIn('wxc_sdk_semaphore_wait_seconds_total{job="test"} 1.5', lines)
+        metrics.reset()
+        self.assertEqual(0, metrics.snapshot().requests)
@@ -0,0 +1,112 @@
+"""
+Offline tests for the number index
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.number_index import NumberIndex
+
+
+def number(location_id: str, phone_number: str = None, extension: str = None, owner_id: str = None) -> dict:
+    r = {
+        'extension': extension,
+        'esn': extension and f'8{location_id[-1]}{extension}',
+        'mainNumber': False,
+        'tollFreeNumber': False,
+        'location': {'id': location_id, 'name': location_id},
+    }
+    if phone_number:
+        r['phoneNumber'] = phone_number
+    if owner_id:
+        r['owner'] = {'id': owner_id, 'type': 'PEOPLE'}
+    return r
+
+
+class TestNumberIndex(TestCase):
+    def setUp(self):
+        self.numbers = {
+            'l1': [
+                number('l1', '+14085550001', '1001', 'p1'),
+                number('l1', '+14085550002'),
+                number('l1', None, '1003'),
+            ],
+            'l2': [number('l2', '+4930123456', '1001', 'p2')],
+        }
+        self.requests: list[str] = []
+
+        def handler(request: PreparedRequest):
+            url = urlparse(request.url)
+            path = url.path.removeprefix('/v1/')
+            self.requests.append(path)
+            if path == 'telephony/config/locations':
+                return 200, {}, {'locations': [{'id': location_id} for location_id in self.numbers]}
+            location_id = parse_qs(url.query)['locationId'][0]
+            return 200, {}, {'phoneNumbers': self.numbers.get(location_id, [])}
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_lookup(self):
+        index = NumberIndex(api=self.api)
+        index.refresh()
+        self.assertEqual(4, len(index))
+        self.assertEqual({'l1', 'l2'}, set(index.location_ids))
+        self.assertEqual('p1', index.owner('+14085550001').owner_id)
+        # normalized at lookup if needed
+        self.assertEqual('p1', index.owner('(408) 555-0001').owner_id)
+        self.assertEqual('p2', index.owner('+49 30 123456').owner_id)
+        self.assertIsNone(index.owner('+14085550002'))
+        self.assertIn('4085550002', index)
+        self.assertNotIn('+14085559999', index)
+        self.assertIsNone(index.extension('l1', '1003').phone_number)
+        self.assertEqual('+4930123456', index.extension('l2', '1001').phone_number)
+        self.assertEqual('+14085550001', index.esn('811001').phone_number)
+        resolved = index.resolve(['+14085550001', '+49-30-123456', '821001', '1003', 'foo', ''], location_id='l1')
+        self.assertEqual(
+            ['+14085550001', '+4930123456', '+4930123456', None, None, None],
+            [n and n.phone_number for n in resolved],
+        )
+        self.assertEqual('1003', resolved[3].extension)
+        self.assertIsNone(resolved[4])
+
+    def test_002_incremental(self):
+        index = NumberIndex(api=self.api)
+        index.refresh()
+        self.numbers['l1'] = [number('l1', '+14085550001', '1001', 'p9')]
+        self.numbers['l2'].append(number('l2', '+4930999999'))
+        self.requests.clear()
+        index.refresh(location_ids=['l1'])
+        self.assertEqual(['telephony/config/numbers'], self.requests)
+        self.assertEqual('p9', index.owner('+14085550001').owner_id)
+        self.assertIsNone(index.get('+14085550002'))
+        self.assertIsNone(index.extension('l1', '1003'))
+        # l2 has not been refreshed
+        self.assertIsNone(index.get('+4930999999'))
+        self.assertEqual(2, len(index))
+        # full refresh removes locations which don't exist anymore
+        del self.numbers['l1']
+        index.refresh()
+        self.assertEqual(['l2'], index.location_ids)
+        self.assertIsNone(index.get('+14085550001'))
+        self.assertIsNotNone(index.get('+4930999999'))
+
+    def test_003_save_load(self):
+        index = NumberIndex(api=self.api)
+        index.refresh()
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'numbers.json')
+            index.save(path)
+            loaded = NumberIndex.load(path, codec='stdlib')
+        self.assertIsNone(loaded.api)
+        self.assertEqual(index.refreshed, loaded.refreshed)
+        self.assertEqual([n.model_dump() for n in index.numbers('l1')], [n.model_dump() for n in loaded.numbers('l1')])
+        self.assertEqual('p2', loaded.owner('+4930123456').owner_id)
+        with self.assertRaises(ValueError):
+            loaded.refresh()
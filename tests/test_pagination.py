@@ -0,0 +1,235 @@
+"""
+Offline tests for pagination helpers
+"""
+
+import asyncio
+import time
+from itertools import product
+from threading import Lock
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.pagination import ItemMode, LazyModel, as_iter_items, as_prefetch, item_converter, item_mode, prefetch
+from wxc_sdk.people import Person
+
+PAGES = 5
+PAGE_SIZE = 3
+
+
+def paged_handler(request: PreparedRequest):
+    """
+    Mock for a paginated list endpoint with Link headers
+    """
+    query = parse_qs(urlparse(request.url).query)
+    page = int(query.get('page', ['0'])[0])
+    items = [{'id': f'{page}-{i}'} for i in range(PAGE_SIZE)]
+    headers = {}
+    if page < PAGES - 1:
+        headers['Link'] = f'<https://webexapis.com/v1/people?page={page + 1}>; rel="next"'
+    return 200, headers, {'items': items}
+
+
+EXPECTED = [f'{page}-{i}' for page in range(PAGES) for i in range(PAGE_SIZE)]
+
+
+class TestPrefetch(TestCase):
+    def test_001_order(self):
+        self.assertEqual(list(range(20)), list(prefetch(iter(range(20)), depth=2)))
+
+    def test_002_reads_ahead(self):
+        read = []
+
+        def source():
+            for i in range(10):
+                read.append(i)
+                yield i
+
+        pages = prefetch(source(), depth=3)
+        self.assertEqual(0, next(pages))
+        time.sleep(0.2)
+        # 1st entry consumed, three buffered and one more waiting for a free slot in the buffer
+        self.assertEqual(5, len(read))
+        pages.close()
+        time.sleep(0.3)
+        self.assertEqual(5, len(read))
+
+    def test_003_error(self):
+        def source():
+            yield 1
+            raise KeyError('foo')
+
+        pages = prefetch(source(), depth=2)
+        self.assertEqual(1, next(pages))
+        with self.assertRaises(KeyError):
+            next(pages)
+
+    def test_004_async(self):
+        async def source():
+            for i in range(10):
+                await asyncio.sleep(0)
+                yield i
+            raise KeyError('foo')
+
+        async def test():
+            result = []
+            with self.assertRaises(KeyError):
+                async for i in as_prefetch(source(), depth=2):
+                    result.append(i)
+            return result
+
+        self.assertEqual(list(range(10)), asyncio.run(test()))
+
+
+class TestFollowPagination(TestCase):
+    def test_001_prefetch(self):
+        for prefetch_pages in (0, 2):
+            with self.subTest(prefetch=prefetch_pages):
+                session, adapter = mock_session(paged_handler)
+                items = list(session.follow_pagination(url=session.ep('people'), prefetch=prefetch_pages))
+                self.assertEqual(EXPECTED, [item['id'] for item in items])
+                self.assertEqual(PAGES, len(adapter.requests))
+
+    def test_002_session_default(self):
+        session, adapter = mock_session(paged_handler, pagination_prefetch=2)
+        items = session.follow_pagination(url=session.ep('people'))
+        self.assertEqual('0-0', next(items)['id'])
+        time.sleep(0.2)
+        # 1st page, two pages read ahead, and one more page waiting for a free slot in the buffer
+        self.assertEqual(4, len(adapter.requests))
+        items.close()
+        time.sleep(0.3)
+        self.assertEqual(4, len(adapter.requests))
+
+
+class OffsetList:
+    """
+    Mock for a list endpoint with offset based pagination
+    """
+
+    def __init__(self, total: int, with_total: bool = False, delay: float = 0.0):
+        self.total = total
+        self.with_total = with_total
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.lock = Lock()
+
+    def __call__(self, request: PreparedRequest):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        query = parse_qs(urlparse(request.url).query)
+        start = int(query.get('start', ['0'])[0])
+        max_ = int(query['max'][0])
+        items = [{'id': i} for i in range(start, min(start + max_, self.total))]
+        headers = {}
+        if start + max_ < self.total:
+            headers['Link'] = f'<https://webexapis.com/v1/numbers?max={max_}&start={start + max_}>; rel="next"'
+        body = {'items': items}
+        if self.with_total:
+            body['totalCount'] = self.total
+        with self.lock:
+            self.running -= 1
+        return 200, headers, body
+
+
+class TestParallelPagination(TestCase):
+    def test_001_ordered(self):
+        for total, with_total in product((0, 3, 10, 95, 100, 101), (False, True)):
+            with self.subTest(total=total, with_total=with_total):
+                endpoint = OffsetList(total=total, with_total=with_total)
+                session, adapter = mock_session(endpoint, concurrent_requests=4, pagination_parallel=4)
+                items = list(session.follow_pagination(url=session.ep('numbers'), params={'max': 10}))
+                self.assertEqual(list(range(total)), [item['id'] for item in items])
+                if with_total:
+                    self.assertEqual(max(1, -(-total // 10)), len(adapter.requests))
+                else:
+                    # we can't request more than `parallel` pages after the end of the list
+                    self.assertLessEqual(len(adapter.requests), -(-total // 10) + 4)
+
+    def test_002_unordered(self):
+        endpoint = OffsetList(total=1000, with_total=True)
+        session, _ = mock_session(endpoint, concurrent_requests=8)
+        items = list(
+            session.follow_pagination(url=session.ep('numbers'), params={'max': 10}, parallel=8, ordered=False)
+        )
+        self.assertEqual(list(range(1000)), sorted(item['id'] for item in items))
+
+    def test_003_concurrency(self):
+        endpoint = OffsetList(total=200, delay=0.05)
+        session, _ = mock_session(endpoint, concurrent_requests=5)
+        start = time.perf_counter()
+        items = list(session.follow_pagination(url=session.ep('numbers'), params={'max': 10}, parallel=10))
+        duration = time.perf_counter() - start
+        self.assertEqual(200, len(items))
+        # bound by the concurrency limit of the session
+        self.assertEqual(5, endpoint.max_running)
+        # serially this would take at least 20 * 0.05 s
+        self.assertLess(duration, 0.7)
+
+    def test_004_cursor_falls_back_to_serial(self):
+        session, adapter = mock_session(paged_handler, concurrent_requests=4, pagination_parallel=4)
+        items = list(session.follow_pagination(url=session.ep('people')))
+        self.assertEqual(EXPECTED, [item['id'] for item in items])
+        self.assertEqual(PAGES, len(adapter.requests))
+
+
+def people_handler(request: PreparedRequest):
+    items = [
+        {
+            'id': f'id{i}',
+            'emails': [f'user{i}@example.com'],
+            'displayName': f'User {i}',
+            'created': '2024-01-02T03:04:05Z',
+        }
+        for i in range(3)
+    ]
+    return 200, {}, {'items': items}
+
+
+class TestItemMode(TestCase):
+    def test_001_modes(self):
+        session, _ = mock_session(people_handler)
+        url = session.ep('people')
+        validated = list(session.follow_pagination(url=url, model=Person))
+        self.assertTrue(all(isinstance(p, Person) for p in validated))
+
+        raw = list(session.follow_pagination(url=url, model=Person, item_mode=ItemMode.raw))
+        self.assertEqual('User 0', raw[0]['displayName'])
+
+        constructed = list(session.follow_pagination(url=url, model=Person, item_mode='construct'))
+        self.assertEqual('User 0', constructed[0].display_name)
+        # no validation: no conversion to datetime
+        self.assertEqual('2024-01-02T03:04:05Z', constructed[0].created)
+
+        lazy = list(session.follow_pagination(url=url, model=Person, item_mode=ItemMode.lazy))
+        self.assertIsInstance(lazy[0], LazyModel)
+        self.assertIn('not validated', repr(lazy[0]))
+        self.assertEqual('User 0', lazy[0].lazy_data['displayName'])
+        self.assertIn('not validated', repr(lazy[0]))
+        self.assertEqual(validated[0].created, lazy[0].created)
+        self.assertIsInstance(lazy[0].lazy_object, Person)
+        self.assertEqual(validated, lazy)
+
+    def test_002_context(self):
+        session, _ = mock_session(people_handler)
+        with item_mode(ItemMode.raw):
+            people = session.follow_pagination(url=session.ep('people'), model=Person)
+        # mode is determined when the generator is created
+        self.assertIsInstance(next(people), dict)
+
+    def test_003_async_context(self):
+        async def source():
+            yield [{'id': 'id0', 'emails': ['user@example.com'], 'displayName': 'User'}]
+
+        async def test():
+            with item_mode('lazy'):
+                return [p async for p in as_iter_items(source(), item_converter(Person))]
+
+        people = asyncio.run(test())
+        self.assertIsInstance(people[0], LazyModel)
+        self.assertEqual('User', people[0].display_name)
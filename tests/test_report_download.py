@@ -0,0 +1,116 @@
+"""
+Offline tests for streaming report downloads
+"""
+
+import asyncio
+import csv
+import io
+import zipfile
+from threading import current_thread, main_thread
+from unittest import TestCase
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsReportsApi
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.reports import CallingCDR
+from wxc_sdk.tokens import Tokens
+
+ROWS = 2000
+
+
+def report() -> bytes:
+    """
+    ZIP file with a CSV file with UTF BOM, like a Calling Detailed Call History report
+    """
+    text = io.StringIO(newline='')
+    writer = csv.writer(text)
+    writer.writerow(['Start time', 'Duration', 'Answered', 'Call type', 'Local SessionID', 'Calling number'])
+    for i in range(ROWS):
+        writer.writerow(['2024-05-01T10:00:00.000Z', i, 'true', 'SIP_NATIONAL', f's{i}', f'+1408555{i:04}'])
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('report.csv', '\ufeff' + text.getvalue())
+    return buffer.getvalue()
+
+
+REPORT = report()
+URL = 'https://reportdownload-a.webex.com/api?reportId=r1'
+
+
+class TestDownload(TestCase):
+    def setUp(self):
+        self.authorization = []
+
+        def handler(request: PreparedRequest):
+            self.authorization.append(request.headers.get('Authorization'))
+            return 200, {}, REPORT
+
+        session, _ = mock_session(handler)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_rows(self):
+        # small chunks and spool size: the report is written to a temporary file
+        rows = list(self.api.reports.download(URL, chunk_size=1000, spool_size=4096))
+        self.assertEqual(ROWS, len(rows))
+        self.assertEqual('Start time', next(iter(rows[0])))
+        self.assertEqual(
+            {'Duration': '7', 'Local SessionID': 's7'}, {k: rows[7][k] for k in ('Duration', 'Local SessionID')}
+        )
+        self.assertEqual(['Bearer token'], self.authorization)
+
+    def test_002_cdrs(self):
+        cdrs = list(self.api.reports.download_cdrs(URL))
+        self.assertEqual(ROWS, len(cdrs))
+        self.assertIsInstance(cdrs[0], CallingCDR)
+        self.assertEqual(7, cdrs[7].duration)
+        self.assertEqual('s7', cdrs[7].local_session_id)
+        self.assertTrue(cdrs[7].answered)
+
+
+class TestAsDownload(TestCase):
+    def test_001_download(self):
+        async def handler(request: web.Request) -> web.StreamResponse:
+            # send the report in small chunks
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for i in range(0, len(REPORT), 1000):
+                await response.write(REPORT[i : i + 1000])
+            await response.write_eof()
+            return response
+
+        async def test():
+            app = web.Application()
+            app.router.add_get('/api', handler)
+            async with TestServer(app) as server:
+                url = str(server.make_url('/api?reportId=r1'))
+                async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=1) as session:
+                    api = AsReportsApi(session=session)
+                    rows = [row async for row in api.download_gen(url, chunk_size=512, spool_size=4096)]
+                    with patch.object(CallingCDR, 'parse_records', side_effect=parse_records) as parser:
+                        cdrs = await api.download_cdrs(url)
+                    parser.assert_called_once()
+            return rows, cdrs
+
+        # CDRs are parsed by the shared parser in a worker thread, not on the event loop
+        parse_threads = set()
+        original = CallingCDR.parse_records
+
+        def parse_records(records):
+            for cdr in original(records):
+                parse_threads.add(current_thread())
+                yield cdr
+
+        rows, cdrs = asyncio.run(test())
+        self.assertTrue(parse_threads)
+        self.assertNotIn(main_thread(), parse_threads)
+        self.assertEqual(ROWS, len(rows))
+        self.assertEqual('s7', rows[7]['Local SessionID'])
+        self.assertEqual(ROWS, len(cdrs))
+        self.assertIsInstance(cdrs[0], CallingCDR)
+        self.assertEqual(7, cdrs[7].duration)
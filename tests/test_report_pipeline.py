@@ -0,0 +1,149 @@
+"""
+Offline tests for the report pipeline
+"""
+
+import csv
+import io
+import json
+import zipfile
+from datetime import date
+from threading import Lock
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.report_pipeline import ReportPipeline, ReportRequest
+from wxc_sdk.reports import CallingCDR
+
+RUN = {'min_interval': 0.001, 'max_interval': 0.005}
+
+
+def report(report_id: str, rows: int) -> bytes:
+    """
+    ZIP file with a CSV file with UTF BOM
+    """
+    text = io.StringIO(newline='')
+    writer = csv.writer(text)
+    writer.writerow(['Start time', 'Duration', 'Local SessionID'])
+    for i in range(rows):
+        writer.writerow(['2024-05-01T10:00:00.000Z', i, f'{report_id}-{i}'])
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zip_file:
+        zip_file.writestr('report.csv', '\ufeff' + text.getvalue())
+    return buffer.getvalue()
+
+
+class Service:
+    """
+    Simulated report service: report N is ready after N + 1 status polls and has 10 * (N + 1) rows
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        # report ID -> remaining polls
+        self.pending: dict[str, int] = {}
+        self.created: list[dict] = []
+        self.deleted: list[str] = []
+        self.polls = 0
+        # templates for which reports fail
+        self.failing: set[int] = set()
+
+    def handler(self, request: PreparedRequest):
+        url = urlparse(request.url)
+        if url.hostname.startswith('reportdownload'):
+            report_id = parse_qs(url.query)['reportId'][0]
+            return 200, {}, report(report_id, 10 * (int(report_id[1:]) + 1))
+        report_id = url.path.removeprefix('/v1/reports').strip('/')
+        with self.lock:
+            if request.method == 'POST':
+                body = json.loads(request.body)
+                report_id = f'r{len(self.created)}'
+                self.created.append(body)
+                self.pending[report_id] = len(self.created)
+                return 200, {}, {'items': {'Id': report_id}}
+            if request.method == 'DELETE':
+                self.deleted.append(report_id)
+                return 204, {}, {}
+            self.polls += 1
+            template_id = self.created[int(report_id[1:])]['templateId']
+            details = {'Id': report_id, 'templateId': template_id, 'status': 'In progress'}
+            if template_id in self.failing:
+                details['status'] = 'failed'
+            else:
+                self.pending[report_id] -= 1
+                if not self.pending[report_id]:
+                    details['status'] = 'done'
+                    details['downloadURL'] = f'https://reportdownload-a.webex.com/api?reportId={report_id}'
+            return 200, {}, {'items': [details]}
+
+
+class TestReportPipeline(TestCase):
+    def setUp(self):
+        self.service = Service()
+        session, _ = mock_session(self.service.handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+        self.requests = ReportRequest.for_templates(
+            [1, 2], [(date(2024, 5, 1), date(2024, 5, 1)), (date(2024, 5, 2), date(2024, 5, 2))]
+        )
+
+    def test_001_rows(self):
+        self.assertEqual(
+            [(1, date(2024, 5, 1)), (1, date(2024, 5, 2)), (2, date(2024, 5, 1)), (2, date(2024, 5, 2))],
+            [(r.template_id, r.start_date) for r in self.requests],
+        )
+        pipeline = ReportPipeline(api=self.api, requests=self.requests)
+        rows = list(pipeline.run(**RUN))
+        self.assertEqual(10 + 20 + 30 + 40, len(rows))
+        # reports are yielded in the order in which they are ready
+        self.assertEqual(['r0', 'r1', 'r2', 'r3'], list(dict.fromkeys(task.report_id for task, _ in rows)))
+        self.assertEqual('r2-7', rows[30 + 7][1]['Local SessionID'])
+        self.assertEqual(['completed'] * 4, [task.state for task in pipeline.tasks])
+        # reports are created concurrently: report IDs don't follow the order of the requests
+        tasks = sorted(pipeline.tasks, key=lambda t: t.report_id)
+        self.assertEqual([1, 2, 3, 4], [task.polls for task in tasks])
+        self.assertEqual([10, 20, 30, 40], [task.rows for task in tasks])
+        self.assertEqual(
+            [(1, '2024-05-01'), (1, '2024-05-02'), (2, '2024-05-01'), (2, '2024-05-02')],
+            sorted((body['templateId'], body['startDate']) for body in self.service.created),
+        )
+        self.assertEqual(['r0', 'r1', 'r2', 'r3'], self.service.deleted)
+
+    def test_002_parser(self):
+        requests = ReportRequest.for_templates([1], [(None, None)], parser=CallingCDR.parse_records)
+        cdrs = [cdr for _, cdr in ReportPipeline(api=self.api, requests=requests).run(**RUN)]
+        self.assertEqual(10, len(cdrs))
+        self.assertIsInstance(cdrs[0], CallingCDR)
+        self.assertEqual(7, cdrs[7].duration)
+
+    def test_003_failed(self):
+        self.service.failing = {2}
+        pipeline = ReportPipeline(api=self.api, requests=self.requests, delete=False)
+        rows = list(pipeline.run(**RUN))
+        self.assertEqual(['completed', 'completed', 'failed', 'failed'], [task.state for task in pipeline.tasks])
+        self.assertEqual('report status: failed', pipeline.tasks[2].error)
+        self.assertEqual(0, pipeline.tasks[2].rows)
+        self.assertEqual(len(rows), sum(task.rows for task in pipeline.tasks))
+        self.assertEqual([], self.service.deleted)
+
+    def test_004_timeout(self):
+        pipeline = ReportPipeline(api=self.api, requests=self.requests)
+        # only one round of status polls before the timeout
+        list(pipeline.run(timeout=0.05, min_interval=10, max_interval=10))
+        # r0 is ready after one poll; the others time out and are deleted anyway
+        tasks = sorted(pipeline.tasks, key=lambda t: t.report_id)
+        self.assertEqual(['completed', 'failed', 'failed', 'failed'], [task.state for task in tasks])
+        self.assertIsInstance(tasks[1].exception, TimeoutError)
+        self.assertEqual(['r0', 'r1', 'r2', 'r3'], sorted(self.service.deleted))
+
+    def test_005_abort(self):
+        pipeline = ReportPipeline(api=self.api, requests=self.requests)
+        run = pipeline.run(**RUN)
+        task, _ = next(run)
+        self.assertEqual('r0', task.report_id)
+        # stopping the iteration deletes all reports
+        run.close()
+        self.assertEqual(['r0', 'r1', 'r2', 'r3'], sorted(self.service.deleted))
+        self.assertTrue(all(task.deleted for task in pipeline.tasks))
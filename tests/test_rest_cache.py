@@ -0,0 +1,120 @@
+"""
+Offline tests for the response cache of the REST sessions
+"""
+
+from unittest import TestCase
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.cache import CacheRule, ResponseCache
+
+
+class Locations:
+    """
+    Mock for the locations endpoints
+    """
+
+    def __init__(self, etag: str = None):
+        self.etag = etag
+        self.name = 'HQ'
+
+    def __call__(self, request: PreparedRequest):
+        if request.method == 'PUT':
+            self.name = 'new name'
+            return 204, {}, None
+        if self.etag:
+            if request.headers.get('If-None-Match') == self.etag:
+                return 304, {'ETag': self.etag}, None
+            return 200, {'ETag': self.etag}, {'items': [{'id': 'l1', 'name': self.name}]}
+        return 200, {}, {'items': [{'id': 'l1', 'name': self.name}]}
+
+
+class TestResponseCache(TestCase):
+    def test_001_hit(self):
+        session, adapter = mock_session(Locations(), cache=True)
+        url = session.ep('locations')
+        first = session.rest_get(url=url)
+        second = session.rest_get(url=url)
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(adapter.requests))
+        # different parameters -> different cache entry
+        session.rest_get(url=url, params={'name': 'HQ'})
+        self.assertEqual(2, len(adapter.requests))
+        self.assertEqual(1, session.cache.hits)
+
+    def test_002_callers_get_copies(self):
+        session, _ = mock_session(Locations(), cache=True)
+        url = session.ep('locations')
+        session.rest_get(url=url)['items'].clear()
+        data = session.rest_get(url=url)
+        data['items'].clear()
+        self.assertEqual(1, len(session.rest_get(url=url)['items']))
+
+    def test_003_not_cached(self):
+        session, adapter = mock_session(Locations(), cache=True)
+        url = session.ep('people')
+        session.rest_get(url=url)
+        session.rest_get(url=url)
+        self.assertEqual(2, len(adapter.requests))
+
+    def test_004_invalidate_on_update(self):
+        session, adapter = mock_session(Locations(), cache=True)
+        session.rest_get(url=session.ep('locations'))
+        session.rest_get(url=session.ep('locations/l1'))
+        session.rest_get(url=session.ep('telephony/config/supportedDevices'))
+        self.assertEqual(3, len(session.cache))
+        session.rest_put(url=session.ep('locations/l1'), json={'name': 'new name'})
+        # item and collection are invalidated
+        self.assertEqual(1, len(session.cache))
+        data = session.rest_get(url=session.ep('locations'))
+        self.assertEqual('new name', data['items'][0]['name'])
+        self.assertEqual(5, len(adapter.requests))
+
+    def test_005_etag(self):
+        cache = ResponseCache(rules=[CacheRule('locations', ttl=0)])
+        session, adapter = mock_session(Locations(etag='"v1"'), cache=cache)
+        url = session.ep('locations')
+        first = session.rest_get(url=url)
+        second = session.rest_get(url=url)
+        self.assertEqual(first, second)
+        self.assertEqual(2, len(adapter.requests))
+        self.assertEqual('"v1"', adapter.requests[1][1].headers['If-None-Match'])
+        self.assertEqual(1, cache.revalidated)
+
+    def test_006_lru(self):
+        cache = ResponseCache(rules=[CacheRule('locations/*', ttl=60)], max_entries=2)
+        session, adapter = mock_session(Locations(), cache=cache)
+        for location_id in ('l1', 'l2', 'l1', 'l3', 'l1', 'l2'):
+            session.rest_get(url=session.ep(f'locations/{location_id}'))
+        # l2 was evicted when l3 was added
+        self.assertEqual(['l1', 'l2', 'l3', 'l2'], [r.url.split('/')[-1] for _, r in adapter.requests])
+        self.assertEqual(2, len(cache))
+
+    def test_007_shared_cache_per_token(self):
+        cache = ResponseCache()
+        session1, adapter1 = mock_session(Locations(), cache=cache)
+        session2, adapter2 = mock_session(Locations(), cache=cache)
+        session2._tokens.access_token = 'other token'
+        session1.rest_get(url=session1.ep('locations'))
+        session2.rest_get(url=session2.ep('locations'))
+        self.assertEqual(1, len(adapter1.requests))
+        self.assertEqual(1, len(adapter2.requests))
+        self.assertEqual(2, len(cache))
+
+    def test_008_pagination(self):
+        session, adapter = mock_session(Locations(), cache=True)
+        for _ in range(3):
+            self.assertEqual(['l1'], [loc['id'] for loc in session.follow_pagination(url=session.ep('locations'))])
+        self.assertEqual(1, len(adapter.requests))
+
+    def test_009_patterns(self):
+        cache = ResponseCache()
+        self.assertEqual(300, cache.ttl('locations/l1'))
+        # wildcards don't match across path segments
+        self.assertIsNone(cache.ttl('locations/l1/floors'))
+        cache = ResponseCache(rules=[CacheRule('locations/**', ttl=60), CacheRule('telephony/config/*/queues', ttl=5)])
+        self.assertEqual(60, cache.ttl('locations/l1/floors'))
+        self.assertEqual(60, cache.ttl('locations'))
+        self.assertEqual(5, cache.ttl('telephony/config/l1/queues'))
+        self.assertIsNone(cache.ttl('telephony/config/locations/l1/queues'))
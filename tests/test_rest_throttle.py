@@ -0,0 +1,202 @@
+"""
+Offline tests for the 429 backoff gate of the REST sessions
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.rest import RestError
+from wxc_sdk.throttle import AdaptiveConcurrency, AsAdaptiveConcurrency, AsBackoffGate, BackoffGate
+
+
+class TestBackoffGate(TestCase):
+    def test_001_close_and_wait(self):
+        gate = BackoffGate()
+        self.assertTrue(gate.is_open)
+        self.assertEqual(0.0, gate.wait())
+        gate.close_for(0.2)
+        self.assertFalse(gate.is_open)
+        waited = gate.wait()
+        self.assertTrue(gate.is_open)
+        self.assertGreaterEqual(waited, 0.15)
+        self.assertEqual(1, gate.throttled_responses)
+        self.assertAlmostEqual(0.2, gate.throttled_seconds, delta=0.05)
+        self.assertAlmostEqual(waited, gate.waited_seconds, delta=0.01)
+
+    def test_002_overlapping_backoff_is_not_counted_twice(self):
+        gate = BackoffGate()
+        gate.close_for(0.2)
+        # a 2nd, shorter, backoff doesn't extend the gate
+        gate.close_for(0.1)
+        gate.wait()
+        self.assertEqual(2, gate.throttled_responses)
+        self.assertAlmostEqual(0.2, gate.throttled_seconds, delta=0.05)
+
+    def test_003_async_gate(self):
+        async def test():
+            gate = AsBackoffGate()
+            gate.close_for(0.2)
+            waited = await asyncio.gather(*[gate.wait() for _ in range(5)])
+            return gate, waited
+
+        gate, waited = asyncio.run(test())
+        self.assertTrue(all(w >= 0.15 for w in waited))
+        self.assertEqual(0, gate.waiting)
+        self.assertAlmostEqual(sum(waited), gate.waited_seconds, delta=0.01)
+
+
+class TestSessionBackoff(TestCase):
+    def test_001_retry_after_429(self):
+        calls = []
+
+        def handler(request: PreparedRequest):
+            calls.append(request.url)
+            if len(calls) == 1:
+                return 429, {'Retry-After': '1'}, {'message': 'throttled', 'trackingId': 'x'}
+            return 200, {}, {'items': []}
+
+        session, adapter = mock_session(handler)
+        data = session.rest_get(url=session.ep('people'))
+        self.assertEqual({'items': []}, data)
+        self.assertEqual(2, len(adapter.requests))
+        self.assertGreaterEqual(adapter.requests[1][0] - adapter.requests[0][0], 0.9)
+        self.assertEqual(1, session.backoff.throttled_responses)
+
+    def test_002_slot_is_released_while_waiting(self):
+        """
+        While a request waits for the gate it doesn't hold a slot and no other request is sent
+        """
+        throttled = []
+
+        def handler(request: PreparedRequest):
+            if not throttled:
+                throttled.append(time.monotonic())
+                return 429, {'Retry-After': '1'}, {'message': 'throttled', 'trackingId': 'x'}
+            return 200, {}, {'id': 'foo'}
+
+        session, adapter = mock_session(handler, concurrent_requests=1)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(session.rest_get, url=session.ep('people/1'))
+            while not throttled:
+                time.sleep(0.01)
+            # the throttled request gave back its slot
+            self.assertTrue(session._sem.acquire(blocking=False))
+            session._sem.release()
+            others = [pool.submit(session.rest_get, url=session.ep(f'people/{i}')) for i in range(2, 5)]
+            results = [f.result() for f in [first] + others]
+        self.assertTrue(all(r == {'id': 'foo'} for r in results))
+        # no request was sent while the gate was closed
+        self.assertTrue(all(sent - throttled[0] >= 0.9 for sent, _ in adapter.requests[1:]))
+
+    def test_003_shared_gate(self):
+        gate = BackoffGate()
+        session1, _ = mock_session(lambda r: (200, {}, {}), backoff=gate)
+        session2, _ = mock_session(lambda r: (200, {}, {}), backoff=gate)
+        self.assertIs(session1.backoff, session2.backoff)
+
+    def test_004_no_retry(self):
+        session, adapter = mock_session(
+            lambda r: (429, {'Retry-After': '1'}, {'message': 'x', 'trackingId': 'x'}), retry_429=False
+        )
+        with self.assertRaises(RestError):
+            session.rest_get(url=session.ep('people'))
+        self.assertEqual(1, len(adapter.requests))
+        self.assertTrue(session.backoff.is_open)
+
+
+class TestAdaptiveConcurrency(TestCase):
+    def test_001_increase_while_saturated(self):
+        limiter = AdaptiveConcurrency(initial_limit=2, max_limit=4)
+        # not saturated: a single request in flight doesn't grow the limit
+        for _ in range(10):
+            with limiter:
+                limiter.record_success(0.1)
+        self.assertEqual(2, limiter.limit)
+        # saturated: all slots in use
+        for _ in range(20):
+            slots = limiter.limit
+            for _ in range(slots):
+                limiter.acquire()
+            limiter.record_success(0.1)
+            for _ in range(slots):
+                limiter.release()
+        self.assertEqual(4, limiter.limit)
+        self.assertEqual(['initial', 'increase', 'increase'], [c.reason for c in limiter.history])
+
+    def test_002_decrease_with_cooldown(self):
+        limiter = AdaptiveConcurrency(initial_limit=16, max_limit=16, cooldown=0.1)
+        limiter.record_congestion('throttled')
+        limiter.record_congestion('throttled')
+        self.assertEqual(8, limiter.limit)
+        time.sleep(0.15)
+        limiter.record_congestion('timeout')
+        self.assertEqual(4, limiter.limit)
+        self.assertEqual([16, 8, 4], [c.limit for c in limiter.history])
+        self.assertEqual('timeout', limiter.history[-1].reason)
+
+    def test_003_latency_degradation_stops_increase(self):
+        limiter = AdaptiveConcurrency(initial_limit=2, max_limit=10)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.record_success(0.1)
+        self.assertEqual(2, limiter.limit)
+        for _ in range(50):
+            limiter.record_success(5.0)
+        self.assertEqual(2, limiter.limit)
+
+    def test_004_blocks_at_limit(self):
+        limiter = AdaptiveConcurrency(initial_limit=2)
+        running = []
+        max_running = []
+
+        def work():
+            with limiter:
+                running.append(1)
+                max_running.append(len(running))
+                time.sleep(0.05)
+                running.pop()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: work(), range(8)))
+        self.assertEqual(2, max(max_running))
+
+    def test_005_async_limiter(self):
+        async def test():
+            limiter = AsAdaptiveConcurrency(initial_limit=2)
+            running = 0
+            max_running = 0
+
+            async def work():
+                nonlocal running, max_running
+                async with limiter:
+                    running += 1
+                    max_running = max(max_running, running)
+                    await asyncio.sleep(0.01)
+                    running -= 1
+
+            await asyncio.gather(*[work() for _ in range(10)])
+            return max_running, limiter
+
+        max_running, limiter = asyncio.run(test())
+        self.assertEqual(2, max_running)
+        self.assertEqual(0, limiter.in_flight)
+
+    def test_006_session_reports_429(self):
+        calls = []
+
+        def handler(request: PreparedRequest):
+            calls.append(request.url)
+            if len(calls) == 1:
+                return 429, {'Retry-After': '0'}, {'message': 'throttled', 'trackingId': 'x'}
+            return 200, {}, {}
+
+        session, _ = mock_session(handler, concurrent_requests=10, adaptive_concurrency=True)
+        self.assertIs(session._sem, session.adaptive_concurrency)
+        session.rest_get(url=session.ep('people'))
+        self.assertEqual(5, session.adaptive_concurrency.limit)
+        self.assertIsNotNone(session.adaptive_concurrency.latency)
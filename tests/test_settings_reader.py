@@ -0,0 +1,88 @@
+"""
+Offline tests for the bulk settings reader
+"""
+
+import time
+from threading import Lock
+from unittest import TestCase
+from urllib.parse import urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.person_settings.common import ApiSelector
+from wxc_sdk.person_settings.dnd import DND
+from wxc_sdk.rest import RestError
+from wxc_sdk.settings_reader import SettingsReader
+
+
+class TestSettingsReader(TestCase):
+    def setUp(self):
+        self.lock = Lock()
+        self.running = 0
+        self.max_running = 0
+        self.paths: list[str] = []
+
+        def handler(request: PreparedRequest):
+            path = urlparse(request.url).path.removeprefix('/v1/')
+            with self.lock:
+                self.paths.append(path)
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            time.sleep(0.01)
+            with self.lock:
+                self.running -= 1
+            entity_id = path.split('/')[-3] if '/features/' in path else path.split('/')[-2]
+            if entity_id == 'bad' and path.endswith('doNotDisturb'):
+                return 404, {}, {'message': 'not found', 'trackingId': 'x'}
+            if path.endswith('doNotDisturb'):
+                return 200, {}, {'enabled': entity_id == 'e1', 'ringSplashEnabled': False}
+            return 200, {}, {'enabled': True}
+
+        session, _ = mock_session(handler, concurrent_requests=3)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+
+    def test_001_people(self):
+        reader = SettingsReader(api=self.api)
+        table = reader.read(entity_ids=['e1', 'e2', 'bad', 'e1'], features=['dnd', 'call_waiting'])
+        self.assertEqual(3, self.max_running)
+        self.assertEqual(6, len(self.paths))
+        self.assertTrue(all(path.startswith('people/') for path in self.paths))
+        self.assertEqual(['e1', 'e2', 'bad'], table.entity_ids)
+        self.assertEqual(['dnd', 'call_waiting'], table.features)
+        self.assertEqual([True, True, True], table.columns['call_waiting'])
+        self.assertIsInstance(table.cell('e1', 'dnd'), DND)
+        self.assertEqual([True, False], [dnd.enabled for dnd in table.columns['dnd'][:2]])
+        self.assertIsInstance(table.cell('bad', 'dnd'), RestError)
+        self.assertFalse(table.ok)
+        self.assertTrue(table.ok_row('e2'))
+        self.assertFalse(table.ok_row('bad'))
+        self.assertEqual([('bad', 'dnd')], [(entity_id, feature) for entity_id, feature, _ in table.errors()])
+        self.assertEqual(['e1', 'e2', 'bad'], [entity_id for entity_id, _ in table.rows()])
+        self.assertEqual({'dnd', 'call_waiting'}, set(table.row('e2')))
+
+    def test_002_workspaces_and_virtual_lines(self):
+        reader = SettingsReader(api=self.api)
+        table = reader.read(entity_ids=['w1'], features=['dnd'], selector=ApiSelector.workspace, org_id='o1')
+        self.assertTrue(table.ok)
+        self.assertEqual(['telephony/config/workspaces/w1/doNotDisturb'], self.paths)
+        self.paths.clear()
+        table = reader.read(entity_ids=['v1'], features=['dnd'], selector=ApiSelector.virtual_line)
+        self.assertTrue(table.ok)
+        self.assertEqual(['telephony/config/virtualLines/v1/doNotDisturb'], self.paths)
+
+    def test_003_invalid_features(self):
+        reader = SettingsReader(api=self.api)
+        self.assertIn('forwarding', reader.features())
+        self.assertNotIn('hoteling', reader.features(ApiSelector.workspace))
+        with self.assertRaises(ValueError):
+            # not available for workspaces
+            reader.read(entity_ids=['w1'], features=['hoteling'], selector=ApiSelector.workspace)
+        with self.assertRaises(ValueError):
+            # no read() method
+            reader.read(entity_ids=['p1'], features=['schedules'])
+        with self.assertRaises(ValueError):
+            # read() doesn't take an org_id
+            reader.read(entity_ids=['p1'], features=['feature_access'], org_id='o1')
+        self.assertEqual([], self.paths)
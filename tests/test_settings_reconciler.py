@@ -0,0 +1,101 @@
+"""
+Offline tests for the settings reconciler
+"""
+
+import json
+from unittest import TestCase
+from urllib.parse import urlparse
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.person_settings.common import ApiSelector
+from wxc_sdk.person_settings.dnd import DND
+from wxc_sdk.settings_reconciler import FieldDiff, SettingsReconciler
+
+
+class TestSettingsReconciler(TestCase):
+    def setUp(self):
+        # current state: path -> settings
+        self.state: dict[str, dict] = {}
+        for i in range(20):
+            self.state[f'people/p{i}/features/callWaiting'] = {'enabled': i != 3}
+            self.state[f'people/p{i}/features/doNotDisturb'] = {'enabled': i in (5, 7), 'ringSplashEnabled': True}
+        self.writes: list[tuple[str, dict]] = []
+
+        def handler(request: PreparedRequest):
+            path = urlparse(request.url).path.removeprefix('/v1/')
+            if path not in self.state:
+                return 404, {}, {'message': 'not found', 'trackingId': 'x'}
+            if request.method == 'PUT':
+                body = json.loads(request.body)
+                self.writes.append((path, body))
+                self.state[path].update(body)
+                return 204, {}, {}
+            return 200, {}, self.state[path]
+
+        session, _ = mock_session(handler, concurrent_requests=4)
+        self.api = WebexSimpleApi(tokens='token', session=session)
+        self.person_ids = [f'p{i}' for i in range(20)]
+
+    def test_001_dry_run(self):
+        reconciler = SettingsReconciler(api=self.api)
+        report = reconciler.reconcile(
+            entity_ids=self.person_ids + ['missing'],
+            desired={'call_waiting': True, 'dnd': DND(enabled=False)},
+            dry_run=True,
+        )
+        self.assertEqual([], self.writes)
+        self.assertEqual(40, report.compared)
+        self.assertEqual(37, report.unchanged)
+        self.assertEqual(
+            [('p3', 'call_waiting'), ('p5', 'dnd'), ('p7', 'dnd')],
+            sorted((c.entity_id, c.feature) for c in report.changes),
+        )
+        change = next(c for c in report.changes if c.entity_id == 'p5')
+        self.assertEqual([FieldDiff(path='enabled', current=True, desired=False)], change.diff)
+        # not set in the desired state: kept from the current setting
+        self.assertTrue(change.setting.ring_splash_enabled)
+        self.assertEqual({('missing', 'call_waiting'), ('missing', 'dnd')}, {e[:2] for e in report.read_errors})
+        self.assertEqual([], report.written)
+        self.assertFalse(report.ok)
+
+    def test_002_write_changes_only(self):
+        reconciler = SettingsReconciler(api=self.api)
+        desired = {'call_waiting': True, 'dnd': DND(enabled=False)}
+        report = reconciler.reconcile(entity_ids=self.person_ids, desired=desired)
+        self.assertTrue(report.ok)
+        self.assertEqual(3, len(report.written))
+        self.assertEqual(
+            [
+                ('people/p3/features/callWaiting', {'enabled': True}),
+                ('people/p5/features/doNotDisturb', {'enabled': False, 'ringSplashEnabled': True}),
+                ('people/p7/features/doNotDisturb', {'enabled': False, 'ringSplashEnabled': True}),
+            ],
+            sorted(self.writes),
+        )
+        # a re-run doesn't write anything
+        self.writes.clear()
+        report = reconciler.reconcile(entity_ids=self.person_ids, desired=desired)
+        self.assertEqual(40, report.unchanged)
+        self.assertEqual([], report.changes)
+        self.assertEqual([], self.writes)
+
+    def test_003_per_entity_and_features(self):
+        reconciler = SettingsReconciler(api=self.api)
+        self.assertIn('forwarding', reconciler.features())
+        self.assertIn('voicemail', reconciler.features(ApiSelector.virtual_line))
+        # configure() doesn't take the type returned by read()
+        self.assertNotIn('caller_id', reconciler.features())
+        with self.assertRaises(ValueError):
+            reconciler.reconcile(entity_ids=self.person_ids, desired={'caller_id': None})
+        # only enable DND for p1; leave all others unchanged
+        report = reconciler.reconcile(
+            entity_ids=self.person_ids,
+            desired={'dnd': lambda person_id: DND(enabled=True) if person_id == 'p1' else None},
+        )
+        self.assertEqual(1, report.compared)
+        self.assertEqual(
+            [('people/p1/features/doNotDisturb', {'enabled': True, 'ringSplashEnabled': True})], self.writes
+        )
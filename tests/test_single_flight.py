@@ -0,0 +1,90 @@
+"""
+Offline tests for single-flight of identical GET requests
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest import TestCase
+
+from requests import PreparedRequest
+
+from tests.rest_mock import mock_session
+from wxc_sdk.rest import RestError
+from wxc_sdk.single_flight import AsSingleFlight
+
+
+def slow_handler(request: PreparedRequest):
+    time.sleep(0.2)
+    if 'fail' in request.url:
+        return 404, {}, {'message': 'not found', 'trackingId': 'x'}
+    return 200, {}, {'id': 'q1', 'agents': [{'id': 'a1'}]}
+
+
+class TestSingleFlight(TestCase):
+    def concurrent_get(self, session, urls: list[str]) -> list:
+        barrier = Barrier(len(urls))
+
+        def get(url: str):
+            barrier.wait()
+            try:
+                return session.rest_get(url=url)
+            except RestError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            return list(pool.map(get, urls))
+
+    def test_001_shared(self):
+        session, adapter = mock_session(slow_handler, concurrent_requests=10, single_flight=True)
+        results = self.concurrent_get(session, [session.ep('queues/q1')] * 8)
+        self.assertEqual(1, len(adapter.requests))
+        self.assertEqual(7, session.single_flight.shared)
+        self.assertEqual(0, session.single_flight.in_flight)
+        # each caller has its own copy
+        results[0]['agents'].clear()
+        self.assertTrue(all(r['agents'] == [{'id': 'a1'}] for r in results[1:]))
+        self.assertEqual(len(results), len({id(r) for r in results}))
+
+    def test_002_not_shared(self):
+        session, adapter = mock_session(slow_handler, concurrent_requests=10)
+        self.concurrent_get(session, [session.ep('queues/q1')] * 4)
+        self.assertEqual(4, len(adapter.requests))
+
+    def test_003_different_urls(self):
+        session, adapter = mock_session(slow_handler, concurrent_requests=10, single_flight=True)
+        self.concurrent_get(session, [session.ep(f'queues/q{i % 2}') for i in range(6)])
+        self.assertEqual(2, len(adapter.requests))
+
+    def test_004_error(self):
+        session, adapter = mock_session(slow_handler, concurrent_requests=10, single_flight=True)
+        results = self.concurrent_get(session, [session.ep('queues/fail')] * 4)
+        self.assertEqual(1, len(adapter.requests))
+        self.assertTrue(all(isinstance(r, RestError) for r in results))
+
+    def test_005_async(self):
+        calls = []
+
+        async def request():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return 'response', {'items': [1, 2, 3]}
+
+        async def test():
+            flights = AsSingleFlight()
+            leader = asyncio.create_task(flights.run('key', request))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(flights.run('key', request)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            # cancelling the leader doesn't affect the followers
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            return flights, results
+
+        flights, results = asyncio.run(test())
+        self.assertEqual(1, len(calls))
+        self.assertEqual(3, flights.shared)
+        results[0][1]['items'].clear()
+        self.assertEqual([1, 2, 3], results[1][1]['items'])
+        self.assertEqual(0, flights.in_flight)
@@ -0,0 +1,136 @@
+"""
+Offline tests for the sync facade over the async API; requests are sent to a local aiohttp server
+"""
+
+import asyncio
+import gc
+import warnings
+from threading import Thread
+from unittest import TestCase
+
+from aiohttp import web
+
+from wxc_sdk.as_rest import AsRestError
+from wxc_sdk.people import Person
+from wxc_sdk.sync_facade import SyncWebexSimpleApi
+
+
+class Server:
+    """
+    Local HTTP server answering people requests
+    """
+
+    def __init__(self):
+        self.max_concurrent = 0
+        self._concurrent = 0
+        self.loop = asyncio.new_event_loop()
+        self.port = 0
+        self._runner = None
+        self._thread = Thread(target=self.loop.run_forever, daemon=True)
+
+    async def person(self, request: web.Request) -> web.Response:
+        self._concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self._concurrent)
+        await asyncio.sleep(0.02)
+        self._concurrent -= 1
+        person_id = request.match_info['person_id']
+        if person_id == 'missing':
+            return web.json_response({'message': 'not found', 'trackingId': 'x'}, status=404)
+        return web.json_response({'id': person_id, 'displayName': f'User {person_id}'})
+
+    async def people(self, request: web.Request) -> web.Response:
+        return web.json_response({'items': [{'id': f'p{i}', 'displayName': f'User {i}'} for i in range(5)]})
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/v1/people', self.people)
+        app.router.add_get('/v1/people/{person_id}', self.person)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+class TestSyncFacade(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = Server()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.max_concurrent = 0
+        self.api = SyncWebexSimpleApi(tokens='token', concurrent_requests=5)
+        self.api.async_api.session.BASE = f'http://127.0.0.1:{self.server.port}/v1'
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_001_call(self):
+        person = self.api.people.details(person_id='p1')
+        self.assertIsInstance(person, Person)
+        self.assertEqual('User p1', person.display_name)
+        with self.assertRaises(AsRestError) as ctx:
+            self.api.people.details(person_id='missing')
+        self.assertEqual(404, ctx.exception.status)
+
+    def test_002_list(self):
+        people = self.api.people.list()
+        self.assertEqual([f'p{i}' for i in range(5)], [p.person_id for p in people])
+        people_gen = self.api.people.list_gen()
+        self.assertEqual('p0', next(people_gen).person_id)
+        self.assertEqual(4, len(list(people_gen)))
+
+    def test_003_batch(self):
+        ids = [f'p{i}' for i in range(20)]
+        people = self.api.people.details.batch(ids)
+        self.assertEqual(ids, [p.person_id for p in people])
+        # bounded by the concurrency limit of the session
+        self.assertEqual(5, self.server.max_concurrent)
+        people = self.api.people.details.batch([dict(person_id='p1'), ('missing',)], return_exceptions=True)
+        self.assertEqual('p1', people[0].person_id)
+        self.assertIsInstance(people[1], AsRestError)
+        with self.assertRaises(AsRestError):
+            self.api.people.details.batch(['p1', 'missing', 'p2'])
+
+    def test_004_facade_batch_and_run(self):
+        async_api = self.api.async_api
+        people = self.api.batch(lambda person_id: async_api.people.details(person_id=person_id), ['p1', 'p2'])
+        self.assertEqual(['p1', 'p2'], [p.person_id for p in people])
+        self.assertEqual('p3', self.api.run(async_api.people.details(person_id='p3')).person_id)
+
+    def test_005_child_apis(self):
+        self.assertEqual(self.api.async_api.session.access_token, self.api.access_token)
+        # child APIs are proxies; model classes and other attributes are returned as is
+        self.assertEqual('people', self.api.people.base)
+        self.assertIs(self.api.people, self.api.people)
+        self.assertTrue(callable(self.api.person_settings.caller_id.read))
+
+    def test_006_loop_thread(self):
+        async def call_from_loop():
+            self.api.people.details(person_id='p1')
+
+        async def run_from_loop():
+            self.api.run(self.api.async_api.people.details(person_id='p1'))
+
+        for call in (call_from_loop, run_from_loop):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                with self.assertRaises(RuntimeError):
+                    self.api.run(call())
+                gc.collect()
+            # no coroutine is left behind without being awaited
+            self.assertEqual([], [str(w.message) for w in caught if issubclass(w.category, RuntimeWarning)])
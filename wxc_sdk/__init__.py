@@ -10,6 +10,7 @@ from typing import Any, Optional, Self
 from .admin_audit import AdminAuditEventsApi
 from .attachment_actions import AttachmentActionsApi
 from .authorizations import AuthorizationsApi
+from .bulk import BulkExecutor
 from .cdr import DetailedCDRApi
 from .converged_recordings import ConvergedRecordingsApi
 from .device_configurations import DeviceConfigurationsApi
@@ -17,6 +18,7 @@ from .devices import DevicesApi
 from .events import EventsApi
 from .groups import GroupsApi
 from .guests import GuestManagementApi
+from .job_waiter import JobWaiter
 from .licenses import LicensesApi
 from .locations import LocationsApi
 from .me import MeSettingsApi
@@ -66,6 +68,8 @@ class WebexSimpleApi:
     attachment_actions: AttachmentActionsApi
     #: Authorizations API :class:`authorizations.AuthorizationsApi`
     authorizations: AuthorizationsApi
+    #: bounded parallel execution of one operation for many items :class:`bulk.BulkExecutor`
+    bulk: BulkExecutor
     #: CDR API :class:`cdr.DetailedCDRApi`
     cdr: DetailedCDRApi
     #: converged recordings API :class:`converged_recordings.ConvergedRecordingsApi`
@@ -82,6 +86,8 @@ class WebexSimpleApi:
     guests: GuestManagementApi
     #: jobs API: :class:`telephony.jobs.JobsApi`
     jobs: JobsApi
+    #: wait for jobs to complete :class:`job_waiter.JobWaiter`
+    job_waiter: JobWaiter
     #: Licenses API :class:`licenses.LicensesApi`
     licenses: LicensesApi
     #: Location API :class:`locations.LocationsApi`
@@ -181,6 +187,7 @@ class WebexSimpleApi:
         self.admin_audit = AdminAuditEventsApi(session=session)
         self.attachment_actions = AttachmentActionsApi(session=session)
         self.authorizations = AuthorizationsApi(session=session)
+        self.bulk = BulkExecutor(session=session)
         self.cdr = DetailedCDRApi(session=session)
         self.converged_recordings = ConvergedRecordingsApi(session=session)
         self.device_configurations = DeviceConfigurationsApi(session=session)
@@ -189,6 +196,7 @@ class WebexSimpleApi:
         self.groups = GroupsApi(session=session)
         self.guests = GuestManagementApi(session=session)
         self.jobs = JobsApi(session=session)
+        self.job_waiter = JobWaiter(session=session)
         self.licenses = LicensesApi(session=session)
         self.locations = LocationsApi(session=session)
         self.me = MeSettingsApi(session=session)
@@ -3,6 +3,7 @@ from wxc_sdk.attachment_actions import AttachmentAction, AttachmentActionData
 from wxc_sdk.authorizations import Authorization, AuthorizationType
 from wxc_sdk.base import ApiModel, ApiModelType, ApiModelWithErrors, CodeAndReason, E164Number, \
     RETRY_429_MAX_WAIT, SafeEnum, StrOrDict, dt_iso_str, enum_str, plus1, to_camel, webex_id_to_uuid
+from wxc_sdk.bulk import BulkExecutor, BulkProgress, BulkReport, BulkResult, RetryOn
 from wxc_sdk.cdr import CDR, CDRCallType, CDRClientType, CDRDirection, CDROriginalReason, CDRRedirectReason, \
     CDRRelatedReason, CDRUserType
 from wxc_sdk.common import AcdCustomization, AlternateNumber, AnnAudioFile, AnnouncementLevel, \
@@ -39,6 +40,7 @@ from wxc_sdk.devices import ActivationCodeResponse, ConnectionStatus, Device, Li
 from wxc_sdk.events import ComplianceEvent, EventData, EventResource, EventType, Recipient
 from wxc_sdk.groups import Group, GroupMember
 from wxc_sdk.guests import Guest
+from wxc_sdk.job_waiter import JobWaiter, WatchedJob
 from wxc_sdk.licenses import License, LicenseProperties, LicenseRequest, LicenseRequestOperation, LicenseUser, \
     LicenseUserType, SiteAccountType, SiteResponse, SiteType, SiteUrlsRequest, UserLicensesResponse
 from wxc_sdk.locations import Floor, Location, LocationAddress
@@ -310,45 +312,45 @@ __all__ = ['AcdCustomization', 'Action', 'ActionToBePerformed', 'ActionToBePerfo
            'BaseStationDetail', 'BaseStationResponse', 'BaseStationResult', 'BaseStationsResponse', 'BehaviorType',
            'BlockContiguousSequences', 'BlockPreviousPasscodes', 'BlockRepeatedDigits', 'BlockingDisableCalling',
            'BlockingUnlessForced', 'BluetoothMode', 'BluetoothSetting', 'BreakoutSession', 'BulkErrorResponse',
-           'BulkMethod', 'BulkOperation', 'BulkResponse', 'BulkResponseOperation', 'BusinessContinuity',
-           'CCExtensions', 'CCSnippet', 'CDR', 'CDRCallType', 'CDRClientType', 'CDRDirection', 'CDROriginalReason',
-           'CDRRedirectReason', 'CDRRelatedReason', 'CDRUserType', 'CPActionType', 'CQHolidaySchedule',
-           'CQRoutingType', 'Calendar', 'CalendarType', 'CallActivity', 'CallActivityAnnouncement',
-           'CallActivityParticipant', 'CallActivityStream', 'CallBackSelected', 'CallBlockNumber', 'CallBounce',
-           'CallBridgeSetting', 'CallForwardExpandedSoftKey', 'CallForwarding', 'CallForwardingAlways',
-           'CallForwardingCommon', 'CallForwardingNoAnswer', 'CallForwardingNumber', 'CallForwardingPerson',
-           'CallHistoryMethod', 'CallHistoryRecord', 'CallInNumber', 'CallInNumbers', 'CallInfo',
-           'CallInterceptDetails', 'CallInterceptDetailsPermission', 'CallNotify', 'CallNotifyCriteria', 'CallPark',
-           'CallParkExtension', 'CallParkRecall', 'CallParkSettings', 'CallPickup', 'CallQueue', 'CallQueueAgent',
-           'CallQueueAgentDetail', 'CallQueueAgentQueue', 'CallQueueCallPolicies', 'CallQueueSettings',
-           'CallRecordingAccessSettings', 'CallRecordingAnnouncement', 'CallRecordingAnnouncements',
-           'CallRecordingInfo', 'CallRecordingJobCounts', 'CallRecordingJobStatus', 'CallRecordingLocationVendors',
-           'CallRecordingRegion', 'CallRecordingSetting', 'CallRecordingTermsOfService', 'CallRecordingVendors',
-           'CallSourceInfo', 'CallSourceType', 'CallState', 'CallTreatment', 'CallTreatmentRetry', 'CallType',
-           'CallTypePermission', 'CallerId', 'CallerIdSelectedType', 'CallerReputationProviderProvider',
-           'CallingBehavior', 'CallingCDR', 'CallingLineId', 'CallingLineIdPolicy', 'CallingPermissions',
-           'CallingPlanReason', 'CallingType', 'CallsFrom', 'CapabilityMap', 'ChatObject', 'ClosedCaption',
-           'CnameRecord', 'CoHost', 'CodeAndName', 'CodeAndReason', 'ComfortMessageBypass', 'ComfortMessageSetting',
-           'CommonDeviceCustomization', 'ComplianceEvent', 'ComplianceLocationStatus', 'ComplianceStatus',
-           'Component', 'ConferenceDetails', 'ConferenceParticipant', 'ConferenceState', 'ConferenceTypeEnum',
-           'ConfigurationLevel', 'ConnectionStatus', 'Contact', 'ContactAddress', 'ContactDetails', 'ContactEmail',
-           'ContactIm', 'ContactImType', 'ContactPhoneNumber', 'ContactSipAddress', 'ConvergedRecording',
-           'ConvergedRecordingMeta', 'ConvergedRecordingWithDirectDownloadLinks', 'CountryConfig',
-           'CountryTelephonyConfigRequirements', 'CreateInviteesItem', 'CreateMeetingBody',
-           'CreateMeetingInviteeBody', 'CreateMeetingInviteesBody', 'CreateResponse', 'CustomNumbers', 'Customer',
-           'CustomizedQuestionForCreateMeeting', 'DECTHandsetItem', 'DECTHandsetLine', 'DECTHandsetList',
-           'DECTNetworkDetail', 'DECTNetworkModel', 'DND', 'Day', 'DaySchedule', 'DectCustomization', 'DectDevice',
-           'DefaultAudioType', 'DefaultVoicemailPinRules', 'DeleteDeviceBackgroundImagesResponse',
-           'DeleteImageRequestObject', 'DeleteImageResponseSuccessObject', 'DeleteImageResponseSuccessObjectResult',
-           'DeleteTranscriptBody', 'DestinationMember', 'DestinationType', 'Device', 'DeviceActivationState',
-           'DeviceConfiguration', 'DeviceConfigurationOperation', 'DeviceConfigurationResponse',
-           'DeviceConfigurationSource', 'DeviceConfigurationSourceEditability', 'DeviceConfigurationSources',
-           'DeviceCustomization', 'DeviceCustomizations', 'DeviceDynamicSettings', 'DeviceDynamicTag',
-           'DeviceHostedMeetings', 'DeviceLayout', 'DeviceList', 'DeviceManagedBy', 'DeviceManufacturer',
-           'DeviceMember', 'DeviceMembersResponse', 'DeviceOwner', 'DevicePlatform', 'DevicePutItem',
-           'DeviceSettings', 'DeviceSettingsConfiguration', 'DeviceSettingsGroupTag', 'DeviceStatus', 'DeviceTag',
-           'DeviceType', 'DialPatternStatus', 'DialPatternValidate', 'DialPatternValidationResult', 'DialPlan',
-           'DialResponse', 'Dialing', 'DifferentHoursDaily', 'DigitPattern', 'DigitPatterns',
+           'BulkExecutor', 'BulkMethod', 'BulkOperation', 'BulkProgress', 'BulkReport', 'BulkResponse',
+           'BulkResponseOperation', 'BulkResult', 'BusinessContinuity', 'CCExtensions', 'CCSnippet', 'CDR',
+           'CDRCallType', 'CDRClientType', 'CDRDirection', 'CDROriginalReason', 'CDRRedirectReason',
+           'CDRRelatedReason', 'CDRUserType', 'CPActionType', 'CQHolidaySchedule', 'CQRoutingType', 'Calendar',
+           'CalendarType', 'CallActivity', 'CallActivityAnnouncement', 'CallActivityParticipant',
+           'CallActivityStream', 'CallBackSelected', 'CallBlockNumber', 'CallBounce', 'CallBridgeSetting',
+           'CallForwardExpandedSoftKey', 'CallForwarding', 'CallForwardingAlways', 'CallForwardingCommon',
+           'CallForwardingNoAnswer', 'CallForwardingNumber', 'CallForwardingPerson', 'CallHistoryMethod',
+           'CallHistoryRecord', 'CallInNumber', 'CallInNumbers', 'CallInfo', 'CallInterceptDetails',
+           'CallInterceptDetailsPermission', 'CallNotify', 'CallNotifyCriteria', 'CallPark', 'CallParkExtension',
+           'CallParkRecall', 'CallParkSettings', 'CallPickup', 'CallQueue', 'CallQueueAgent', 'CallQueueAgentDetail',
+           'CallQueueAgentQueue', 'CallQueueCallPolicies', 'CallQueueSettings', 'CallRecordingAccessSettings',
+           'CallRecordingAnnouncement', 'CallRecordingAnnouncements', 'CallRecordingInfo', 'CallRecordingJobCounts',
+           'CallRecordingJobStatus', 'CallRecordingLocationVendors', 'CallRecordingRegion', 'CallRecordingSetting',
+           'CallRecordingTermsOfService', 'CallRecordingVendors', 'CallSourceInfo', 'CallSourceType', 'CallState',
+           'CallTreatment', 'CallTreatmentRetry', 'CallType', 'CallTypePermission', 'CallerId',
+           'CallerIdSelectedType', 'CallerReputationProviderProvider', 'CallingBehavior', 'CallingCDR',
+           'CallingLineId', 'CallingLineIdPolicy', 'CallingPermissions', 'CallingPlanReason', 'CallingType',
+           'CallsFrom', 'CapabilityMap', 'ChatObject', 'ClosedCaption', 'CnameRecord', 'CoHost', 'CodeAndName',
+           'CodeAndReason', 'ComfortMessageBypass', 'ComfortMessageSetting', 'CommonDeviceCustomization',
+           'ComplianceEvent', 'ComplianceLocationStatus', 'ComplianceStatus', 'Component', 'ConferenceDetails',
+           'ConferenceParticipant', 'ConferenceState', 'ConferenceTypeEnum', 'ConfigurationLevel', 'ConnectionStatus',
+           'Contact', 'ContactAddress', 'ContactDetails', 'ContactEmail', 'ContactIm', 'ContactImType',
+           'ContactPhoneNumber', 'ContactSipAddress', 'ConvergedRecording', 'ConvergedRecordingMeta',
+           'ConvergedRecordingWithDirectDownloadLinks', 'CountryConfig', 'CountryTelephonyConfigRequirements',
+           'CreateInviteesItem', 'CreateMeetingBody', 'CreateMeetingInviteeBody', 'CreateMeetingInviteesBody',
+           'CreateResponse', 'CustomNumbers', 'Customer', 'CustomizedQuestionForCreateMeeting', 'DECTHandsetItem',
+           'DECTHandsetLine', 'DECTHandsetList', 'DECTNetworkDetail', 'DECTNetworkModel', 'DND', 'Day', 'DaySchedule',
+           'DectCustomization', 'DectDevice', 'DefaultAudioType', 'DefaultVoicemailPinRules',
+           'DeleteDeviceBackgroundImagesResponse', 'DeleteImageRequestObject', 'DeleteImageResponseSuccessObject',
+           'DeleteImageResponseSuccessObjectResult', 'DeleteTranscriptBody', 'DestinationMember', 'DestinationType',
+           'Device', 'DeviceActivationState', 'DeviceConfiguration', 'DeviceConfigurationOperation',
+           'DeviceConfigurationResponse', 'DeviceConfigurationSource', 'DeviceConfigurationSourceEditability',
+           'DeviceConfigurationSources', 'DeviceCustomization', 'DeviceCustomizations', 'DeviceDynamicSettings',
+           'DeviceDynamicTag', 'DeviceHostedMeetings', 'DeviceLayout', 'DeviceList', 'DeviceManagedBy',
+           'DeviceManufacturer', 'DeviceMember', 'DeviceMembersResponse', 'DeviceOwner', 'DevicePlatform',
+           'DevicePutItem', 'DeviceSettings', 'DeviceSettingsConfiguration', 'DeviceSettingsGroupTag', 'DeviceStatus',
+           'DeviceTag', 'DeviceType', 'DialPatternStatus', 'DialPatternValidate', 'DialPatternValidationResult',
+           'DialPlan', 'DialResponse', 'Dialing', 'DifferentHoursDaily', 'DigitPattern', 'DigitPatterns',
            'DirectLineCallerIdName', 'DirectLineCallerIdNameSelection', 'DirectoryMethod',
            'DisableCallingLocationCounts', 'DisableCallingLocationJobStatus', 'DisplayCallqueueAgentSoftkey',
            'DisplayNameSelection', 'DistinctiveRing', 'Dnis', 'DnisAnnouncements', 'DnisSettings',
@@ -377,12 +379,12 @@ __all__ = ['AcdCustomization', 'Action', 'ActionToBePerformed', 'ActionToBePerfo
            'InterceptNumber', 'InterceptSetting', 'InterceptSettingIncoming', 'InterceptSettingOutgoing',
            'InterceptTypeIncoming', 'InterceptTypeOutgoing', 'InternalDialing',
            'InterpreterForSimultaneousInterpretation', 'Invitee', 'InviteeForCreateMeeting', 'JobError',
-           'JobErrorItem', 'JobErrorMessage', 'JobExecutionStatus', 'JoinMeetingBody', 'JoinMeetingResponse',
-           'KemKey', 'KemModuleType', 'LargeOrgStatus', 'LayoutMode', 'License', 'LicenseProperties',
-           'LicenseRequest', 'LicenseRequestOperation', 'LicenseUser', 'LicenseUserType', 'Lifecycle',
-           'LineKeyLabelSelection', 'LineKeyLedPattern', 'LineKeyTemplate', 'LineKeyTemplateAdvisoryTypes',
-           'LineKeyType', 'LinkRelation', 'Location', 'LocationAddress', 'LocationAndNumbers',
-           'LocationAssignedNumber', 'LocationCallCaptions', 'LocationCallNotification',
+           'JobErrorItem', 'JobErrorMessage', 'JobExecutionStatus', 'JobWaiter', 'JoinMeetingBody',
+           'JoinMeetingResponse', 'KemKey', 'KemModuleType', 'LargeOrgStatus', 'LayoutMode', 'License',
+           'LicenseProperties', 'LicenseRequest', 'LicenseRequestOperation', 'LicenseUser', 'LicenseUserType',
+           'Lifecycle', 'LineKeyLabelSelection', 'LineKeyLedPattern', 'LineKeyTemplate',
+           'LineKeyTemplateAdvisoryTypes', 'LineKeyType', 'LinkRelation', 'Location', 'LocationAddress',
+           'LocationAndNumbers', 'LocationAssignedNumber', 'LocationCallCaptions', 'LocationCallNotification',
            'LocationCallNotificationOrganization', 'LocationCallParkSettings', 'LocationComplianceAnnouncement',
            'LocationDeleteStatus', 'LocationECBN', 'LocationECBNLocation', 'LocationECBNLocationMember',
            'LocationEmergencyCallNotification', 'LocationMoHGreetingType', 'LocationMoHSetting',
@@ -438,8 +440,8 @@ __all__ = ['AcdCustomization', 'Action', 'ActionToBePerformed', 'ActionToBePerfo
            'RedirectReason', 'Redirection', 'Registration', 'RejectAction', 'RepoAnnouncement', 'Report',
            'ReportTemplate', 'RepositoryUsage', 'ReputationProviderRegion', 'ReputationProviderSettings',
            'ReputationProviderState', 'ReputationProviderStatus', 'ResponseError', 'ResponseStatus',
-           'ResponseStatusType', 'RingPattern', 'Room', 'RoomTab', 'RoomType', 'RouteGroup', 'RouteGroupUsage',
-           'RouteIdentity', 'RouteList', 'RouteListDestination', 'RouteListDetail', 'RouteType',
+           'ResponseStatusType', 'RetryOn', 'RingPattern', 'Room', 'RoomTab', 'RoomType', 'RouteGroup',
+           'RouteGroupUsage', 'RouteIdentity', 'RouteList', 'RouteListDestination', 'RouteListDetail', 'RouteType',
            'RoutingPrefixCounts', 'SafeDeleteCheckResponse', 'SafeEnum', 'SameHoursDaily', 'Schedule',
            'ScheduleApiBase', 'ScheduleDay', 'ScheduleLevel', 'ScheduleMonth', 'ScheduleType', 'ScheduleTypeOrStr',
            'ScheduleWeek', 'ScheduledMeeting', 'ScheduledType', 'SchedulingOptions', 'ScimGroup', 'ScimGroupMember',
@@ -482,12 +484,12 @@ __all__ = ['AcdCustomization', 'Action', 'ActionToBePerformed', 'ActionToBePerfo
            'VoicemailCopyOfMessage', 'VoicemailEnabled', 'VoicemailEnabledWithGreeting', 'VoicemailFax',
            'VoicemailGroup', 'VoicemailGroupDetail', 'VoicemailMessageStorage', 'VoicemailNotifications',
            'VoicemailSettings', 'VoicemailTransferToNumber', 'VolumeSettings', 'WaitMessageSetting', 'WaitMode',
-           'WebexGroup', 'WebexGroupMeta', 'WebexGroupOwner', 'WebexStatus', 'WebexUser', 'WebexUserMeta', 'Webhook',
-           'WebhookCreate', 'WebhookEvent', 'WebhookEventData', 'WebhookEventType', 'WebhookResource',
-           'WebhookStatus', 'Week', 'WelcomeMessageSetting', 'WifiAuthenticationMethod', 'WifiCustomization',
-           'WifiNetwork', 'WorkSpaceType', 'Workspace', 'WorkspaceCalling', 'WorkspaceCallingHybridCalling',
-           'WorkspaceEmail', 'WorkspaceHealth', 'WorkspaceHealthIssue', 'WorkspaceHealthLevel',
-           'WorkspaceIndoorNavigation', 'WorkspaceLocation', 'WorkspaceLocationFloor', 'WorkspaceNumbers',
-           'WorkspacePersonalizationTaskResponse', 'WorkspaceSupportedDevices', 'WorkspaceWebexCalling',
-           'WrapUpReason', 'WrapUpReasonDetails', 'WrapupReasonQueue', '_Helper', 'dt_iso_str', 'enum_str', 'plus1',
-           'to_camel', 'webex_id_to_uuid']
+           'WatchedJob', 'WebexGroup', 'WebexGroupMeta', 'WebexGroupOwner', 'WebexStatus', 'WebexUser',
+           'WebexUserMeta', 'Webhook', 'WebhookCreate', 'WebhookEvent', 'WebhookEventData', 'WebhookEventType',
+           'WebhookResource', 'WebhookStatus', 'Week', 'WelcomeMessageSetting', 'WifiAuthenticationMethod',
+           'WifiCustomization', 'WifiNetwork', 'WorkSpaceType', 'Workspace', 'WorkspaceCalling',
+           'WorkspaceCallingHybridCalling', 'WorkspaceEmail', 'WorkspaceHealth', 'WorkspaceHealthIssue',
+           'WorkspaceHealthLevel', 'WorkspaceIndoorNavigation', 'WorkspaceLocation', 'WorkspaceLocationFloor',
+           'WorkspaceNumbers', 'WorkspacePersonalizationTaskResponse', 'WorkspaceSupportedDevices',
+           'WorkspaceWebexCalling', 'WrapUpReason', 'WrapUpReasonDetails', 'WrapupReasonQueue', '_Helper',
+           'dt_iso_str', 'enum_str', 'plus1', 'to_camel', 'webex_id_to_uuid']
@@ -1,16 +1,24 @@
 # auto-generated. DO NOT EDIT
+import asyncio
 import builtins
+import csv
+import io
+import itertools
 import json
 import logging
 import mimetypes
 import os
+import tempfile
+import time
 import urllib.parse
-from collections.abc import AsyncGenerator
+import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Iterable, Iterator, Sized
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from enum import Enum
 from io import BufferedReader
-from typing import Any, Union, Optional, Literal, Self
+from typing import IO, Any, Union, Optional, Literal, Self
 
 import pytz
 from dateutil import tz
@@ -34,28 +42,28 @@ CALLING_DATA_TIMEOUT_PROTECTION = False
 __all__ = ['AsAccessCodesApi', 'AsAdminAuditEventsApi', 'AsAgentCallerIdApi', 'AsAnnouncementApi',
            'AsAnnouncementsRepositoryApi', 'AsAnonCallsApi', 'AsApiChild', 'AsAppServicesApi', 'AsAppSharedLineApi',
            'AsApplyLineKeyTemplatesJobsApi', 'AsAttachmentActionsApi', 'AsAuthorizationsApi', 'AsAutoAttendantApi',
-           'AsAvailableNumbersApi', 'AsBargeApi', 'AsCQPolicyApi', 'AsCallBridgeApi', 'AsCallControlsMembersApi',
-           'AsCallInterceptApi', 'AsCallParkApi', 'AsCallPickupApi', 'AsCallPolicyApi', 'AsCallQueueAgentsApi',
-           'AsCallQueueApi', 'AsCallQueueDnisApi', 'AsCallRecordingApi', 'AsCallRecordingJobsApi',
-           'AsCallRecordingSettingsApi', 'AsCallRoutingApi', 'AsCallWaitingApi', 'AsCallerIdApi',
-           'AsCallerReputationProviderApi', 'AsCallingBehaviorApi', 'AsCallparkExtensionApi', 'AsCallsApi',
-           'AsConferenceControlsApi', 'AsConvergedRecordingsApi', 'AsCustomerExperienceEssentialsApi',
+           'AsAvailableNumbersApi', 'AsBargeApi', 'AsBulkExecutor', 'AsCQPolicyApi', 'AsCallBridgeApi',
+           'AsCallControlsMembersApi', 'AsCallInterceptApi', 'AsCallParkApi', 'AsCallPickupApi', 'AsCallPolicyApi',
+           'AsCallQueueAgentsApi', 'AsCallQueueApi', 'AsCallQueueDnisApi', 'AsCallRecordingApi',
+           'AsCallRecordingJobsApi', 'AsCallRecordingSettingsApi', 'AsCallRoutingApi', 'AsCallWaitingApi',
+           'AsCallerIdApi', 'AsCallerReputationProviderApi', 'AsCallingBehaviorApi', 'AsCallparkExtensionApi',
+           'AsCallsApi', 'AsConferenceControlsApi', 'AsConvergedRecordingsApi', 'AsCustomerExperienceEssentialsApi',
            'AsDECTDevicesApi', 'AsDetailedCDRApi', 'AsDeviceConfigurationsApi', 'AsDeviceSettingsJobsApi',
            'AsDevicesApi', 'AsDevicesDynamicSettingsApi', 'AsDialPlanApi', 'AsDigitPatternsApi',
            'AsDisableCallingLocationJobsApi', 'AsDndApi', 'AsECBNApi', 'AsEmergencyAddressApi', 'AsEventsApi',
            'AsExecAssistantApi', 'AsExecutiveSettingsApi', 'AsFeatureAccessApi', 'AsFeatureSelector',
            'AsForwardingApi', 'AsGoOverrideApi', 'AsGroupsApi', 'AsGuestCallingApi', 'AsGuestManagementApi',
            'AsHotDeskApi', 'AsHotDeskingApi', 'AsHotDeskingSigninViaVoicePortalApi', 'AsHotelingApi',
-           'AsHuntGroupApi', 'AsIncomingPermissionsApi', 'AsInternalDialingApi', 'AsJobsApi', 'AsLicensesApi',
-           'AsLocationAccessCodesApi', 'AsLocationEmergencyServicesApi', 'AsLocationInterceptApi', 'AsLocationMoHApi',
-           'AsLocationNumbersApi', 'AsLocationVoicemailSettingsApi', 'AsLocationsApi', 'AsMSTeamsSettingApi',
-           'AsManageNumbersJobsApi', 'AsMeAnonCallsApi', 'AsMeBargeApi', 'AsMeCallBlockApi', 'AsMeCallCenterApi',
-           'AsMeCallControlApi', 'AsMeCallNotifyApi', 'AsMeCallParkApi', 'AsMeCallPickupApi', 'AsMeCallPoliciesApi',
-           'AsMeCallWaitingApi', 'AsMeCallerIdApi', 'AsMeDNDApi', 'AsMeEndpointsApi', 'AsMeExecutiveApi',
-           'AsMeForwardingApi', 'AsMeHotelingApi', 'AsMeModeManagementApi', 'AsMePersonalAssistantApi',
-           'AsMePriorityAlertApi', 'AsMeRecordingApi', 'AsMeSNRApi', 'AsMeSchedulesApi', 'AsMeSelectiveAcceptApi',
-           'AsMeSelectiveForwardApi', 'AsMeSelectiveRejectApi', 'AsMeSequentialRingApi', 'AsMeSettingsApi',
-           'AsMeSimRingApi', 'AsMeVoicemailApi', 'AsMeetingChatsApi', 'AsMeetingClosedCaptionsApi',
+           'AsHuntGroupApi', 'AsIncomingPermissionsApi', 'AsInternalDialingApi', 'AsJobWaiter', 'AsJobsApi',
+           'AsLicensesApi', 'AsLocationAccessCodesApi', 'AsLocationEmergencyServicesApi', 'AsLocationInterceptApi',
+           'AsLocationMoHApi', 'AsLocationNumbersApi', 'AsLocationVoicemailSettingsApi', 'AsLocationsApi',
+           'AsMSTeamsSettingApi', 'AsManageNumbersJobsApi', 'AsMeAnonCallsApi', 'AsMeBargeApi', 'AsMeCallBlockApi',
+           'AsMeCallCenterApi', 'AsMeCallControlApi', 'AsMeCallNotifyApi', 'AsMeCallParkApi', 'AsMeCallPickupApi',
+           'AsMeCallPoliciesApi', 'AsMeCallWaitingApi', 'AsMeCallerIdApi', 'AsMeDNDApi', 'AsMeEndpointsApi',
+           'AsMeExecutiveApi', 'AsMeForwardingApi', 'AsMeHotelingApi', 'AsMeModeManagementApi',
+           'AsMePersonalAssistantApi', 'AsMePriorityAlertApi', 'AsMeRecordingApi', 'AsMeSNRApi', 'AsMeSchedulesApi',
+           'AsMeSelectiveAcceptApi', 'AsMeSelectiveForwardApi', 'AsMeSelectiveRejectApi', 'AsMeSequentialRingApi',
+           'AsMeSettingsApi', 'AsMeSimRingApi', 'AsMeVoicemailApi', 'AsMeetingChatsApi', 'AsMeetingClosedCaptionsApi',
            'AsMeetingInviteesApi', 'AsMeetingParticipantsApi', 'AsMeetingPreferencesApi', 'AsMeetingQandAApi',
            'AsMeetingQualitiesApi', 'AsMeetingTranscriptsApi', 'AsMeetingsApi', 'AsMembershipApi', 'AsMessagesApi',
            'AsModeManagementApi', 'AsMonitoringApi', 'AsMoveUsersJobsApi', 'AsMusicOnHoldApi', 'AsNumbersApi',
@@ -444,6 +452,177 @@ class AsAuthorizationsApi(AsApiChild, base='authorizations'):
         await super().delete(url, params=params)
 
 
+class AsBulkExecutor:
+    """
+    Run an operation for many items in parallel; the number of concurrent operations is bounded by the concurrency
+    limit of the session.
+
+    Exceptions raised by the operation are collected per item and don't abort the run. Selected exceptions can be
+    retried per item.
+    """
+
+    def __init__(self, *, session: AsRestSession):
+        self._session = session
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Default for the number of concurrent operations: the maximum number of concurrent requests of the session
+        """
+        return self._session.max_concurrent_requests
+
+    @staticmethod
+    def _retry(exception: Exception, retry_on: RetryOn) -> bool:
+        """
+        Check if an operation that failed with the given exception is to be retried
+
+        :meta private:
+        """
+        if isinstance(retry_on, (type, tuple)):
+            return isinstance(exception, retry_on)
+        return retry_on(exception)
+
+    async def map(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        *,
+        ordered: bool = True,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: asyncio.Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+        retry_delay: float = 1.0,
+    ) -> AsyncGenerator[BulkResult, None]:
+        """
+        Await `func` for each item with a bounded number of concurrent tasks and yield the results
+
+        Items are taken from `items` as tasks complete; `items` can be a generator or an async iterable like the
+        result of a `list_gen()` call. If the caller stops iterating then pending items are not started and tasks in
+        progress are cancelled.
+
+        :param func: coroutine function to call for each item
+        :param items: items
+        :param ordered: yield results in the order of the items; else results are yielded as tasks complete
+        :param max_workers: number of concurrent tasks; default: :attr:`max_workers`
+        :param progress: called with the :class:`BulkProgress` after each completed item
+        :param cancel: event to cancel the run: once set, no further items are started and failed operations are not
+            retried. Tasks in progress are completed and their results are yielded
+        :param retries: number of times the operation is retried for an item if it fails with an exception matching
+            `retry_on`. 429 responses are already retried by the session
+        :param retry_on: exceptions to retry; see :data:`RetryOn`
+        :param retry_delay: delay before the first retry in seconds; doubles with each retry
+        :return: yields one :class:`BulkResult` per item
+        """
+        max_workers = max_workers or self.max_workers
+        stats = BulkProgress(total=len(items) if isinstance(items, Sized) else None)
+
+        async def call(index: int, item: Any) -> BulkResult:
+            attempt = 1
+            while True:
+                try:
+                    return BulkResult(index=index, item=item, result=await func(item), attempts=attempt)
+                except Exception as e:
+                    if attempt > retries or not self._retry(e, retry_on) or (cancel is not None and cancel.is_set()):
+                        return BulkResult(index=index, item=item, exception=e, attempts=attempt)
+                await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+                attempt += 1
+
+        async def indexed_items() -> AsyncGenerator[tuple[int, Any], None]:
+            if isinstance(items, AsyncIterable):
+                index = 0
+                async for item in items:
+                    yield index, item
+                    index += 1
+            else:
+                for entry in enumerate(items):
+                    yield entry
+
+        source = indexed_items()
+        pending: deque[asyncio.Task] = deque()
+        # unordered: tasks put themselves into this queue when done
+        completed: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+        try:
+            while True:
+                # keep up to max_workers tasks running
+                while len(pending) < max_workers and not (cancel is not None and cancel.is_set()):
+                    next_item = await anext(source, None)
+                    if next_item is None:
+                        break
+                    task = asyncio.create_task(call(*next_item))
+                    if not ordered:
+                        task.add_done_callback(completed.put_nowait)
+                    pending.append(task)
+                if not pending:
+                    break
+                if ordered:
+                    task = pending.popleft()
+                    await asyncio.wait([task])
+                else:
+                    task = await completed.get()
+                    pending.remove(task)
+                result = task.result()
+                stats.record(result)
+                if progress is not None:
+                    progress(stats)
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            await source.aclose()
+        
+
+    async def run(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        *,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: asyncio.Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+        retry_delay: float = 1.0,
+    ) -> BulkReport:
+        """
+        Await `func` for each item with a bounded number of concurrent tasks and return a report
+
+        Only the results of failed items are kept: memory use does not grow with the number of items. Use :meth:`map`
+        to work with the return values of the operation.
+
+        :param func: coroutine function to call for each item
+        :param items: items
+        :param max_workers: number of concurrent tasks; default: :attr:`max_workers`
+        :param progress: called with the :class:`BulkProgress` after each completed item
+        :param cancel: event to cancel the run; see :meth:`map`
+        :param retries: number of times the operation is retried for an item; see :meth:`map`
+        :param retry_on: exceptions to retry; see :data:`RetryOn`
+        :param retry_delay: delay before the first retry in seconds; doubles with each retry
+        :return: report with counters and the results of the failed items
+        """
+        start = time.perf_counter()
+        report = BulkReport(total=len(items) if isinstance(items, Sized) else None)
+        async for result in self.map(
+            func,
+            items,
+            ordered=False,
+            max_workers=max_workers,
+            progress=progress,
+            cancel=cancel,
+            retries=retries,
+            retry_on=retry_on,
+            retry_delay=retry_delay,
+        ):
+            report.record(result)
+        report.cancelled = cancel is not None and cancel.is_set()
+        report.seconds = time.perf_counter() - start
+        return report
+        
+
+
 class AsConvergedRecordingsApi(AsApiChild, base=''):
     """
     Converged Recordings
@@ -1260,19 +1439,9 @@ class AsDetailedCDRApi(AsApiChild, base=''):
         url = f'https://{host}/v1/{endpoint}'
         if locations:
             params['locations'] = ','.join(locations)
-        if not start_time:
-            start_time = datetime.now(tz=tz.tzutc()) - timedelta(hours=47, minutes=58)
-        if not end_time:
-            end_time = datetime.now(tz=tz.tzutc()) - timedelta(minutes=5, seconds=30)
-
-        def guess_datetime(dt: datetime | str) -> str:
-            if isinstance(dt, str):
-                dt = isoparse(dt)
-            r = dt_iso_str(dt)
-            return r
-
-        params['startTime'] = guess_datetime(start_time)
-        params['endTime'] = guess_datetime(end_time)
+        start_time, end_time = self._time_window(start_time, end_time)
+        params['startTime'] = dt_iso_str(start_time)
+        params['endTime'] = dt_iso_str(end_time)
         # noinspection PyTypeChecker
         return self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')
 
@@ -1318,21 +1487,218 @@ class AsDetailedCDRApi(AsApiChild, base=''):
         url = f'https://{host}/v1/{endpoint}'
         if locations:
             params['locations'] = ','.join(locations)
+        start_time, end_time = self._time_window(start_time, end_time)
+        params['startTime'] = dt_iso_str(start_time)
+        params['endTime'] = dt_iso_str(end_time)
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')]
+
+    @staticmethod
+    def _time_window(
+        start_time: Optional[str | datetime], end_time: Optional[str | datetime]
+    ) -> tuple[datetime, datetime]:
+        """
+        Start and end of a time window for CDR queries; ISO-8601 strings are parsed and missing values are replaced
+        by the defaults: 47:58 hours ago and 5:30 minutes ago
+
+        :meta private:
+        """
         if not start_time:
             start_time = datetime.now(tz=tz.tzutc()) - timedelta(hours=47, minutes=58)
         if not end_time:
             end_time = datetime.now(tz=tz.tzutc()) - timedelta(minutes=5, seconds=30)
+        if isinstance(start_time, str):
+            start_time = isoparse(start_time)
+        if isinstance(end_time, str):
+            end_time = isoparse(end_time)
+        return start_time, end_time
+
+    @classmethod
+    def _slice_queries(
+        cls,
+        start_time: Optional[str | datetime],
+        end_time: Optional[str | datetime],
+        locations: Optional[list[str]],
+        slices: int,
+    ) -> list[tuple[int, datetime, datetime, Optional[list[str]]]]:
+        """
+        Queries for a sliced CDR request: one query per time slice and group of up to 10 locations
 
-        def guess_datetime(dt: datetime | str) -> str:
-            if isinstance(dt, str):
-                dt = isoparse(dt)
-            r = dt_iso_str(dt)
-            return r
+        :meta private:
+        :return: list of (slice index, start, end, locations)
+        """
+        if slices < 1:
+            raise ValueError('slices has to be at least 1')
+        start, end = cls._time_window(start_time, end_time)
+        step = (end - start) / slices
+        # slice boundaries are sent with millisecond precision
+        boundaries = [start + step * i for i in range(slices)]
+        boundaries = [b.replace(microsecond=b.microsecond - b.microsecond % 1000) for b in boundaries] + [end]
+        location_groups: list[Optional[list[str]]] = [None]
+        if locations:
+            location_groups = [locations[i : i + 10] for i in range(0, len(locations), 10)]
+        return [
+            (i, boundaries[i], boundaries[i + 1], group)
+            for i in range(slices)
+            if boundaries[i] < boundaries[i + 1]
+            for group in location_groups
+        ]
 
-        params['startTime'] = guess_datetime(start_time)
-        params['endTime'] = guess_datetime(end_time)
-        # noinspection PyTypeChecker
-        return [o async for o in self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')]
+    @staticmethod
+    def cdr_key(cdr: CDR) -> Optional[tuple[Optional[str], ...]]:
+        """
+        Key to identify duplicate CDRs: correlation ID, call ID, and local call ID (which identifies the call leg)
+
+        :param cdr: CDR
+        :return: key; None if the CDR has none of the IDs
+        """
+        key = (cdr.correlation_id, cdr.call_id, cdr.local_call_id)
+        if not any(key):
+            return None
+        return key
+
+    @classmethod
+    def _merge_slice(
+        cls, groups: Iterable[list[CDR]], seen: set[tuple[Optional[str], ...]]
+    ) -> tuple[list[CDR], set[tuple[Optional[str], ...]]]:
+        """
+        Merge the CDRs of the location groups of a time slice in order of report time and remove CDRs which were
+        already returned for the previous slice
+
+        :meta private:
+        :param groups: CDRs of the location groups of the slice
+        :param seen: keys of the CDRs of the previous slice
+        :return: CDRs of the slice, keys of the CDRs of the slice
+        """
+        cdrs = [cdr for group in groups for cdr in group]
+        cdrs.sort(key=lambda cdr: (cdr.report_time is not None, cdr.report_time or 0))
+        merged = []
+        keys = set()
+        for cdr in cdrs:
+            key = cls.cdr_key(cdr)
+            if key is not None:
+                if key in seen or key in keys:
+                    continue
+                keys.add(key)
+            merged.append(cdr)
+        return merged, keys
+
+    async def get_cdr_history_sliced_gen(
+        self,
+        start_time: Optional[str | datetime] = None,
+        end_time: Optional[str | datetime] = None,
+        locations: list[str] = None,
+        host: str = 'analytics-calling.webexapis.com',
+        stream: bool = False,
+        slices: int = 1,
+        max_workers: int = None,
+        initial_interval: float = 60.0,
+        **params,
+    ) -> AsyncGenerator[CDR, None]:
+        """
+        Detailed Call History data for a time window, fetched concurrently in time slices
+
+        The time window is split into `slices` time slices of equal length. If more than 10 locations are given, then
+        each slice is also split into groups of up to 10 locations. Each query is a separate call of
+        :meth:`get_cdr_history` and queries are executed concurrently; the number of concurrent queries is bounded by
+        the concurrency limit of the session.
+
+        The CDR API allows only one initial request per minute per user token: the initial requests of the queries are
+        sent `initial_interval` seconds apart and only the pagination requests overlap. Hence more than one slice only
+        pays off for long time windows which need many pages per slice; for short windows (for example an hourly pull)
+        use the default of one slice.
+
+        CDRs are yielded in order of report time as soon as all slices up to the current slice have been fetched. CDRs
+        which were returned for two adjacent slices (records reported at a slice boundary) are only yielded once; see
+        :meth:`cdr_key`.
+
+        The rate limits of the CDR API still apply: requests which are answered with a 429 are retried by the session.
+
+        :param start_time: Time of the first report you wish to collect; see :meth:`get_cdr_history`
+        :type start_time: str|datetime
+        :param end_time: Time of the last report you wish to collect; see :meth:`get_cdr_history`
+        :type end_time: str|datetime
+        :param locations: Names of the locations (as shown in Control Hub). Can be more than 10 locations.
+        :type locations: list[str]
+        :param host: analytics host to access
+        :type host: str
+        :param stream: If true, collect data from cdr_stream, else from cdr_feed. Defaults to False (cdr_feed).
+        :type stream: bool
+        :param slices: number of time slices
+        :type slices: int
+        :param max_workers: maximum number of concurrent queries; default: concurrency limit of the session
+        :type max_workers: int
+        :param initial_interval: minimum time in seconds between the initial requests of two queries; 0 to send all
+            initial requests at once
+        :type initial_interval: float
+        :param params: additional arguments
+        :return: CDRs
+        """
+        queries = self._slice_queries(start_time, end_time, locations, slices)
+        # time of the next initial request
+        next_initial = time.monotonic()
+
+        async def fetch(query: tuple[int, datetime, datetime, Optional[list[str]]]) -> list[CDR]:
+            nonlocal next_initial
+            _, start, end, group = query
+            initial = max(time.monotonic(), next_initial)
+            next_initial = initial + initial_interval
+            await asyncio.sleep(max(0.0, initial - time.monotonic()))
+            return await self.get_cdr_history(
+                start_time=start, end_time=end, locations=group, host=host, stream=stream, **params
+            )
+
+        seen: set[tuple[Optional[str], ...]] = set()
+        groups: list[list[CDR]] = []
+        current = 0
+        async for result in AsBulkExecutor(session=self.session).map(fetch, queries, max_workers=max_workers):
+            if result.exception is not None:
+                raise result.exception
+            if result.item[0] != current:
+                cdrs, seen = self._merge_slice(groups, seen)
+                for cdr in cdrs:
+                    yield cdr
+                groups = []
+                current = result.item[0]
+            groups.append(result.result or [])
+        cdrs, _ = self._merge_slice(groups, seen)
+        for cdr in cdrs:
+            yield cdr
+
+    async def get_cdr_history_sliced(
+        self,
+        start_time: Optional[str | datetime] = None,
+        end_time: Optional[str | datetime] = None,
+        locations: list[str] = None,
+        host: str = 'analytics-calling.webexapis.com',
+        stream: bool = False,
+        slices: int = 1,
+        max_workers: int = None,
+        initial_interval: float = 60.0,
+        **params,
+    ) -> builtins.list[CDR]:
+        """
+        Detailed Call History data for a time window, fetched concurrently in time slices
+
+        See :meth:`get_cdr_history_sliced_gen`
+
+        :return: CDRs in order of report time
+        """
+        return [
+            cdr
+            async for cdr in self.get_cdr_history_sliced_gen(
+                start_time=start_time,
+                end_time=end_time,
+                locations=locations,
+                host=host,
+                stream=stream,
+                slices=slices,
+                max_workers=max_workers,
+                initial_interval=initial_interval,
+                **params,
+            )
+        ]
+        
 
 
 class AsDeviceConfigurationsApi(AsApiChild, base='deviceConfigurations'):
@@ -1435,7 +1801,9 @@ class AsDeviceSettingsJobsApi(AsApiChild, base='telephony/config/jobs/devices/ca
             body['locationId'] = location_id
             body['locationCustomizationsEnabled'] = customization.custom_enabled
         if customization.custom_enabled or not location_id:
-            body['customizations'] = json.loads(customization.customizations.model_dump_json())
+            body['customizations'] = customization.customizations.model_dump(
+                mode='json', by_alias=True, exclude_none=True
+            )
         data = await self.post(url=url, params=params, json=body)
         return StartJobResponse.model_validate(data)
 
@@ -2374,6 +2742,237 @@ class AsGuestManagementApi(AsApiChild, base='guests'):
         return data
 
 
+class AsJobWaiter:
+    """
+    Wait for jobs to complete
+
+    Job status is polled with an adaptive interval: if the job details indicate progress (percentage complete or
+    counts), then the next poll is scheduled at the estimated completion time. Else the interval grows exponentially
+    from `min_interval` to `max_interval`.
+
+    Many jobs are watched by a single polling loop; polls which are due at the same time are sent concurrently.
+    """
+
+    def __init__(self, *, session: AsRestSession):
+        self._session = session
+
+    async def wait(
+        self,
+        jobs_api: Any,
+        job_id: str,
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        progress: Callable[[WatchedJob], None] = None,
+    ) -> Any:
+        """
+        Wait for a job to stop running
+
+        :param jobs_api: job API with `status()` and `errors()` methods; for example
+            :attr:`api.telephony.jobs.manage_numbers <wxc_sdk.telephony.jobs.JobsApi.manage_numbers>`
+        :param job_id: job ID
+        :param org_id: organization ID
+        :param timeout: maximum time to wait in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if the job doesn't indicate progress
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :return: job details returned by the last `status()` call. The job might have failed; check
+            `latest_execution_status`
+        :raises TimeoutError: if the job is still running after `timeout` seconds
+        """
+        async for watched in self.watch(
+            [(jobs_api, job_id)],
+            org_id=org_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            progress=progress,
+        ):
+            if watched.exception is not None:
+                raise watched.exception
+            return watched.job
+        
+
+    async def poll(
+        self,
+        jobs: list[WatchedJob],
+        *,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        errors: bool = False,
+        progress: Callable[[WatchedJob], None] = None,
+        on_error: Callable[[WatchedJob, JobErrorItem], None] = None,
+        max_workers: int = None,
+    ) -> list[WatchedJob]:
+        """
+        One round of polling: wait until the first job is due and poll all jobs which are due concurrently
+
+        Building block for loops which watch a changing set of jobs: the polling state (interval, next poll, progress,
+        errors seen) is kept in the :class:`WatchedJob` instances, so the same instances have to be passed to
+        each call. :meth:`watch` calls this method until all jobs are done.
+
+        Exceptions raised by `status()` or `errors()` are not raised but stored in :attr:`WatchedJob.exception`;
+        jobs still running after their deadline get a :class:`TimeoutError`.
+
+        :param jobs: jobs to poll; all jobs have to be running
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param errors: also read the errors of each job and collect them in :attr:`WatchedJob.errors`
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :param on_error: called for each new error of a job as soon as it is seen; implies `errors`
+        :param max_workers: maximum number of concurrent polls; default: maximum number of concurrent requests of the
+            session
+        :return: jobs which have stopped running
+        :raises ValueError: if the `status()` or `errors()` method of a job API can't be called with the job ID and
+            organization ID of the job
+        """
+        read_errors = errors or on_error is not None
+        if not jobs:
+            return []
+        # reject unsupported job APIs before sending any request
+        for watched in jobs:
+            watched.params('status')
+            if read_errors:
+                watched.params('errors')
+        now = time.monotonic()
+        first = min(watched.next_poll for watched in jobs)
+        if first > now:
+            await asyncio.sleep(first - now)
+            now = time.monotonic()
+        due = [watched for watched in jobs if watched.next_poll <= now]
+        bulk = AsBulkExecutor(session=self._session)
+
+        async def poll_job(watched: WatchedJob) -> tuple[Any, list[JobErrorItem]]:
+            job = await watched.jobs_api.status(**watched.params('status'))
+            job_errors = await watched.jobs_api.errors(**watched.params('errors')) if read_errors else []
+            return job, job_errors
+
+        async for result in bulk.map(poll_job, due, ordered=False, max_workers=max_workers):
+            watched = result.item
+            if result.ok and result.result is not None:
+                job, job_errors = result.result
+                watched.update(job, time.monotonic(), min_interval, max_interval, backoff)
+                for error in watched.add_errors(job_errors):
+                    if on_error is not None:
+                        on_error(watched, error)
+                if progress is not None:
+                    progress(watched)
+                watched.check_deadline(time.monotonic())
+            else:
+                watched.exception = result.exception
+        return [watched for watched in due if watched.done]
+        
+
+    async def watch(
+        self,
+        jobs: Iterable[Union[WatchedJob, tuple[Any, str]]],
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        errors: bool = False,
+        progress: Callable[[WatchedJob], None] = None,
+        on_error: Callable[[WatchedJob, JobErrorItem], None] = None,
+        max_workers: int = None,
+    ) -> AsyncGenerator[WatchedJob, None]:
+        """
+        Wait for many jobs; all jobs are polled by a single loop and each job is yielded once it has stopped running
+
+        Exceptions raised by `status()` or `errors()` are not raised but stored in :attr:`WatchedJob.exception`;
+        jobs which didn't complete in time get a :class:`TimeoutError`.
+
+        :param jobs: jobs to watch: :class:`WatchedJob` instances or (job API, job ID) tuples
+        :param org_id: organization ID for jobs given as tuples
+        :param timeout: maximum time to wait for each job in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param errors: also read the errors of each job with each poll and collect them in
+            :attr:`WatchedJob.errors`
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :param on_error: called for each new error of a job as soon as it is seen; implies `errors`
+        :param max_workers: maximum number of concurrent polls; default: maximum number of concurrent requests of the
+            session
+        :return: yields each job once it's done
+        :raises ValueError: if the `status()` or `errors()` method of a job API can't be called with the job ID and
+            organization ID of the job
+        """
+        start = time.monotonic()
+        pending = [
+            j
+            if isinstance(j, WatchedJob)
+            else WatchedJob(
+                jobs_api=j[0], job_id=j[1], org_id=org_id, deadline=None if timeout is None else start + timeout
+            )
+            for j in jobs
+        ]
+        while pending:
+            for watched in await self.poll(
+                pending,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                backoff=backoff,
+                errors=errors,
+                progress=progress,
+                on_error=on_error,
+                max_workers=max_workers,
+            ):
+                pending.remove(watched)
+                yield watched
+        
+
+    async def errors(
+        self,
+        jobs_api: Any,
+        job_id: str,
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+    ) -> AsyncGenerator[JobErrorItem, None]:
+        """
+        Yield the errors of a job as soon as they are reported; returns when the job has stopped running
+
+        :param jobs_api: job API with `status()` and `errors()` methods
+        :param job_id: job ID
+        :param org_id: organization ID
+        :param timeout: maximum time to wait in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if the job doesn't indicate progress
+        :return: yields each error once
+        :raises TimeoutError: if the job is still running after `timeout` seconds
+        """
+        watched = WatchedJob(
+            jobs_api=jobs_api,
+            job_id=job_id,
+            org_id=org_id,
+            deadline=None if timeout is None else time.monotonic() + timeout,
+        )
+        while True:
+            job = await jobs_api.status(**watched.params('status'))
+            watched.update(job, time.monotonic(), min_interval, max_interval, backoff)
+            for error in watched.add_errors(await jobs_api.errors(**watched.params('errors'))):
+                yield error
+            if watched.done:
+                return
+            if watched.check_deadline(time.monotonic()):
+                raise watched.exception
+            await asyncio.sleep(max(watched.next_poll - time.monotonic(), 0))
+        
+
+
 class AsApplyLineKeyTemplatesJobsApi(AsApiChild, base='telephony/config/jobs/devices/applyLineKeyTemplate'):
     async def apply(
         self,
@@ -4455,7 +5054,18 @@ class AsLocationsApi(AsApiChild, base='locations'):
         :return: locations
         :rtype: Location
         """
-        return next((location for location in await self.list(name=name, org_id=org_id) if location.name == name), None)
+        # use the session's entity directory, if any
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, location = directory.get('locations', 'name', name, org_id=org_id)
+            if found and (location is None or isinstance(location, Location)):
+                return location
+            epoch = directory.epoch
+        location = next((location for location in await self.list(name=name, org_id=org_id) if location.name == name), None)
+        if directory is not None:
+            directory.put('locations', 'name', name, location, org_id=org_id, epoch=epoch)
+        return location
 
     async def details(self, location_id: str, org_id: str = None) -> Location:
         """
@@ -4474,6 +5084,8 @@ class AsLocationsApi(AsApiChild, base='locations'):
             * `spark-admin:people_read`
             * `spark-admin:device_read`
 
+        Uses the session's :class:`wxc_sdk.directory.EntityDirectory`, if any
+
         :param location_id: A unique identifier for the location.
         :type location_id: str
         :param org_id: Get location common attributes for this organization.
@@ -4482,9 +5094,20 @@ class AsLocationsApi(AsApiChild, base='locations'):
         :return: location details
         :rtype: :class:`Location`
         """
+        # use the session's entity directory, if any
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, location = directory.get('locations', 'id', location_id, org_id=org_id)
+            if found and isinstance(location, Location):
+                return location
+            epoch = directory.epoch
         params = org_id and {'orgId': org_id} or None
         ep = self.ep(location_id)
-        return Location.model_validate(await self.get(ep, params=params))
+        location = Location.model_validate(await self.get(ep, params=params))
+        if directory is not None:
+            directory.put('locations', 'id', location_id, location, org_id=org_id, epoch=epoch)
+        return location
 
     async def create(
         self,
@@ -12511,6 +13134,39 @@ class AsPeopleApi(AsApiChild, base='people'):
         data = settings.create_update()
         return Person.model_validate(await self.post(url, json=data, params=params))
 
+    async def by_email(self, email: str, org_id: str = None) -> Optional[Person]:
+        """
+        Get a person by email address
+
+        Uses the session's :class:`wxc_sdk.directory.EntityDirectory`, if any
+
+        :param email: email address of the person; case-insensitive
+        :type email: str
+        :param org_id: search in this organization
+        :type org_id: str
+        :return: person or None if no person with this email address exists
+        :rtype: Person
+        """
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, person = directory.get('people', 'email', email, org_id=org_id)
+            if found and (person is None or isinstance(person, Person)):
+                return person
+            epoch = directory.epoch
+        lower = email.lower()
+        person = next(
+            (
+                person
+                for person in await self.list(email=email, org_id=org_id)
+                if any(lower == e.lower() for e in person.emails or [])
+            ),
+            None,
+        )
+        if directory is not None:
+            directory.put('people', 'email', email, person, org_id=org_id, epoch=epoch)
+        return person
+
     async def details(self, person_id: str, calling_data: bool = False) -> Person:
         """
         Get Person Details
@@ -12525,6 +13181,8 @@ class AsPeopleApi(AsApiChild, base='people'):
         Admin users can include `Webex Calling` (BroadCloud) user details in the response by specifying `callingData`
         parameter as `true`.
 
+        Without `calling_data` the session's :class:`wxc_sdk.directory.EntityDirectory`, if any, is used
+
         :param person_id: A unique identifier for the person.
         :type person_id: str
         :param calling_data: Include Webex Calling user details in the response. Default: false
@@ -12532,9 +13190,20 @@ class AsPeopleApi(AsApiChild, base='people'):
         :return: person details
         :rtype: Person
         """
+        # entities in the directory don't have calling data
+        directory = None if calling_data else self.session.directory
+        epoch = None
+        if directory is not None:
+            found, person = directory.get('people', 'id', person_id)
+            if found and isinstance(person, Person):
+                return person
+            epoch = directory.epoch
         ep = self.ep(path=person_id)
         params = calling_data and {'callingData': 'true'} or None
-        return Person.model_validate(await self.get(ep, params=params))
+        person = Person.model_validate(await self.get(ep, params=params))
+        if directory is not None:
+            directory.put('people', 'id', person_id, person, epoch=epoch)
+        return person
 
     async def delete_person(self, person_id: str):
         """
@@ -19088,16 +19757,169 @@ class AsReportsApi(AsApiChild, base='devices'):
         url = self.session.ep(f'reports/{report_id}')
         await super().delete(url=url)
 
-    async def download(self, url: str) -> builtins.list[dict]:
+    @staticmethod
+    def _zip_rows(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+        """
+        Rows of the CSV file in a ZIP file; the CSV file is decompressed and parsed incrementally
+
+        :meta private:
+        :param file: seekable ZIP file
+        """
+        with zipfile.ZipFile(file, 'r') as zip_file:
+            # open 1st file
+            first_info = zip_file.infolist()[0]
+            with zip_file.open(first_info) as f:
+                # utf-8-sig skips the UTF BOM
+                text = io.TextIOWrapper(f, encoding='utf-8-sig', newline='')
+                yield from csv.DictReader(text)
+
+    @staticmethod
+    def _batches(rows: Iterable[Any], size: int) -> Iterator[tuple[Any, ...]]:
+        """
+        Group rows in batches; the async API parses the rows of a report batch by batch in a worker thread
+
+        :meta private:
+        """
+        rows = iter(rows)
+        while batch := tuple(itertools.islice(rows, size)):
+            yield batch
+
+    async def download_gen(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """
         Download a report from the given URL and yield the rows as dicts
 
+        The report (a ZIP file) is downloaded in chunks into a spooled temporary file: reports up to `spool_size` bytes
+        are kept in memory, larger reports are written to a temporary file. Rows are then parsed directly from the
+        compressed CSV file in the ZIP file; memory use does not depend on the size of the report.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file; default: system default for temporary files
+        :type spool_dir: str
+        :return: yields dicts
+        """
+        async for batch in self._download_batches(
+            url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir
+        ):
+            for row in batch:
+                yield row
+
+    async def _download_batches(
+        self,
+        url: str,
+        chunk_size: int,
+        spool_size: int,
+        spool_dir: Optional[str],
+        parser: Callable[[Iterable[dict[str, Any]]], Iterable[Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[tuple[Any, ...], None]:
+        """
+        Download a report and yield the parsed rows in batches
+
+        Writes to the spool file (which go to disk once the report exceeds `spool_size`), decompression, CSV parsing,
+        and `parser` run in worker threads so that the event loop is not blocked while a large report is processed.
+
+        :meta private:
+        """
+        headers = {'Authorization': f'Bearer {self.session.access_token}'}
+        spool = tempfile.SpooledTemporaryFile(max_size=spool_size, dir=spool_dir)
+        try:
+            async with self.session.get(url, headers=headers) as r:
+                r.raise_for_status()
+                async for chunk in r.content.iter_chunked(chunk_size):
+                    await asyncio.to_thread(spool.write, chunk)
+            await asyncio.to_thread(spool.seek, 0)
+            rows: Iterable[Any] = self._zip_rows(spool)
+            if parser is not None:
+                rows = parser(rows)
+            batches = self._batches(rows, batch_size)
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                yield batch
+        finally:
+            await asyncio.to_thread(spool.close)
+
+    async def download(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> builtins.list[dict]:
+        """
+        Download a report from the given URL and return the rows as dicts
+
+        Use :meth:`download_gen` to process rows without holding all of them in memory.
+
         :param url: download URL
         :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file; default: system default for temporary files
+        :type spool_dir: str
         :return: list of dicts (one per row)
         :rtype: list[dict]
         """
-        raise NotImplementedError('async download not implemented; use sync call instead')
+        return [
+            row
+            async for row in self.download_gen(url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir)
+        ]
+        
+
+    async def download_cdrs_gen(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> AsyncGenerator[CallingCDR, None]:
+        """
+        Download a Calling Detailed Call History report from the given URL and yield the rows as
+        :class:`CallingCDR` instances
+
+        See :meth:`download_gen` for the parameters.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file
+        :type spool_dir: str
+        :return: yields CDRs
+        """
+        async for batch in self._download_batches(
+            url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir, parser=CallingCDR.parse_records
+        ):
+            for cdr in batch:
+                yield cdr
+
+    async def download_cdrs(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> builtins.list[CallingCDR]:
+        """
+        Download a Calling Detailed Call History report from the given URL and return the rows as
+        :class:`CallingCDR` instances
+
+        See :meth:`download_gen` for the parameters.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file
+        :type spool_dir: str
+        :return: list of CDRs
+        :rtype: list[CallingCDR]
+        """
+        return [
+            cdr
+            async for cdr in self.download_cdrs_gen(
+                url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir
+            )
+        ]
         
 
 
@@ -37993,7 +38815,9 @@ class AsVoicePortalApi(AsApiChild, base='telephony/config/locations'):
         :param org_id: Organization to which the voice portal belongs.
         :type org_id: str
         """
-        data = json.loads(settings.model_dump_json(exclude={'portal_id': True, 'language': True}))
+        data = settings.model_dump(
+            mode='json', by_alias=True, exclude_none=True, exclude={'portal_id': True, 'language': True}
+        )
         if passcode is not None:
             data['passcode'] = {'newPasscode': passcode, 'confirmPasscode': passcode}
         params = org_id and {'orgId': org_id} or None
@@ -40649,6 +41473,34 @@ class AsWorkspacesApi(AsApiChild, base='workspaces'):
         result = await self.post(url, json=data)
         return Workspace.model_validate(result)
 
+    async def by_name(self, name: str, org_id: str = None) -> Optional[Workspace]:
+        """
+        Get a workspace by display name
+
+        Uses the session's :class:`wxc_sdk.directory.EntityDirectory`, if any
+
+        :param name: display name of the workspace
+        :type name: str
+        :param org_id: search in this organization
+        :type org_id: str
+        :return: workspace or None if no workspace with this name exists
+        :rtype: Workspace
+        """
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, workspace = directory.get('workspaces', 'name', name, org_id=org_id)
+            if found and (workspace is None or isinstance(workspace, Workspace)):
+                return workspace
+            epoch = directory.epoch
+        workspace = next(
+            (workspace for workspace in await self.list(display_name=name, org_id=org_id) if workspace.display_name == name),
+            None,
+        )
+        if directory is not None:
+            directory.put('workspaces', 'name', name, workspace, org_id=org_id, epoch=epoch)
+        return workspace
+
     async def details(self, workspace_id: str, include_devices: bool = None) -> Workspace:
         """
         Get Workspace Details
@@ -40656,6 +41508,8 @@ class AsWorkspacesApi(AsApiChild, base='workspaces'):
         Shows details for a workspace, by ID. The `locationId`, `workspaceLocationId`, `floorId`, `indoorNavigation`,
         `capacity`, `type` and `notes` fields will only be present if they have been set for the workspace.
 
+        Without `include_devices` the session's :class:`wxc_sdk.directory.EntityDirectory`, if any, is used
+
         :param workspace_id: A unique identifier for the workspace.
         :type workspace_id: str
         :param include_devices: Flag identifying whether to include the devices associated with the workspace in the
@@ -40664,11 +41518,22 @@ class AsWorkspacesApi(AsApiChild, base='workspaces'):
         :return: workspace details
         :rtype: :class:`Workspace`
         """
+        # entities in the directory don't have devices
+        directory = None if include_devices is not None else self.session.directory
+        epoch = None
+        if directory is not None:
+            found, workspace = directory.get('workspaces', 'id', workspace_id)
+            if found and isinstance(workspace, Workspace):
+                return workspace
+            epoch = directory.epoch
         params = {}
         if include_devices is not None:
             params['includeDevices'] = str(include_devices).lower()
         url = self.ep(workspace_id)
-        return Workspace.model_validate(await self.get(url, params=params))
+        workspace = Workspace.model_validate(await self.get(url, params=params))
+        if directory is not None:
+            directory.put('workspaces', 'id', workspace_id, workspace, epoch=epoch)
+        return workspace
 
     async def update(self, workspace_id: str, settings: Workspace) -> Workspace:
         """
@@ -40855,6 +41720,8 @@ class AsWebexSimpleApi:
     attachment_actions: AsAttachmentActionsApi
     #: Authorizations API :class:`AsAuthorizationsApi`
     authorizations: AsAuthorizationsApi
+    #: bounded parallel execution of one operation for many items :class:`AsBulkExecutor`
+    bulk: AsBulkExecutor
     #: CDR API :class:`AsDetailedCDRApi`
     cdr: AsDetailedCDRApi
     #: converged recordings API :class:`AsConvergedRecordingsApi`
@@ -40871,6 +41738,8 @@ class AsWebexSimpleApi:
     guests: AsGuestManagementApi
     #: jobs API: :class:`AsJobsApi`
     jobs: AsJobsApi
+    #: wait for jobs to complete :class:`AsJobWaiter`
+    job_waiter: AsJobWaiter
     #: Licenses API :class:`AsLicensesApi`
     licenses: AsLicensesApi
     #: Location API :class:`AsLocationsApi`
@@ -40970,6 +41839,7 @@ class AsWebexSimpleApi:
         self.admin_audit = AsAdminAuditEventsApi(session=session)
         self.attachment_actions = AsAttachmentActionsApi(session=session)
         self.authorizations = AsAuthorizationsApi(session=session)
+        self.bulk = AsBulkExecutor(session=session)
         self.cdr = AsDetailedCDRApi(session=session)
         self.converged_recordings = AsConvergedRecordingsApi(session=session)
         self.device_configurations = AsDeviceConfigurationsApi(session=session)
@@ -40978,6 +41848,7 @@ class AsWebexSimpleApi:
         self.groups = AsGroupsApi(session=session)
         self.guests = AsGuestManagementApi(session=session)
         self.jobs = AsJobsApi(session=session)
+        self.job_waiter = AsJobWaiter(session=session)
         self.licenses = AsLicensesApi(session=session)
         self.locations = AsLocationsApi(session=session)
         self.me = AsMeSettingsApi(session=session)
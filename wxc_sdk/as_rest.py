@@ -3,17 +3,18 @@ REST session for Webex API requests
 """
 
 import asyncio
-import json as json_mod
+import copy
 import logging
 import ssl
 import urllib.parse
 import uuid
 from asyncio import Semaphore
-from collections.abc import AsyncGenerator, Callable
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Iterator
 from dataclasses import dataclass
 from functools import wraps
 from io import StringIO, TextIOBase
-from json import JSONDecodeError
+from itertools import count
 from time import perf_counter_ns
 from typing import Any, Optional, Union
 
@@ -23,6 +24,14 @@ from aiohttp.typedefs import LooseHeaders
 from pydantic import ValidationError
 
 from .base import RETRY_429_MAX_WAIT, ApiModel, ApiModelType, StrOrDict
+from .cache import ResponseCache
+from .directory import EntityDirectory
+from .json_codec import JsonCodec, StdlibCodec, get_codec
+from .metrics import SessionMetrics
+from .pagination import ItemMode, as_iter_items, item_converter, offset_paging, offset_url, page_items
+from .pagination import as_prefetch as as_prefetch_pages
+from .single_flight import AsSingleFlight
+from .throttle import AsAdaptiveConcurrency, AsBackoffGate
 from .tokens import Tokens
 
 __all__ = ['AsErrorMessage', 'AsSingleError', 'AsErrorDetail', 'AsRestError', 'as_dump_response', 'AsRestSession']
@@ -132,6 +141,7 @@ def as_dump_response(
     file: TextIOBase = None,
     dump_log: logging.Logger = None,
     diff_ns: int = None,
+    codec: JsonCodec = None,
 ) -> None:
     """
     Dump response object to log file
@@ -145,15 +155,17 @@ def as_dump_response(
     :type dump_log: logging.Logger
     :param diff_ns: time the request took (in ns)
     :type diff_ns: int
+    :param codec: JSON codec to pretty print the response body; default: standard library
     """
     if not log.isEnabledFor(logging.DEBUG):
         return
     dump_log = dump_log or log
     output = file or StringIO()
+    codec = codec or StdlibCodec()
 
     # dump response objects in redirect history
     for h in response.history:
-        as_dump_response(response=h, file=output)
+        as_dump_response(response=h, file=output, codec=codec)
 
     if diff_ns is None:
         time_str = ''
@@ -194,7 +206,7 @@ def as_dump_response(
                 body['access_token'] = '***'
             if 'refresh_token' in body:
                 body['refresh_token'] = '***'
-        body = json_mod.dumps(body, indent=2)
+        body = codec.dumps_pretty(body)
         for line in body.splitlines():
             print(f'  {line}', file=output)
     print(' --- end ---', file=output)
@@ -206,18 +218,25 @@ def retry_request(
     func: Callable[..., tuple[ClientResponse, StrOrDict]],
 ) -> Callable[..., tuple[ClientResponse, StrOrDict]]:
     """
-    Decorator for the request method in the AsRestSession class. Used to implement backoff on 429 responses
+    Decorator for the request method in the AsRestSession class. Used to implement backoff on 429 responses.
+
+    A 429 response closes the session's :class:`wxc_sdk.throttle.AsBackoffGate`. All requests (including the one that
+    got the 429) wait at the gate without holding a slot of the session's concurrency limit.
+
+    If the session uses an :class:`wxc_sdk.throttle.AsAdaptiveConcurrency` limiter, then latencies of successful
+    requests, 429 responses, and timeouts are reported to the limiter.
 
     :param func:
     :return:
     """
 
-    async def giveup_429(e: ClientResponseError, retry_429: bool) -> bool:
+    async def giveup_429(e: ClientResponseError, retry_429: bool, gate: AsBackoffGate) -> bool:
         """
         callback for backoff on REST requests
 
         :param e: latest exception
         :param retry_429: retry on 429?
+        :param gate: backoff gate of the session
         :return: True -> break the backoff loop
         """
         if e.status != 429 or not retry_429:
@@ -230,39 +249,158 @@ def retry_request(
         # never wait more than the defined maximum wait time
         retry_after = min(retry_after, RETRY_429_MAX_WAIT)
         log.warning(f'429 retry after {retry_after} on {e.request_info.method} {e.request_info.url}')
-        await asyncio.sleep(retry_after)
+        # close the gate for all requests on the session; the actual wait happens at the gate
+        gate.close_for(retry_after)
         return False
 
     @wraps(func)
     async def wrapper(session: 'AsRestSession', *args: Any, **kwargs: Any) -> tuple[ClientResponse, StrOrDict]:
-        async with session._sem:
-            while True:
+        gate = session.backoff
+        adaptive = session.adaptive_concurrency
+        metrics = session.metrics
+        while True:
+            waited = await gate.wait()
+            slot_wait_start = perf_counter_ns()
+            async with session._sem:
+                if metrics is not None:
+                    metrics.record_throttled_wait(waited)
+                    metrics.record_semaphore_wait((perf_counter_ns() - slot_wait_start) / 1e9)
+                if not gate.is_open:
+                    # the gate was closed while we were waiting for a slot -> give the slot back and wait again
+                    continue
+                start = perf_counter_ns()
                 try:
                     result = await func(session, *args, **kwargs)  # type: ignore[misc]
                 except ClientResponseError as e:
-                    if await giveup_429(e, session.retry_429):
+                    if adaptive is not None and e.status == 429:
+                        adaptive.record_congestion('throttled')
+                    if await giveup_429(e, session.retry_429, gate):
                         raise
+                except TimeoutError:
+                    if adaptive is not None:
+                        adaptive.record_congestion('timeout')
+                    raise
                 else:
-                    break
-        return result  # type: ignore[no-any-return]
+                    if adaptive is not None:
+                        adaptive.record_success((perf_counter_ns() - start) / 1e9)
+                    return result  # type: ignore[no-any-return]
 
     return wrapper  # type: ignore[return-value]
 
 
-# Callback for response logging
-# callbacks get called with the response object, request body(str), request content type (str), response body, and the
-# time the request took
-AsRestResponseCallBack = Callable[[ClientResponse, str, str, dict[Any, Any], int], None]
+def cache_request(
+    func: Callable[..., tuple[ClientResponse, StrOrDict]],
+) -> Callable[..., tuple[ClientResponse, StrOrDict]]:
+    """
+    Decorator for the request method in the AsRestSession class. Used to serve GET requests from the session's
+    :class:`wxc_sdk.cache.ResponseCache` and to invalidate cached responses on updates.
+
+    Callers always get their own copy of the response body.
+
+    :param func:
+    :return:
+    """
 
+    @wraps(func)
+    async def wrapper(
+        session: 'AsRestSession', method: str, url: str, **kwargs: Any
+    ) -> tuple[ClientResponse, StrOrDict]:
+        cache = session.cache
+        if cache is None:
+            return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+        path = cache.path(session.BASE, url)
+        if method != 'GET':
+            try:
+                return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+            finally:
+                cache.invalidate_path(path)
+        ttl = cache.ttl(path)
+        if ttl is None:
+            return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+        key = cache.key(url, kwargs.get('params'), session.access_token)
+        entry = cache.get(key)
+        if entry is not None:
+            if entry.fresh:
+                return entry.response, copy.deepcopy(entry.data)
+            # expired entry with ETag: revalidate
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'If-None-Match': entry.etag}
+        epoch = cache.epoch
+        response, data = await func(session, method, url, **kwargs)  # type: ignore[misc]
+        if entry is not None and response.status == 304:
+            cache.refresh(entry, ttl)
+            return entry.response, copy.deepcopy(entry.data)
+        if 200 <= response.status < 300:
+            cache.put(key, path, response, data, ttl=ttl, etag=response.headers.get('ETag'), epoch=epoch)
+        return response, data
 
-# as_dump_response(response=response, data=data, json=json, response_data=response_data, diff_ns=diff_ns)
-#
+    return wrapper  # type: ignore[return-value]
 
 
-def _dump_response_callback(
-    response: ClientResponse, request_body: str, request_ct: str, response_data: str, diff_ns: int
-) -> None:
-    as_dump_response(response=response, request_body=request_body, response_data=response_data, diff_ns=diff_ns)
+def directory_request(
+    func: Callable[..., tuple[ClientResponse, StrOrDict]],
+) -> Callable[..., tuple[ClientResponse, StrOrDict]]:
+    """
+    Decorator for the request method in the AsRestSession class. Invalidates entries of the session's
+    :class:`wxc_sdk.directory.EntityDirectory` on updates.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    async def wrapper(
+        session: 'AsRestSession', method: str, url: str, **kwargs: Any
+    ) -> tuple[ClientResponse, StrOrDict]:
+        directory = session.directory
+        if directory is None or method == 'GET':
+            return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+        try:
+            return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+        finally:
+            directory.invalidate_path(ResponseCache.path(session.BASE, url))
+
+    return wrapper  # type: ignore[return-value]
+
+
+def single_flight_request(
+    func: Callable[..., tuple[ClientResponse, StrOrDict]],
+) -> Callable[..., tuple[ClientResponse, StrOrDict]]:
+    """
+    Decorator for the request method in the AsRestSession class. Identical GET requests (same URL, parameters, and
+    access token) in flight at the same time share a single request if the session has a single-flight group.
+
+    Callers always get their own copy of the response body.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    async def wrapper(
+        session: 'AsRestSession', method: str, url: str, **kwargs: Any
+    ) -> tuple[ClientResponse, StrOrDict]:
+        flights = session.single_flight
+        if flights is None:
+            return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+        if method != 'GET':
+            try:
+                return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+            finally:
+                # requests after an update don't join requests sent before the update
+                flights.forget()
+        if set(kwargs) - {'params'}:
+            # only plain GET requests are shared
+            return await func(session, method, url, **kwargs)  # type: ignore[misc,no-any-return]
+        key = ResponseCache.key(url, kwargs.get('params'), session.access_token)
+        return await flights.run(key, lambda: func(session, method, url, **kwargs))  # type: ignore[arg-type,return-value]
+
+    return wrapper  # type: ignore[return-value]
+
+
+# Callback for response logging
+# callbacks get called with the response object, request body(str), request content type (str), response body, and the
+# time the request took
+AsRestResponseCallBack = Callable[[ClientResponse, str, str, dict[Any, Any], int], None]
 
 
 @dataclass(init=False, repr=False)
@@ -280,9 +418,30 @@ class AsRestSession(ClientSession):
     # Bearer token(s) for this session
     _tokens: Tokens
     # semaphore for rate limiting
-    _sem: Semaphore
+    _sem: Union[Semaphore, AsAdaptiveConcurrency]
     # retry on 429?
     retry_429: bool
+    #: gate used to back off all requests of the session after a 429 response
+    backoff: AsBackoffGate
+    #: adaptive concurrency limiter; None if the session uses a fixed concurrency limit
+    adaptive_concurrency: Optional[AsAdaptiveConcurrency]
+    #: maximum number of concurrent requests; with adaptive concurrency the maximum limit of the limiter
+    max_concurrent_requests: int
+    #: default for number of pages :meth:`follow_pagination` reads ahead in a background task
+    pagination_prefetch: int
+    #: default for maximum number of concurrent page requests :meth:`follow_pagination` uses for offset based
+    #: pagination; 0: pages are requested one after another
+    pagination_parallel: int
+    #: JSON codec used to decode response bodies, encode request bodies, and to dump requests and responses
+    json_codec: JsonCodec
+    #: response cache; None if responses are not cached
+    cache: Optional[ResponseCache]
+    #: entity directory used by the lookup helpers; None if lookups are not cached
+    directory: Optional[EntityDirectory]
+    #: request metrics; None if metrics are not collected
+    metrics: Optional[SessionMetrics]
+    #: single-flight group for identical GET requests; None if identical requests are not shared
+    single_flight: Optional[AsSingleFlight]
     # registry of response callbacks
     _response_callback_registry: dict[str, AsRestResponseCallBack]
     # additional request arguments
@@ -297,6 +456,15 @@ class AsRestSession(ClientSession):
         trace_configs: list[TraceConfig] = None,
         proxy_url: str = None,
         ssl: Union[bool, aiohttp.Fingerprint, ssl.SSLContext] = None,
+        backoff: AsBackoffGate = None,
+        adaptive_concurrency: Union[bool, AsAdaptiveConcurrency] = False,
+        pagination_prefetch: int = 0,
+        pagination_parallel: int = 0,
+        cache: Union[bool, ResponseCache] = False,
+        directory: Union[bool, EntityDirectory] = False,
+        single_flight: bool = False,
+        metrics: Union[bool, SessionMetrics] = False,
+        json_codec: Union[str, JsonCodec] = 'stdlib',
         **kwargs: Any,
     ):
         """
@@ -308,15 +476,68 @@ class AsRestSession(ClientSession):
         :param trace_configs: trace configurations, passed to :class:`aiohttp.ClientSession`
         :param proxy_url: used as proxy argument for all :meth:`aiohttp.ClientSession.request` calls
         :param ssl: used as ssl argument for all :meth:`aiohttp.ClientSession.request` calls
+        :param backoff: backoff gate to use for this session. Pass the same :class:`wxc_sdk.throttle.AsBackoffGate`
+            instance to multiple sessions to have them back off together. If not given, then the session creates its
+            own gate.
+        :param adaptive_concurrency: if True, then instead of a fixed limit of `concurrent_requests` concurrent
+            requests an :class:`wxc_sdk.throttle.AsAdaptiveConcurrency` limiter starting at `concurrent_requests` is
+            used. Alternatively, a pre-configured :class:`wxc_sdk.throttle.AsAdaptiveConcurrency` instance can be
+            passed.
+        :param pagination_prefetch: number of pages list requests read ahead in a background task while the
+            caller processes the items of the current page. Default: 0, no read ahead
+        :param pagination_parallel: maximum number of concurrent page requests for list requests with offset based
+            pagination (`start` and `max` parameters). Default: 0, pages are requested one after another
+        :param cache: if True, then responses of GET requests to endpoints returning reference data are cached using
+            a :class:`wxc_sdk.cache.ResponseCache` with default rules. Alternatively, a pre-configured
+            :class:`wxc_sdk.cache.ResponseCache` instance can be passed.
+        :param directory: if True, then the lookup helpers like :meth:`wxc_sdk.locations.LocationsApi.by_name` cache
+            people, locations, and workspaces in a :class:`wxc_sdk.directory.EntityDirectory` with default settings.
+            Alternatively, a pre-configured :class:`wxc_sdk.directory.EntityDirectory` instance can be passed.
+        :param single_flight: if True, then identical GET requests (same URL, parameters, and access token) in flight
+            at the same time share a single request. Each caller gets its own copy of the response body.
+        :param metrics: if True, then request metrics are collected in a :class:`wxc_sdk.metrics.SessionMetrics`
+            instance. Alternatively, a :class:`wxc_sdk.metrics.SessionMetrics` instance can be passed, for example to
+            aggregate metrics of multiple sessions.
+        :param json_codec: JSON codec for request and response bodies: 'stdlib', 'orjson', 'msgspec', 'auto' (orjson
+            or msgspec if installed, else standard library), or a :class:`wxc_sdk.json_codec.JsonCodec` instance.
+            Default: 'stdlib'
         :param kwargs: additional arguments. All arguments with a `req_ prefix are passed to each
             :meth:`aiohttp.ClientSession.request` call. All other arguments are passed to the constructor of
             :class:`aiohttp.ClientSession`
         """
         self._tokens = tokens
-        self._sem = Semaphore(concurrent_requests)
+        if adaptive_concurrency is True:
+            adaptive_concurrency = AsAdaptiveConcurrency(
+                initial_limit=concurrent_requests, max_limit=max(concurrent_requests, 100)
+            )
+        self.adaptive_concurrency = adaptive_concurrency or None
+        if self.adaptive_concurrency is None:
+            self._sem = Semaphore(concurrent_requests)
+            self.max_concurrent_requests = concurrent_requests
+        else:
+            self._sem = self.adaptive_concurrency
+            self.max_concurrent_requests = self.adaptive_concurrency.max_limit
         self.retry_429 = retry_429
+        self.backoff = backoff or AsBackoffGate()
+        self.pagination_prefetch = pagination_prefetch
+        self.pagination_parallel = pagination_parallel
+        if cache is True:
+            cache = ResponseCache()
+        # an empty cache is falsy
+        self.cache = cache if isinstance(cache, ResponseCache) else None
+        if directory is True:
+            directory = EntityDirectory()
+        # an empty directory is falsy
+        self.directory = directory if isinstance(directory, EntityDirectory) else None
+        self.single_flight = AsSingleFlight() if single_flight else None
+        if metrics is True:
+            metrics = SessionMetrics()
+        self.metrics = metrics if isinstance(metrics, SessionMetrics) else None
+        self.json_codec = get_codec(json_codec)
         self._response_callback_registry = dict()
-        self.register_response_callback(_dump_response_callback)  # type: ignore[arg-type]
+        self.register_response_callback(self._dump_response_callback)  # type: ignore[arg-type]
+        if self.metrics is not None:
+            self.register_response_callback(self._metrics_callback)
         # keyword arguments for requests start with 'req_'. Any other keyword arguments are passed to the session.
         request_arguments = dict()
         session_arguments = dict()
@@ -373,7 +594,7 @@ class AsRestSession(ClientSession):
         self,
         response: ClientResponse,
         request_data: Union[str, dict[str, Any]],
-        request_json: dict[str, Any],
+        request_json: Optional[bytes],
         response_data: Union[str, dict[str, Any]],
         diff_ns: int,
     ) -> None:
@@ -398,11 +619,47 @@ class AsRestSession(ClientSession):
             # noinspection PyUnresolvedReferences
             body_ct = request_data.content_type
         elif request_json:
-            body_str = json_mod.dumps(request_json)
+            body_str = request_json.decode('utf-8')
             body_ct = 'application/json;charset=utf-8'
         for callback in self._response_callback_registry.values():
             callback(response, body_str, body_ct, response_data, diff_ns)  # type: ignore[arg-type]
 
+    def _dump_response_callback(
+        self, response: ClientResponse, request_body: str, request_ct: str, response_data: str, diff_ns: int
+    ) -> None:
+        """
+        Response callback to dump requests and responses to the log
+
+        :meta private:
+        """
+        as_dump_response(
+            response=response,
+            request_body=request_body,
+            response_data=response_data,
+            diff_ns=diff_ns,
+            codec=self.json_codec,
+        )
+
+    def _metrics_callback(
+        self, response: ClientResponse, request_body: str, request_ct: str, response_data: StrOrDict, diff_ns: int
+    ) -> None:
+        """
+        Response callback to record request metrics
+
+        :meta private:
+        """
+        if self.metrics is None:
+            return
+        body = getattr(response, '_body', None)
+        self.metrics.record_response(
+            method=response.request_info.method,
+            path=ResponseCache.path(self.BASE, str(response.request_info.url)),
+            status=response.status,
+            seconds=diff_ns / 1e9,
+            bytes_in=len(body) if body is not None else response.content_length or 0,
+            bytes_out=len(request_body) if request_body else 0,
+        )
+
     def unregister_response_callback(self, id: str) -> None:
         """
         Unregister a response callback
@@ -432,6 +689,9 @@ class AsRestSession(ClientSession):
         """
         return self._tokens.access_token
 
+    @directory_request
+    @cache_request
+    @single_flight_request
     @retry_request  # type: ignore[arg-type]
     async def _request_w_response(
         self,
@@ -478,19 +738,27 @@ class AsRestSession(ClientSession):
         else:
             # just pick one set of arguments .. or none
             additional_arguments = kwargs or self._request_arguments
+        # JSON body is encoded with the session's codec
+        json_body = self.json_codec.dumps(json) if json is not None else None
         # the event is cleared if any task hit a 429
         start = perf_counter_ns()
         async with self.request(
-            method, url=url, headers=request_headers, data=data, json=json, **additional_arguments
+            method,
+            url=url,
+            headers=request_headers,
+            data=data if json_body is None else json_body,
+            **additional_arguments,
         ) as response:
             # get response body as text or dict (parsed JSON)
             ct = response.headers.get('Content-Type')
             if not ct:
-                response_data = ''
+                response_data: Any = ''
             elif ct.startswith('application/json'):
+                body = await response.read()
                 try:
-                    response_data = await response.json()
-                except JSONDecodeError:
+                    # same as ClientResponse.json(): empty body -> None
+                    response_data = self.json_codec.loads(body) if body.strip() else None
+                except ValueError:
                     response_data = await response.text()
             else:
                 response_data = await response.text()
@@ -500,7 +768,7 @@ class AsRestSession(ClientSession):
             self._dispatch_to_response_callbacks(
                 response=response,
                 request_data=data,  # type: ignore[arg-type]
-                request_json=json,  # type: ignore[arg-type]
+                request_json=json_body,
                 response_data=response_data,
                 diff_ns=diff_ns,
             )
@@ -587,36 +855,27 @@ class AsRestSession(ClientSession):
         """
         return await self._rest_request('PATCH', *args, **kwargs)
 
-    async def follow_pagination(
+    async def _item_pages(
         self,
         url: str,
-        model: type[ApiModelType] = None,
-        params: dict[str, Any] = None,
-        item_key: str = None,
+        params: Optional[dict[str, Any]],
+        item_key: Optional[str],
+        parallel: int = 0,
+        ordered: bool = True,
         **kwargs: Any,
-    ) -> AsyncGenerator[ApiModelType, None]:
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
         """
-        Handling RFC5988 pagination of list requests. Generator of parsed objects
+        Follow RFC5988 pagination and yield the list of items of each page
 
+        :meta private:
         :param url: start url for 1st GET
-        :type url: str
-        :param model: data type to return
-        :type model: ApiModel
         :param params: URL parameters, optional
-        :type params: Optional[dict]
         :param item_key: key to list of values
-        :type item_key: str
-        :return: yields parsed objects
+        :param parallel: maximum number of concurrent page requests if the 'next' URL of the 1st page shows offset
+            based pagination
+        :param ordered: yield pages in order
+        :return: yields the list of items of each page
         """
-
-        def noop(x: Any) -> Any:
-            return x
-
-        if model is None or not issubclass(model, ApiModel):
-            model = noop  # type: ignore[assignment]
-        else:
-            model = model.model_validate  # type: ignore[assignment]
-
         cur_url: Optional[str] = url
         while cur_url:
             log.debug(f'{self.__class__.__name__}.pagination: getting {cur_url}')
@@ -628,21 +887,145 @@ class AsRestSession(ClientSession):
                 cur_url = str(response.links['next']['url'])
             except KeyError:
                 cur_url = None
-            else:
-                pass
             if not data:
                 continue
             # return all items
-            if item_key is None:
-                if 'items' in data:
-                    item_key = 'items'
-                else:
-                    # we go w/ the first return value that is a list
-                    item_key = next((k for k, v in data.items() if isinstance(v, list)))
-            items = data.get(item_key, [])
+            item_key, items = page_items(data, item_key)
             # if the response has no items, we're done
             if not items:
                 log.debug(f'{self.__class__.__name__}.pagination: no items found')
                 break
-            for item in items:
-                yield model(item)  # type: ignore[call-arg,misc]
+            yield items
+            if parallel and cur_url and (paging := offset_paging(cur_url, data, items)):
+                # offset based pagination: we can get the remaining pages concurrently
+                start, page_size, total = paging
+                async for items in self._offset_pages(
+                    url=cur_url,
+                    start=start,
+                    page_size=page_size,
+                    total=total,
+                    item_key=item_key,
+                    parallel=parallel,
+                    ordered=ordered,
+                    **kwargs,
+                ):
+                    yield items
+                break
+
+    async def _offset_pages(
+        self,
+        url: str,
+        start: int,
+        page_size: int,
+        total: Optional[int],
+        item_key: str,
+        parallel: int,
+        ordered: bool,
+        **kwargs: Any,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Get pages of a list request with offset based pagination concurrently
+
+        If the total number of items is not known, then up to `parallel` pages are requested ahead until the first
+        page with less than `page_size` items shows the end of the list.
+
+        :meta private:
+        :param url: URL of the next page
+        :param start: start of next page
+        :param page_size: number of items per page
+        :param total: total number of items, if known
+        :param item_key: key to list of values
+        :param parallel: maximum number of concurrent page requests
+        :param ordered: yield pages in order; else pages are yielded as soon as they are available
+        :return: yields the list of items of each page
+        """
+
+        async def get_page(page_start: int) -> list[dict[str, Any]]:
+            page_url = offset_url(url, page_start)
+            log.debug(f'{self.__class__.__name__}.pagination: getting {page_url}')
+            _, data = await self._request_w_response('GET', url=page_url, **kwargs)  # type: ignore[misc]
+            return page_items(data, item_key)[1] if data else []
+
+        starts: Iterator[int] = iter(range(start, total, page_size)) if total is not None else count(start, page_size)
+        pending: deque[asyncio.Task[list[dict[str, Any]]]] = deque()
+        # set as soon as a short page shows the end of the list
+        last_page = False
+        try:
+            while True:
+                # keep up to `parallel` page requests in flight
+                while not last_page and len(pending) < parallel:
+                    page_start = next(starts, None)
+                    if page_start is None:
+                        break
+                    pending.append(asyncio.create_task(get_page(page_start)))
+                if not pending:
+                    break
+                if ordered:
+                    task = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = done.pop()
+                    pending.remove(task)
+                items = await task
+                if len(items) < page_size:
+                    last_page = True
+                    if ordered:
+                        # all pending requests are for pages after the end of the list
+                        yield items
+                        break
+                if items:
+                    yield items
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def follow_pagination(
+        self,
+        url: str,
+        model: type[ApiModelType] = None,
+        params: dict[str, Any] = None,
+        item_key: str = None,
+        prefetch: int = None,
+        parallel: int = None,
+        ordered: bool = True,
+        item_mode: ItemMode = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[ApiModelType, None]:
+        """
+        Handling RFC5988 pagination of list requests. Generator of parsed objects
+
+        :param url: start url for 1st GET
+        :type url: str
+        :param model: data type to return
+        :type model: ApiModel
+        :param params: URL parameters, optional
+        :type params: Optional[dict]
+        :param item_key: key to list of values
+        :type item_key: str
+        :param prefetch: number of pages to read ahead in a background task while the caller processes the items
+            of the current page. Default: :attr:`pagination_prefetch`
+        :type prefetch: int
+        :param parallel: maximum number of concurrent page requests if the list request uses offset based pagination
+            (`start` and `max` parameters). Default: :attr:`pagination_parallel`
+        :type parallel: int
+        :param ordered: only relevant for concurrent page requests: if False, then items are yielded as soon as a page
+            is available; the order of the items is not guaranteed
+        :type ordered: bool
+        :param item_mode: how to convert items: validated models (default), plain dicts, models created w/o
+            validation, or lazily validated proxies. Default: mode set by :func:`wxc_sdk.pagination.item_mode` when
+            this method is called
+        :type item_mode: ItemMode
+        :return: yields parsed objects
+        """
+        # the item mode is determined now; it applies even if the generator is consumed outside the current context
+        converter = item_converter(model, item_mode)
+        if prefetch is None:
+            prefetch = self.pagination_prefetch
+        if parallel is None:
+            parallel = self.pagination_parallel
+        pages = self._item_pages(
+            url=url, params=params, item_key=item_key, parallel=parallel, ordered=ordered, **kwargs
+        )
+        if prefetch:
+            pages = as_prefetch_pages(pages, depth=prefetch)
+        return as_iter_items(pages, converter)
@@ -0,0 +1,421 @@
+"""
+Bounded parallel execution of one operation for many items; available as :attr:`wxc_sdk.WebexSimpleApi.bulk` and
+:attr:`wxc_sdk.as_api.AsWebexSimpleApi.bulk`
+
+Example: update the caller ID settings of all users in a location
+
+.. code-block:: python
+
+    def update(user: Person):
+        api.person_settings.caller_id.configure(entity_id=user.person_id,
+                                                selected=CallerIdSelectedType.location_number)
+
+    users = list(api.people.list(location_id=location_id, calling_data=True))
+    for result in api.bulk.map(update, users):
+        if not result.ok:
+            print(f'{result.item.display_name}: {result.exception}')
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from queue import SimpleQueue
+from threading import Event
+from typing import Any, Generic, Optional, TypeVar, Union
+
+from .rest import RestSession
+
+__all__ = ['BulkResult', 'BulkProgress', 'BulkReport', 'RetryOn', 'BulkExecutor']
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+#: exceptions to retry: an exception class, a tuple of exception classes, or a predicate called with the exception
+RetryOn = Union[type[Exception], tuple[type[Exception], ...], Callable[[Exception], bool]]
+
+
+@dataclass
+class BulkResult(Generic[T, R]):
+    """
+    Outcome of the operation for one item
+    """
+
+    #: position of the item in the input
+    index: int
+    #: the item
+    item: T
+    #: return value of the operation; None if the operation failed
+    result: Optional[R] = None
+    #: exception raised by the operation; None if the operation succeeded. If the operation was retried then this is
+    #: the exception of the last attempt
+    exception: Optional[Exception] = None
+    #: number of times the operation was called for the item
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the operation succeeded
+        """
+        return self.exception is None
+
+
+@dataclass
+class BulkProgress:
+    """
+    Progress of a bulk run; passed to the progress callback after each completed item
+    """
+
+    #: number of completed items
+    done: int = 0
+    #: number of items for which the operation succeeded
+    succeeded: int = 0
+    #: number of items for which the operation failed
+    failed: int = 0
+    #: total number of items; None if the items are not a sized collection
+    total: Optional[int] = None
+    #: number of retries
+    retried: int = 0
+
+    def record(self, result: BulkResult[Any, Any]) -> None:
+        """
+        Account for a completed item
+
+        :meta private:
+        """
+        self.done += 1
+        self.retried += result.attempts - 1
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+
+@dataclass
+class BulkReport(BulkProgress):
+    """
+    Outcome of a bulk run: counters and the results of the failed items. Results of successful items are not kept
+    """
+
+    #: results of the failed items
+    failures: list[BulkResult[Any, Any]] = field(default_factory=list)
+    #: True if the run was cancelled before all items were started
+    cancelled: bool = False
+    #: duration of the run in seconds
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the operation succeeded for all items
+        """
+        return not self.failed and not self.cancelled
+
+    def record(self, result: BulkResult[Any, Any]) -> None:
+        super().record(result)
+        if not result.ok:
+            self.failures.append(result)
+
+
+class BulkExecutor:
+    """
+    Run an operation for many items in parallel; the number of concurrent operations is bounded by the concurrency
+    limit of the session.
+
+    Exceptions raised by the operation are collected per item and don't abort the run. Selected exceptions can be
+    retried per item.
+    """
+
+    def __init__(self, *, session: RestSession):
+        self._session = session
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Default for the number of concurrent operations: the maximum number of concurrent requests of the session
+        """
+        return self._session.max_concurrent_requests
+
+    @staticmethod
+    def _retry(exception: Exception, retry_on: RetryOn) -> bool:
+        """
+        Check if an operation that failed with the given exception is to be retried
+
+        :meta private:
+        """
+        if isinstance(retry_on, (type, tuple)):
+            return isinstance(exception, retry_on)
+        return retry_on(exception)
+
+    def map(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        ordered: bool = True,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+        retry_delay: float = 1.0,
+    ) -> Generator[BulkResult[T, R], None, None]:
+        """
+        Call `func` for each item in a pool of worker threads and yield the results
+
+        Items are taken from `items` as workers become available; `items` can be a generator. If the caller stops
+        iterating then pending items are not started; operations in progress are completed before the generator
+        returns.
+
+        :param func: operation to call for each item
+        :param items: items
+        :param ordered: yield results in the order of the items; else results are yielded as operations complete
+        :param max_workers: number of concurrent operations; default: :attr:`max_workers`
+        :param progress: called with the :class:`BulkProgress` after each completed item
+        :param cancel: event to cancel the run: once set, no further items are started and failed operations are not
+            retried. Operations in progress are completed and their results are yielded
+        :param retries: number of times the operation is retried for an item if it fails with an exception matching
+            `retry_on`. 429 responses are already retried by the session
+        :param retry_on: exceptions to retry; see :data:`RetryOn`
+        :param retry_delay: delay before the first retry in seconds; doubles with each retry
+        :return: yields one :class:`BulkResult` per item
+        """
+        '''async
+    async def map(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        *,
+        ordered: bool = True,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: asyncio.Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+        retry_delay: float = 1.0,
+    ) -> AsyncGenerator[BulkResult, None]:
+        """
+        Await `func` for each item with a bounded number of concurrent tasks and yield the results
+
+        Items are taken from `items` as tasks complete; `items` can be a generator or an async iterable like the
+        result of a `list_gen()` call. If the caller stops iterating then pending items are not started and tasks in
+        progress are cancelled.
+
+        :param func: coroutine function to call for each item
+        :param items: items
+        :param ordered: yield results in the order of the items; else results are yielded as tasks complete
+        :param max_workers: number of concurrent tasks; default: :attr:`max_workers`
+        :param progress: called with the :class:`BulkProgress` after each completed item
+        :param cancel: event to cancel the run: once set, no further items are started and failed operations are not
+            retried. Tasks in progress are completed and their results are yielded
+        :param retries: number of times the operation is retried for an item if it fails with an exception matching
+            `retry_on`. 429 responses are already retried by the session
+        :param retry_on: exceptions to retry; see :data:`RetryOn`
+        :param retry_delay: delay before the first retry in seconds; doubles with each retry
+        :return: yields one :class:`BulkResult` per item
+        """
+        max_workers = max_workers or self.max_workers
+        stats = BulkProgress(total=len(items) if isinstance(items, Sized) else None)
+
+        async def call(index: int, item: Any) -> BulkResult:
+            attempt = 1
+            while True:
+                try:
+                    return BulkResult(index=index, item=item, result=await func(item), attempts=attempt)
+                except Exception as e:
+                    if attempt > retries or not self._retry(e, retry_on) or (cancel is not None and cancel.is_set()):
+                        return BulkResult(index=index, item=item, exception=e, attempts=attempt)
+                await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+                attempt += 1
+
+        async def indexed_items() -> AsyncGenerator[tuple[int, Any], None]:
+            if isinstance(items, AsyncIterable):
+                index = 0
+                async for item in items:
+                    yield index, item
+                    index += 1
+            else:
+                for entry in enumerate(items):
+                    yield entry
+
+        source = indexed_items()
+        pending: deque[asyncio.Task] = deque()
+        # unordered: tasks put themselves into this queue when done
+        completed: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+        try:
+            while True:
+                # keep up to max_workers tasks running
+                while len(pending) < max_workers and not (cancel is not None and cancel.is_set()):
+                    next_item = await anext(source, None)
+                    if next_item is None:
+                        break
+                    task = asyncio.create_task(call(*next_item))
+                    if not ordered:
+                        task.add_done_callback(completed.put_nowait)
+                    pending.append(task)
+                if not pending:
+                    break
+                if ordered:
+                    task = pending.popleft()
+                    await asyncio.wait([task])
+                else:
+                    task = await completed.get()
+                    pending.remove(task)
+                result = task.result()
+                stats.record(result)
+                if progress is not None:
+                    progress(stats)
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            await source.aclose()
+        '''
+        max_workers = max_workers or self.max_workers
+        stats = BulkProgress(total=len(items) if isinstance(items, Sized) else None)
+
+        def call(index: int, item: T) -> BulkResult[T, R]:
+            attempt = 1
+            while True:
+                try:
+                    return BulkResult(index=index, item=item, result=func(item), attempts=attempt)
+                except Exception as e:
+                    if attempt > retries or not self._retry(e, retry_on) or (cancel is not None and cancel.is_set()):
+                        return BulkResult(index=index, item=item, exception=e, attempts=attempt)
+                time.sleep(retry_delay * 2 ** (attempt - 1))
+                attempt += 1
+
+        indexed_items = enumerate(items)
+        pending: deque[Future[BulkResult[T, R]]] = deque()
+        # unordered: futures put themselves into this queue when done
+        completed: SimpleQueue[Future[BulkResult[T, R]]] = SimpleQueue()
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bulk')
+        try:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    # drop queued items which have not been started yet
+                    pending = deque(future for future in pending if not future.cancel())
+                else:
+                    # queue up to two items per worker so that workers don't idle while the caller handles results
+                    while len(pending) < 2 * max_workers:
+                        next_item = next(indexed_items, None)
+                        if next_item is None:
+                            break
+                        future = pool.submit(call, *next_item)
+                        if not ordered:
+                            future.add_done_callback(completed.put)
+                        pending.append(future)
+                if not pending:
+                    break
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    future = completed.get()
+                    if future.cancelled():
+                        # dropped after cancel
+                        continue
+                    pending.remove(future)
+                result = future.result()
+                stats.record(result)
+                if progress is not None:
+                    progress(stats)
+                yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def run(
+        self,
+        func: Callable[[T], Any],
+        items: Iterable[T],
+        *,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+        retry_delay: float = 1.0,
+    ) -> BulkReport:
+        """
+        Call `func` for each item in a pool of worker threads and return a report
+
+        Only the results of failed items are kept: memory use does not grow with the number of items. Use :meth:`map`
+        to work with the return values of the operation.
+
+        :param func: operation to call for each item
+        :param items: items
+        :param max_workers: number of concurrent operations; default: :attr:`max_workers`
+        :param progress: called with the :class:`BulkProgress` after each completed item
+        :param cancel: event to cancel the run; see :meth:`map`
+        :param retries: number of times the operation is retried for an item; see :meth:`map`
+        :param retry_on: exceptions to retry; see :data:`RetryOn`
+        :param retry_delay: delay before the first retry in seconds; doubles with each retry
+        :return: report with counters and the results of the failed items
+        """
+        '''async
+    async def run(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        *,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: asyncio.Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+        retry_delay: float = 1.0,
+    ) -> BulkReport:
+        """
+        Await `func` for each item with a bounded number of concurrent tasks and return a report
+
+        Only the results of failed items are kept: memory use does not grow with the number of items. Use :meth:`map`
+        to work with the return values of the operation.
+
+        :param func: coroutine function to call for each item
+        :param items: items
+        :param max_workers: number of concurrent tasks; default: :attr:`max_workers`
+        :param progress: called with the :class:`BulkProgress` after each completed item
+        :param cancel: event to cancel the run; see :meth:`map`
+        :param retries: number of times the operation is retried for an item; see :meth:`map`
+        :param retry_on: exceptions to retry; see :data:`RetryOn`
+        :param retry_delay: delay before the first retry in seconds; doubles with each retry
+        :return: report with counters and the results of the failed items
+        """
+        start = time.perf_counter()
+        report = BulkReport(total=len(items) if isinstance(items, Sized) else None)
+        async for result in self.map(
+            func,
+            items,
+            ordered=False,
+            max_workers=max_workers,
+            progress=progress,
+            cancel=cancel,
+            retries=retries,
+            retry_on=retry_on,
+            retry_delay=retry_delay,
+        ):
+            report.record(result)
+        report.cancelled = cancel is not None and cancel.is_set()
+        report.seconds = time.perf_counter() - start
+        return report
+        '''
+        start = time.perf_counter()
+        report = BulkReport(total=len(items) if isinstance(items, Sized) else None)
+        for result in self.map(
+            func,
+            items,
+            ordered=False,
+            max_workers=max_workers,
+            progress=progress,
+            cancel=cancel,
+            retries=retries,
+            retry_on=retry_on,
+            retry_delay=retry_delay,
+        ):
+            report.record(result)
+        report.cancelled = cancel is not None and cancel.is_set()
+        report.seconds = time.perf_counter() - start
+        return report
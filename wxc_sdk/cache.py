@@ -0,0 +1,280 @@
+"""
+Response cache shared by :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+__all__ = ['CacheRule', 'CacheEntry', 'ResponseCache', 'REFERENCE_DATA_RULES']
+
+
+def _match_path(path: str, pattern: str) -> bool:
+    """
+    Match a URL path against a pattern segment by segment; '**' matches any number of segments
+
+    :meta private:
+    """
+
+    def match(segments: list[str], patterns: list[str]) -> bool:
+        if not patterns:
+            return not segments
+        head, rest = patterns[0], patterns[1:]
+        if head == '**':
+            return any(match(segments[i:], rest) for i in range(len(segments) + 1))
+        return bool(segments) and fnmatchcase(segments[0], head) and match(segments[1:], rest)
+
+    return match(path.split('/'), pattern.split('/'))
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """
+    Time to live for cached responses of GET requests to endpoints matching a path pattern
+    """
+
+    #: pattern matched against the URL path relative to the API base URL; supports shell-style wildcards which match
+    #: within a path segment: 'locations/*' matches 'locations/{id}' but not 'locations/{id}/floors'. A '**' segment
+    #: matches any number of segments. Examples: 'locations', 'locations/*',
+    #: 'telephony/config/locations/*/outgoingPermission/*', 'locations/**'
+    pattern: str
+    #: time to live of cached responses in seconds
+    ttl: float
+
+
+#: rules for endpoints returning reference data that hardly ever changes
+REFERENCE_DATA_RULES = (
+    CacheRule('locations', ttl=300),
+    CacheRule('locations/*', ttl=300),
+    CacheRule('telephony/config/supportedDevices', ttl=3600),
+    CacheRule('telephony/config/announcementLanguages', ttl=3600),
+    CacheRule('telephony/config/callingProfiles', ttl=3600),
+    CacheRule('telephony/config/routeChoices', ttl=300),
+)
+
+
+@dataclass
+class CacheEntry:
+    """
+    Cached response
+    """
+
+    #: URL path relative to the API base URL
+    path: str
+    #: response object; the body has been read already
+    response: Any
+    #: parsed body
+    data: Any
+    #: time.monotonic() timestamp after which the entry needs to be revalidated
+    expires: float
+    #: ETag header of the response, if any
+    etag: Optional[str]
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires > time.monotonic()
+
+
+class ResponseCache:
+    """
+    LRU cache for responses of GET requests.
+
+    Only GET requests to endpoints matching one of the rules are cached. The first matching rule determines the TTL.
+    Expired entries with an ETag are revalidated using If-None-Match. Any PUT, POST, PATCH, or DELETE request
+    invalidates cached responses for the same resource path, for sub-resources of that path, and for the parent
+    collections of that path.
+
+    A single cache instance can be shared by multiple sessions. Cached responses are only returned for the same access
+    token.
+
+    Example:
+
+    .. code-block:: python
+
+        cache = ResponseCache(rules=REFERENCE_DATA_RULES + (CacheRule('telephony/config/queues', ttl=60),))
+        with WebexSimpleApi(cache=cache) as api:
+            ...
+    """
+
+    def __init__(self, rules: Iterable[CacheRule] = REFERENCE_DATA_RULES, max_entries: int = 1000):
+        """
+        :param rules: TTL rules; only responses for endpoints matching one of the rules are cached
+        :param max_entries: maximum number of cached responses; least recently used entries are evicted first
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries has to be at least 1')
+        self.rules = list(rules)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], CacheEntry] = OrderedDict()
+        self._lock = Lock()
+        # incremented with each invalidation; responses of requests started before an invalidation are not cached
+        self._epoch = 0
+        #: number of requests served from the cache w/o revalidation
+        self.hits = 0
+        #: number of cacheable requests not served from the cache
+        self.misses = 0
+        #: number of expired entries revalidated with a 304 response
+        self.revalidated = 0
+        #: number of entries removed because of updates
+        self.invalidated = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(entries={len(self._entries)}, hits={self.hits}, misses={self.misses}, '
+            f'revalidated={self.revalidated}, invalidated={self.invalidated})'
+        )
+
+    @staticmethod
+    def path(base: str, url: str) -> str:
+        """
+        URL path relative to the API base URL
+
+        :param base: API base URL; for example: 'https://webexapis.com/v1'
+        :param url: request URL
+        :return: relative path; for example: 'telephony/config/locations/Y2lz...'
+        """
+        path = urlsplit(url).path
+        base_path = urlsplit(base).path.rstrip('/')
+        if base_path and path.startswith(f'{base_path}/'):
+            path = path[len(base_path) :]
+        return path.strip('/')
+
+    @staticmethod
+    def key(url: str, params: Optional[dict[str, Any]], token: Optional[str]) -> tuple[str, str, str]:
+        """
+        Cache key for a GET request
+
+        :param url: request URL
+        :param params: URL parameters
+        :param token: access token used for the request
+        :return: cache key
+        """
+        params_key = '&'.join(f'{k}={v}' for k, v in sorted((params or {}).items()) if v is not None)
+        # don't keep the token itself in the cache keys
+        token_key = sha256((token or '').encode()).hexdigest()
+        return token_key, url, params_key
+
+    def ttl(self, path: str) -> Optional[float]:
+        """
+        TTL for responses of GET requests to a path
+
+        :param path: URL path relative to the API base URL
+        :return: TTL in seconds; None if the path is not cacheable
+        """
+        return next((rule.ttl for rule in self.rules if _match_path(path, rule.pattern)), None)
+
+    @property
+    def epoch(self) -> int:
+        """
+        Invalidation counter; needs to be passed to :meth:`put`
+        """
+        return self._epoch
+
+    def get(self, key: tuple[str, str, str]) -> Optional[CacheEntry]:
+        """
+        Get a cached entry; the entry might be expired
+
+        :param key: cache key
+        :return: cache entry, None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+            elif not entry.etag:
+                # expired and can't be revalidated
+                del self._entries[key]
+                self.misses += 1
+                return None
+            return entry
+
+    def put(
+        self,
+        key: tuple[str, str, str],
+        path: str,
+        response: Any,
+        data: Any,
+        ttl: float,
+        etag: Optional[str],
+        epoch: int,
+    ) -> None:
+        """
+        Add a response to the cache
+
+        :param key: cache key
+        :param path: URL path relative to the API base URL
+        :param response: response object
+        :param data: parsed response body; a copy is stored
+        :param ttl: TTL in seconds
+        :param etag: ETag header of the response
+        :param epoch: value of :attr:`epoch` before the request was sent
+        """
+        entry = CacheEntry(
+            path=path, response=response, data=copy.deepcopy(data), expires=time.monotonic() + ttl, etag=etag
+        )
+        with self._lock:
+            if epoch != self._epoch:
+                # the resource might have been updated while the request was in flight
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, entry: CacheEntry, ttl: float) -> None:
+        """
+        Mark an expired entry as fresh after a 304 response
+
+        :param entry: cache entry
+        :param ttl: TTL in seconds
+        """
+        with self._lock:
+            entry.expires = time.monotonic() + ttl
+            self.revalidated += 1
+
+    def invalidate_path(self, path: str) -> None:
+        """
+        Invalidate cached responses after an update of a resource: responses for the same path, sub-resources, and
+        parent collections are removed
+
+        :param path: URL path relative to the API base URL
+        """
+        prefix = f'{path}/'
+        with self._lock:
+            self._epoch += 1
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.path == path or entry.path.startswith(prefix) or path.startswith(f'{entry.path}/')
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.invalidated += len(keys)
+
+    def invalidate(self, pattern: str = None) -> None:
+        """
+        Invalidate cached responses
+
+        :param pattern: only invalidate responses for paths matching this pattern; same syntax as
+            :attr:`CacheRule.pattern`. Default: invalidate all cached responses
+        """
+        with self._lock:
+            self._epoch += 1
+            keys = [key for key, entry in self._entries.items() if pattern is None or _match_path(entry.path, pattern)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidated += len(keys)
@@ -3,18 +3,21 @@ CDR API
 """
 
 import re
-from collections.abc import Generator, Iterator
+import time
+from collections.abc import Generator, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, ClassVar, Optional, Self
 
 from dateutil import tz
 from dateutil.parser import isoparse
-from pydantic import Field, model_validator
+from pydantic import Field, TypeAdapter, ValidationInfo, model_validator
 
 from ..api_child import ApiChild
 from ..base import ApiModel, dt_iso_str
 from ..base import SafeEnum as Enum
+from ..bulk import BulkExecutor
 
 __all__ = [
     'CDRCallType',
@@ -166,17 +169,91 @@ def names_and_values(data: dict[str, Any]) -> Iterator[tuple[str, Optional[str]]
         yield normalize_name(k), v
 
 
+#: attribute name or alias -> key used for validation: the alias of the attribute. Populated on first use
+_validation_keys: dict[str, str] = {}
+
+#: memoized mapping of field names in CDRs to keys used for validation; CDRs only have a small, fixed set of field
+#: names
+_record_keys: dict[str, str] = {}
+
+#: values which are converted to None
+_EMPTY_VALUES = frozenset({'', 'NA'})
+
+#: validation context key to indicate that CDR data has already been normalized by :func:`normalize_record`
+NORMALIZED_CONTEXT = 'cdr_normalized'
+
+
+def record_key(name: str) -> str:
+    """
+    Key used for validation of a CDR field: the field name is normalized (see :func:`normalize_name`) and then
+    mapped to the alias of the matching attribute; validation is faster if values are passed by alias
+
+    :meta private:
+    """
+    if not _validation_keys:
+        for attribute, field in CDR.model_fields.items():
+            alias = field.alias or attribute
+            _validation_keys[attribute] = _validation_keys[alias] = alias
+    name = normalize_name(name)
+    return _validation_keys.get(name, name)
+
+
+def normalize_record(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize a CDR: convert keys to attribute aliases and empty values to None
+
+    :meta private:
+    """
+    keys = _record_keys
+    try:
+        return {keys[k]: None if v in _EMPTY_VALUES else v for k, v in data.items()}
+    except KeyError:
+        pass
+    # new field names: memoize keys
+    if len(keys) >= 1024:
+        # unexpected number of different field names: don't memoize any more names
+        return {record_key(k): None if v in _EMPTY_VALUES else v for k, v in data.items()}
+    for k in data:
+        if k not in keys:
+            keys[k] = record_key(k)
+    return {keys[k]: None if v in _EMPTY_VALUES else v for k, v in data.items()}
+
+
 class CDR(ApiModel):
+    #: type adapters to validate normalized records; one per class
+    _adapters: ClassVar[dict[type, TypeAdapter[Any]]] = {}
+
     @model_validator(mode='before')
     @classmethod
-    def normalize_data(cls, data: dict[str, Any]):
+    def normalize_data(cls, data: dict[str, Any], info: ValidationInfo):
         """
         Pop all empty strings so that they get caught by Optional[] and convert keys to proper attribute names
         :meta private:
         """
-        # convert empty values to None and convert names to snail case
-        data = dict(names_and_values(data))
-        return data
+        if info.context and info.context.get(NORMALIZED_CONTEXT):
+            # already normalized by parse_records()
+            return data
+        # convert empty values to None and convert names to attribute aliases
+        return normalize_record(data)
+
+    @classmethod
+    def parse_records(cls, records: Iterable[dict[str, Any]]) -> Generator[Self, None, None]:
+        """
+        Parse CDRs from dicts as returned by the API or read from a CSV report
+
+        Field names are mapped to attribute aliases using a memoized mapping and empty values are converted to None in
+        a single pass over each record; records are then validated by a prebuilt type adapter.
+
+        :param records: dicts to parse
+        :return: yields instances of the class
+        """
+        adapter = cls._adapters.get(cls)
+        if adapter is None:
+            adapter = cls._adapters[cls] = TypeAdapter(cls)
+        validate = adapter.validate_python
+        context = {NORMALIZED_CONTEXT: True}
+        for record in records:
+            yield validate(normalize_record(record), context=context)
 
     #: This is the start time of the call, the answer time may be slightly after this. Time is in UTC.
     start_time: Optional[datetime] = None
@@ -690,18 +767,301 @@ class DetailedCDRApi(ApiChild, base=''):
         url = f'https://{host}/v1/{endpoint}'
         if locations:
             params['locations'] = ','.join(locations)
+        start_time, end_time = self._time_window(start_time, end_time)
+        params['startTime'] = dt_iso_str(start_time)
+        params['endTime'] = dt_iso_str(end_time)
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')
+
+    @staticmethod
+    def _time_window(
+        start_time: Optional[str | datetime], end_time: Optional[str | datetime]
+    ) -> tuple[datetime, datetime]:
+        """
+        Start and end of a time window for CDR queries; ISO-8601 strings are parsed and missing values are replaced
+        by the defaults: 47:58 hours ago and 5:30 minutes ago
+
+        :meta private:
+        """
         if not start_time:
             start_time = datetime.now(tz=tz.tzutc()) - timedelta(hours=47, minutes=58)
         if not end_time:
             end_time = datetime.now(tz=tz.tzutc()) - timedelta(minutes=5, seconds=30)
+        if isinstance(start_time, str):
+            start_time = isoparse(start_time)
+        if isinstance(end_time, str):
+            end_time = isoparse(end_time)
+        return start_time, end_time
 
-        def guess_datetime(dt: datetime | str) -> str:
-            if isinstance(dt, str):
-                dt = isoparse(dt)
-            r = dt_iso_str(dt)
-            return r
+    @classmethod
+    def _slice_queries(
+        cls,
+        start_time: Optional[str | datetime],
+        end_time: Optional[str | datetime],
+        locations: Optional[list[str]],
+        slices: int,
+    ) -> list[tuple[int, datetime, datetime, Optional[list[str]]]]:
+        """
+        Queries for a sliced CDR request: one query per time slice and group of up to 10 locations
 
-        params['startTime'] = guess_datetime(start_time)
-        params['endTime'] = guess_datetime(end_time)
-        # noinspection PyTypeChecker
-        return self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')
+        :meta private:
+        :return: list of (slice index, start, end, locations)
+        """
+        if slices < 1:
+            raise ValueError('slices has to be at least 1')
+        start, end = cls._time_window(start_time, end_time)
+        step = (end - start) / slices
+        # slice boundaries are sent with millisecond precision
+        boundaries = [start + step * i for i in range(slices)]
+        boundaries = [b.replace(microsecond=b.microsecond - b.microsecond % 1000) for b in boundaries] + [end]
+        location_groups: list[Optional[list[str]]] = [None]
+        if locations:
+            location_groups = [locations[i : i + 10] for i in range(0, len(locations), 10)]
+        return [
+            (i, boundaries[i], boundaries[i + 1], group)
+            for i in range(slices)
+            if boundaries[i] < boundaries[i + 1]
+            for group in location_groups
+        ]
+
+    @staticmethod
+    def cdr_key(cdr: CDR) -> Optional[tuple[Optional[str], ...]]:
+        """
+        Key to identify duplicate CDRs: correlation ID, call ID, and local call ID (which identifies the call leg)
+
+        :param cdr: CDR
+        :return: key; None if the CDR has none of the IDs
+        """
+        key = (cdr.correlation_id, cdr.call_id, cdr.local_call_id)
+        if not any(key):
+            return None
+        return key
+
+    @classmethod
+    def _merge_slice(
+        cls, groups: Iterable[list[CDR]], seen: set[tuple[Optional[str], ...]]
+    ) -> tuple[list[CDR], set[tuple[Optional[str], ...]]]:
+        """
+        Merge the CDRs of the location groups of a time slice in order of report time and remove CDRs which were
+        already returned for the previous slice
+
+        :meta private:
+        :param groups: CDRs of the location groups of the slice
+        :param seen: keys of the CDRs of the previous slice
+        :return: CDRs of the slice, keys of the CDRs of the slice
+        """
+        cdrs = [cdr for group in groups for cdr in group]
+        cdrs.sort(key=lambda cdr: (cdr.report_time is not None, cdr.report_time or 0))
+        merged = []
+        keys = set()
+        for cdr in cdrs:
+            key = cls.cdr_key(cdr)
+            if key is not None:
+                if key in seen or key in keys:
+                    continue
+                keys.add(key)
+            merged.append(cdr)
+        return merged, keys
+
+    def get_cdr_history_sliced(
+        self,
+        start_time: Optional[str | datetime] = None,
+        end_time: Optional[str | datetime] = None,
+        locations: list[str] = None,
+        host: str = 'analytics-calling.webexapis.com',
+        stream: bool = False,
+        slices: int = 1,
+        max_workers: int = None,
+        initial_interval: float = 60.0,
+        **params,
+    ) -> Generator[CDR, None, None]:
+        """
+        Detailed Call History data for a time window, fetched concurrently in time slices
+
+        The time window is split into `slices` time slices of equal length. If more than 10 locations are given, then
+        each slice is also split into groups of up to 10 locations. Each query is a separate call of
+        :meth:`get_cdr_history` and queries are executed concurrently; the number of concurrent queries is bounded by
+        the concurrency limit of the session.
+
+        The CDR API allows only one initial request per minute per user token: the initial requests of the queries are
+        sent `initial_interval` seconds apart and only the pagination requests overlap. Hence more than one slice only
+        pays off for long time windows which need many pages per slice; for short windows (for example an hourly pull)
+        use the default of one slice.
+
+        CDRs are yielded in order of report time as soon as all slices up to the current slice have been fetched. CDRs
+        which were returned for two adjacent slices (records reported at a slice boundary) are only yielded once; see
+        :meth:`cdr_key`.
+
+        The rate limits of the CDR API still apply: requests which are answered with a 429 are retried by the session.
+
+        :param start_time: Time of the first report you wish to collect; see :meth:`get_cdr_history`
+        :type start_time: str|datetime
+        :param end_time: Time of the last report you wish to collect; see :meth:`get_cdr_history`
+        :type end_time: str|datetime
+        :param locations: Names of the locations (as shown in Control Hub). Can be more than 10 locations.
+        :type locations: list[str]
+        :param host: analytics host to access
+        :type host: str
+        :param stream: If true, collect data from cdr_stream, else from cdr_feed. Defaults to False (cdr_feed).
+        :type stream: bool
+        :param slices: number of time slices
+        :type slices: int
+        :param max_workers: maximum number of concurrent queries; default: concurrency limit of the session
+        :type max_workers: int
+        :param initial_interval: minimum time in seconds between the initial requests of two queries; 0 to send all
+            initial requests at once
+        :type initial_interval: float
+        :param params: additional arguments
+        :return: CDRs
+        """
+        '''async
+    async def get_cdr_history_sliced_gen(
+        self,
+        start_time: Optional[str | datetime] = None,
+        end_time: Optional[str | datetime] = None,
+        locations: list[str] = None,
+        host: str = 'analytics-calling.webexapis.com',
+        stream: bool = False,
+        slices: int = 1,
+        max_workers: int = None,
+        initial_interval: float = 60.0,
+        **params,
+    ) -> AsyncGenerator[CDR, None]:
+        """
+        Detailed Call History data for a time window, fetched concurrently in time slices
+
+        The time window is split into `slices` time slices of equal length. If more than 10 locations are given, then
+        each slice is also split into groups of up to 10 locations. Each query is a separate call of
+        :meth:`get_cdr_history` and queries are executed concurrently; the number of concurrent queries is bounded by
+        the concurrency limit of the session.
+
+        The CDR API allows only one initial request per minute per user token: the initial requests of the queries are
+        sent `initial_interval` seconds apart and only the pagination requests overlap. Hence more than one slice only
+        pays off for long time windows which need many pages per slice; for short windows (for example an hourly pull)
+        use the default of one slice.
+
+        CDRs are yielded in order of report time as soon as all slices up to the current slice have been fetched. CDRs
+        which were returned for two adjacent slices (records reported at a slice boundary) are only yielded once; see
+        :meth:`cdr_key`.
+
+        The rate limits of the CDR API still apply: requests which are answered with a 429 are retried by the session.
+
+        :param start_time: Time of the first report you wish to collect; see :meth:`get_cdr_history`
+        :type start_time: str|datetime
+        :param end_time: Time of the last report you wish to collect; see :meth:`get_cdr_history`
+        :type end_time: str|datetime
+        :param locations: Names of the locations (as shown in Control Hub). Can be more than 10 locations.
+        :type locations: list[str]
+        :param host: analytics host to access
+        :type host: str
+        :param stream: If true, collect data from cdr_stream, else from cdr_feed. Defaults to False (cdr_feed).
+        :type stream: bool
+        :param slices: number of time slices
+        :type slices: int
+        :param max_workers: maximum number of concurrent queries; default: concurrency limit of the session
+        :type max_workers: int
+        :param initial_interval: minimum time in seconds between the initial requests of two queries; 0 to send all
+            initial requests at once
+        :type initial_interval: float
+        :param params: additional arguments
+        :return: CDRs
+        """
+        queries = self._slice_queries(start_time, end_time, locations, slices)
+        # time of the next initial request
+        next_initial = time.monotonic()
+
+        async def fetch(query: tuple[int, datetime, datetime, Optional[list[str]]]) -> list[CDR]:
+            nonlocal next_initial
+            _, start, end, group = query
+            initial = max(time.monotonic(), next_initial)
+            next_initial = initial + initial_interval
+            await asyncio.sleep(max(0.0, initial - time.monotonic()))
+            return await self.get_cdr_history(
+                start_time=start, end_time=end, locations=group, host=host, stream=stream, **params
+            )
+
+        seen: set[tuple[Optional[str], ...]] = set()
+        groups: list[list[CDR]] = []
+        current = 0
+        async for result in AsBulkExecutor(session=self.session).map(fetch, queries, max_workers=max_workers):
+            if result.exception is not None:
+                raise result.exception
+            if result.item[0] != current:
+                cdrs, seen = self._merge_slice(groups, seen)
+                for cdr in cdrs:
+                    yield cdr
+                groups = []
+                current = result.item[0]
+            groups.append(result.result or [])
+        cdrs, _ = self._merge_slice(groups, seen)
+        for cdr in cdrs:
+            yield cdr
+
+    async def get_cdr_history_sliced(
+        self,
+        start_time: Optional[str | datetime] = None,
+        end_time: Optional[str | datetime] = None,
+        locations: list[str] = None,
+        host: str = 'analytics-calling.webexapis.com',
+        stream: bool = False,
+        slices: int = 1,
+        max_workers: int = None,
+        initial_interval: float = 60.0,
+        **params,
+    ) -> builtins.list[CDR]:
+        """
+        Detailed Call History data for a time window, fetched concurrently in time slices
+
+        See :meth:`get_cdr_history_sliced_gen`
+
+        :return: CDRs in order of report time
+        """
+        return [
+            cdr
+            async for cdr in self.get_cdr_history_sliced_gen(
+                start_time=start_time,
+                end_time=end_time,
+                locations=locations,
+                host=host,
+                stream=stream,
+                slices=slices,
+                max_workers=max_workers,
+                initial_interval=initial_interval,
+                **params,
+            )
+        ]
+        '''
+        queries = self._slice_queries(start_time, end_time, locations, slices)
+        # time of the next initial request
+        next_initial = time.monotonic()
+        lock = Lock()
+
+        def fetch(query: tuple[int, datetime, datetime, Optional[list[str]]]) -> list[CDR]:
+            nonlocal next_initial
+            _, start, end, group = query
+            with lock:
+                initial = max(time.monotonic(), next_initial)
+                next_initial = initial + initial_interval
+            time.sleep(max(0.0, initial - time.monotonic()))
+            # the initial request is sent when the pagination is consumed
+            return list(
+                self.get_cdr_history(
+                    start_time=start, end_time=end, locations=group, host=host, stream=stream, **params
+                )
+            )
+
+        seen: set[tuple[Optional[str], ...]] = set()
+        groups: list[list[CDR]] = []
+        current = 0
+        for result in BulkExecutor(session=self.session).map(fetch, queries, max_workers=max_workers):
+            if result.exception is not None:
+                raise result.exception
+            if result.item[0] != current:
+                # all queries of the previous slice are done
+                cdrs, seen = self._merge_slice(groups, seen)
+                yield from cdrs
+                groups = []
+                current = result.item[0]
+            groups.append(result.result or [])
+        cdrs, _ = self._merge_slice(groups, seen)
+        yield from cdrs
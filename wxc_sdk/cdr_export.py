@@ -0,0 +1,489 @@
+"""
+Columnar export of CDRs for bulk loads
+
+:meth:`DetailedCDRApi.get_cdr_history <wxc_sdk.cdr.DetailedCDRApi.get_cdr_history>` validates each record as a
+:class:`wxc_sdk.cdr.CDR` model. For exports of millions of records this module skips the models: items are taken from
+the feed as plain dicts (see :attr:`wxc_sdk.pagination.ItemMode.raw`), and converted in batches to typed columns:
+timestamps, integers, booleans, categories (the enum fields of :class:`wxc_sdk.cdr.CDR`), and strings.
+
+Batches are written to Parquet or Arrow IPC files if `pyarrow <https://arrow.apache.org/docs/python/>`_ is installed;
+CSV files are always available. pyarrow is optional and is only imported when a Parquet or Arrow writer is created.
+
+Example: export the CDRs of the last day
+
+.. code-block:: python
+
+    stats = export_cdrs(api, 'cdrs.parquet', start_time=start, end_time=end)
+    print(f'{stats.records} records written to {stats.path}')
+"""
+
+import csv
+import logging
+import os
+import time
+import typing
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+
+from .cdr import CDR, normalize_name
+from .pagination import ItemMode, item_mode
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = [
+    'CdrColumn',
+    'CDR_COLUMNS',
+    'CdrBatch',
+    'cdr_batch',
+    'cdr_batches',
+    'CdrWriter',
+    'CsvCdrWriter',
+    'ParquetCdrWriter',
+    'ArrowCdrWriter',
+    'get_cdr_writer',
+    'CdrExportStats',
+    'export_cdrs',
+]
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CdrColumn:
+    """
+    Column of a CDR export
+    """
+
+    #: column name; same as the attribute name in :class:`wxc_sdk.cdr.CDR`
+    name: str
+    #: type of the column: 'timestamp', 'int', 'bool', 'category', or 'string'
+    kind: str
+
+
+def _column_kind(annotation: Any) -> str:
+    """
+    Column type for the type annotation of a CDR field
+
+    :meta private:
+    """
+    types = [t for t in typing.get_args(annotation) or (annotation,) if t is not type(None)]
+    first = types[0] if types else str
+    if first is datetime:
+        return 'timestamp'
+    # bool is a subclass of int: check bool first
+    if first is bool:
+        return 'bool'
+    if first is int:
+        return 'int'
+    if isinstance(first, type) and issubclass(first, Enum):
+        return 'category'
+    return 'string'
+
+
+#: columns of a CDR export: all fields of :class:`wxc_sdk.cdr.CDR`
+CDR_COLUMNS: list[CdrColumn] = [
+    CdrColumn(name=name, kind=_column_kind(field.annotation)) for name, field in CDR.model_fields.items()
+]
+
+#: normalized CDR key -> column name
+_COLUMN_BY_KEY: dict[str, str] = {}
+for _name, _field in CDR.model_fields.items():
+    _COLUMN_BY_KEY[_name] = _name
+    if _field.alias:
+        _COLUMN_BY_KEY[normalize_name(_field.alias)] = _name
+
+#: key as received from the API -> column name; '' for keys which are not exported. Only a few dozen distinct keys
+#: exist: each key is normalized once
+_column_by_raw_key: dict[str, str] = {}
+
+#: values which are exported as null
+_NULLS = frozenset({'', 'NA', None})
+
+_TRUE = frozenset({'true', 't', 'yes', 'y', 'on', '1'})
+_FALSE = frozenset({'false', 'f', 'no', 'n', 'off', '0'})
+
+
+def _timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    value = str(value).lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    raise ValueError(f'invalid boolean: {value}')
+
+
+def _string(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    'timestamp': _timestamp,
+    'int': int,
+    'bool': _bool,
+    'category': _string,
+    'string': _string,
+}
+
+
+@dataclass
+class CdrBatch:
+    """
+    Batch of CDRs in columnar form
+    """
+
+    #: column name -> values; one list per column in :data:`CDR_COLUMNS`. Missing and empty values are None
+    columns: dict[str, list[Any]]
+    #: number of records
+    num_rows: int
+    #: number of values which could not be converted to the column type; these values are None
+    conversion_errors: int = 0
+
+
+def _convert(values: list[Any], kind: str) -> tuple[list[Any], int]:
+    """
+    Convert the raw values of a column
+
+    :meta private:
+    :return: converted values, number of conversion errors
+    """
+    convert = _CONVERTERS[kind]
+    try:
+        if kind == 'string' or kind == 'category':
+            # values from JSON are strings: avoid a function call per value
+            return [None if v in _NULLS else v if v.__class__ is str else str(v) for v in values], 0
+        return [None if v in _NULLS else convert(v) for v in values], 0
+    except (TypeError, ValueError):
+        pass
+    # at least one value can't be converted: convert value by value
+    result: list[Any] = []
+    errors = 0
+    for v in values:
+        if v in _NULLS:
+            result.append(None)
+            continue
+        try:
+            result.append(convert(v))
+        except (TypeError, ValueError):
+            result.append(None)
+            errors += 1
+    return result, errors
+
+
+def cdr_batch(records: list[dict[str, Any]]) -> CdrBatch:
+    """
+    Convert CDRs as received from the API to a columnar batch
+
+    Keys which don't belong to a field of :class:`wxc_sdk.cdr.CDR` are ignored.
+
+    :param records: CDRs as plain dicts
+    :return: batch
+    """
+    n = len(records)
+    # raw values of the columns present in the batch
+    raw: dict[str, list[Any]] = {}
+    # key -> raw values of the column; None for keys which are not exported
+    targets: dict[str, Optional[list[Any]]] = {}
+    for i, record in enumerate(records):
+        for key, value in record.items():
+            try:
+                target = targets[key]
+            except KeyError:
+                name = _column_by_raw_key.get(key)
+                if name is None:
+                    name = _column_by_raw_key[key] = _COLUMN_BY_KEY.get(normalize_name(key), '')
+                    if not name:
+                        log.debug(f'cdr_batch: ignoring unknown key "{key}"')
+                target = targets[key] = raw.setdefault(name, [None] * n) if name else None
+            if target is not None:
+                target[i] = value
+    columns: dict[str, list[Any]] = {}
+    errors = 0
+    for column in CDR_COLUMNS:
+        values = raw.get(column.name)
+        if values is None:
+            # column is empty in all records
+            columns[column.name] = [None] * n
+            continue
+        columns[column.name], column_errors = _convert(values, column.kind)
+        errors += column_errors
+    return CdrBatch(columns=columns, num_rows=n, conversion_errors=errors)
+
+
+def cdr_batches(api: 'WebexSimpleApi', batch_size: int = 10000, **kwargs: Any) -> Generator[CdrBatch, None, None]:
+    """
+    Read CDRs and yield them in columnar batches
+
+    Items of the feed are not validated as :class:`wxc_sdk.cdr.CDR` models; at most one batch of records is held
+    in memory.
+
+    :param api: API used to read the CDRs
+    :param batch_size: number of records per batch
+    :param kwargs: parameters for :meth:`DetailedCDRApi.get_cdr_history
+        <wxc_sdk.cdr.DetailedCDRApi.get_cdr_history>`: `start_time`, `end_time`, `locations`, `host`, `stream`
+    :return: yields batches
+    """
+    with item_mode(ItemMode.raw):
+        # in raw mode the feed yields plain dicts
+        records = typing.cast(Iterable[dict[str, Any]], api.cdr.get_cdr_history(**kwargs))
+    batch: list[dict[str, Any]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield cdr_batch(batch)
+            batch = []
+    if batch:
+        yield cdr_batch(batch)
+
+
+class CdrWriter(ABC):
+    """
+    Base class for CDR writers; use as context manager or call :meth:`close`
+    """
+
+    #: name of the format
+    format: str = ''
+    #: file name suffix of the format
+    suffix: str = ''
+
+    def __init__(self, path: str):
+        """
+        :param path: path of the file to write
+        """
+        self.path = path
+
+    @abstractmethod
+    def write(self, batch: CdrBatch) -> None:
+        """
+        Write a batch
+
+        :param batch: batch
+        """
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Finish the file
+        """
+        ...
+
+    def __enter__(self) -> 'CdrWriter':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+class CsvCdrWriter(CdrWriter):
+    """
+    Write CDRs to a CSV file with one column per entry in :data:`CDR_COLUMNS`
+
+    Timestamps are written in ISO 8601 format, booleans as `true` or `false`, and missing values as empty strings.
+    """
+
+    format = 'csv'
+    suffix = '.csv'
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([column.name for column in CDR_COLUMNS])
+
+    def write(self, batch: CdrBatch) -> None:
+        columns: list[list[Any]] = []
+        for column in CDR_COLUMNS:
+            values = batch.columns[column.name]
+            if column.kind == 'timestamp':
+                values = [v and v.isoformat() for v in values]
+            elif column.kind == 'bool':
+                values = [None if v is None else ('true' if v else 'false') for v in values]
+            columns.append(values)
+        self._writer.writerows(zip(*columns, strict=True))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _arrow_schema(pa: Any) -> Any:
+    """
+    Arrow schema for :data:`CDR_COLUMNS`
+
+    :meta private:
+    """
+    types = {
+        'timestamp': pa.timestamp('us', tz='UTC'),
+        'int': pa.int64(),
+        'bool': pa.bool_(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'string': pa.string(),
+    }
+    return pa.schema([pa.field(column.name, types[column.kind]) for column in CDR_COLUMNS])
+
+
+def _record_batch(pa: Any, schema: Any, batch: CdrBatch) -> Any:
+    """
+    Arrow record batch for a CDR batch
+
+    :meta private:
+    """
+    arrays = []
+    for column, field in zip(CDR_COLUMNS, schema, strict=True):
+        values = batch.columns[column.name]
+        if column.kind == 'category':
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class ParquetCdrWriter(CdrWriter):
+    """
+    Write CDRs to a Parquet file; each batch is written as a row group. Requires pyarrow
+    """
+
+    format = 'parquet'
+    suffix = '.parquet'
+
+    def __init__(self, path: str, compression: str = 'zstd'):
+        """
+        :param path: path of the file to write
+        :param compression: Parquet compression codec
+        """
+        import pyarrow  # type: ignore[import-not-found,unused-ignore]
+        import pyarrow.parquet  # type: ignore[import-not-found,unused-ignore]
+
+        super().__init__(path)
+        self._pa = pyarrow
+        self._schema = _arrow_schema(pyarrow)
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema, compression=compression)
+
+    def write(self, batch: CdrBatch) -> None:
+        self._writer.write_batch(_record_batch(self._pa, self._schema, batch))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ArrowCdrWriter(CdrWriter):
+    """
+    Write CDRs to an Arrow IPC file (Feather v2). Requires pyarrow
+    """
+
+    format = 'arrow'
+    suffix = '.arrow'
+
+    def __init__(self, path: str):
+        import pyarrow  # type: ignore[import-not-found,unused-ignore]
+        import pyarrow.ipc  # type: ignore[import-not-found,unused-ignore]
+
+        super().__init__(path)
+        self._pa = pyarrow
+        self._schema = _arrow_schema(pyarrow)
+        self._writer = pyarrow.ipc.new_file(path, self._schema)
+
+    def write(self, batch: CdrBatch) -> None:
+        self._writer.write_batch(_record_batch(self._pa, self._schema, batch))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS: dict[str, type[CdrWriter]] = {w.format: w for w in (ParquetCdrWriter, ArrowCdrWriter, CsvCdrWriter)}
+
+
+def get_cdr_writer(path: str, format: str = 'auto') -> CdrWriter:
+    """
+    Create a CDR writer
+
+    :param path: path of the file to write. With format 'auto' the suffix of the path is replaced by the suffix of
+        the selected format: '.parquet' or '.csv'
+    :param format: 'parquet', 'arrow', 'csv', or 'auto'. 'auto' writes Parquet if pyarrow is installed and CSV
+        otherwise
+    :return: writer
+    :raises ImportError: if pyarrow is required for the requested format and not installed
+    """
+    if format == 'auto':
+        root, _ = os.path.splitext(path)
+        try:
+            return ParquetCdrWriter(f'{root}{ParquetCdrWriter.suffix}')
+        except ImportError:
+            return CsvCdrWriter(f'{root}{CsvCdrWriter.suffix}')
+    try:
+        writer_class = _WRITERS[format]
+    except KeyError:
+        raise ValueError(f'Unknown CDR export format: {format}') from None
+    return writer_class(path)
+
+
+@dataclass
+class CdrExportStats:
+    """
+    Result of :func:`export_cdrs`
+    """
+
+    #: path of the written file
+    path: str
+    #: format of the written file
+    format: str
+    #: number of records written
+    records: int = 0
+    #: number of batches written
+    batches: int = 0
+    #: number of values which could not be converted to the column type and were written as null
+    conversion_errors: int = 0
+    #: duration of the export in seconds
+    seconds: float = 0.0
+
+
+def export_cdrs(
+    api: 'WebexSimpleApi',
+    path: str,
+    *,
+    format: str = 'auto',
+    batch_size: int = 10000,
+    start_time: Optional[str | datetime] = None,
+    end_time: Optional[str | datetime] = None,
+    **kwargs: Any,
+) -> CdrExportStats:
+    """
+    Read CDRs and write them to a file
+
+    Records are converted and written in batches of `batch_size` records: memory use does not grow with the number
+    of records.
+
+    :param api: API used to read the CDRs
+    :param path: path of the file to write; see :func:`get_cdr_writer`
+    :param format: 'parquet', 'arrow', 'csv', or 'auto'; see :func:`get_cdr_writer`
+    :param batch_size: number of records per batch
+    :param start_time: start of the time period; see :meth:`DetailedCDRApi.get_cdr_history
+        <wxc_sdk.cdr.DetailedCDRApi.get_cdr_history>`
+    :param end_time: end of the time period
+    :param kwargs: other parameters for :meth:`DetailedCDRApi.get_cdr_history
+        <wxc_sdk.cdr.DetailedCDRApi.get_cdr_history>`: `locations`, `host`, `stream`
+    :return: statistics
+    """
+    start = time.perf_counter()
+    with get_cdr_writer(path, format) as writer:
+        stats = CdrExportStats(path=writer.path, format=writer.format)
+        for batch in cdr_batches(api, batch_size=batch_size, start_time=start_time, end_time=end_time, **kwargs):
+            writer.write(batch)
+            stats.records += batch.num_rows
+            stats.batches += 1
+            stats.conversion_errors += batch.conversion_errors
+    stats.seconds = time.perf_counter() - start
+    log.debug(f'export_cdrs: {stats}')
+    return stats
@@ -0,0 +1,285 @@
+"""
+Entity directory shared by :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`: caches
+people, locations, and workspaces by ID, email, or name for the lookup helpers like
+:meth:`wxc_sdk.locations.LocationsApi.by_name`
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['DirectoryKind', 'DIRECTORY_KINDS', 'EntityDirectory']
+
+
+@dataclass(frozen=True)
+class DirectoryKind:
+    """
+    Type of entities in the directory and the attributes they can be looked up by
+    """
+
+    #: name of the kind; also the first segment of the URL path of the entities: 'people', 'locations', 'workspaces'
+    name: str
+    #: ID of an entity
+    entity_id: Callable[[Any], Optional[str]]
+    #: lookup keys of an entity: (attribute, value) tuples; for example ('email', 'alice@example.com')
+    keys: Callable[[Any], Iterable[tuple[str, Optional[str]]]]
+
+
+#: entity kinds in the directory by name
+DIRECTORY_KINDS: dict[str, DirectoryKind] = {
+    k.name: k
+    for k in (
+        DirectoryKind(
+            name='people',
+            entity_id=lambda p: p.person_id,
+            keys=lambda p: [('id', p.person_id), *(('email', email) for email in p.emails or [])],
+        ),
+        DirectoryKind(
+            name='locations',
+            entity_id=lambda loc: loc.location_id,
+            keys=lambda loc: [('id', loc.location_id), ('name', loc.name)],
+        ),
+        DirectoryKind(
+            name='workspaces',
+            entity_id=lambda w: w.workspace_id,
+            keys=lambda w: [('id', w.workspace_id), ('name', w.display_name)],
+        ),
+    )
+}
+
+
+@dataclass
+class _Entry:
+    #: cached entity; None for a cached negative lookup
+    entity: Any
+    #: time.monotonic() timestamp after which the entry is expired
+    expires: float
+
+
+class EntityDirectory:
+    """
+    LRU cache for people, locations, and workspaces: (kind, attribute, value, org ID) → entity
+
+    Entities are cached by ID and by email (people) or name (locations, workspaces); emails are compared
+    case-insensitively. IDs are globally unique and are looked up independent of the org ID. Lookups which didn't
+    find an entity are cached as well (negative caching) with a separate, usually shorter, TTL.
+
+    The lookup helpers (:meth:`wxc_sdk.locations.LocationsApi.by_name`, :meth:`wxc_sdk.people.PeopleApi.by_email`,
+    :meth:`wxc_sdk.workspaces.WorkspacesApi.by_name`) and the `details()` methods of these APIs (lookup by ID) use the
+    directory of the session if the session has one. Any PUT, POST, PATCH, or DELETE request sent by the session for
+    one of these entities removes the cached entries of the entity and all negative entries of the same kind.
+
+    Example:
+
+    .. code-block:: python
+
+        with WebexSimpleApi(directory=True) as api:
+            # read all locations and people once
+            api.session.directory.warm_up(api, kinds=['locations', 'people'])
+            for email, location_name in assignments:
+                person = api.people.by_email(email)
+                location = api.locations.by_name(location_name)
+                ...
+    """
+
+    def __init__(self, ttl: float = 300, negative_ttl: float = 60, max_entries: int = 10000):
+        """
+        :param ttl: time to live of cached entities in seconds
+        :param negative_ttl: time to live of cached negative lookups in seconds; 0 to disable negative caching
+        :param max_entries: maximum number of cached keys; least recently used keys are evicted first
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries has to be at least 1')
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str, Optional[str]], _Entry] = OrderedDict()
+        self._lock = Lock()
+        # incremented with each invalidation; lookups started before an invalidation are not cached
+        self._epoch = 0
+        #: number of lookups served from the directory
+        self.hits = 0
+        #: number of lookups not served from the directory
+        self.misses = 0
+        #: number of entries removed because of updates
+        self.invalidated = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(entries={len(self._entries)}, hits={self.hits}, misses={self.misses}, '
+            f'invalidated={self.invalidated})'
+        )
+
+    @staticmethod
+    def _key(kind: str, attribute: str, value: str, org_id: Optional[str]) -> tuple[str, str, str, Optional[str]]:
+        if attribute == 'email':
+            value = value.lower()
+        elif attribute == 'id':
+            # entity IDs are globally unique
+            org_id = None
+        return kind, attribute, value, org_id
+
+    @property
+    def epoch(self) -> int:
+        """
+        Invalidation counter; needs to be passed to :meth:`put`
+        """
+        return self._epoch
+
+    def get(self, kind: str, attribute: str, value: str, org_id: str = None) -> tuple[bool, Any]:
+        """
+        Look up an entity
+
+        :param kind: 'people', 'locations', or 'workspaces'
+        :param attribute: 'id', 'email', or 'name'
+        :param value: value of the attribute
+        :param org_id: organization ID used for the lookup
+        :return: tuple (found, entity). `found` is True if the lookup is cached; `entity` is None for cached negative
+            lookups
+        """
+        key = self._key(kind, attribute, value, org_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # callers get their own copy of the entity
+        return True, copy.deepcopy(entry.entity)
+
+    def _store(self, key: tuple[str, str, str, Optional[str]], entity: Any, expires: float) -> None:
+        self._entries[key] = _Entry(entity=entity, expires=expires)
+        self._entries.move_to_end(key)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, kind: str, attribute: str, value: str, entity: Any, org_id: str = None, epoch: int = None) -> None:
+        """
+        Add the result of a lookup; the entity is also cached under all its other keys
+
+        :param kind: 'people', 'locations', or 'workspaces'
+        :param attribute: attribute used for the lookup
+        :param value: value used for the lookup
+        :param entity: entity found; None if no entity was found
+        :param org_id: organization ID used for the lookup
+        :param epoch: value of :attr:`epoch` before the lookup was started; if the directory has been invalidated in
+            the meantime, then the result is not cached
+        """
+        now = time.monotonic()
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                # the entity might have been updated while the lookup was in flight
+                return
+            if entity is None:
+                if self.negative_ttl > 0:
+                    self._store(self._key(kind, attribute, value, org_id), None, now + self.negative_ttl)
+            else:
+                self._store(self._key(kind, attribute, value, org_id), entity, now + self.ttl)
+                self._add_locked(kind, entity, org_id, now + self.ttl)
+            self._evict()
+
+    def _add_locked(self, kind: str, entity: Any, org_id: Optional[str], expires: float) -> None:
+        for attribute, value in DIRECTORY_KINDS[kind].keys(entity):
+            if value:
+                self._store(self._key(kind, attribute, value, org_id), entity, expires)
+
+    def add(self, kind: str, entities: Iterable[Any], org_id: str = None) -> int:
+        """
+        Add entities; for example the result of a list call
+
+        :param kind: 'people', 'locations', or 'workspaces'
+        :param entities: entities
+        :param org_id: organization ID used to list the entities
+        :return: number of entities added
+        """
+        expires = time.monotonic() + self.ttl
+        count = 0
+        with self._lock:
+            for entity in entities:
+                self._add_locked(kind, entity, org_id, expires)
+                count += 1
+            self._evict()
+        return count
+
+    def warm_up(self, api: 'WebexSimpleApi', kinds: Iterable[str] = None, org_id: str = None) -> dict[str, int]:
+        """
+        Read entities with the list endpoints and add them to the directory; the lists are read concurrently
+
+        For the async API add the entities with :meth:`add`: `directory.add('people', await api.people.list())`
+
+        :param api: API used to read the entities
+        :param kinds: kinds to read; default: all kinds. See :data:`DIRECTORY_KINDS`
+        :param org_id: organization ID
+        :return: number of entities added by kind
+        """
+        kinds = list(DIRECTORY_KINDS) if kinds is None else list(kinds)
+        unknown = [kind for kind in kinds if kind not in DIRECTORY_KINDS]
+        if unknown:
+            raise ValueError(f'Unknown kind(s): {", ".join(unknown)}')
+        counts: dict[str, int] = {}
+
+        def read(kind: str) -> list[Any]:
+            if kind == 'people':
+                return list(api.people.list(org_id=org_id))
+            if kind == 'locations':
+                return list(api.locations.list(org_id=org_id))
+            return list(api.workspaces.list(org_id=org_id))
+
+        for result in api.bulk.map(read, kinds, max_workers=len(kinds) or None):
+            if not result.ok:
+                raise result.exception  # type: ignore[misc]
+            counts[result.item] = self.add(result.item, result.result or [], org_id=org_id)
+        return counts
+
+    def invalidate_path(self, path: str) -> None:
+        """
+        Invalidate entries after an update: cached entries of the entity and all negative entries of the same kind are
+        removed. Updates of paths which don't belong to an entity in the directory are ignored
+
+        :param path: URL path relative to the API base URL; for example 'people/Y2lz...'
+        """
+        kind, _, rest = path.partition('/')
+        if kind not in DIRECTORY_KINDS:
+            return
+        entity_id = rest.partition('/')[0] or None
+        entity_id_of = DIRECTORY_KINDS[kind].entity_id
+        with self._lock:
+            self._epoch += 1
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == kind
+                and (entry.entity is None or (entity_id is not None and entity_id_of(entry.entity) == entity_id))
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.invalidated += len(keys)
+
+    def invalidate(self, kind: str = None) -> None:
+        """
+        Remove cached entries
+
+        :param kind: only remove entries of this kind; default: remove all entries
+        """
+        with self._lock:
+            self._epoch += 1
+            keys = [key for key in self._entries if kind is None or key[0] == kind]
+            for key in keys:
+                del self._entries[key]
+            self.invalidated += len(keys)
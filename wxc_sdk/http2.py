@@ -0,0 +1,217 @@
+"""
+HTTP/2 transport for :class:`wxc_sdk.rest.RestSession` based on `httpx <https://www.python-httpx.org/>`_
+
+httpx and h2 are optional: install them with `pip install httpx[http2]`. They are only imported when a
+:class:`Http2Adapter` is created.
+"""
+
+import asyncio
+import ssl
+from collections.abc import Coroutine, Generator, Iterator
+from contextlib import contextmanager
+from threading import Thread
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
+
+from requests import ConnectionError, ConnectTimeout, PreparedRequest, ReadTimeout, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import ProxyError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    import httpx
+
+__all__ = ['Http2Adapter']
+
+_T = TypeVar('_T')
+
+
+@contextmanager
+def _map_exceptions(request: PreparedRequest) -> Generator[None, None, None]:
+    """
+    Raise httpx exceptions as the equivalent requests exceptions so that retry logic and callers see the same
+    exceptions as with the default transport
+    """
+    import httpx
+
+    try:
+        yield
+    except httpx.ConnectTimeout as e:
+        raise ConnectTimeout(e, request=request) from e
+    except httpx.TimeoutException as e:
+        raise ReadTimeout(e, request=request) from e
+    except httpx.ProxyError as e:
+        raise ProxyError(e, request=request) from e
+    except httpx.TransportError as e:
+        raise ConnectionError(e, request=request) from e
+
+
+def _refused(e: Exception) -> bool:
+    """
+    Check if a request failed because the server refused the stream or shut down the connection gracefully (GOAWAY
+    with NO_ERROR) before processing the request. These requests can safely be retried on a new connection.
+    """
+    # httpx exception <- httpcore exception <- h2 event
+    cause = e.__cause__
+    event = cause.args[0] if cause is not None and cause.args else None
+    # 0: NO_ERROR, 7: REFUSED_STREAM
+    return getattr(event, 'error_code', None) in (0, 7)
+
+
+class _RawResponse:
+    """
+    Stand-in for the urllib3 response in :attr:`requests.Response.raw`; streams the body of an httpx response
+    """
+
+    def __init__(self, adapter: 'Http2Adapter', response: 'httpx.Response', request: PreparedRequest):
+        self._adapter = adapter
+        self._response = response
+        self._request = request
+        #: HTTP version of the response; for example 'HTTP/2'
+        self.version_string = response.http_version
+
+    def stream(self, chunk_size: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        if self._response.is_stream_consumed:
+            # body has already been read
+            yield from self._response.iter_bytes(chunk_size)
+            return
+        chunks = self._response.aiter_bytes(chunk_size)
+        with _map_exceptions(self._request):
+            while (chunk := self._adapter._run(anext(chunks, None))) is not None:
+                yield chunk
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        if amt is None:
+            return b''.join(self.stream())
+        return next(iter(self.stream(amt)), b'')
+
+    def close(self) -> None:
+        if not self._response.is_closed:
+            self._adapter._run(self._response.aclose())
+
+    release_conn = close
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    Transport adapter sending requests via HTTP/2 using an :class:`httpx.AsyncClient`.
+
+    All concurrent requests of a session to the same host are multiplexed over a single connection instead of one
+    TCP+TLS connection per concurrent request. Mounted by :class:`wxc_sdk.rest.RestSession` if created with
+    `http2=True`.
+
+    The HTTP/2 connections are handled by an event loop in a background thread; the threads sending requests wait
+    for the results. The sync HTTP/2 implementation of httpx is not used because it is not safe to share a
+    connection between threads.
+
+    TLS verification and proxy are configured when the adapter is created; per request `verify`, `cert`, and
+    `proxies` arguments are ignored.
+    """
+
+    #: number of times a request refused by the server is retried; see :attr:`refused_retries`
+    max_refused_retries = 3
+
+    def __init__(
+        self, max_connections: int = 10, verify: Union[bool, str, ssl.SSLContext] = True, proxy: Optional[str] = None
+    ):
+        """
+        :param max_connections: maximum number of connections
+        :param verify: TLS verification: bool, path to CA bundle, or SSL context
+        :param proxy: URL of proxy to use
+        """
+        super().__init__()
+        import httpx
+
+        #: number of requests retried because the server refused the stream or closed the connection (GOAWAY) before
+        #: processing the request. Servers close HTTP/2 connections after a number of requests (for example 1000)
+        self.refused_retries = 0
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+        self._client = httpx.AsyncClient(
+            http2=True,
+            verify=verify,
+            proxy=proxy,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            follow_redirects=False,
+            timeout=None,
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._loop.run_forever, name='Http2Adapter', daemon=True)
+        self._thread.start()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """
+        Run a coroutine in the adapter's event loop and wait for the result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _send(self, request: 'httpx.Request', stream: bool) -> 'httpx.Response':
+        import httpx
+
+        retries = self.max_refused_retries
+        while True:
+            try:
+                response = await self._client.send(request, stream=True)
+            except httpx.RemoteProtocolError as e:
+                if not retries or not _refused(e):
+                    raise
+                retries -= 1
+                self.refused_retries += 1
+                continue
+            break
+        if not stream:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+        return response
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, tuple[float, float], tuple[float, None]] = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            httpx_timeout = httpx.Timeout(read, connect=connect)
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+        body: Any = request.body
+        if body is not None and hasattr(body, 'read'):
+            # file-like body; for example a multipart encoder
+            body = body.read()
+        httpx_request = self._client.build_request(
+            method=request.method or 'GET',
+            url=request.url or '',
+            headers=list(request.headers.items()),
+            content=body,
+            timeout=httpx_timeout,
+        )
+        with _map_exceptions(request):
+            httpx_response = self._run(self._send(httpx_request, stream=stream))
+
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = request.url or ''
+        response.request = request
+        # the body is consumed by requests.Session.send() unless stream is True
+        response.raw = _RawResponse(self, httpx_response, request)
+        response.connection = self  # type: ignore[assignment]
+        return response
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
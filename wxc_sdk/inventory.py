@@ -0,0 +1,416 @@
+"""
+Local inventory of an organization: people, locations, workspaces, numbers, devices, virtual lines, hunt groups, and
+call queues are read concurrently using the list methods of :class:`wxc_sdk.WebexSimpleApi` and stored in a SQLite
+database. Scripts can then answer questions locally instead of making thousands of API calls.
+
+Example: users in a location without a device
+
+.. code-block:: python
+
+    with Inventory(api=api, path='inventory.db') as inventory:
+        # only read collections which are older than an hour
+        inventory.refresh(max_age=3600)
+        location = inventory.find('location', 'Berlin')[0]
+        rows = inventory.execute(
+            "SELECT id FROM item p WHERE p.collection = 'people' AND p.location_id = ? "
+            "AND NOT EXISTS (SELECT 1 FROM item d WHERE d.collection = 'devices' AND d.owner_id = p.id)",
+            (location.id,),
+        )
+        users = [inventory.get('people', row['id']) for row in rows]
+"""
+
+import logging
+import re
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Optional, Self
+
+from .base import ApiModel
+from .devices import Device
+from .locations import Location
+from .people import Person
+from .telephony import NumberListPhoneNumber
+from .telephony.callqueue import CallQueue
+from .telephony.huntgroup import HuntGroup
+from .telephony.virtual_line import VirtualLine
+from .workspaces import Workspace
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['InventoryCollection', 'InventoryItem', 'COLLECTIONS', 'Inventory']
+
+log = logging.getLogger(__name__)
+
+
+def _e164(number: Optional[str]) -> Optional[str]:
+    """
+    Phone number without formatting if it is an E.164 number; else None
+    """
+    if not number:
+        return None
+    number = re.sub(r'[\s()-]', '', number)
+    return number if number.startswith('+') else None
+
+
+@dataclass(frozen=True)
+class InventoryCollection:
+    """
+    Definition of a collection of the inventory: how to read the items and how to index them
+    """
+
+    #: name of the collection
+    name: str
+    #: model of the items
+    model: type[ApiModel]
+    #: read all items of the collection
+    fetch: Callable[['WebexSimpleApi'], Iterable[Any]]
+    #: unique ID of an item
+    item_id: Callable[[Any], str]
+    #: name of an item
+    item_name: Callable[[Any], Optional[str]] = lambda item: None
+    #: location ID of an item
+    location_id: Callable[[Any], Optional[str]] = lambda item: None
+    #: ID of the owner of an item; for example the person or workspace a device or number is assigned to
+    owner_id: Callable[[Any], Optional[str]] = lambda item: None
+    #: identifiers of an item: (kind, value) tuples with kind 'email', 'sip', 'extension', 'e164', 'mac',
+    #: or 'location'
+    identifiers: Callable[[Any], Iterable[tuple[str, Optional[str]]]] = lambda item: ()
+
+
+#: collections of the inventory by name
+COLLECTIONS: dict[str, InventoryCollection] = {
+    c.name: c
+    for c in (
+        InventoryCollection(
+            name='people',
+            model=Person,
+            fetch=lambda api: api.people.list(calling_data=True),
+            item_id=lambda p: p.person_id,
+            item_name=lambda p: p.display_name,
+            location_id=lambda p: p.location_id,
+            identifiers=lambda p: [
+                *(('email', email.lower()) for email in p.emails or []),
+                ('extension', p.extension),
+                *(('e164', _e164(number.value)) for number in p.phone_numbers or []),
+            ],
+        ),
+        InventoryCollection(
+            name='locations',
+            model=Location,
+            fetch=lambda api: api.locations.list(),
+            item_id=lambda loc: loc.location_id,
+            item_name=lambda loc: loc.name,
+            location_id=lambda loc: loc.location_id,
+            identifiers=lambda loc: [('location', loc.name)],
+        ),
+        InventoryCollection(
+            name='workspaces',
+            model=Workspace,
+            fetch=lambda api: api.workspaces.list(),
+            item_id=lambda w: w.workspace_id,
+            item_name=lambda w: w.display_name,
+            location_id=lambda w: w.location_id,
+            identifiers=lambda w: [('sip', w.sip_address and w.sip_address.lower())],
+        ),
+        InventoryCollection(
+            name='numbers',
+            model=NumberListPhoneNumber,
+            fetch=lambda api: api.telephony.phone_numbers(),
+            item_id=lambda n: n.phone_number or f'{n.location and n.location.id}/{n.extension}',
+            item_name=lambda n: n.owner and (n.owner.display_name or f'{n.owner.first_name} {n.owner.last_name}'),
+            location_id=lambda n: n.location and n.location.id,
+            owner_id=lambda n: n.owner and n.owner.owner_id,
+            identifiers=lambda n: [('e164', _e164(n.phone_number)), ('extension', n.extension)],
+        ),
+        InventoryCollection(
+            name='devices',
+            model=Device,
+            fetch=lambda api: api.devices.list(),
+            item_id=lambda d: d.device_id,
+            item_name=lambda d: d.display_name,
+            location_id=lambda d: d.location_id,
+            owner_id=lambda d: d.person_id or d.workspace_id,
+            identifiers=lambda d: [('mac', d.mac and d.mac.upper())],
+        ),
+        InventoryCollection(
+            name='virtual_lines',
+            model=VirtualLine,
+            fetch=lambda api: api.telephony.virtual_lines.list(),
+            item_id=lambda v: v.id,
+            item_name=lambda v: v.display_name or f'{v.first_name} {v.last_name}',
+            location_id=lambda v: v.location and v.location.id,
+            identifiers=lambda v: (
+                v.number and [('e164', _e164(v.number.external)), ('extension', v.number.extension)] or []
+            ),
+        ),
+        InventoryCollection(
+            name='hunt_groups',
+            model=HuntGroup,
+            fetch=lambda api: api.telephony.huntgroup.list(),
+            item_id=lambda h: h.id,
+            item_name=lambda h: h.name,
+            location_id=lambda h: h.location_id,
+            identifiers=lambda h: [('e164', _e164(h.phone_number)), ('extension', h.extension)],
+        ),
+        InventoryCollection(
+            name='call_queues',
+            model=CallQueue,
+            fetch=lambda api: api.telephony.callqueue.list(),
+            item_id=lambda q: q.id,
+            item_name=lambda q: q.name,
+            location_id=lambda q: q.location_id,
+            identifiers=lambda q: [('e164', _e164(q.phone_number)), ('extension', q.extension)],
+        ),
+    )
+}
+
+
+@dataclass
+class InventoryItem:
+    """
+    Item found in the inventory
+    """
+
+    #: name of the collection
+    collection: str
+    #: unique ID of the item in the collection
+    id: str
+    #: name of the item
+    name: Optional[str]
+    #: location ID of the item
+    location_id: Optional[str]
+    #: ID of the owner of the item
+    owner_id: Optional[str]
+    #: JSON of the item
+    data: str = field(repr=False)
+
+    @property
+    def item(self) -> ApiModel:
+        """
+        The item parsed into the model of the collection
+        """
+        return COLLECTIONS[self.collection].model.model_validate_json(self.data)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS collection (
+    name TEXT PRIMARY KEY,
+    refreshed REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS item (
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    location_id TEXT,
+    owner_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (collection, id)
+);
+CREATE INDEX IF NOT EXISTS item_location ON item (location_id, collection);
+CREATE INDEX IF NOT EXISTS item_owner ON item (owner_id);
+CREATE TABLE IF NOT EXISTS identifier (
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS identifier_value ON identifier (kind, value);
+CREATE INDEX IF NOT EXISTS identifier_item ON identifier (collection, id);
+"""
+
+
+class Inventory:
+    """
+    Inventory of an organization in a SQLite database
+
+    Tables:
+
+    * `item`: one row per item: collection, id, name, location_id, owner_id, and the item as JSON (data)
+    * `identifier`: emails, SIP addresses, extensions, E.164 numbers, MAC addresses, and location names of the items:
+      collection, id, kind, value
+    * `collection`: time of the last refresh and number of items per collection
+
+    The database is only accessed from the thread that created the inventory.
+    """
+
+    def __init__(self, *, api: 'WebexSimpleApi', path: str = ':memory:'):
+        """
+        :param api: API used to read the collections
+        :param path: path of the SQLite database; the database is created if it doesn't exist
+        """
+        self.api = api
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+
+    def refreshed(self, collection: str) -> Optional[datetime]:
+        """
+        Time of the last refresh of a collection
+
+        :param collection: name of the collection
+        :return: time of the last refresh; None if the collection has not been read yet
+        """
+        row = self._db.execute('SELECT refreshed FROM collection WHERE name = ?', (collection,)).fetchone()
+        return row and datetime.fromtimestamp(row['refreshed'], tz=UTC)
+
+    def refresh(self, collections: Iterable[str] = None, max_age: float = None) -> list[str]:
+        """
+        Read collections from the API and replace them in the database
+
+        The collections are read concurrently. Each collection is replaced in a transaction as soon as it has been
+        read; if reading a collection fails, then the other collections are still updated and the first exception is
+        raised at the end.
+
+        :param collections: names of the collections to refresh; default: all collections. See :data:`COLLECTIONS`
+        :param max_age: only refresh collections which have not been refreshed within the last `max_age` seconds
+        :return: names of the refreshed collections
+        """
+        names = list(COLLECTIONS) if collections is None else list(collections)
+        unknown = [name for name in names if name not in COLLECTIONS]
+        if unknown:
+            raise ValueError(f'Unknown collection(s): {", ".join(unknown)}')
+        if max_age is not None:
+            now = time.time()
+            names = [
+                name
+                for name in names
+                if (refreshed := self.refreshed(name)) is None or now - refreshed.timestamp() > max_age
+            ]
+        refreshed_names = []
+        error: Optional[Exception] = None
+        for result in self.api.bulk.map(
+            lambda name: list(COLLECTIONS[name].fetch(self.api)), names, ordered=False, max_workers=len(names) or None
+        ):
+            if not result.ok:
+                log.error(f'refresh: failed to read {result.item}: {result.exception}')
+                error = error or result.exception
+                continue
+            self._store(COLLECTIONS[result.item], result.result or [])
+            refreshed_names.append(result.item)
+        if error is not None:
+            raise error
+        return refreshed_names
+
+    def _store(self, collection: InventoryCollection, items: list[Any]) -> None:
+        """
+        Replace all items of a collection
+
+        :meta private:
+        """
+        # the same item can be returned twice if the list changes while pages are read: the last one wins
+        unique = {collection.item_id(item): item for item in items}
+        rows = []
+        identifiers: dict[tuple[str, str, str, str], None] = {}
+        for item_id, item in unique.items():
+            rows.append(
+                (
+                    collection.name,
+                    item_id,
+                    collection.item_name(item),
+                    collection.location_id(item),
+                    collection.owner_id(item),
+                    item.model_dump_json(by_alias=True, exclude_none=True),
+                )
+            )
+            identifiers.update(
+                dict.fromkeys(
+                    (collection.name, item_id, kind, value) for kind, value in collection.identifiers(item) if value
+                )
+            )
+        with self._db:
+            self._db.execute('DELETE FROM item WHERE collection = ?', (collection.name,))
+            self._db.execute('DELETE FROM identifier WHERE collection = ?', (collection.name,))
+            self._db.executemany('INSERT INTO item VALUES (?, ?, ?, ?, ?, ?)', rows)
+            self._db.executemany('INSERT INTO identifier VALUES (?, ?, ?, ?)', identifiers)
+            self._db.execute(
+                'INSERT OR REPLACE INTO collection VALUES (?, ?, ?)', (collection.name, time.time(), len(rows))
+            )
+        log.debug(f'refresh: stored {len(rows)} {collection.name}')
+
+    def items(self, collection: str, location_id: str = None) -> list[Any]:
+        """
+        Items of a collection
+
+        :param collection: name of the collection
+        :param location_id: only items in this location
+        :return: list of items; instances of the model of the collection
+        """
+        if location_id is None:
+            cursor = self._db.execute('SELECT data FROM item WHERE collection = ?', (collection,))
+        else:
+            cursor = self._db.execute(
+                'SELECT data FROM item WHERE collection = ? AND location_id = ?', (collection, location_id)
+            )
+        model = COLLECTIONS[collection].model
+        return [model.model_validate_json(row['data']) for row in cursor]
+
+    def get(self, collection: str, item_id: str) -> Optional[Any]:
+        """
+        Get an item by ID
+
+        :param collection: name of the collection
+        :param item_id: ID of the item
+        :return: item or None if the item doesn't exist
+        """
+        row = self._db.execute(
+            'SELECT data FROM item WHERE collection = ? AND id = ?', (collection, item_id)
+        ).fetchone()
+        return row and COLLECTIONS[collection].model.model_validate_json(row['data'])
+
+    def find(self, kind: str, value: str, collection: str = None, location_id: str = None) -> list[InventoryItem]:
+        """
+        Find items by identifier
+
+        Example: `inventory.find('e164', '+14085551234')` finds the number, and the person, workspace, virtual line,
+        hunt group, or call queue the number is assigned to
+
+        :param kind: 'email', 'sip', 'extension', 'e164', 'mac', or 'location' (location name)
+        :param value: value of the identifier
+        :param collection: only items of this collection
+        :param location_id: only items in this location; useful for extensions
+        :return: list of items
+        """
+        if kind in ('email', 'sip'):
+            value = value.lower()
+        elif kind == 'e164':
+            value = _e164(value) or value
+        elif kind == 'mac':
+            value = value.upper()
+        query = (
+            'SELECT item.collection, item.id, item.name, item.location_id, item.owner_id, item.data '
+            'FROM identifier JOIN item ON item.collection = identifier.collection AND item.id = identifier.id '
+            'WHERE identifier.kind = ? AND identifier.value = ?'
+        )
+        params: list[Any] = [kind, value]
+        if collection is not None:
+            query = f'{query} AND item.collection = ?'
+            params.append(collection)
+        if location_id is not None:
+            query = f'{query} AND item.location_id = ?'
+            params.append(location_id)
+        return [InventoryItem(**dict(row)) for row in self._db.execute(query, params)]
+
+    def execute(self, sql: str, parameters: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        """
+        Run a SQL query on the database
+
+        :param sql: query
+        :param parameters: query parameters
+        :return: rows; columns can be accessed by name
+        """
+        return self._db.execute(sql, tuple(parameters)).fetchall()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
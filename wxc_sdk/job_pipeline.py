@@ -0,0 +1,436 @@
+"""
+Pipelines for number moves and user moves which are too large for a single job
+
+The input is split into chunks which the service accepts in one job. Jobs are started as long as the number of jobs in
+flight is below the limit; as soon as a job completes, the next chunk is started. Errors of all jobs are collected in
+one report, and the state of all chunks is written to a checkpoint file so that an interrupted run can be resumed.
+
+Example: move 20,000 numbers to a new location
+
+.. code-block:: python
+
+    pipeline = MoveNumbersPipeline(
+        api=api,
+        number_list=[NumberItem(location_id=source_location_id, numbers=numbers)],
+        target_location_id=target_location_id,
+        checkpoint='move_numbers.json',
+    )
+    # running the same code again after an interruption continues where the last run stopped
+    report = pipeline.run(progress=lambda r: print(f'{len(r.completed)}/{len(r.chunks)} jobs completed'))
+    for error in report.errors:
+        print(error.item, error.error.message[0].description)
+"""
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import Field, TypeAdapter
+
+from .base import ApiModel
+from .job_waiter import WatchedJob
+from .json_codec import get_codec
+from .rest import RestError
+from .telephony.jobs import JobErrorItem, MoveUser, MoveUsersList, NumberItem, NumberJob, StartMoveUsersJobResponse
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['JobChunk', 'JobPipelineReport', 'JobPipeline', 'MoveNumbersPipeline', 'MoveUsersPipeline']
+
+log = logging.getLogger(__name__)
+
+
+class JobChunk(ApiModel):
+    """
+    Part of the input of a pipeline which is processed by one job
+    """
+
+    #: position of the chunk
+    index: int
+    #: items of the chunk as JSON-serializable dicts
+    items: list[dict[str, Any]]
+    #: 'pending', 'running', 'completed', or 'failed'
+    state: str = 'pending'
+    #: ID of the job started for the chunk
+    job_id: Optional[str] = None
+    #: last `latest_execution_status` of the job
+    status: Optional[str] = None
+    #: reason why the chunk failed: error starting the job or polling the job status
+    error: Optional[str] = None
+    #: errors reported by the job
+    errors: list[JobErrorItem] = Field(default_factory=list)
+
+
+@dataclass
+class JobPipelineReport:
+    """
+    State of a pipeline run
+    """
+
+    #: all chunks of the input
+    chunks: list[JobChunk]
+
+    def _in_state(self, state: str) -> list[JobChunk]:
+        return [chunk for chunk in self.chunks if chunk.state == state]
+
+    @property
+    def pending(self) -> list[JobChunk]:
+        """
+        Chunks which have not been started yet
+        """
+        return self._in_state('pending')
+
+    @property
+    def running(self) -> list[JobChunk]:
+        """
+        Chunks with a job in flight
+        """
+        return self._in_state('running')
+
+    @property
+    def completed(self) -> list[JobChunk]:
+        """
+        Chunks for which the job completed
+        """
+        return self._in_state('completed')
+
+    @property
+    def failed(self) -> list[JobChunk]:
+        """
+        Chunks for which the job could not be started, the job failed, or polling the job status failed
+        """
+        return self._in_state('failed')
+
+    @property
+    def errors(self) -> list[JobErrorItem]:
+        """
+        Errors reported by all jobs
+        """
+        return [error for chunk in self.chunks for error in chunk.errors]
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if all jobs completed without errors
+        """
+        return len(self.completed) == len(self.chunks) and not self.errors
+
+
+class JobPipeline(ABC):
+    """
+    Base class for pipelines: splits the input into chunks, starts one job per chunk, and keeps up to
+    :attr:`max_jobs` jobs in flight
+
+    Subclasses implement :meth:`_start` to start the job for a chunk.
+    """
+
+    def __init__(
+        self,
+        *,
+        api: 'WebexSimpleApi',
+        jobs_api: Any,
+        items: Iterable[dict[str, Any]],
+        chunk_size: int,
+        max_jobs: int,
+        checkpoint: str = None,
+        org_id: str = None,
+    ):
+        """
+        :param api: API used to start and watch the jobs
+        :param jobs_api: job API used to read the status and the errors of the jobs
+        :param items: items to process as JSON-serializable dicts
+        :param chunk_size: maximum number of items per job
+        :param max_jobs: maximum number of jobs in flight
+        :param checkpoint: path of the checkpoint file. If the file exists, then the run continues with the state
+            stored in the file: completed and failed chunks are skipped and jobs in flight are watched again
+        :param org_id: organization ID
+        """
+        if chunk_size < 1 or max_jobs < 1:
+            raise ValueError('chunk_size and max_jobs have to be at least 1')
+        self.api = api
+        self.jobs_api = jobs_api
+        self.max_jobs = max_jobs
+        self.checkpoint = checkpoint
+        self.org_id = org_id
+        self.chunks = self._chunk(list(items), chunk_size)
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._resume(checkpoint)
+
+    def _chunk(self, items: list[dict[str, Any]], chunk_size: int) -> list[JobChunk]:
+        """
+        Split the input into chunks
+
+        :meta private:
+        """
+        return [
+            JobChunk(index=i, items=items[start : start + chunk_size])
+            for i, start in enumerate(range(0, len(items), chunk_size))
+        ]
+
+    def _resume(self, path: str) -> None:
+        """
+        Take the state of the chunks from a checkpoint file
+
+        :meta private:
+        """
+        with open(path, 'rb') as f:
+            saved = TypeAdapter(list[JobChunk]).validate_python(get_codec().loads(f.read())['chunks'])
+        if [chunk.items for chunk in saved] != [chunk.items for chunk in self.chunks]:
+            raise ValueError(f'checkpoint {path} does not match the input')
+        self.chunks = saved
+        report = JobPipelineReport(chunks=saved)
+        log.info(
+            f'resume from {path}: {len(report.completed)} completed, {len(report.failed)} failed, '
+            f'{len(report.running)} running, {len(report.pending)} pending'
+        )
+
+    def _save(self) -> None:
+        """
+        Write the state of all chunks to the checkpoint file
+
+        :meta private:
+        """
+        if self.checkpoint is None:
+            return
+        data = {'chunks': [chunk.model_dump(mode='json', by_alias=True, exclude_none=True) for chunk in self.chunks]}
+        tmp = f'{self.checkpoint}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(get_codec().dumps(data))
+        os.replace(tmp, self.checkpoint)
+
+    @abstractmethod
+    def _start(self, chunk: JobChunk) -> str:
+        """
+        Start the job for a chunk
+
+        :meta private:
+        :return: job ID
+        """
+        ...
+
+    def run(
+        self,
+        *,
+        progress: Callable[[JobPipelineReport], None] = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        conflict_delay: float = 30.0,
+        conflict_retries: int = 10,
+    ) -> JobPipelineReport:
+        """
+        Process all pending chunks and wait for all jobs to complete
+
+        All jobs in flight are watched by one polling loop (see :meth:`wxc_sdk.job_waiter.JobWaiter.poll`): each job
+        keeps its polling interval while other jobs complete and new jobs are started.
+
+        If the service rejects a new job with 409 (Conflict) because too many jobs are running, then the chunk is
+        started again once another job of the pipeline has completed and the limit of jobs in flight for this run is
+        lowered to the number of jobs in flight. Each time as many jobs have completed as the lowered limit allows,
+        the limit grows by one again, up to :attr:`max_jobs`. If no job of the pipeline is in flight, then the start
+        is retried after `conflict_delay` seconds, up to `conflict_retries` times.
+
+        :param progress: called with the :class:`JobPipelineReport` each time a job is started or has stopped
+        :param min_interval: minimum polling interval in seconds; see :meth:`wxc_sdk.job_waiter.JobWaiter.watch`
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param conflict_delay: delay in seconds before retrying a start rejected with 409 while no job of the pipeline
+            is in flight
+        :param conflict_retries: number of retries for a start rejected with 409 while no job of the pipeline is in
+            flight
+        :return: report with the state of all chunks
+        """
+        report = JobPipelineReport(chunks=self.chunks)
+        queue = deque(report.pending)
+        in_flight = {
+            chunk.job_id: (chunk, WatchedJob(jobs_api=self.jobs_api, job_id=chunk.job_id, org_id=self.org_id))
+            for chunk in report.running
+            if chunk.job_id is not None
+        }
+        conflicts = 0
+        # limit of jobs in flight: lowered on 409, grows back by one per `limit` completed jobs
+        limit = self.max_jobs
+        completed_at_limit = 0
+        while queue or in_flight:
+            # start jobs until the limit is reached
+            while queue and len(in_flight) < limit:
+                chunk = queue[0]
+                try:
+                    job_id = self._start(chunk)
+                except RestError as e:
+                    if e.response.status_code == 409 and in_flight:
+                        log.warning(f'run: chunk {chunk.index} rejected with 409, {len(in_flight)} jobs in flight')
+                        limit, completed_at_limit = len(in_flight), 0
+                        break
+                    if e.response.status_code == 409 and conflicts < conflict_retries:
+                        conflicts += 1
+                        log.warning(f'run: chunk {chunk.index} rejected with 409, retry in {conflict_delay} s')
+                        time.sleep(conflict_delay)
+                        continue
+                    chunk.state, chunk.error = 'failed', str(e)
+                except Exception as e:
+                    chunk.state, chunk.error = 'failed', str(e)
+                else:
+                    chunk.state, chunk.job_id = 'running', job_id
+                    in_flight[job_id] = (chunk, WatchedJob(jobs_api=self.jobs_api, job_id=job_id, org_id=self.org_id))
+                conflicts = 0
+                queue.popleft()
+                log.debug(f'run: chunk {chunk.index}: {chunk.state}, job {chunk.job_id}, {chunk.error or ""}')
+                self._save()
+                if progress is not None:
+                    progress(report)
+            if not in_flight:
+                continue
+            # one round of polling; the polling state is kept in the WatchedJob instances
+            for watched in self.api.job_waiter.poll(
+                [w for _, w in in_flight.values()],
+                errors=True,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                backoff=backoff,
+            ):
+                chunk, _ = in_flight.pop(watched.job_id)
+                if limit < self.max_jobs:
+                    completed_at_limit += 1
+                    if completed_at_limit >= limit:
+                        limit, completed_at_limit = limit + 1, 0
+                chunk.status = watched.status
+                chunk.errors = list(watched.errors)
+                if watched.ok:
+                    chunk.state = 'completed'
+                else:
+                    chunk.state = 'failed'
+                    chunk.error = str(watched.exception) if watched.exception is not None else None
+                log.debug(f'run: chunk {chunk.index}: job {chunk.job_id} {chunk.status}, {len(chunk.errors)} errors')
+                self._save()
+                if progress is not None:
+                    progress(report)
+        return report
+
+
+class MoveNumbersPipeline(JobPipeline):
+    """
+    Move numbers to a location with :meth:`ManageNumbersJobsApi.initiate_job
+    <wxc_sdk.telephony.jobs.ManageNumbersJobsApi.initiate_job>`
+
+    A job accepts up to 1000 numbers and only one number move job can run at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        api: 'WebexSimpleApi',
+        number_list: Iterable[NumberItem],
+        target_location_id: str,
+        chunk_size: int = 1000,
+        max_jobs: int = 1,
+        checkpoint: str = None,
+        org_id: str = None,
+    ):
+        """
+        :param api: API used to start and watch the jobs
+        :param number_list: numbers to move by source location
+        :param target_location_id: ID of the location to move the numbers to
+        :param chunk_size: maximum number of numbers per job
+        :param max_jobs: maximum number of jobs in flight
+        :param checkpoint: path of the checkpoint file; see :class:`JobPipeline`
+        :param org_id: organization ID
+        """
+        self.target_location_id = target_location_id
+        items = [
+            {'locationId': item.location_id, 'number': number} for item in number_list for number in item.numbers or []
+        ]
+        super().__init__(
+            api=api,
+            jobs_api=api.telephony.jobs.manage_numbers,
+            items=items,
+            chunk_size=chunk_size,
+            max_jobs=max_jobs,
+            checkpoint=checkpoint,
+            org_id=org_id,
+        )
+
+    def _start(self, chunk: JobChunk) -> str:
+        # group the numbers of the chunk by source location
+        by_location: dict[str, list[str]] = {}
+        for item in chunk.items:
+            by_location.setdefault(item['locationId'], []).append(item['number'])
+        job: NumberJob = self.jobs_api.initiate_job(
+            operation='MOVE',
+            number_list=[
+                NumberItem(location_id=location_id, numbers=numbers) for location_id, numbers in by_location.items()
+            ],
+            target_location_id=self.target_location_id,
+            org_id=self.org_id,
+        )
+        if job.id is None:
+            raise ValueError('no job ID in response')
+        return job.id
+
+
+class MoveUsersPipeline(JobPipeline):
+    """
+    Move users to a location with :meth:`MoveUsersJobsApi.validate_or_initiate
+    <wxc_sdk.telephony.jobs.MoveUsersJobsApi.validate_or_initiate>`
+
+    A job accepts one calling user. If more jobs are in flight than the service allows, then the number of jobs in
+    flight is lowered automatically; see :meth:`JobPipeline.run`.
+    """
+
+    def __init__(
+        self,
+        *,
+        api: 'WebexSimpleApi',
+        users: Iterable[MoveUser],
+        target_location_id: str,
+        chunk_size: int = 1,
+        max_jobs: int = 5,
+        checkpoint: str = None,
+        org_id: str = None,
+    ):
+        """
+        :param api: API used to start and watch the jobs
+        :param users: users to move
+        :param target_location_id: ID of the location to move the users to
+        :param chunk_size: maximum number of users per job
+        :param max_jobs: maximum number of jobs in flight
+        :param checkpoint: path of the checkpoint file; see :class:`JobPipeline`
+        :param org_id: organization ID
+        """
+        self.target_location_id = target_location_id
+        super().__init__(
+            api=api,
+            jobs_api=api.telephony.jobs.move_users,
+            items=[user.model_dump(mode='json', by_alias=True, exclude_none=True) for user in users],
+            chunk_size=chunk_size,
+            max_jobs=max_jobs,
+            checkpoint=checkpoint,
+            org_id=org_id,
+        )
+
+    def _start(self, chunk: JobChunk) -> str:
+        response: StartMoveUsersJobResponse = self.jobs_api.validate_or_initiate(
+            users_list=[
+                MoveUsersList(
+                    location_id=self.target_location_id,
+                    validate_only=False,  # type: ignore[call-arg]
+                    users=[MoveUser.model_validate(user) for user in chunk.items],
+                )
+            ],
+            org_id=self.org_id,
+        )
+        if response.job_details is None:
+            # the request was rejected: report the errors returned for the users
+            errors = [
+                f'{user.user_id}: {error.code} {error.message}'
+                for user in response.users_list or []
+                for error in user.errors or []
+            ]
+            raise ValueError(f'no job started: {"; ".join(errors) or "unknown reason"}')
+        return response.job_details.id
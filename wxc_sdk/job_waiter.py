@@ -0,0 +1,636 @@
+"""
+Wait for background jobs to complete; available as :attr:`wxc_sdk.WebexSimpleApi.job_waiter` and
+:attr:`wxc_sdk.as_api.AsWebexSimpleApi.job_waiter`
+
+Works with all job APIs which have `status()` and `errors()` methods; for example the APIs in
+:class:`wxc_sdk.telephony.jobs.JobsApi`.
+
+Example: rebuild the phones of some locations and wait for all jobs to complete
+
+.. code-block:: python
+
+    rebuild = api.telephony.jobs.rebuild_phones
+    jobs = [(rebuild, rebuild.rebuild_phones_configuration(location_id=location_id).id)
+            for location_id in location_ids]
+    for watched in api.job_waiter.watch(jobs, errors=True):
+        print(f'{watched.job_id}: {watched.status}, {len(watched.errors)} errors')
+"""
+
+import inspect
+import time
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional, Union
+
+from .bulk import BulkExecutor
+from .rest import RestSession
+from .telephony.jobs import JobErrorItem
+
+__all__ = ['WatchedJob', 'JobWaiter']
+
+
+@dataclass(eq=False)
+class WatchedJob:
+    """
+    State of a job while waiting for it to complete
+    """
+
+    #: values of `latest_execution_status` of a job which has stopped running
+    TERMINAL_STATUSES: ClassVar[frozenset[str]] = frozenset({'COMPLETED', 'FAILED', 'STOPPED', 'ABANDONED'})
+
+    #: job API with `status()` and `errors()` methods; for example :attr:`api.telephony.jobs.manage_numbers
+    #: <wxc_sdk.telephony.jobs.JobsApi.manage_numbers>`
+    jobs_api: Any
+    #: job ID
+    job_id: str
+    #: organization ID
+    org_id: Optional[str] = None
+    #: time.monotonic() timestamp after which waiting for the job times out; None: no timeout
+    deadline: Optional[float] = None
+    #: job details returned by the last `status()` call
+    job: Any = None
+    #: exception raised by `status()` or `errors()`; :class:`TimeoutError` if the job didn't complete in time
+    exception: Optional[Exception] = None
+    #: errors reported for the job so far; only read if requested
+    errors: list[JobErrorItem] = field(default_factory=list)
+    #: number of `status()` calls
+    polls: int = 0
+    #: estimated progress between 0 and 1; None if the job details don't indicate progress
+    progress: Optional[float] = None
+    #: current polling interval in seconds
+    interval: float = 0.0
+    #: time.monotonic() timestamp of the next poll
+    next_poll: float = 0.0
+    #: time and value of the last progress change
+    _progress_at: Optional[tuple[float, float]] = field(default=None, repr=False)
+    #: keys of the errors seen so far
+    _error_keys: set[tuple[int, str]] = field(default_factory=set, repr=False)
+
+    def params(self, method: str) -> dict[str, Any]:
+        """
+        Keyword arguments for `status()` or `errors()` of the job API
+
+        Job APIs differ in how they take the organization ID: most have an optional `org_id` parameter, some require
+        it, and some don't have it at all. The organization ID is only passed if the method has the parameter.
+
+        :meta private:
+        :param method: 'status' or 'errors'
+        :raises ValueError: if the job API doesn't have the method, the method doesn't have a `job_id` parameter, or
+            the method requires an organization ID and :attr:`org_id` is not set
+        """
+        func = getattr(self.jobs_api, method, None)
+        if func is None:
+            raise ValueError(f'{type(self.jobs_api).__name__} has no {method}() method')
+        parameters = inspect.signature(func).parameters
+        if 'job_id' not in parameters:
+            raise ValueError(f'{type(self.jobs_api).__name__}.{method}() has no job_id parameter')
+        params: dict[str, Any] = {'job_id': self.job_id}
+        org_id = parameters.get('org_id')
+        if org_id is not None:
+            if self.org_id is not None:
+                params['org_id'] = self.org_id
+            elif org_id.default is inspect.Parameter.empty:
+                raise ValueError(f'{type(self.jobs_api).__name__}.{method}() requires an org_id')
+        return params
+
+    @property
+    def status(self) -> Optional[str]:
+        """
+        `latest_execution_status` of the job; None before the first poll
+        """
+        return getattr(self.job, 'latest_execution_status', None)
+
+    @property
+    def done(self) -> bool:
+        """
+        True if the job has stopped running or waiting for the job failed
+        """
+        return self.exception is not None or self.status in self.TERMINAL_STATUSES
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the job completed
+        """
+        return self.exception is None and self.status == 'COMPLETED'
+
+    @staticmethod
+    def job_progress(job: Any) -> Optional[float]:
+        """
+        Estimate the progress of a job from the job details: `percentage_complete` or the counts of the job
+
+        :param job: job details
+        :return: progress between 0 and 1; None if the job details don't indicate progress
+        """
+        percentage: Optional[int] = getattr(job, 'percentage_complete', None)
+        if percentage is not None:
+            return min(max(percentage / 100, 0.0), 1.0)
+        counts = getattr(job, 'counts', None)
+        if counts is None:
+            return None
+        values = {k: v for k, v in counts.model_dump().items() if isinstance(v, int)}
+        total = sum(v for k, v in values.items() if k.startswith('total'))
+        if not total:
+            return None
+        if 'pending' in values:
+            processed = total - values['pending']
+        else:
+            processed = sum(v for k, v in values.items() if not k.startswith('total'))
+        return min(max(processed / total, 0.0), 1.0)
+
+    def update(self, job: Any, now: float, min_interval: float, max_interval: float, backoff: float) -> None:
+        """
+        Record the result of a poll and schedule the next poll
+
+        If the progress of the job advances, then the next poll is scheduled at the estimated completion time of the
+        job. Else the polling interval grows exponentially. The interval is always kept between `min_interval` and
+        `max_interval`.
+
+        :meta private:
+        """
+        self.job = job
+        self.polls += 1
+        interval = self.interval * backoff if self.interval else min_interval
+        progress = self.job_progress(job)
+        if progress is not None:
+            if self._progress_at is not None and progress > self._progress_at[1] and now > self._progress_at[0]:
+                rate = (progress - self._progress_at[1]) / (now - self._progress_at[0])
+                interval = (1 - progress) / rate
+            if self._progress_at is None or progress != self._progress_at[1]:
+                self._progress_at = (now, progress)
+        self.progress = progress
+        self.interval = min(max(interval, min_interval), max_interval)
+        self.next_poll = now + self.interval
+        if self.deadline is not None:
+            self.next_poll = min(self.next_poll, self.deadline)
+
+    def add_errors(self, errors: Iterable[JobErrorItem]) -> list[JobErrorItem]:
+        """
+        Add errors read from the job API
+
+        :meta private:
+        :return: errors not seen before
+        """
+        new_errors = []
+        for error in errors:
+            key = (error.item_number, error.error.key)
+            if key not in self._error_keys:
+                self._error_keys.add(key)
+                new_errors.append(error)
+        self.errors.extend(new_errors)
+        return new_errors
+
+    def check_deadline(self, now: float) -> bool:
+        """
+        Set :attr:`exception` if the job is still running after the deadline
+
+        :meta private:
+        :return: True if the deadline has passed
+        """
+        if self.done or self.deadline is None or now < self.deadline:
+            return False
+        self.exception = TimeoutError(f'job {self.job_id} still {self.status} after {self.polls} polls')
+        return True
+
+
+class JobWaiter:
+    """
+    Wait for jobs to complete
+
+    Job status is polled with an adaptive interval: if the job details indicate progress (percentage complete or
+    counts), then the next poll is scheduled at the estimated completion time. Else the interval grows exponentially
+    from `min_interval` to `max_interval`.
+
+    Many jobs are watched by a single polling loop; polls which are due at the same time are sent concurrently.
+    """
+
+    def __init__(self, *, session: RestSession):
+        self._session = session
+
+    def wait(
+        self,
+        jobs_api: Any,
+        job_id: str,
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        progress: Callable[[WatchedJob], None] = None,
+    ) -> Any:
+        """
+        Wait for a job to stop running
+
+        :param jobs_api: job API with `status()` and `errors()` methods; for example
+            :attr:`api.telephony.jobs.manage_numbers <wxc_sdk.telephony.jobs.JobsApi.manage_numbers>`
+        :param job_id: job ID
+        :param org_id: organization ID
+        :param timeout: maximum time to wait in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if the job doesn't indicate progress
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :return: job details returned by the last `status()` call. The job might have failed; check
+            `latest_execution_status`
+        :raises TimeoutError: if the job is still running after `timeout` seconds
+        """
+        '''async
+    async def wait(
+        self,
+        jobs_api: Any,
+        job_id: str,
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        progress: Callable[[WatchedJob], None] = None,
+    ) -> Any:
+        """
+        Wait for a job to stop running
+
+        :param jobs_api: job API with `status()` and `errors()` methods; for example
+            :attr:`api.telephony.jobs.manage_numbers <wxc_sdk.telephony.jobs.JobsApi.manage_numbers>`
+        :param job_id: job ID
+        :param org_id: organization ID
+        :param timeout: maximum time to wait in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if the job doesn't indicate progress
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :return: job details returned by the last `status()` call. The job might have failed; check
+            `latest_execution_status`
+        :raises TimeoutError: if the job is still running after `timeout` seconds
+        """
+        async for watched in self.watch(
+            [(jobs_api, job_id)],
+            org_id=org_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            progress=progress,
+        ):
+            if watched.exception is not None:
+                raise watched.exception
+            return watched.job
+        '''
+        for watched in self.watch(
+            [(jobs_api, job_id)],
+            org_id=org_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            progress=progress,
+        ):
+            if watched.exception is not None:
+                raise watched.exception
+            return watched.job
+        raise RuntimeError('no result')  # pragma: no cover
+
+    def poll(
+        self,
+        jobs: list[WatchedJob],
+        *,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        errors: bool = False,
+        progress: Callable[[WatchedJob], None] = None,
+        on_error: Callable[[WatchedJob, JobErrorItem], None] = None,
+        max_workers: int = None,
+    ) -> list[WatchedJob]:
+        """
+        One round of polling: wait until the first job is due and poll all jobs which are due concurrently
+
+        Building block for loops which watch a changing set of jobs: the polling state (interval, next poll, progress,
+        errors seen) is kept in the :class:`WatchedJob` instances, so the same instances have to be passed to
+        each call. :meth:`watch` calls this method until all jobs are done.
+
+        Exceptions raised by `status()` or `errors()` are not raised but stored in :attr:`WatchedJob.exception`;
+        jobs still running after their deadline get a :class:`TimeoutError`.
+
+        :param jobs: jobs to poll; all jobs have to be running
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param errors: also read the errors of each job and collect them in :attr:`WatchedJob.errors`
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :param on_error: called for each new error of a job as soon as it is seen; implies `errors`
+        :param max_workers: maximum number of concurrent polls; default: maximum number of concurrent requests of the
+            session
+        :return: jobs which have stopped running
+        :raises ValueError: if the `status()` or `errors()` method of a job API can't be called with the job ID and
+            organization ID of the job
+        """
+        '''async
+    async def poll(
+        self,
+        jobs: list[WatchedJob],
+        *,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        errors: bool = False,
+        progress: Callable[[WatchedJob], None] = None,
+        on_error: Callable[[WatchedJob, JobErrorItem], None] = None,
+        max_workers: int = None,
+    ) -> list[WatchedJob]:
+        """
+        One round of polling: wait until the first job is due and poll all jobs which are due concurrently
+
+        Building block for loops which watch a changing set of jobs: the polling state (interval, next poll, progress,
+        errors seen) is kept in the :class:`WatchedJob` instances, so the same instances have to be passed to
+        each call. :meth:`watch` calls this method until all jobs are done.
+
+        Exceptions raised by `status()` or `errors()` are not raised but stored in :attr:`WatchedJob.exception`;
+        jobs still running after their deadline get a :class:`TimeoutError`.
+
+        :param jobs: jobs to poll; all jobs have to be running
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param errors: also read the errors of each job and collect them in :attr:`WatchedJob.errors`
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :param on_error: called for each new error of a job as soon as it is seen; implies `errors`
+        :param max_workers: maximum number of concurrent polls; default: maximum number of concurrent requests of the
+            session
+        :return: jobs which have stopped running
+        :raises ValueError: if the `status()` or `errors()` method of a job API can't be called with the job ID and
+            organization ID of the job
+        """
+        read_errors = errors or on_error is not None
+        if not jobs:
+            return []
+        # reject unsupported job APIs before sending any request
+        for watched in jobs:
+            watched.params('status')
+            if read_errors:
+                watched.params('errors')
+        now = time.monotonic()
+        first = min(watched.next_poll for watched in jobs)
+        if first > now:
+            await asyncio.sleep(first - now)
+            now = time.monotonic()
+        due = [watched for watched in jobs if watched.next_poll <= now]
+        bulk = AsBulkExecutor(session=self._session)
+
+        async def poll_job(watched: WatchedJob) -> tuple[Any, list[JobErrorItem]]:
+            job = await watched.jobs_api.status(**watched.params('status'))
+            job_errors = await watched.jobs_api.errors(**watched.params('errors')) if read_errors else []
+            return job, job_errors
+
+        async for result in bulk.map(poll_job, due, ordered=False, max_workers=max_workers):
+            watched = result.item
+            if result.ok and result.result is not None:
+                job, job_errors = result.result
+                watched.update(job, time.monotonic(), min_interval, max_interval, backoff)
+                for error in watched.add_errors(job_errors):
+                    if on_error is not None:
+                        on_error(watched, error)
+                if progress is not None:
+                    progress(watched)
+                watched.check_deadline(time.monotonic())
+            else:
+                watched.exception = result.exception
+        return [watched for watched in due if watched.done]
+        '''
+        read_errors = errors or on_error is not None
+        if not jobs:
+            return []
+        # reject unsupported job APIs before sending any request
+        for watched in jobs:
+            watched.params('status')
+            if read_errors:
+                watched.params('errors')
+        now = time.monotonic()
+        first = min(watched.next_poll for watched in jobs)
+        if first > now:
+            time.sleep(first - now)
+            now = time.monotonic()
+        due = [watched for watched in jobs if watched.next_poll <= now]
+        bulk = BulkExecutor(session=self._session)
+
+        def poll_job(watched: WatchedJob) -> tuple[Any, list[JobErrorItem]]:
+            job = watched.jobs_api.status(**watched.params('status'))
+            job_errors = list(watched.jobs_api.errors(**watched.params('errors'))) if read_errors else []
+            return job, job_errors
+
+        for result in bulk.map(poll_job, due, ordered=False, max_workers=max_workers):
+            watched = result.item
+            if result.ok and result.result is not None:
+                job, job_errors = result.result
+                watched.update(job, time.monotonic(), min_interval, max_interval, backoff)
+                for error in watched.add_errors(job_errors):
+                    if on_error is not None:
+                        on_error(watched, error)
+                if progress is not None:
+                    progress(watched)
+                watched.check_deadline(time.monotonic())
+            else:
+                watched.exception = result.exception
+        return [watched for watched in due if watched.done]
+
+    def watch(
+        self,
+        jobs: Iterable[Union[WatchedJob, tuple[Any, str]]],
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        errors: bool = False,
+        progress: Callable[[WatchedJob], None] = None,
+        on_error: Callable[[WatchedJob, JobErrorItem], None] = None,
+        max_workers: int = None,
+    ) -> Generator[WatchedJob, None, None]:
+        """
+        Wait for many jobs; all jobs are polled by a single loop and each job is yielded once it has stopped running
+
+        Exceptions raised by `status()` or `errors()` are not raised but stored in :attr:`WatchedJob.exception`;
+        jobs which didn't complete in time get a :class:`TimeoutError`.
+
+        :param jobs: jobs to watch: :class:`WatchedJob` instances or (job API, job ID) tuples
+        :param org_id: organization ID for jobs given as tuples
+        :param timeout: maximum time to wait for each job in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param errors: also read the errors of each job with each poll and collect them in
+            :attr:`WatchedJob.errors`
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :param on_error: called for each new error of a job as soon as it is seen; implies `errors`
+        :param max_workers: maximum number of concurrent polls; default: maximum number of concurrent requests of the
+            session
+        :return: yields each job once it's done
+        :raises ValueError: if the `status()` or `errors()` method of a job API can't be called with the job ID and
+            organization ID of the job
+        """
+        '''async
+    async def watch(
+        self,
+        jobs: Iterable[Union[WatchedJob, tuple[Any, str]]],
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        errors: bool = False,
+        progress: Callable[[WatchedJob], None] = None,
+        on_error: Callable[[WatchedJob, JobErrorItem], None] = None,
+        max_workers: int = None,
+    ) -> AsyncGenerator[WatchedJob, None]:
+        """
+        Wait for many jobs; all jobs are polled by a single loop and each job is yielded once it has stopped running
+
+        Exceptions raised by `status()` or `errors()` are not raised but stored in :attr:`WatchedJob.exception`;
+        jobs which didn't complete in time get a :class:`TimeoutError`.
+
+        :param jobs: jobs to watch: :class:`WatchedJob` instances or (job API, job ID) tuples
+        :param org_id: organization ID for jobs given as tuples
+        :param timeout: maximum time to wait for each job in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if a job doesn't indicate progress
+        :param errors: also read the errors of each job with each poll and collect them in
+            :attr:`WatchedJob.errors`
+        :param progress: called with the :class:`WatchedJob` after each poll
+        :param on_error: called for each new error of a job as soon as it is seen; implies `errors`
+        :param max_workers: maximum number of concurrent polls; default: maximum number of concurrent requests of the
+            session
+        :return: yields each job once it's done
+        :raises ValueError: if the `status()` or `errors()` method of a job API can't be called with the job ID and
+            organization ID of the job
+        """
+        start = time.monotonic()
+        pending = [
+            j
+            if isinstance(j, WatchedJob)
+            else WatchedJob(
+                jobs_api=j[0], job_id=j[1], org_id=org_id, deadline=None if timeout is None else start + timeout
+            )
+            for j in jobs
+        ]
+        while pending:
+            for watched in await self.poll(
+                pending,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                backoff=backoff,
+                errors=errors,
+                progress=progress,
+                on_error=on_error,
+                max_workers=max_workers,
+            ):
+                pending.remove(watched)
+                yield watched
+        '''
+        start = time.monotonic()
+        pending = [
+            j
+            if isinstance(j, WatchedJob)
+            else WatchedJob(
+                jobs_api=j[0], job_id=j[1], org_id=org_id, deadline=None if timeout is None else start + timeout
+            )
+            for j in jobs
+        ]
+        while pending:
+            for watched in self.poll(
+                pending,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                backoff=backoff,
+                errors=errors,
+                progress=progress,
+                on_error=on_error,
+                max_workers=max_workers,
+            ):
+                pending.remove(watched)
+                yield watched
+
+    def errors(
+        self,
+        jobs_api: Any,
+        job_id: str,
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+    ) -> Generator[JobErrorItem, None, None]:
+        """
+        Yield the errors of a job as soon as they are reported; returns when the job has stopped running
+
+        :param jobs_api: job API with `status()` and `errors()` methods
+        :param job_id: job ID
+        :param org_id: organization ID
+        :param timeout: maximum time to wait in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if the job doesn't indicate progress
+        :return: yields each error once
+        :raises TimeoutError: if the job is still running after `timeout` seconds
+        """
+        '''async
+    async def errors(
+        self,
+        jobs_api: Any,
+        job_id: str,
+        *,
+        org_id: str = None,
+        timeout: float = None,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+    ) -> AsyncGenerator[JobErrorItem, None]:
+        """
+        Yield the errors of a job as soon as they are reported; returns when the job has stopped running
+
+        :param jobs_api: job API with `status()` and `errors()` methods
+        :param job_id: job ID
+        :param org_id: organization ID
+        :param timeout: maximum time to wait in seconds; default: wait forever
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by if the job doesn't indicate progress
+        :return: yields each error once
+        :raises TimeoutError: if the job is still running after `timeout` seconds
+        """
+        watched = WatchedJob(
+            jobs_api=jobs_api,
+            job_id=job_id,
+            org_id=org_id,
+            deadline=None if timeout is None else time.monotonic() + timeout,
+        )
+        while True:
+            job = await jobs_api.status(**watched.params('status'))
+            watched.update(job, time.monotonic(), min_interval, max_interval, backoff)
+            for error in watched.add_errors(await jobs_api.errors(**watched.params('errors'))):
+                yield error
+            if watched.done:
+                return
+            if watched.check_deadline(time.monotonic()):
+                raise watched.exception
+            await asyncio.sleep(max(watched.next_poll - time.monotonic(), 0))
+        '''
+        watched = WatchedJob(
+            jobs_api=jobs_api,
+            job_id=job_id,
+            org_id=org_id,
+            deadline=None if timeout is None else time.monotonic() + timeout,
+        )
+        while True:
+            job = jobs_api.status(**watched.params('status'))
+            watched.update(job, time.monotonic(), min_interval, max_interval, backoff)
+            yield from watched.add_errors(jobs_api.errors(**watched.params('errors')))
+            if watched.done:
+                return
+            if watched.check_deadline(time.monotonic()):
+                raise watched.exception  # type: ignore[misc]
+            time.sleep(max(watched.next_poll - time.monotonic(), 0))
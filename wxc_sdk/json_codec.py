@@ -0,0 +1,163 @@
+"""
+JSON codecs used by :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession` to decode response
+bodies, encode request bodies, and to pretty print bodies when dumping requests and responses to the log.
+
+`orjson <https://github.com/ijl/orjson>`_ and `msgspec <https://jcristharif.com/msgspec/>`_ are optional: they are
+only imported when a codec using them is created.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+__all__ = ['JsonCodec', 'StdlibCodec', 'OrjsonCodec', 'MsgspecCodec', 'get_codec']
+
+
+class JsonCodec(ABC):
+    """
+    Base class for JSON codecs
+    """
+
+    #: name of the codec
+    name: str = ''
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode JSON
+
+        :param data: JSON text
+        :return: decoded object
+        :raises ValueError: if data is not valid JSON
+        """
+        ...
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as UTF-8 encoded JSON
+
+        :param obj: object to encode
+        :return: JSON
+        """
+        ...
+
+    @abstractmethod
+    def dumps_pretty(self, obj: Any) -> str:
+        """
+        Encode an object as indented JSON; used for logging
+
+        :param obj: object to encode
+        :return: JSON
+        """
+        ...
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+
+class StdlibCodec(JsonCodec):
+    """
+    JSON codec using the :mod:`json` module of the standard library
+    """
+
+    name = 'stdlib'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def dumps_pretty(self, obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec using orjson
+
+    orjson only supports integers up to 64 bit and only str keys in dicts; objects orjson can't encode are encoded
+    using the standard library.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            return json.dumps(obj).encode('utf-8')
+
+    def dumps_pretty(self, obj: Any) -> str:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            return json.dumps(obj, indent=2)
+
+
+class MsgspecCodec(JsonCodec):
+    """
+    JSON codec using msgspec
+    """
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found,unused-ignore]
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)  # type: ignore[no-any-return,unused-ignore]
+        except (TypeError, OverflowError):
+            return json.dumps(obj).encode('utf-8')
+
+    def dumps_pretty(self, obj: Any) -> str:
+        return self._msgspec.json.format(self.dumps(obj), indent=2).decode('utf-8')  # type: ignore[no-any-return,unused-ignore]
+
+
+_CODECS: dict[str, type[JsonCodec]] = {c.name: c for c in (StdlibCodec, OrjsonCodec, MsgspecCodec)}
+
+
+def get_codec(codec: Union[str, JsonCodec] = 'auto') -> JsonCodec:
+    """
+    Get a JSON codec
+
+    :param codec: codec instance or codec name: 'stdlib', 'orjson', 'msgspec', or 'auto'. 'auto' picks the first
+        installed of orjson and msgspec and falls back to the standard library
+    :return: codec
+    :raises ImportError: if the package for the requested codec is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        for auto_class in (OrjsonCodec, MsgspecCodec):
+            try:
+                return auto_class()
+            except ImportError:
+                continue
+        return StdlibCodec()
+    try:
+        codec_class = _CODECS[codec]
+    except KeyError:
+        raise ValueError(f'Unknown JSON codec: {codec}') from None
+    return codec_class()
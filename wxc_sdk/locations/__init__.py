@@ -165,7 +165,18 @@ class LocationsApi(ApiChild, base='locations'):
         :return: locations
         :rtype: Location
         """
-        return next((location for location in self.list(name=name, org_id=org_id) if location.name == name), None)
+        # use the session's entity directory, if any
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, location = directory.get('locations', 'name', name, org_id=org_id)
+            if found and (location is None or isinstance(location, Location)):
+                return location
+            epoch = directory.epoch
+        location = next((location for location in self.list(name=name, org_id=org_id) if location.name == name), None)
+        if directory is not None:
+            directory.put('locations', 'name', name, location, org_id=org_id, epoch=epoch)
+        return location
 
     def details(self, location_id: str, org_id: str = None) -> Location:
         """
@@ -184,6 +195,8 @@ class LocationsApi(ApiChild, base='locations'):
             * `spark-admin:people_read`
             * `spark-admin:device_read`
 
+        Uses the session's :class:`wxc_sdk.directory.EntityDirectory`, if any
+
         :param location_id: A unique identifier for the location.
         :type location_id: str
         :param org_id: Get location common attributes for this organization.
@@ -192,9 +205,20 @@ class LocationsApi(ApiChild, base='locations'):
         :return: location details
         :rtype: :class:`Location`
         """
+        # use the session's entity directory, if any
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, location = directory.get('locations', 'id', location_id, org_id=org_id)
+            if found and isinstance(location, Location):
+                return location
+            epoch = directory.epoch
         params = org_id and {'orgId': org_id} or None
         ep = self.ep(location_id)
-        return Location.model_validate(self.get(ep, params=params))
+        location = Location.model_validate(self.get(ep, params=params))
+        if directory is not None:
+            directory.put('locations', 'id', location_id, location, org_id=org_id, epoch=epoch)
+        return location
 
     def create(
         self,
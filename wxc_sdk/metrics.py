@@ -0,0 +1,339 @@
+"""
+Request metrics for :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+from typing import Optional
+
+__all__ = ['LATENCY_BUCKETS', 'endpoint_template', 'EndpointMetrics', 'MetricsSnapshot', 'SessionMetrics']
+
+#: upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# path segments that are IDs: UUIDs, Webex IDs, numbers, E.164 numbers, email addresses, ...
+_ID_SEGMENT = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'  # UUID
+    r'|[+%0-9].*'  # numbers, E.164, URL encoded values
+    r'|.*@.*'  # email addresses
+    r'|(?=.*\d)[A-Za-z0-9_=-]{16,}',  # Webex IDs and other long tokens with digits
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1)
+def _api_bases() -> list[str]:
+    """
+    Endpoint prefixes of all :class:`wxc_sdk.api_child.ApiChild` subclasses; longest first
+    """
+    # late import to avoid circular import: api_child -> rest -> metrics
+    from .api_child import ApiChild
+
+    bases = set()
+    classes = [ApiChild]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        base = getattr(cls, 'base', None)
+        if base:
+            bases.add(base.strip('/'))
+    return sorted(bases, key=len, reverse=True)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """
+    Endpoint template for a URL path with IDs collapsed to `{id}`
+
+    The endpoint prefixes of the :class:`wxc_sdk.api_child.ApiChild` subclasses are kept as is; IDs are detected in the
+    remainder of the path. Example: 'telephony/config/locations/Y2lz.../queues/Y2lz...' ->
+    'telephony/config/locations/{id}/queues/{id}'
+
+    :param path: URL path relative to the API base URL
+    :return: template
+    """
+    path = path.strip('/')
+    prefix = next((base for base in _api_bases() if path == base or path.startswith(f'{base}/')), '')
+    remainder = path[len(prefix) :].strip('/')
+    segments = [prefix] if prefix else []
+    segments.extend(
+        '{id}' if _ID_SEGMENT.fullmatch(segment) else segment for segment in remainder.split('/') if segment
+    )
+    return '/'.join(segments)
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Metrics for one endpoint template and HTTP method
+    """
+
+    method: str
+    #: endpoint template; IDs collapsed to `{id}`
+    template: str
+    #: number of responses
+    count: int = 0
+    #: sum of latencies in seconds
+    seconds: float = 0.0
+    #: maximum latency in seconds
+    max_seconds: float = 0.0
+    #: number of responses per latency bucket; the last bucket counts all responses above the largest bound in
+    #: :data:`LATENCY_BUCKETS`. Not cumulative.
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    #: number of responses per HTTP status code
+    status: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    #: response body bytes
+    bytes_in: int = 0
+    #: request body bytes
+    bytes_out: int = 0
+
+    @property
+    def throttled(self) -> int:
+        """
+        number of 429 responses
+        """
+        return self.status.get(429, 0)
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.count and self.seconds / self.count or 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile from the histogram: upper bound of the bucket containing the quantile
+
+        :param q: quantile; 0 < q <= 1
+        :return: latency in seconds
+        """
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets, strict=False):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max_seconds
+
+    def copy(self) -> 'EndpointMetrics':
+        return EndpointMetrics(
+            method=self.method,
+            template=self.template,
+            count=self.count,
+            seconds=self.seconds,
+            max_seconds=self.max_seconds,
+            buckets=list(self.buckets),
+            status=dict(self.status),
+            bytes_in=self.bytes_in,
+            bytes_out=self.bytes_out,
+        )
+
+
+@dataclass
+class MetricsSnapshot:
+    """
+    Point in time copy of the metrics of a session
+    """
+
+    #: metrics per HTTP method and endpoint template
+    endpoints: list[EndpointMetrics]
+    #: total time (in seconds) requests waited for the backoff gate after 429 responses
+    throttled_seconds: float
+    #: total time (in seconds) requests waited for a slot of the session's concurrency limit
+    semaphore_wait_seconds: float
+
+    @property
+    def requests(self) -> int:
+        return sum(e.count for e in self.endpoints)
+
+    @property
+    def throttled(self) -> int:
+        """
+        number of 429 responses
+        """
+        return sum(e.throttled for e in self.endpoints)
+
+    @property
+    def bytes_in(self) -> int:
+        return sum(e.bytes_in for e in self.endpoints)
+
+    @property
+    def bytes_out(self) -> int:
+        return sum(e.bytes_out for e in self.endpoints)
+
+    def slowest(self, n: int = 10) -> list[EndpointMetrics]:
+        """
+        Endpoints with the highest total latency
+
+        :param n: number of endpoints to return
+        """
+        return sorted(self.endpoints, key=lambda e: e.seconds, reverse=True)[:n]
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+class SessionMetrics:
+    """
+    Request metrics of a REST session: latency histograms, status codes, and bytes in/out per endpoint template, time
+    requests spent waiting for the backoff gate and for a slot of the concurrency limit.
+
+    Example:
+
+    .. code-block:: python
+
+        with WebexSimpleApi(metrics=True) as api:
+            ...
+            snapshot = api.session.metrics.snapshot()
+            for endpoint in snapshot.slowest(5):
+                print(f'{endpoint.method} {endpoint.template}: {endpoint.count} requests, '
+                      f'{endpoint.mean_seconds * 1000:.0f} ms on average')
+            print(api.session.metrics.prometheus())
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._throttled_seconds = 0.0
+        self._semaphore_wait_seconds = 0.0
+
+    def __repr__(self) -> str:
+        snapshot = self.snapshot()
+        return (
+            f'{self.__class__.__name__}(requests={snapshot.requests}, throttled={snapshot.throttled}, '
+            f'endpoints={len(snapshot.endpoints)})'
+        )
+
+    def record_response(
+        self, method: str, path: str, status: int, seconds: float, bytes_in: int, bytes_out: int
+    ) -> None:
+        """
+        Record a response
+
+        :param method: HTTP method
+        :param path: URL path relative to the API base URL
+        :param status: HTTP status code
+        :param seconds: latency in seconds
+        :param bytes_in: size of the response body
+        :param bytes_out: size of the request body
+        """
+        template = endpoint_template(path)
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            metrics = self._endpoints.get((method, template))
+            if metrics is None:
+                metrics = EndpointMetrics(method=method, template=template)
+                self._endpoints[(method, template)] = metrics
+            metrics.count += 1
+            metrics.seconds += seconds
+            metrics.max_seconds = max(metrics.max_seconds, seconds)
+            metrics.buckets[bucket] += 1
+            metrics.status[status] += 1
+            metrics.bytes_in += bytes_in
+            metrics.bytes_out += bytes_out
+
+    def record_throttled_wait(self, seconds: float) -> None:
+        """
+        Record time a request waited for the backoff gate
+
+        :param seconds: wait time in seconds
+        """
+        if seconds:
+            with self._lock:
+                self._throttled_seconds += seconds
+
+    def record_semaphore_wait(self, seconds: float) -> None:
+        """
+        Record time a request waited for a slot of the concurrency limit
+
+        :param seconds: wait time in seconds
+        """
+        with self._lock:
+            self._semaphore_wait_seconds += seconds
+
+    def reset(self) -> None:
+        """
+        Reset all metrics
+        """
+        with self._lock:
+            self._endpoints.clear()
+            self._throttled_seconds = 0.0
+            self._semaphore_wait_seconds = 0.0
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Get a copy of the current metrics
+
+        :return: snapshot
+        """
+        with self._lock:
+            return MetricsSnapshot(
+                endpoints=[metrics.copy() for metrics in self._endpoints.values()],
+                throttled_seconds=self._throttled_seconds,
+                semaphore_wait_seconds=self._semaphore_wait_seconds,
+            )
+
+    def prometheus(self, prefix: str = 'wxc_sdk', labels: Optional[dict[str, str]] = None) -> str:
+        """
+        Metrics in the Prometheus text exposition format
+
+        :param prefix: prefix for all metric names
+        :param labels: additional labels for all metrics; for example: {'job': 'provisioning'}
+        :return: metrics as text
+        """
+        snapshot = self.snapshot()
+        extra = ''.join(f',{k}="{_label(v)}"' for k, v in (labels or {}).items())
+        common = extra.lstrip(',')
+        lines = [
+            f'# HELP {prefix}_request_duration_seconds Latency of Webex API requests',
+            f'# TYPE {prefix}_request_duration_seconds histogram',
+        ]
+        endpoints = sorted(snapshot.endpoints, key=lambda e: (e.template, e.method))
+        for e in endpoints:
+            ep_labels = f'method="{e.method}",endpoint="{_label(e.template)}"{extra}'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, e.buckets, strict=False):
+                cumulative += count
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{ep_labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_request_duration_seconds_bucket{{{ep_labels},le="+Inf"}} {e.count}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{{ep_labels}}} {e.seconds}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{{ep_labels}}} {e.count}')
+        lines.extend(
+            (
+                f'# HELP {prefix}_responses_total Webex API responses by status code',
+                f'# TYPE {prefix}_responses_total counter',
+            )
+        )
+        for e in endpoints:
+            for status, count in sorted(e.status.items()):
+                lines.append(
+                    f'{prefix}_responses_total{{method="{e.method}",endpoint="{_label(e.template)}",'
+                    f'status="{status}"{extra}}} {count}'
+                )
+        for name, help_text, attr in (
+            ('response_bytes_total', 'Size of Webex API response bodies', 'bytes_in'),
+            ('request_bytes_total', 'Size of Webex API request bodies', 'bytes_out'),
+        ):
+            lines.extend((f'# HELP {prefix}_{name} {help_text}', f'# TYPE {prefix}_{name} counter'))
+            for e in endpoints:
+                lines.append(
+                    f'{prefix}_{name}{{method="{e.method}",endpoint="{_label(e.template)}"{extra}}} {getattr(e, attr)}'
+                )
+        for name, help_text, value in (
+            (
+                'throttled_wait_seconds_total',
+                'Time requests waited for the backoff gate after 429 responses',
+                snapshot.throttled_seconds,
+            ),
+            (
+                'semaphore_wait_seconds_total',
+                'Time requests waited for a slot of the concurrency limit',
+                snapshot.semaphore_wait_seconds,
+            ),
+        ):
+            lines.extend((f'# HELP {prefix}_{name} {help_text}', f'# TYPE {prefix}_{name} counter'))
+            lines.append(f'{prefix}_{name}{{{common}}} {value}' if common else f'{prefix}_{name} {value}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,255 @@
+"""
+In-memory index of the phone numbers and extensions of an organization
+
+The index is built from the number lists of all locations, read concurrently, and then maps numbers to their owners
+without API calls: by normalized E.164 number, by location and extension, and by ESN (routing prefix + extension).
+
+Example: resolve the owners of the numbers in a list of CDRs
+
+.. code-block:: python
+
+    index = NumberIndex(api=api)
+    index.refresh()
+    index.save('numbers.json')
+    owners = [number and number.owner for number in index.resolve(cdr.called_number for cdr in cdrs)]
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .base import e164
+from .common import NumberOwner
+from .json_codec import JsonCodec, get_codec
+from .telephony import NumberListPhoneNumber
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['NumberIndex']
+
+log = logging.getLogger(__name__)
+
+
+class NumberIndex:
+    """
+    Index of phone numbers and extensions
+
+    Phone numbers are normalized to +E.164 (see :func:`wxc_sdk.base.e164`) when they are added to the index. Lookups
+    with numbers which are already normalized are plain dictionary lookups; other numbers are normalized before the
+    lookup.
+    """
+
+    #: API used to read the numbers; can be None for an index loaded from disk
+    api: Optional['WebexSimpleApi']
+    #: time of the last refresh (seconds since the epoch)
+    refreshed: Optional[float]
+
+    def __init__(self, *, api: 'WebexSimpleApi' = None):
+        """
+        :param api: API used to read the numbers
+        """
+        self.api = api
+        self.refreshed = None
+        self._by_location: dict[str, list[NumberListPhoneNumber]] = {}
+        self._by_e164: dict[str, NumberListPhoneNumber] = {}
+        self._by_extension: dict[tuple[str, str], NumberListPhoneNumber] = {}
+        self._by_esn: dict[str, NumberListPhoneNumber] = {}
+
+    def __len__(self) -> int:
+        return sum(len(numbers) for numbers in self._by_location.values())
+
+    def __contains__(self, number: str) -> bool:
+        return self.get(number) is not None
+
+    @property
+    def location_ids(self) -> list[str]:
+        """
+        IDs of the locations in the index
+        """
+        return list(self._by_location)
+
+    def numbers(self, location_id: str = None) -> list[NumberListPhoneNumber]:
+        """
+        Numbers in the index
+
+        :param location_id: only numbers of this location
+        :return: list of numbers
+        """
+        if location_id is not None:
+            return list(self._by_location.get(location_id, []))
+        return [number for numbers in self._by_location.values() for number in numbers]
+
+    def _add(self, location_id: str, numbers: list[NumberListPhoneNumber]) -> None:
+        """
+        Replace the numbers of a location
+
+        :meta private:
+        """
+        self.remove_location(location_id)
+        self._by_location[location_id] = numbers
+        for number in numbers:
+            if number.phone_number:
+                self._by_e164[e164(number.phone_number)] = number
+            if number.extension:
+                self._by_extension[(location_id, number.extension)] = number
+            if number.esn:
+                self._by_esn[number.esn] = number
+
+    def remove_location(self, location_id: str) -> None:
+        """
+        Remove all numbers of a location from the index
+
+        :param location_id: location ID
+        """
+        for number in self._by_location.pop(location_id, []):
+            # only remove entries which still point to a number of this location
+            if number.phone_number and self._by_e164.get(key := e164(number.phone_number)) is number:
+                del self._by_e164[key]
+            if number.extension and self._by_extension.get((location_id, number.extension)) is number:
+                del self._by_extension[(location_id, number.extension)]
+            if number.esn and self._by_esn.get(number.esn) is number:
+                del self._by_esn[number.esn]
+
+    def refresh(self, location_ids: Iterable[str] = None, org_id: str = None, max_workers: int = None) -> None:
+        """
+        Read numbers from the API
+
+        The numbers of each location are read concurrently with :attr:`api.bulk <wxc_sdk.WebexSimpleApi.bulk>`.
+        Locations for which reading the numbers failed keep their numbers in the index; the first exception is raised
+        after all other locations have been updated.
+
+        :param location_ids: only update the numbers of these locations; default: all Webex Calling locations.
+            Locations which don't exist anymore are removed from the index
+        :param org_id: organization
+        :param max_workers: number of concurrent requests; default: maximum number of concurrent requests of the session
+        """
+        if self.api is None:
+            raise ValueError('an API is required to refresh the index')
+        api = self.api
+        full = location_ids is None
+        if location_ids is None:
+            location_ids = [
+                location.location_id
+                for location in api.telephony.location.list(org_id=org_id)
+                if location.location_id is not None
+            ]
+        location_ids = list(dict.fromkeys(location_ids))
+        error: Optional[Exception] = None
+        for result in api.bulk.map(
+            lambda location_id: list(api.telephony.phone_numbers(location_id=location_id, org_id=org_id)),
+            location_ids,
+            ordered=False,
+            max_workers=max_workers,
+        ):
+            if not result.ok:
+                log.error(f'refresh: failed to read numbers of location {result.item}: {result.exception}')
+                error = error or result.exception
+                continue
+            self._add(result.item, result.result or [])
+        if full:
+            for location_id in set(self._by_location) - set(location_ids):
+                self.remove_location(location_id)
+        self.refreshed = time.time()
+        if error is not None:
+            raise error
+
+    def get(self, number: str) -> Optional[NumberListPhoneNumber]:
+        """
+        Number by phone number
+
+        :param number: phone number; normalized to +E.164 if needed
+        :return: number or None if the number is not in the index
+        """
+        found = self._by_e164.get(number)
+        if found is None and number:
+            found = self._by_e164.get(e164(number))
+        return found
+
+    def extension(self, location_id: str, extension: str) -> Optional[NumberListPhoneNumber]:
+        """
+        Number by location and extension
+
+        :param location_id: location ID
+        :param extension: extension
+        :return: number or None if the extension is not in the index
+        """
+        return self._by_extension.get((location_id, extension))
+
+    def esn(self, esn: str) -> Optional[NumberListPhoneNumber]:
+        """
+        Number by ESN (routing prefix + extension)
+
+        :param esn: ESN
+        :return: number or None if the ESN is not in the index
+        """
+        return self._by_esn.get(esn)
+
+    def owner(self, number: str) -> Optional[NumberOwner]:
+        """
+        Owner of a phone number
+
+        :param number: phone number; normalized to +E.164 if needed
+        :return: owner or None if the number is not in the index or not assigned
+        """
+        found = self.get(number)
+        return found.owner if found is not None else None
+
+    def resolve(self, numbers: Iterable[str], location_id: str = None) -> list[Optional[NumberListPhoneNumber]]:
+        """
+        Resolve many numbers
+
+        Each value is looked up as phone number, then as ESN, and then as extension in the given location.
+
+        :param numbers: phone numbers, ESNs, or extensions
+        :param location_id: location for extension lookups
+        :return: numbers in the order of the values; None for values which are not in the index
+        """
+        by_e164 = self._by_e164
+        by_esn = self._by_esn
+        by_extension = self._by_extension
+        result: list[Optional[NumberListPhoneNumber]] = []
+        for value in numbers:
+            found = by_e164.get(value) or by_esn.get(value)
+            if found is None and value:
+                found = by_e164.get(e164(value))
+                if found is None and location_id is not None:
+                    found = by_extension.get((location_id, value))
+            result.append(found)
+        return result
+
+    def save(self, path: str, codec: Union[JsonCodec, str] = 'auto') -> None:
+        """
+        Write the index to a JSON file
+
+        :param path: path of the file
+        :param codec: JSON codec; see :func:`wxc_sdk.json_codec.get_codec`
+        """
+        data: dict[str, Any] = {
+            'refreshed': self.refreshed,
+            'locations': {
+                location_id: [number.model_dump(mode='json', by_alias=True, exclude_none=True) for number in numbers]
+                for location_id, numbers in self._by_location.items()
+            },
+        }
+        with open(path, 'wb') as f:
+            f.write(get_codec(codec).dumps(data))
+
+    @classmethod
+    def load(cls, path: str, api: 'WebexSimpleApi' = None, codec: Union[JsonCodec, str] = 'auto') -> 'NumberIndex':
+        """
+        Read an index from a JSON file written by :meth:`save`
+
+        :param path: path of the file
+        :param api: API used for later refreshes
+        :param codec: JSON codec; see :func:`wxc_sdk.json_codec.get_codec`
+        :return: index
+        """
+        with open(path, 'rb') as f:
+            data = get_codec(codec).loads(f.read())
+        index = cls(api=api)
+        index.refreshed = data.get('refreshed')
+        for location_id, numbers in data['locations'].items():
+            index._add(location_id, [NumberListPhoneNumber.model_validate(number) for number in numbers])
+        return index
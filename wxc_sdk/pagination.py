@@ -0,0 +1,356 @@
+"""
+Helpers for paginated list requests used by :meth:`wxc_sdk.rest.RestSession.follow_pagination` and
+:meth:`wxc_sdk.as_rest.AsRestSession.follow_pagination`
+"""
+
+import asyncio
+import logging
+import queue
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from threading import Event, Thread
+from typing import Any, Generic, Optional, TypeVar, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from pydantic import BaseModel
+
+from .base import ApiModel
+
+__all__ = [
+    'ItemMode',
+    'LazyModel',
+    'item_mode',
+    'current_item_mode',
+    'item_converter',
+    'iter_items',
+    'as_iter_items',
+    'prefetch',
+    'as_prefetch',
+    'page_items',
+    'offset_paging',
+    'offset_url',
+    'TOTAL_KEYS',
+]
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+M = TypeVar('M', bound=BaseModel)
+
+
+class ItemMode(StrEnum):
+    """
+    How list requests turn the items of the responses into objects
+    """
+
+    #: validate each item using :meth:`model_validate`; default
+    validate = 'validate'
+    #: no conversion; items are returned as plain dicts
+    raw = 'raw'
+    #: create objects using :meth:`model_construct`; no validation and no conversion of nested objects
+    construct = 'construct'
+    #: :class:`LazyModel` proxies; items are only validated on first attribute access
+    lazy = 'lazy'
+
+
+_item_mode: ContextVar[Optional[ItemMode]] = ContextVar('item_mode', default=None)
+
+
+@contextmanager
+def item_mode(mode: Union[ItemMode, str]) -> Generator[None, None, None]:
+    """
+    Context manager to set the item mode for all list requests started in the current context (thread or task).
+
+    The mode is determined when the list method is called, so generators obtained within the context keep the mode
+    even if they are consumed outside of the context.
+
+    .. code-block:: Python
+
+        with item_mode(ItemMode.raw):
+            emails = [user['emails'][0] for user in api.people.list()]
+
+    :param mode: item mode to use
+    """
+    token = _item_mode.set(ItemMode(mode))
+    try:
+        yield
+    finally:
+        _item_mode.reset(token)
+
+
+def current_item_mode() -> ItemMode:
+    """
+    Item mode in the current context
+
+    :return: item mode set by :func:`item_mode`; :attr:`ItemMode.validate` if not set
+    """
+    return _item_mode.get() or ItemMode.validate
+
+
+class LazyModel(Generic[M]):
+    """
+    Proxy for an item of a list response. The item is validated on the first access to any attribute of the model.
+
+    The proxy is not an instance of the model class; use :attr:`lazy_object` to get the validated model instance.
+    """
+
+    __slots__ = ('_lazy_model', '_lazy_data', '_lazy_object')
+
+    def __init__(self, model: type[M], data: dict[str, Any]):
+        object.__setattr__(self, '_lazy_model', model)
+        object.__setattr__(self, '_lazy_data', data)
+        object.__setattr__(self, '_lazy_object', None)
+
+    @property
+    def lazy_data(self) -> dict[str, Any]:
+        """
+        Item data as received from the API; accessing the data doesn't trigger validation
+        """
+        return self._lazy_data  # type: ignore[no-any-return]
+
+    @property
+    def lazy_object(self) -> M:
+        """
+        Validated model instance; validation happens on first access
+        """
+        if self._lazy_object is None:
+            object.__setattr__(self, '_lazy_object', self._lazy_model.model_validate(self._lazy_data))
+        return self._lazy_object  # type: ignore[no-any-return]
+
+    def __getattr__(self, item: str) -> Any:
+        if item.startswith('_lazy_'):
+            # slots not initialized yet, for example while copying
+            raise AttributeError(item)
+        return getattr(self.lazy_object, item)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        setattr(self.lazy_object, key, value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyModel):
+            other = other.lazy_object
+        return self.lazy_object == other
+
+    def __dir__(self) -> list[str]:
+        return dir(self.lazy_object)
+
+    def __repr__(self) -> str:
+        if self._lazy_object is None:
+            return f'{self.__class__.__name__}({self._lazy_model.__name__}, not validated)'
+        return repr(self._lazy_object)
+
+
+def item_converter(model: Optional[type[Any]], mode: Optional[Union[ItemMode, str]] = None) -> Callable[[Any], Any]:
+    """
+    Get the callable to convert the items of list responses
+
+    :param model: model class of the items. If not an :class:`wxc_sdk.base.ApiModel`, then items are returned
+        unchanged
+    :param mode: item mode; default: mode from :func:`current_item_mode`
+    :return: callable converting a dict to the target type
+    """
+    mode = current_item_mode() if mode is None else ItemMode(mode)
+    if model is None or not issubclass(model, ApiModel) or mode == ItemMode.raw:
+        return lambda item: item
+    if mode == ItemMode.construct:
+        return lambda item: model.model_construct(**item)
+    if mode == ItemMode.lazy:
+        return lambda item: LazyModel(model, item)
+    return model.model_validate
+
+
+def iter_items(pages: Generator[list[Any], None, None], converter: Callable[[Any], Any]) -> Generator[Any, None, None]:
+    """
+    Yield the converted items of all pages
+
+    :param pages: generator of lists of items; closed when the caller stops early
+    :param converter: callable to convert each item
+    :return: yields converted items
+    """
+    try:
+        for items in pages:
+            for item in items:
+                yield converter(item)
+    finally:
+        # make sure to stop reading ahead if the caller stops early
+        pages.close()
+
+
+async def as_iter_items(
+    pages: AsyncGenerator[list[Any], None], converter: Callable[[Any], Any]
+) -> AsyncGenerator[Any, None]:
+    """
+    Yield the converted items of all pages
+
+    :param pages: async generator of lists of items; closed when the caller stops early
+    :param converter: callable to convert each item
+    :return: yields converted items
+    """
+    try:
+        async for items in pages:
+            for item in items:
+                yield converter(item)
+    finally:
+        # make sure to stop reading ahead if the caller stops early
+        await pages.aclose()
+
+
+class _Done:
+    """
+    Marker put into the queue by the producer once the source is exhausted
+    """
+
+
+class _Failed:
+    """
+    Wrapper for an exception raised by the source; re-raised in the consumer
+    """
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def prefetch(source: Iterator[T], depth: int) -> Generator[T, None, None]:
+    """
+    Read ahead from an iterator in a background thread.
+
+    Used to fetch pages of a paginated list request while the caller is still processing the items of the previous
+    page(s). At most `depth` items (pages) are buffered. If the consumer stops early (closes the generator) then the
+    background thread stops after the request in progress.
+
+    :param source: iterator to read from; the iterator is consumed in a background thread
+    :param depth: maximum number of items read ahead
+    :return: yields the items from the source in the same order
+    """
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=depth)
+    stop = Event()
+
+    def put(entry: Any) -> bool:
+        # put entry into the buffer; check regularly whether the consumer is gone
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        try:
+            for entry in source:
+                if not put(entry):
+                    return
+        except BaseException as e:
+            put(_Failed(e))
+        else:
+            put(_Done())
+
+    producer = Thread(target=produce, name='prefetch', daemon=True)
+    producer.start()
+    try:
+        while True:
+            entry = buffer.get()
+            if isinstance(entry, _Done):
+                break
+            if isinstance(entry, _Failed):
+                raise entry.exception
+            yield entry
+    finally:
+        stop.set()
+
+
+async def as_prefetch(source: AsyncIterator[T], depth: int) -> AsyncGenerator[T, None]:
+    """
+    Read ahead from an async iterator in a background task.
+
+    Used to fetch pages of a paginated list request while the caller is still processing the items of the previous
+    page(s). At most `depth` items (pages) are buffered. If the consumer stops early (closes the generator) then the
+    background task is cancelled.
+
+    :param source: async iterator to read from; the iterator is consumed in a background task
+    :param depth: maximum number of items read ahead
+    :return: yields the items from the source in the same order
+    """
+    buffer: asyncio.Queue[Any] = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for entry in source:
+                await buffer.put(entry)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await buffer.put(_Failed(e))
+        else:
+            await buffer.put(_Done())
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            entry = await buffer.get()
+            if isinstance(entry, _Done):
+                break
+            if isinstance(entry, _Failed):
+                raise entry.exception
+            yield entry
+    finally:
+        producer.cancel()
+
+
+#: keys of list responses that can hold the total number of items
+TOTAL_KEYS = ('totalCount', 'total')
+
+
+def page_items(data: dict[str, Any], item_key: Optional[str]) -> tuple[str, list[Any]]:
+    """
+    Get the list of items from the body of a list response
+
+    :param data: parsed body of the response
+    :param item_key: key to list of items; if not set, then 'items' or the first key with a list value is used
+    :return: tuple of item key and list of items
+    """
+    if item_key is None:
+        if 'items' in data:
+            item_key = 'items'
+        else:
+            # we go w/ the first return value that is a list
+            item_key = next((k for k, v in data.items() if isinstance(v, list)))
+    return item_key, data.get(item_key, [])
+
+
+def offset_paging(next_url: str, data: dict[str, Any], items: list[Any]) -> Optional[tuple[int, int, Optional[int]]]:
+    """
+    Check whether a list response uses offset based pagination: the 'next' URL has `start` and `max` parameters, and the
+    page is full
+
+    :param next_url: URL of the next page from the `Link` header
+    :param data: parsed body of the response
+    :param items: list of items in the response
+    :return: tuple of start of the next page, page size, and total number of items (if present in the response);
+        None if pages can't be computed from the offset
+    """
+    query = dict(parse_qsl(urlsplit(next_url).query))
+    try:
+        start, page_size = int(query['start']), int(query['max'])
+    except (KeyError, ValueError):
+        return None
+    if page_size <= 0 or len(items) != page_size:
+        # we can only safely compute the next pages if the page size is what the next URL claims
+        return None
+    total = next((data[key] for key in TOTAL_KEYS if isinstance(data.get(key), int)), None)
+    return start, page_size, total
+
+
+def offset_url(url: str, start: int) -> str:
+    """
+    Set the `start` parameter of a URL
+
+    :param url: URL with `start` parameter
+    :param start: new value for the `start` parameter
+    :return: URL with updated `start` parameter
+    """
+    parts = urlsplit(url)
+    query = [(k, str(start) if k == 'start' else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
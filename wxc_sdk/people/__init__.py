@@ -434,6 +434,39 @@ class PeopleApi(ApiChild, base='people'):
         data = settings.create_update()
         return Person.model_validate(self.post(url, json=data, params=params))
 
+    def by_email(self, email: str, org_id: str = None) -> Optional[Person]:
+        """
+        Get a person by email address
+
+        Uses the session's :class:`wxc_sdk.directory.EntityDirectory`, if any
+
+        :param email: email address of the person; case-insensitive
+        :type email: str
+        :param org_id: search in this organization
+        :type org_id: str
+        :return: person or None if no person with this email address exists
+        :rtype: Person
+        """
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, person = directory.get('people', 'email', email, org_id=org_id)
+            if found and (person is None or isinstance(person, Person)):
+                return person
+            epoch = directory.epoch
+        lower = email.lower()
+        person = next(
+            (
+                person
+                for person in self.list(email=email, org_id=org_id)
+                if any(lower == e.lower() for e in person.emails or [])
+            ),
+            None,
+        )
+        if directory is not None:
+            directory.put('people', 'email', email, person, org_id=org_id, epoch=epoch)
+        return person
+
     def details(self, person_id: str, calling_data: bool = False) -> Person:
         """
         Get Person Details
@@ -448,6 +481,8 @@ class PeopleApi(ApiChild, base='people'):
         Admin users can include `Webex Calling` (BroadCloud) user details in the response by specifying `callingData`
         parameter as `true`.
 
+        Without `calling_data` the session's :class:`wxc_sdk.directory.EntityDirectory`, if any, is used
+
         :param person_id: A unique identifier for the person.
         :type person_id: str
         :param calling_data: Include Webex Calling user details in the response. Default: false
@@ -455,9 +490,20 @@ class PeopleApi(ApiChild, base='people'):
         :return: person details
         :rtype: Person
         """
+        # entities in the directory don't have calling data
+        directory = None if calling_data else self.session.directory
+        epoch = None
+        if directory is not None:
+            found, person = directory.get('people', 'id', person_id)
+            if found and isinstance(person, Person):
+                return person
+            epoch = directory.epoch
         ep = self.ep(path=person_id)
         params = calling_data and {'callingData': 'true'} or None
-        return Person.model_validate(self.get(ep, params=params))
+        person = Person.model_validate(self.get(ep, params=params))
+        if directory is not None:
+            directory.put('people', 'id', person_id, person, epoch=epoch)
+        return person
 
     def delete_person(self, person_id: str):
         """
@@ -0,0 +1,298 @@
+"""
+Pipeline to get data out of reports: create reports, wait for them to be ready, download them, and parse the rows
+
+Reports for all requests are created concurrently. Report status is polled with an interval that grows while reports
+are in progress; status polls which are due at the same time are sent concurrently. Each report is downloaded as soon
+as it is ready and its rows are yielded, then the report is deleted.
+
+Example: Calling Detailed Call History for the last three days, one report per day
+
+.. code-block:: python
+
+    template = next(t for t in api.reports.list_templates() if t.title == 'Calling Detailed Call History')
+    today = date.today()
+    requests = ReportRequest.for_templates(
+        [template.id], [(today - timedelta(days=i), today - timedelta(days=i)) for i in range(1, 4)],
+        parser=CallingCDR.parse_records,
+    )
+    pipeline = ReportPipeline(api=api, requests=requests)
+    for task, cdr in pipeline.run(timeout=3600):
+        print(task.request.start_date, cdr.start_time, cdr.duration)
+"""
+
+import logging
+import time
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
+
+from .bulk import BulkExecutor
+from .reports import Report
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['ReportRequest', 'ReportTask', 'ReportPipeline']
+
+log = logging.getLogger(__name__)
+
+#: parser for the rows of a report: called with an iterable of the rows as dicts, yields parsed rows
+RowParser = Callable[[Iterable[dict[str, Any]]], Iterable[Any]]
+
+
+@dataclass
+class ReportRequest:
+    """
+    Report to create; see :meth:`wxc_sdk.reports.ReportsApi.create`
+    """
+
+    #: report template ID
+    template_id: int
+    #: data in the report will be from this date onwards
+    start_date: Optional[date] = None
+    #: data in the report will be until this date
+    end_date: Optional[date] = None
+    #: sites for site-based templates
+    site_list: Optional[str] = None
+    #: parser for the rows of the report, for example :meth:`CallingCDR.parse_records
+    #: <wxc_sdk.cdr.CDR.parse_records>`. If not set, then rows are yielded as dicts
+    parser: Optional[RowParser] = None
+
+    @classmethod
+    def for_templates(
+        cls,
+        template_ids: Iterable[int],
+        date_ranges: Iterable[tuple[Optional[date], Optional[date]]],
+        site_list: str = None,
+        parser: RowParser = None,
+    ) -> list['ReportRequest']:
+        """
+        Requests for all combinations of templates and date ranges
+
+        :param template_ids: report template IDs
+        :param date_ranges: (start date, end date) tuples
+        :param site_list: sites for site-based templates
+        :param parser: parser for the rows of the reports
+        :return: one request per template and date range
+        """
+        date_ranges = list(date_ranges)
+        return [
+            cls(template_id=template_id, start_date=start, end_date=end, site_list=site_list, parser=parser)
+            for template_id in template_ids
+            for start, end in date_ranges
+        ]
+
+
+@dataclass
+class ReportTask:
+    """
+    State of one report in a :class:`ReportPipeline`
+    """
+
+    #: report status which indicates that a report is ready for download
+    DONE_STATUS: ClassVar[str] = 'done'
+    #: report status values (lower case) which indicate that a report failed
+    FAILED_STATUSES: ClassVar[frozenset[str]] = frozenset({'failed', 'error', 'cancelled'})
+
+    #: the request
+    request: ReportRequest
+    #: 'pending', 'running', 'ready', 'downloading', 'completed', or 'failed'
+    state: str = 'pending'
+    #: ID of the created report
+    report_id: Optional[str] = None
+    #: report details of the last status poll
+    report: Optional[Report] = None
+    #: reason why the task failed
+    error: Optional[str] = None
+    #: exception which caused the task to fail, if any
+    exception: Optional[Exception] = None
+    #: number of status polls
+    polls: int = 0
+    #: number of rows yielded
+    rows: int = 0
+    #: True if the report has been deleted
+    deleted: bool = False
+    #: current polling interval in seconds
+    interval: float = 0.0
+    #: time of the next status poll (time.monotonic())
+    next_poll: float = field(default=0.0, repr=False)
+
+    @property
+    def status(self) -> Optional[str]:
+        """
+        Report status of the last poll
+        """
+        return self.report.status if self.report else None
+
+    def fail(self, error: str, exception: Exception = None) -> None:
+        """
+        Mark the task as failed
+
+        :param error: reason
+        :param exception: exception which caused the failure
+        """
+        self.state = 'failed'
+        self.error = error
+        self.exception = exception
+        log.warning(f'report {self.report_id}, template {self.request.template_id}: {error}')
+
+    def update(self, report: Report, now: float, min_interval: float, max_interval: float, backoff: float) -> None:
+        """
+        Update the task with the report details of a status poll and schedule the next poll
+
+        :param report: report details
+        :param now: time of the poll (time.monotonic())
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by with each poll
+        """
+        self.report = report
+        self.polls += 1
+        status = (report.status or '').lower()
+        if status == self.DONE_STATUS:
+            self.state = 'ready'
+        elif status in self.FAILED_STATUSES:
+            self.fail(f'report status: {report.status}')
+        else:
+            self.interval = min_interval if not self.interval else min(max_interval, self.interval * backoff)
+            self.next_poll = now + self.interval
+
+
+class ReportPipeline:
+    """
+    Create reports, wait for them to be ready, download them, and yield the parsed rows
+
+    Status polls are suspended while the consumer iterates over the rows of a report; reports continue to be
+    generated in the meantime.
+    """
+
+    def __init__(
+        self,
+        api: 'WebexSimpleApi',
+        requests: Iterable[ReportRequest],
+        *,
+        delete: bool = True,
+        max_workers: int = None,
+    ):
+        """
+        :param api: API used to create, poll, download, and delete reports
+        :param requests: reports to create
+        :param delete: delete the reports once they have been downloaded. If the run is aborted (the consumer stops
+            iterating, an exception, or a timeout), then all reports created by the pipeline are deleted
+        :param max_workers: maximum number of concurrent requests; default: concurrency limit of the session
+        """
+        self.api = api
+        #: one task per request
+        self.tasks = [ReportTask(request=request) for request in requests]
+        self.delete = delete
+        self.max_workers = max_workers
+
+    def _create(self, task: ReportTask) -> None:
+        request = task.request
+        task.report_id = self.api.reports.create(
+            template_id=request.template_id,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            site_list=request.site_list,
+        )
+        task.state = 'running'
+
+    def _poll(self, task: ReportTask) -> Report:
+        return self.api.reports.details(report_id=str(task.report_id))
+
+    def _download(self, task: ReportTask) -> Generator[tuple[ReportTask, Any], None, None]:
+        """
+        Download a ready report and yield the rows
+
+        :meta private:
+        """
+        task.state = 'downloading'
+        try:
+            if task.report is None or not task.report.download_url:
+                raise ValueError('no download URL')
+            rows: Iterable[Any] = self.api.reports.download(task.report.download_url)
+            if task.request.parser is not None:
+                rows = task.request.parser(rows)
+            for row in rows:
+                task.rows += 1
+                yield task, row
+        except Exception as e:
+            task.fail(f'download failed: {e}', e)
+        else:
+            task.state = 'completed'
+        if self.delete:
+            self._delete(task)
+
+    def _delete(self, task: ReportTask) -> None:
+        try:
+            self.api.reports.delete(report_id=str(task.report_id))
+        except Exception as e:
+            log.warning(f'failed to delete report {task.report_id}: {e}')
+        else:
+            task.deleted = True
+
+    def run(
+        self,
+        *,
+        timeout: float = None,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        backoff: float = 1.5,
+        progress: Callable[[list[ReportTask]], None] = None,
+    ) -> Generator[tuple[ReportTask, Any], None, None]:
+        """
+        Create all reports, wait for them, and yield the rows of each report as soon as it is ready
+
+        Tasks which fail (creating the report, polling, report status, download) are marked as failed in
+        :attr:`tasks` and don't abort the run.
+
+        :param timeout: maximum time in seconds to wait for reports; reports which are not ready in time are marked as
+            failed
+        :param min_interval: first polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param backoff: factor the polling interval grows by with each poll
+        :param progress: called with :attr:`tasks` after each round of status polls
+        :return: yields (task, row) tuples; rows are dicts or the output of the parser of the request
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        bulk = BulkExecutor(session=self.api.session)
+        try:
+            # create all reports concurrently
+            for created in bulk.map(self._create, self.tasks, max_workers=self.max_workers):
+                if created.exception is not None:
+                    created.item.fail(f'create failed: {created.exception}', created.exception)
+            while True:
+                running = [task for task in self.tasks if task.state == 'running']
+                if not running:
+                    break
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    for task in running:
+                        task.fail('timeout', TimeoutError(f'report {task.report_id} not ready after {timeout} seconds'))
+                    break
+                due = [task for task in running if task.next_poll <= now]
+                if not due:
+                    wake_up = min(task.next_poll for task in running)
+                    if deadline is not None:
+                        wake_up = min(wake_up, deadline)
+                    time.sleep(max(0.0, wake_up - now))
+                    continue
+
+                for polled in bulk.map(self._poll, due, max_workers=self.max_workers):
+                    task = polled.item
+                    if polled.exception is not None or polled.result is None:
+                        task.fail(f'status poll failed: {polled.exception}', polled.exception)
+                    else:
+                        task.update(polled.result, time.monotonic(), min_interval, max_interval, backoff)
+                if progress is not None:
+                    progress(self.tasks)
+                for task in due:
+                    if task.state == 'ready':
+                        yield from self._download(task)
+        finally:
+            if self.delete:
+                # also clean up after an aborted run
+                left_over = [task for task in self.tasks if task.report_id is not None and not task.deleted]
+                if left_over:
+                    bulk.run(self._delete, left_over, max_workers=self.max_workers)
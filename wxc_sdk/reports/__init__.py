@@ -4,11 +4,13 @@ Reports API
 
 import csv
 import io
+import itertools
+import tempfile
 import zipfile
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from pydantic import Field, TypeAdapter
 
@@ -91,9 +93,11 @@ class CallingCDR(CDR):
                 # download call history report from Webex
                 cdrs = list(CallingCDR.from_dicts(api.reports.download(url=url)))
 
+                # same as
+                cdrs = list(api.reports.download_cdrs(url=url))
+
         """
-        for record in dicts:
-            yield cls.model_validate(record)
+        yield from cls.parse_records(dicts)
 
 
 @dataclass(init=False, repr=False)
@@ -260,39 +264,219 @@ class ReportsApi(ApiChild, base='devices'):
         url = self.session.ep(f'reports/{report_id}')
         super().delete(url=url)
 
-    def download(self, url: str) -> Generator[dict[str, Any], None, None]:
+    @staticmethod
+    def _zip_rows(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+        """
+        Rows of the CSV file in a ZIP file; the CSV file is decompressed and parsed incrementally
+
+        :meta private:
+        :param file: seekable ZIP file
+        """
+        with zipfile.ZipFile(file, 'r') as zip_file:
+            # open 1st file
+            first_info = zip_file.infolist()[0]
+            with zip_file.open(first_info) as f:
+                # utf-8-sig skips the UTF BOM
+                text = io.TextIOWrapper(f, encoding='utf-8-sig', newline='')
+                yield from csv.DictReader(text)
+
+    @staticmethod
+    def _batches(rows: Iterable[Any], size: int) -> Iterator[tuple[Any, ...]]:
+        """
+        Group rows in batches; the async API parses the rows of a report batch by batch in a worker thread
+
+        :meta private:
+        """
+        rows = iter(rows)
+        while batch := tuple(itertools.islice(rows, size)):
+            yield batch
+
+    def download(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> Generator[dict[str, Any], None, None]:
         """
         Download a report from the given URL and yield the rows as dicts
 
+        The report (a ZIP file) is downloaded in chunks into a spooled temporary file: reports up to `spool_size` bytes
+        are kept in memory, larger reports are written to a temporary file. Rows are then parsed directly from the
+        compressed CSV file in the ZIP file; memory use does not depend on the size of the report.
+
         :param url: download URL
         :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file; default: system default for temporary files
+        :type spool_dir: str
         :return: yields dicts
         """
         '''async
-    async def download(self, url: str) -> builtins.list[dict]:
+    async def download_gen(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """
         Download a report from the given URL and yield the rows as dicts
 
+        The report (a ZIP file) is downloaded in chunks into a spooled temporary file: reports up to `spool_size` bytes
+        are kept in memory, larger reports are written to a temporary file. Rows are then parsed directly from the
+        compressed CSV file in the ZIP file; memory use does not depend on the size of the report.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file; default: system default for temporary files
+        :type spool_dir: str
+        :return: yields dicts
+        """
+        async for batch in self._download_batches(
+            url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir
+        ):
+            for row in batch:
+                yield row
+
+    async def _download_batches(
+        self,
+        url: str,
+        chunk_size: int,
+        spool_size: int,
+        spool_dir: Optional[str],
+        parser: Callable[[Iterable[dict[str, Any]]], Iterable[Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[tuple[Any, ...], None]:
+        """
+        Download a report and yield the parsed rows in batches
+
+        Writes to the spool file (which go to disk once the report exceeds `spool_size`), decompression, CSV parsing,
+        and `parser` run in worker threads so that the event loop is not blocked while a large report is processed.
+
+        :meta private:
+        """
+        headers = {'Authorization': f'Bearer {self.session.access_token}'}
+        spool = tempfile.SpooledTemporaryFile(max_size=spool_size, dir=spool_dir)
+        try:
+            async with self.session.get(url, headers=headers) as r:
+                r.raise_for_status()
+                async for chunk in r.content.iter_chunked(chunk_size):
+                    await asyncio.to_thread(spool.write, chunk)
+            await asyncio.to_thread(spool.seek, 0)
+            rows: Iterable[Any] = self._zip_rows(spool)
+            if parser is not None:
+                rows = parser(rows)
+            batches = self._batches(rows, batch_size)
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                yield batch
+        finally:
+            await asyncio.to_thread(spool.close)
+
+    async def download(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> builtins.list[dict]:
+        """
+        Download a report from the given URL and return the rows as dicts
+
+        Use :meth:`download_gen` to process rows without holding all of them in memory.
+
         :param url: download URL
         :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file; default: system default for temporary files
+        :type spool_dir: str
         :return: list of dicts (one per row)
         :rtype: list[dict]
         """
-        raise NotImplementedError('async download not implemented; use sync call instead')
+        return [
+            row
+            async for row in self.download_gen(url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir)
+        ]
         '''
         headers = {'Authorization': f'Bearer {self.session.access_token}'}
-        with self.session.get(url=url, stream=True, headers=headers) as r:
-            r.raise_for_status()
-            # content is a ZIP file
-            zip_file_bytes = io.BytesIO(r.content)
-            with zipfile.ZipFile(zip_file_bytes, 'r') as zip_file:
-                # open 1st file
-                first_info = zip_file.infolist()[0]
-                with zip_file.open(first_info) as f:
-                    # read over UTF BOM
-                    f.read(3)
-                    text = io.TextIOWrapper(f, encoding='utf-8')
-                    lines = (line for line in text)
-                    reader = csv.DictReader(lines)
-                    yield from reader
-        return
+        with tempfile.SpooledTemporaryFile(max_size=spool_size, dir=spool_dir) as spool:
+            with self.session.get(url=url, stream=True, headers=headers) as r:
+                r.raise_for_status()
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    spool.write(chunk)
+            spool.seek(0)
+            yield from self._zip_rows(spool)
+
+    def download_cdrs(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> Generator[CallingCDR, None, None]:
+        """
+        Download a Calling Detailed Call History report from the given URL and yield the rows as
+        :class:`CallingCDR` instances
+
+        See :meth:`download` for the parameters.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file
+        :type spool_dir: str
+        :return: yields CDRs
+        """
+        '''async
+    async def download_cdrs_gen(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> AsyncGenerator[CallingCDR, None]:
+        """
+        Download a Calling Detailed Call History report from the given URL and yield the rows as
+        :class:`CallingCDR` instances
+
+        See :meth:`download_gen` for the parameters.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file
+        :type spool_dir: str
+        :return: yields CDRs
+        """
+        async for batch in self._download_batches(
+            url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir, parser=CallingCDR.parse_records
+        ):
+            for cdr in batch:
+                yield cdr
+
+    async def download_cdrs(
+        self, url: str, chunk_size: int = 1 << 20, spool_size: int = 16 << 20, spool_dir: str = None
+    ) -> builtins.list[CallingCDR]:
+        """
+        Download a Calling Detailed Call History report from the given URL and return the rows as
+        :class:`CallingCDR` instances
+
+        See :meth:`download_gen` for the parameters.
+
+        :param url: download URL
+        :type url: str
+        :param chunk_size: size of chunks read from the response in bytes
+        :type chunk_size: int
+        :param spool_size: maximum size of a report in bytes which is kept in memory
+        :type spool_size: int
+        :param spool_dir: directory for the temporary file
+        :type spool_dir: str
+        :return: list of CDRs
+        :rtype: list[CallingCDR]
+        """
+        return [
+            cdr
+            async for cdr in self.download_cdrs_gen(
+                url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir
+            )
+        ]
+        '''
+        yield from CallingCDR.parse_records(
+            self.download(url, chunk_size=chunk_size, spool_size=spool_size, spool_dir=spool_dir)
+        )
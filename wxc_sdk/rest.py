@@ -2,25 +2,37 @@
 REST session for Webex API requests
 """
 
+import copy
 import json
 import logging
 import time
 import uuid
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from functools import wraps
 from io import StringIO, TextIOBase
-from json import JSONDecodeError
+from itertools import count
 from threading import Semaphore
 from typing import Any, Callable, ClassVar, Optional, Union
 from urllib.parse import parse_qsl
 
 from pydantic import BaseModel, Field, ValidationError
-from requests import HTTPError, Response, Session
+from requests import HTTPError, Response, Session, Timeout
 from requests.adapters import HTTPAdapter
 from requests.models import PreparedRequest
 
 from .base import RETRY_429_MAX_WAIT, ApiModel, ApiModelType, StrOrDict
+from .cache import ResponseCache
+from .directory import EntityDirectory
+from .http2 import Http2Adapter
+from .json_codec import JsonCodec, StdlibCodec, get_codec
+from .metrics import SessionMetrics
+from .pagination import ItemMode, item_converter, iter_items, offset_paging, offset_url, page_items
+from .pagination import prefetch as prefetch_pages
+from .single_flight import SingleFlight
+from .throttle import AdaptiveConcurrency, BackoffGate
 from .tokens import Tokens
 
 __all__ = ['SingleError', 'ErrorDetail', 'RestError', 'RestSession', 'dump_response']
@@ -120,7 +132,11 @@ class RestError(HTTPError):
 
 
 def dump_response(
-    response: Response, file: TextIOBase = None, dump_log: logging.Logger = None, diff_ns: int = None
+    response: Response,
+    file: TextIOBase = None,
+    dump_log: logging.Logger = None,
+    diff_ns: int = None,
+    codec: JsonCodec = None,
 ) -> None:
     """
     Dump response object to log file
@@ -132,15 +148,17 @@ def dump_response(
     :type dump_log: logging.Logger
     :param diff_ns: time the request took (in ns)
     :type diff_ns: int
+    :param codec: JSON codec to parse and pretty print JSON bodies; default: standard library
     """
     if not log.isEnabledFor(logging.DEBUG):
         return
     dump_log = dump_log or log
     output = file or StringIO()
+    codec = codec or StdlibCodec()
 
     # dump response objects in redirect history
     for h in response.history:
-        dump_response(response=h, file=output)
+        dump_response(response=h, file=output, codec=codec)
 
     if diff_ns is None:
         time_str = ''
@@ -167,7 +185,7 @@ def dump_response(
         print('  --- body ---', file=output)
         ct = response.request.headers.get('Content-Type').lower()
         if ct.startswith('application/json'):
-            for line in json.dumps(json.loads(request_body), indent=2).splitlines():
+            for line in codec.dumps_pretty(codec.loads(request_body)).splitlines():
                 print(f'  {line}', file=output)
         elif ct.startswith('application/x-www-form-urlencoded'):
             for k, v in parse_qsl(request_body):
@@ -184,7 +202,7 @@ def dump_response(
     if body:
         print('  --- response body ---', file=output)
         try:
-            body = json.loads(body)
+            body = codec.loads(body)
             if isinstance(body, dict):
                 # mask access and refresh tokens
                 if 'access_token' in body:
@@ -192,8 +210,8 @@ def dump_response(
                     body['access_token'] = '***'
                 if 'refresh_token' in body:
                     body['refresh_token'] = '***'
-            body = json.dumps(body, indent=2)
-        except json.JSONDecodeError:
+            body = codec.dumps_pretty(body)
+        except ValueError:
             pass
         for line in body.splitlines():
             print(f'  {line}', file=output)
@@ -204,18 +222,25 @@ def dump_response(
 
 def retry_request(func: Callable[..., tuple[Response, StrOrDict]]) -> Callable[..., tuple[Response, StrOrDict]]:
     """
-    Decorator for the request method in the RestSession class. Used to implement backoff on 429 responses
+    Decorator for the request method in the RestSession class. Used to implement backoff on 429 responses.
+
+    A 429 response closes the session's :class:`wxc_sdk.throttle.BackoffGate`. All requests (including the one that
+    got the 429) wait at the gate without holding a slot of the session's concurrency limit.
+
+    If the session uses an :class:`wxc_sdk.throttle.AdaptiveConcurrency` limiter, then latencies of successful requests,
+    429 responses, and timeouts are reported to the limiter.
 
     :param func:
     :return:
     """
 
-    def giveup_429(e: RestError, retry_429: bool) -> bool:
+    def giveup_429(e: RestError, retry_429: bool, gate: BackoffGate) -> bool:
         """
         callback for backoff on REST requests
 
         :param e: latest exception
         :param retry_429: retry on 429?
+        :param gate: backoff gate of the session
         :return: True -> break the backoff loop
         """
         response = e.response
@@ -228,21 +253,140 @@ def retry_request(func: Callable[..., tuple[Response, StrOrDict]]) -> Callable[.
 
         # never wait more than the defined maximum
         retry_after = min(retry_after, RETRY_429_MAX_WAIT)
-        time.sleep(retry_after)
+        # close the gate for all requests on the session; the actual wait happens at the gate
+        gate.close_for(retry_after)
         return False
 
     @wraps(func)
     def wrapper(session: 'RestSession', *args: Any, **kwargs: Any) -> Any:
-        with session._sem:
-            while True:
+        gate = session.backoff
+        adaptive = session.adaptive_concurrency
+        metrics = session.metrics
+        while True:
+            waited = gate.wait()
+            slot_wait_start = time.perf_counter()
+            with session._sem:
+                if metrics is not None:
+                    metrics.record_throttled_wait(waited)
+                    metrics.record_semaphore_wait(time.perf_counter() - slot_wait_start)
+                if not gate.is_open:
+                    # the gate was closed while we were waiting for a slot -> give the slot back and wait again
+                    continue
+                start = time.perf_counter()
                 try:
                     result = func(session, *args, **kwargs)
                 except RestError as e:
-                    if giveup_429(e, session.retry_429):
+                    if adaptive is not None and e.response.status_code == 429:
+                        adaptive.record_congestion('throttled')
+                    if giveup_429(e, session.retry_429, gate):
                         raise
+                except Timeout:
+                    if adaptive is not None:
+                        adaptive.record_congestion('timeout')
+                    raise
                 else:
-                    break
-        return result
+                    if adaptive is not None:
+                        adaptive.record_success(time.perf_counter() - start)
+                    return result
+
+    return wrapper
+
+
+def cache_request(func: Callable[..., tuple[Response, StrOrDict]]) -> Callable[..., tuple[Response, StrOrDict]]:
+    """
+    Decorator for the request method in the RestSession class. Used to serve GET requests from the session's
+    :class:`wxc_sdk.cache.ResponseCache` and to invalidate cached responses on updates.
+
+    Callers always get their own copy of the response body.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    def wrapper(session: 'RestSession', method: str, url: str, **kwargs: Any) -> tuple[Response, StrOrDict]:
+        cache = session.cache
+        if cache is None:
+            return func(session, method, url, **kwargs)
+        path = cache.path(session.BASE, url)
+        if method != 'GET':
+            try:
+                return func(session, method, url, **kwargs)
+            finally:
+                cache.invalidate_path(path)
+        ttl = cache.ttl(path)
+        if ttl is None:
+            return func(session, method, url, **kwargs)
+        key = cache.key(url, kwargs.get('params'), session.access_token)
+        entry = cache.get(key)
+        if entry is not None:
+            if entry.fresh:
+                return entry.response, copy.deepcopy(entry.data)
+            # expired entry with ETag: revalidate
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'If-None-Match': entry.etag}
+        epoch = cache.epoch
+        response, data = func(session, method, url, **kwargs)
+        if entry is not None and response.status_code == 304:
+            cache.refresh(entry, ttl)
+            return entry.response, copy.deepcopy(entry.data)
+        if 200 <= response.status_code < 300:
+            cache.put(key, path, response, data, ttl=ttl, etag=response.headers.get('ETag'), epoch=epoch)
+        return response, data
+
+    return wrapper
+
+
+def directory_request(func: Callable[..., tuple[Response, StrOrDict]]) -> Callable[..., tuple[Response, StrOrDict]]:
+    """
+    Decorator for the request method in the RestSession class. Invalidates entries of the session's
+    :class:`wxc_sdk.directory.EntityDirectory` on updates.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    def wrapper(session: 'RestSession', method: str, url: str, **kwargs: Any) -> tuple[Response, StrOrDict]:
+        directory = session.directory
+        if directory is None or method == 'GET':
+            return func(session, method, url, **kwargs)
+        try:
+            return func(session, method, url, **kwargs)
+        finally:
+            directory.invalidate_path(ResponseCache.path(session.BASE, url))
+
+    return wrapper
+
+
+def single_flight_request(
+    func: Callable[..., tuple[Response, StrOrDict]],
+) -> Callable[..., tuple[Response, StrOrDict]]:
+    """
+    Decorator for the request method in the RestSession class. Identical GET requests (same URL, parameters, and access
+    token) in flight at the same time share a single request if the session has a single-flight group.
+
+    Callers always get their own copy of the response body.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    def wrapper(session: 'RestSession', method: str, url: str, **kwargs: Any) -> tuple[Response, StrOrDict]:
+        flights = session.single_flight
+        if flights is None:
+            return func(session, method, url, **kwargs)
+        if method != 'GET':
+            try:
+                return func(session, method, url, **kwargs)
+            finally:
+                # requests after an update don't join requests sent before the update
+                flights.forget()
+        if set(kwargs) - {'params'}:
+            # only plain GET requests are shared
+            return func(session, method, url, **kwargs)
+        key = ResponseCache.key(url, kwargs.get('params'), session.access_token)
+        return flights.run(key, lambda: func(session, method, url, **kwargs))
 
     return wrapper
 
@@ -252,10 +396,6 @@ def retry_request(func: Callable[..., tuple[Response, StrOrDict]]) -> Callable[.
 RestResponseCallBack = Callable[[Response, int], None]
 
 
-def _dump_response_callback(response: Response, diff_ns: int) -> None:
-    dump_response(response, diff_ns=diff_ns)
-
-
 @dataclass(init=False, repr=False)
 class RestSession(Session):
     """
@@ -271,9 +411,30 @@ class RestSession(Session):
     # Bearer token(s) for this session
     _tokens: Tokens
     # semaphore for rate limiting
-    _sem: Semaphore
+    _sem: Union[Semaphore, AdaptiveConcurrency]
     # retry on 429?
     retry_429: bool
+    #: gate used to back off all requests of the session after a 429 response
+    backoff: BackoffGate
+    #: adaptive concurrency limiter; None if the session uses a fixed concurrency limit
+    adaptive_concurrency: Optional[AdaptiveConcurrency]
+    #: maximum number of concurrent requests; with adaptive concurrency the maximum limit of the limiter
+    max_concurrent_requests: int
+    #: default for number of pages :meth:`follow_pagination` reads ahead in a background thread
+    pagination_prefetch: int
+    #: default for maximum number of concurrent page requests :meth:`follow_pagination` uses for offset based
+    #: pagination; 0: pages are requested one after another
+    pagination_parallel: int
+    #: JSON codec used to decode response bodies, encode request bodies, and to dump requests and responses
+    json_codec: JsonCodec
+    #: response cache; None if responses are not cached
+    cache: Optional[ResponseCache]
+    #: entity directory used by the lookup helpers; None if lookups are not cached
+    directory: Optional[EntityDirectory]
+    #: request metrics; None if metrics are not collected
+    metrics: Optional[SessionMetrics]
+    #: single-flight group for identical GET requests; None if identical requests are not shared
+    single_flight: Optional[SingleFlight]
     # registry of response callbacks
     _response_callback_registry: dict[str, RestResponseCallBack]
 
@@ -285,15 +446,97 @@ class RestSession(Session):
         retry_429: bool = True,
         proxy_url: str = None,
         verify: Union[bool, str] = None,
+        backoff: BackoffGate = None,
+        adaptive_concurrency: Union[bool, AdaptiveConcurrency] = False,
+        pagination_prefetch: int = 0,
+        pagination_parallel: int = 0,
+        cache: Union[bool, ResponseCache] = False,
+        directory: Union[bool, EntityDirectory] = False,
+        single_flight: bool = False,
+        metrics: Union[bool, SessionMetrics] = False,
+        json_codec: Union[str, JsonCodec] = 'stdlib',
+        http2: bool = False,
     ):
+        """
+        Initialize the REST session
+
+        :param tokens: tokens to be used for the session
+        :param concurrent_requests: maximum number of concurrent requests
+        :param retry_429: enable automatic retry on 429 responses
+        :param proxy_url: URL of HTTPS proxy to use
+        :param verify: passed as `verify` to all requests
+        :param backoff: backoff gate to use for this session. Pass the same :class:`wxc_sdk.throttle.BackoffGate`
+            instance to multiple sessions to have them back off together. If not given, then the session creates its
+            own gate.
+        :param adaptive_concurrency: if True, then instead of a fixed limit of `concurrent_requests` concurrent
+            requests an :class:`wxc_sdk.throttle.AdaptiveConcurrency` limiter starting at `concurrent_requests` is
+            used. Alternatively, a pre-configured :class:`wxc_sdk.throttle.AdaptiveConcurrency` instance can be passed.
+        :param pagination_prefetch: number of pages list requests read ahead in a background thread while the
+            caller processes the items of the current page. Default: 0, no read ahead
+        :param pagination_parallel: maximum number of concurrent page requests for list requests with offset based
+            pagination (`start` and `max` parameters). Default: 0, pages are requested one after another
+        :param cache: if True, then responses of GET requests to endpoints returning reference data are cached using
+            a :class:`wxc_sdk.cache.ResponseCache` with default rules. Alternatively, a pre-configured
+            :class:`wxc_sdk.cache.ResponseCache` instance can be passed.
+        :param directory: if True, then the lookup helpers like :meth:`wxc_sdk.locations.LocationsApi.by_name` cache
+            people, locations, and workspaces in a :class:`wxc_sdk.directory.EntityDirectory` with default settings.
+            Alternatively, a pre-configured :class:`wxc_sdk.directory.EntityDirectory` instance can be passed.
+        :param single_flight: if True, then identical GET requests (same URL, parameters, and access token) in flight
+            at the same time share a single request. Each caller gets its own copy of the response body.
+        :param metrics: if True, then request metrics are collected in a :class:`wxc_sdk.metrics.SessionMetrics`
+            instance. Alternatively, a :class:`wxc_sdk.metrics.SessionMetrics` instance can be passed, for example to
+            aggregate metrics of multiple sessions.
+        :param json_codec: JSON codec for request and response bodies: 'stdlib', 'orjson', 'msgspec', 'auto' (orjson
+            or msgspec if installed, else standard library), or a :class:`wxc_sdk.json_codec.JsonCodec` instance.
+            Default: 'stdlib'
+        :param http2: if True, then requests are sent via HTTP/2 using an :class:`wxc_sdk.http2.Http2Adapter`: all
+            concurrent requests share a single connection. Requires httpx with HTTP/2 support: `pip install
+            httpx[http2]`
+        """
         super().__init__()
-        self.mount('http://', HTTPAdapter(pool_maxsize=concurrent_requests))
-        self.mount('https://', HTTPAdapter(pool_maxsize=concurrent_requests))
+        if adaptive_concurrency is True:
+            adaptive_concurrency = AdaptiveConcurrency(
+                initial_limit=concurrent_requests, max_limit=max(concurrent_requests, 100)
+            )
+        self.adaptive_concurrency = adaptive_concurrency or None
+        if self.adaptive_concurrency is None:
+            self._sem = Semaphore(concurrent_requests)
+            pool_maxsize = concurrent_requests
+        else:
+            self._sem = self.adaptive_concurrency
+            pool_maxsize = self.adaptive_concurrency.max_limit
+        self.max_concurrent_requests = pool_maxsize
+        if http2:
+            adapter: Union[HTTPAdapter, Http2Adapter] = Http2Adapter(
+                max_connections=pool_maxsize, verify=True if verify is None else verify, proxy=proxy_url
+            )
+            self.mount('http://', adapter)
+            self.mount('https://', adapter)
+        else:
+            self.mount('http://', HTTPAdapter(pool_maxsize=pool_maxsize))
+            self.mount('https://', HTTPAdapter(pool_maxsize=pool_maxsize))
         self._tokens = tokens
-        self._sem = Semaphore(concurrent_requests)
         self.retry_429 = retry_429
+        self.backoff = backoff or BackoffGate()
+        self.pagination_prefetch = pagination_prefetch
+        self.pagination_parallel = pagination_parallel
+        if cache is True:
+            cache = ResponseCache()
+        # an empty cache is falsy
+        self.cache = cache if isinstance(cache, ResponseCache) else None
+        if directory is True:
+            directory = EntityDirectory()
+        # an empty directory is falsy
+        self.directory = directory if isinstance(directory, EntityDirectory) else None
+        self.single_flight = SingleFlight() if single_flight else None
+        if metrics is True:
+            metrics = SessionMetrics()
+        self.metrics = metrics if isinstance(metrics, SessionMetrics) else None
+        self.json_codec = get_codec(json_codec)
         self._response_callback_registry = dict()
-        self.register_response_callback(_dump_response_callback)
+        self.register_response_callback(self._dump_response_callback)
+        if self.metrics is not None:
+            self.register_response_callback(self._metrics_callback)
         if proxy_url:
             self.proxies = {'https': proxy_url}
         if verify is not None:
@@ -313,6 +556,32 @@ class RestSession(Session):
         self._response_callback_registry[id] = callback
         return id
 
+    def _dump_response_callback(self, response: Response, diff_ns: int) -> None:
+        """
+        Response callback to dump requests and responses to the log
+
+        :meta private:
+        """
+        dump_response(response, diff_ns=diff_ns, codec=self.json_codec)
+
+    def _metrics_callback(self, response: Response, diff_ns: int) -> None:
+        """
+        Response callback to record request metrics
+
+        :meta private:
+        """
+        if self.metrics is None:
+            return
+        request = response.request
+        self.metrics.record_response(
+            method=request.method or '',
+            path=ResponseCache.path(self.BASE, request.url or ''),
+            status=response.status_code,
+            seconds=diff_ns / 1e9,
+            bytes_in=len(response.content or b''),
+            bytes_out=len(request.body) if request.body else 0,
+        )
+
     def unregister_response_callback(self, id: str) -> None:
         """
         Unregister a response callback
@@ -342,6 +611,9 @@ class RestSession(Session):
         """
         return self._tokens.access_token
 
+    @directory_request
+    @cache_request
+    @single_flight_request
     @retry_request
     def _request_w_response(
         self,
@@ -379,6 +651,8 @@ class RestSession(Session):
             request_headers.update((k.lower(), v) for k, v in headers.items())
         if content_type:
             request_headers['Content-Type'] = content_type
+        if kwargs.get('json') is not None:
+            kwargs['data'] = self.json_codec.dumps(kwargs.pop('json'))
         start = time.perf_counter_ns()
         response = self.request(method, url=url, headers=request_headers, **kwargs)
         diff_ns = time.perf_counter_ns() - start
@@ -397,10 +671,10 @@ class RestSession(Session):
             ct = response.headers.get('Content-Type')
             if not ct:
                 data = ''
-            elif ct.startswith('application/json') and response.text:
+            elif ct.startswith('application/json') and response.content:
                 try:
-                    data = response.json()
-                except JSONDecodeError:
+                    data = self.json_codec.loads(response.content)
+                except ValueError:
                     data = response.text
             else:
                 data = response.text
@@ -474,36 +748,27 @@ class RestSession(Session):
         """
         return self._rest_request('PATCH', *args, **kwargs)
 
-    def follow_pagination(
+    def _item_pages(
         self,
         url: str,
-        model: type[ApiModelType] = None,
-        params: dict[str, str] = None,
-        item_key: str = None,
+        params: Optional[dict[str, str]],
+        item_key: Optional[str],
+        parallel: int = 0,
+        ordered: bool = True,
         **kwargs: Any,
-    ) -> Generator[ApiModelType, None, None]:
+    ) -> Generator[list[dict[str, Any]], None, None]:
         """
-        Handling RFC5988 pagination of list requests. Generator of parsed objects
+        Follow RFC5988 pagination and yield the list of items of each page
 
+        :meta private:
         :param url: start url for 1st GET
-        :type url: str
-        :param model: data type to return
-        :type model: ApiModel
         :param params: URL parameters, optional
-        :type params: Optional[dict]
         :param item_key: key to list of values
-        :type item_key: str
-        :return: yields parsed objects
+        :param parallel: maximum number of concurrent page requests if the 'next' URL of the 1st page shows offset
+            based pagination
+        :param ordered: yield pages in order
+        :return: yields the list of items of each page
         """
-
-        def noop(x: dict[str, Any]) -> dict[str, Any]:
-            return x
-
-        if model is None or not issubclass(model, ApiModel):
-            validator = noop
-        else:
-            validator = model.model_validate  # type: ignore[assignment]
-
         cur_url: Optional[str] = url
         while cur_url:
             log.debug(f'{self.__class__.__name__}.pagination: getting {cur_url}')
@@ -518,16 +783,141 @@ class RestSession(Session):
             if not data:
                 continue
             # return all items
-            if item_key is None:
-                if 'items' in data:
-                    item_key = 'items'
-                else:
-                    # we go w/ the first return value that is a list
-                    item_key = next((k for k, v in data.items() if isinstance(v, list)))
-            items = data.get(item_key, [])
+            item_key, items = page_items(data, item_key)  # type: ignore[arg-type]
             # if the response has no items, we're done
             if not items:
                 log.debug(f'{self.__class__.__name__}.pagination: no items found')
                 break
-            for item in items:
-                yield validator(item)  # type: ignore[misc]
+            yield items
+            if parallel and cur_url and (paging := offset_paging(cur_url, data, items)):  # type: ignore[arg-type]
+                # offset based pagination: we can get the remaining pages concurrently
+                start, page_size, total = paging
+                yield from self._offset_pages(
+                    url=cur_url,
+                    start=start,
+                    page_size=page_size,
+                    total=total,
+                    item_key=item_key,
+                    parallel=parallel,
+                    ordered=ordered,
+                    **kwargs,
+                )
+                break
+
+    def _offset_pages(
+        self,
+        url: str,
+        start: int,
+        page_size: int,
+        total: Optional[int],
+        item_key: str,
+        parallel: int,
+        ordered: bool,
+        **kwargs: Any,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """
+        Get pages of a list request with offset based pagination concurrently
+
+        If the total number of items is not known, then up to `parallel` pages are requested ahead until the first
+        page with less than `page_size` items shows the end of the list.
+
+        :meta private:
+        :param url: URL of the next page
+        :param start: start of next page
+        :param page_size: number of items per page
+        :param total: total number of items, if known
+        :param item_key: key to list of values
+        :param parallel: maximum number of concurrent page requests
+        :param ordered: yield pages in order; else pages are yielded as soon as they are available
+        :return: yields the list of items of each page
+        """
+
+        def get_page(page_start: int) -> list[dict[str, Any]]:
+            page_url = offset_url(url, page_start)
+            log.debug(f'{self.__class__.__name__}.pagination: getting {page_url}')
+            _, data = self._request_w_response('GET', url=page_url, **kwargs)
+            return page_items(data, item_key)[1] if data else []  # type: ignore[arg-type]
+
+        starts: Iterator[int] = iter(range(start, total, page_size)) if total is not None else count(start, page_size)
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        # set as soon as a short page shows the end of the list
+        last_page = False
+        pool = ThreadPoolExecutor(max_workers=parallel, thread_name_prefix='pagination')
+        try:
+            while True:
+                # keep up to `parallel` page requests in flight
+                while not last_page and len(pending) < parallel:
+                    page_start = next(starts, None)
+                    if page_start is None:
+                        break
+                    pending.append(pool.submit(get_page, page_start))
+                if not pending:
+                    break
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                items = future.result()
+                if len(items) < page_size:
+                    last_page = True
+                    if ordered:
+                        # all pending requests are for pages after the end of the list
+                        yield items
+                        break
+                if items:
+                    yield items
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def follow_pagination(
+        self,
+        url: str,
+        model: type[ApiModelType] = None,
+        params: dict[str, str] = None,
+        item_key: str = None,
+        prefetch: int = None,
+        parallel: int = None,
+        ordered: bool = True,
+        item_mode: ItemMode = None,
+        **kwargs: Any,
+    ) -> Generator[ApiModelType, None, None]:
+        """
+        Handling RFC5988 pagination of list requests. Generator of parsed objects
+
+        :param url: start url for 1st GET
+        :type url: str
+        :param model: data type to return
+        :type model: ApiModel
+        :param params: URL parameters, optional
+        :type params: Optional[dict]
+        :param item_key: key to list of values
+        :type item_key: str
+        :param prefetch: number of pages to read ahead in a background thread while the caller processes the items
+            of the current page. Default: :attr:`pagination_prefetch`
+        :type prefetch: int
+        :param parallel: maximum number of concurrent page requests if the list request uses offset based pagination
+            (`start` and `max` parameters). Default: :attr:`pagination_parallel`
+        :type parallel: int
+        :param ordered: only relevant for concurrent page requests: if False, then items are yielded as soon as a page
+            is available; the order of the items is not guaranteed
+        :type ordered: bool
+        :param item_mode: how to convert items: validated models (default), plain dicts, models created w/o
+            validation, or lazily validated proxies. Default: mode set by :func:`wxc_sdk.pagination.item_mode` when
+            this method is called
+        :type item_mode: ItemMode
+        :return: yields parsed objects
+        """
+        # the item mode is determined now; it applies even if the generator is consumed outside the current context
+        converter = item_converter(model, item_mode)
+        if prefetch is None:
+            prefetch = self.pagination_prefetch
+        if parallel is None:
+            parallel = self.pagination_parallel
+        pages: Generator[list[dict[str, Any]], None, None] = self._item_pages(
+            url=url, params=params, item_key=item_key, parallel=parallel, ordered=ordered, **kwargs
+        )
+        if prefetch:
+            pages = prefetch_pages(pages, depth=prefetch)
+        return iter_items(pages, converter)
@@ -0,0 +1,238 @@
+"""
+Bulk reader for person, workspace, and virtual line settings: reads a set of features for many entities concurrently
+and returns the settings as a table with one column per feature.
+
+Example: audit call forwarding and DND of all users in a location
+
+.. code-block:: python
+
+    users = list(api.people.list(location_id=location_id, calling_data=True))
+    table = SettingsReader(api=api).read(entity_ids=[user.person_id for user in users],
+                                         features=['forwarding', 'dnd'])
+    for person_id, row in table.rows():
+        if not table.ok_row(person_id):
+            continue
+        if row['dnd'].enabled or row['forwarding'].call_forwarding.always.enabled:
+            print(person_id)
+"""
+
+import inspect
+import logging
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import CancelledError
+from dataclasses import dataclass
+from functools import partial
+from threading import Event
+from typing import TYPE_CHECKING, Any
+
+from .bulk import BulkProgress, RetryOn
+from .person_settings.common import ApiSelector
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['SettingsTable', 'SettingsReader']
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class SettingsTable:
+    """
+    Settings of a set of entities; one column per feature with one cell per entity
+
+    Each cell holds the result of the `read()` call of the feature for the entity or the exception if the read
+    failed. The columns can directly be used to create a data frame: `DataFrame(table.columns, index=table.entity_ids)`
+    """
+
+    #: type of the entities
+    selector: ApiSelector
+    #: IDs of the entities; order of the cells in each column
+    entity_ids: list[str]
+    #: settings by feature name: one list per feature with the settings or exceptions in the order of
+    #: :attr:`entity_ids`
+    columns: dict[str, list[Any]]
+
+    def __post_init__(self):
+        self._index = {entity_id: i for i, entity_id in enumerate(self.entity_ids)}
+
+    @property
+    def features(self) -> list[str]:
+        """
+        Names of the features; the columns of the table
+        """
+        return list(self.columns)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if all reads succeeded
+        """
+        return not any(isinstance(cell, Exception) for column in self.columns.values() for cell in column)
+
+    def cell(self, entity_id: str, feature: str) -> Any:
+        """
+        Setting of a feature for an entity
+
+        :param entity_id: ID of the entity
+        :param feature: name of the feature
+        :return: setting or exception if the read failed
+        """
+        return self.columns[feature][self._index[entity_id]]
+
+    def row(self, entity_id: str) -> dict[str, Any]:
+        """
+        Settings of one entity
+
+        :param entity_id: ID of the entity
+        :return: settings or exceptions by feature name
+        """
+        i = self._index[entity_id]
+        return {feature: column[i] for feature, column in self.columns.items()}
+
+    def ok_row(self, entity_id: str) -> bool:
+        """
+        True if all reads for an entity succeeded
+
+        :param entity_id: ID of the entity
+        """
+        return not any(isinstance(cell, Exception) for cell in self.row(entity_id).values())
+
+    def rows(self) -> Generator[tuple[str, dict[str, Any]], None, None]:
+        """
+        Iterate over the rows of the table
+
+        :return: yields entity ID and settings or exceptions by feature name
+        """
+        for entity_id in self.entity_ids:
+            yield entity_id, self.row(entity_id)
+
+    def errors(self) -> list[tuple[str, str, Exception]]:
+        """
+        All failed reads
+
+        :return: list of (entity ID, feature name, exception)
+        """
+        return [
+            (entity_id, feature, cell)
+            for feature, column in self.columns.items()
+            for entity_id, cell in zip(self.entity_ids, column, strict=True)
+            if isinstance(cell, Exception)
+        ]
+
+
+class SettingsReader:
+    """
+    Read settings of many entities concurrently
+
+    The features are the names of the settings APIs of the entity type:
+
+    * people: attributes of :attr:`api.person_settings <wxc_sdk.WebexSimpleApi.person_settings>` like `forwarding`,
+      `call_waiting`, `voicemail`, `dnd`, `caller_id`, or `permissions_out`
+    * workspaces: attributes of :attr:`api.workspace_settings <wxc_sdk.WebexSimpleApi.workspace_settings>`
+    * virtual lines: attributes of :attr:`api.telephony.virtual_lines <wxc_sdk.telephony.TelephonyApi.virtual_lines>`
+
+    Only features with a `read()` method can be read.
+    """
+
+    def __init__(self, *, api: 'WebexSimpleApi'):
+        """
+        :param api: API used to read the settings
+        """
+        self.api = api
+
+    def _container(self, selector: ApiSelector) -> Any:
+        """
+        API object with the settings APIs for the entity type
+
+        :meta private:
+        """
+        if selector == ApiSelector.person:
+            return self.api.person_settings
+        if selector == ApiSelector.workspace:
+            return self.api.workspace_settings
+        if selector == ApiSelector.virtual_line:
+            return self.api.telephony.virtual_lines
+        raise ValueError(f'Unsupported selector: {selector}')
+
+    def features(self, selector: ApiSelector = ApiSelector.person) -> list[str]:
+        """
+        Names of the features which can be read for an entity type
+
+        :param selector: type of the entities
+        :return: feature names
+        """
+        container = self._container(selector)
+        return sorted(
+            name
+            for name, value in vars(container).items()
+            if not name.startswith('_') and callable(getattr(value, 'read', None))
+        )
+
+    def read(
+        self,
+        entity_ids: Iterable[str],
+        features: Iterable[str],
+        *,
+        selector: ApiSelector = ApiSelector.person,
+        org_id: str = None,
+        max_workers: int = None,
+        progress: Callable[[BulkProgress], None] = None,
+        cancel: Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+    ) -> SettingsTable:
+        """
+        Read features for a set of entities
+
+        All reads (entities × features) are executed concurrently with :attr:`api.bulk
+        <wxc_sdk.WebexSimpleApi.bulk>`; the number of concurrent requests is bounded by the session's concurrency
+        limit. A failed read doesn't stop the other reads: the exception is stored in the cell of the table.
+
+        :param entity_ids: IDs of people, workspaces, or virtual lines; duplicates are ignored
+        :param features: names of the features to read; see :meth:`features`
+        :param selector: type of the entities
+        :param org_id: organization of the entities
+        :param max_workers: number of concurrent reads; default: maximum number of concurrent requests of the session
+        :param progress: called with the :class:`wxc_sdk.bulk.BulkProgress` after each read
+        :param cancel: event to cancel the run; cells of reads which have not been started are set to
+            :class:`concurrent.futures.CancelledError`
+        :param retries: number of times a failed read is retried; see :meth:`wxc_sdk.bulk.BulkExecutor.map`
+        :param retry_on: exceptions to retry
+        :return: settings table
+        """
+        container = self._container(selector)
+        entity_ids = list(dict.fromkeys(entity_ids))
+        features = list(dict.fromkeys(features))
+        readers: dict[str, Callable[[str], Any]] = {}
+        for feature in features:
+            read = getattr(getattr(container, feature, None), 'read', None)
+            if feature.startswith('_') or not callable(read):
+                raise ValueError(f'Feature "{feature}" cannot be read for {selector}')
+            if org_id is None:
+                readers[feature] = read
+            elif 'org_id' in inspect.signature(read).parameters:
+                readers[feature] = partial(read, org_id=org_id)
+            else:
+                raise ValueError(f'Feature "{feature}" does not support org_id')
+
+        # cells are initialized as cancelled: only overwritten if the read was executed
+        columns: dict[str, list[Any]] = {
+            feature: [CancelledError(f'{feature} not read')] * len(entity_ids) for feature in features
+        }
+        cells = [(row, feature) for row in range(len(entity_ids)) for feature in features]
+        for result in self.api.bulk.map(
+            lambda cell: readers[cell[1]](entity_ids[cell[0]]),
+            cells,
+            ordered=False,
+            max_workers=max_workers,
+            progress=progress,
+            cancel=cancel,
+            retries=retries,
+            retry_on=retry_on,
+        ):
+            row, feature = result.item
+            if not result.ok:
+                log.debug(f'read: {feature} for {entity_ids[row]} failed: {result.exception}')
+            columns[feature][row] = result.result if result.ok else result.exception
+        return SettingsTable(selector=selector, entity_ids=entity_ids, columns=columns)
@@ -0,0 +1,286 @@
+"""
+Desired-state reconciliation of person, workspace, and virtual line settings: the current settings are read
+concurrently, compared field by field with the desired settings, and only settings which differ are written.
+
+Example: make sure call waiting is enabled and DND is disabled for all users; only report the differences
+
+.. code-block:: python
+
+    reconciler = SettingsReconciler(api=api)
+    report = reconciler.reconcile(entity_ids=person_ids,
+                                  desired={'call_waiting': True, 'dnd': DND(enabled=False)},
+                                  dry_run=True)
+    for change in report.changes:
+        print(change.entity_id, change.feature, change.diff)
+"""
+
+import inspect
+import logging
+import typing
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import partial
+from threading import Event
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .base import ApiModel
+from .bulk import RetryOn
+from .person_settings.common import ApiSelector
+from .settings_reader import SettingsReader
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+
+__all__ = ['FieldDiff', 'SettingsChange', 'ReconcileReport', 'SettingsReconciler']
+
+log = logging.getLogger(__name__)
+
+#: desired setting of a feature: a value (a settings model or a bool) which is the same for all entities, or a callable
+#: returning the desired value for an entity ID; None means: leave the setting of the entity unchanged
+DesiredSetting = Union[Any, Callable[[str], Any]]
+
+
+@dataclass
+class FieldDiff:
+    """
+    Difference of one field between current and desired setting
+    """
+
+    #: dotted path of the field; empty for features with a simple value like call waiting. List items are addressed by
+    #: index: `selected_members[0].name`
+    path: str
+    #: current value
+    current: Any
+    #: desired value
+    desired: Any
+
+
+@dataclass
+class SettingsChange:
+    """
+    Setting of a feature for an entity which differs from the desired state
+    """
+
+    #: ID of the entity
+    entity_id: str
+    #: name of the feature
+    feature: str
+    #: field level differences
+    diff: list[FieldDiff]
+    #: the new setting: current setting updated with the desired fields
+    setting: Any = field(repr=False)
+    #: True if the setting has been written
+    written: bool = False
+    #: exception if the write failed
+    exception: Optional[Exception] = None
+
+
+@dataclass
+class ReconcileReport:
+    """
+    Result of a reconciliation
+    """
+
+    #: True if nothing has been written
+    dry_run: bool
+    #: number of entity/feature combinations compared
+    compared: int = 0
+    #: number of entity/feature combinations which already had the desired state
+    unchanged: int = 0
+    #: settings which differ from the desired state
+    changes: list[SettingsChange] = field(default_factory=list)
+    #: failed reads: (entity ID, feature, exception); these settings have not been compared
+    read_errors: list[tuple[str, str, Exception]] = field(default_factory=list)
+
+    @property
+    def written(self) -> list[SettingsChange]:
+        """
+        Changes which have been written
+        """
+        return [change for change in self.changes if change.written]
+
+    @property
+    def write_errors(self) -> list[SettingsChange]:
+        """
+        Changes for which the write failed
+        """
+        return [change for change in self.changes if change.exception is not None]
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if all reads and writes succeeded
+        """
+        return not self.read_errors and not self.write_errors
+
+
+def _diff(current: Any, desired: Any, path: str = '') -> list[FieldDiff]:
+    """
+    Field level differences between a current and a desired value. Only fields explicitly set in desired models are
+    compared
+
+    :meta private:
+    """
+    if isinstance(desired, ApiModel) and isinstance(current, ApiModel):
+        return [
+            d
+            for name in sorted(desired.model_fields_set)
+            for d in _diff(getattr(current, name, None), getattr(desired, name), f'{path}.{name}' if path else name)
+        ]
+    if isinstance(desired, list) and isinstance(current, list) and len(desired) == len(current):
+        return [d for i, (c, v) in enumerate(zip(current, desired, strict=True)) for d in _diff(c, v, f'{path}[{i}]')]
+    if current != desired:
+        return [FieldDiff(path=path, current=current, desired=desired)]
+    return []
+
+
+def _merge(current: Any, desired: Any) -> Any:
+    """
+    Current value updated with the fields explicitly set in the desired value
+
+    :meta private:
+    """
+    if isinstance(desired, ApiModel) and isinstance(current, ApiModel):
+        return current.model_copy(
+            update={
+                name: _merge(getattr(current, name, None), getattr(desired, name)) for name in desired.model_fields_set
+            }
+        )
+    if isinstance(desired, list) and isinstance(current, list) and len(desired) == len(current):
+        return [_merge(c, v) for c, v in zip(current, desired, strict=True)]
+    return desired
+
+
+class SettingsReconciler:
+    """
+    Reconcile settings of many entities with a desired state
+
+    Features are named like in :class:`wxc_sdk.settings_reader.SettingsReader`. Features can be reconciled if
+    `configure()` takes the same type `read()` returns; for example `forwarding`, `voicemail`, `call_waiting`, or
+    `dnd`. See :meth:`features`.
+
+    The desired state of a feature is a settings model with only the fields to enforce set, or a simple value for
+    features like call waiting. Fields which are not set in the desired model are neither compared nor changed.
+    """
+
+    def __init__(self, *, api: 'WebexSimpleApi'):
+        """
+        :param api: API used to read and write the settings
+        """
+        self.api = api
+        self.reader = SettingsReader(api=api)
+
+    def _writer(self, selector: ApiSelector, feature: str) -> Optional[Callable[..., Any]]:
+        """
+        configure() method of a feature if it takes the same type read() returns; else None
+
+        :meta private:
+        """
+        feature_api = getattr(self.reader._container(selector), feature, None)
+        read = getattr(feature_api, 'read', None)
+        configure: Optional[Callable[..., Any]] = getattr(feature_api, 'configure', None)
+        if feature.startswith('_') or not callable(read) or not callable(configure):
+            return None
+        params = list(inspect.signature(configure).parameters)
+        if len(params) < 2:
+            return None
+        read_type = typing.get_type_hints(read).get('return')
+        if read_type is None or typing.get_type_hints(configure).get(params[1]) != read_type:
+            return None
+        return configure
+
+    def features(self, selector: ApiSelector = ApiSelector.person) -> list[str]:
+        """
+        Names of the features which can be reconciled for an entity type
+
+        :param selector: type of the entities
+        :return: feature names
+        """
+        return [feature for feature in self.reader.features(selector) if self._writer(selector, feature)]
+
+    def reconcile(
+        self,
+        entity_ids: Iterable[str],
+        desired: dict[str, DesiredSetting],
+        *,
+        selector: ApiSelector = ApiSelector.person,
+        org_id: str = None,
+        dry_run: bool = False,
+        max_workers: int = None,
+        cancel: Event = None,
+        retries: int = 0,
+        retry_on: RetryOn = Exception,
+    ) -> ReconcileReport:
+        """
+        Read the current settings, compare them with the desired settings, and write the settings which differ
+
+        Reads and writes are executed concurrently with :attr:`api.bulk <wxc_sdk.WebexSimpleApi.bulk>`. The written
+        setting is the current setting updated with the fields set in the desired setting. Entities for which a read
+        failed are not written; the error is reported in :attr:`ReconcileReport.read_errors`.
+
+        :param entity_ids: IDs of people, workspaces, or virtual lines
+        :param desired: desired setting by feature name; see :data:`DesiredSetting`
+        :param selector: type of the entities
+        :param org_id: organization of the entities
+        :param dry_run: only compare; don't write
+        :param max_workers: number of concurrent requests; default: maximum number of concurrent requests of the
+            session
+        :param cancel: event to cancel reads and writes which have not been started yet
+        :param retries: number of times a failed read or write is retried; see :meth:`wxc_sdk.bulk.BulkExecutor.map`
+        :param retry_on: exceptions to retry
+        :return: report
+        """
+        writers = {}
+        for feature in desired:
+            writer = self._writer(selector, feature)
+            if writer is None:
+                raise ValueError(f'Feature "{feature}" cannot be reconciled for {selector}')
+            writers[feature] = writer if org_id is None else partial(writer, org_id=org_id)
+        table = self.reader.read(
+            entity_ids,
+            list(desired),
+            selector=selector,
+            org_id=org_id,
+            max_workers=max_workers,
+            cancel=cancel,
+            retries=retries,
+            retry_on=retry_on,
+        )
+        report = ReconcileReport(dry_run=dry_run, read_errors=table.errors())
+        for feature, column in table.columns.items():
+            desired_setting = desired[feature]
+            for entity_id, current in zip(table.entity_ids, column, strict=True):
+                if isinstance(current, Exception):
+                    continue
+                target = desired_setting(entity_id) if callable(desired_setting) else desired_setting
+                if target is None:
+                    continue
+                report.compared += 1
+                diff = _diff(current, target)
+                if not diff:
+                    report.unchanged += 1
+                    continue
+                report.changes.append(
+                    SettingsChange(entity_id=entity_id, feature=feature, diff=diff, setting=_merge(current, target))
+                )
+        log.debug(
+            f'reconcile: {report.compared} compared, {report.unchanged} unchanged, {len(report.changes)} to write, '
+            f'{len(report.read_errors)} read errors'
+        )
+        if dry_run or not report.changes:
+            return report
+        for result in self.api.bulk.map(
+            lambda change: writers[change.feature](change.entity_id, change.setting),
+            report.changes,
+            ordered=False,
+            max_workers=max_workers,
+            cancel=cancel,
+            retries=retries,
+            retry_on=retry_on,
+        ):
+            change = result.item
+            change.written = result.ok
+            change.exception = result.exception
+            if not result.ok:
+                log.warning(f'reconcile: writing {change.feature} for {change.entity_id} failed: {result.exception}')
+        return report
@@ -0,0 +1,172 @@
+"""
+Single-flight for identical concurrent GET requests used by :class:`wxc_sdk.rest.RestSession` and
+:class:`wxc_sdk.as_rest.AsRestSession`
+"""
+
+import asyncio
+import copy
+from collections.abc import Awaitable, Callable, Hashable
+from threading import Event, Lock
+from typing import Any, Optional
+
+__all__ = ['SingleFlight', 'AsSingleFlight']
+
+
+class _Flight:
+    """
+    Request in flight; callers joining the flight wait for the result of the request
+    """
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.followers = 0
+        self.response: Any = None
+        # copy of the response body for the followers; the leader gets the original
+        self.data: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+class _AsFlight:
+    """
+    Request in flight; callers joining the flight await the task sending the request
+    """
+
+    def __init__(self, task: asyncio.Future[tuple[Any, Any]]):
+        self.task = task
+        self.followers = 0
+        # copy of the response body for the followers; the leader gets the original
+        self.data: Any = None
+
+    def finished(self) -> None:
+        if self.task.cancelled():
+            return
+        if self.task.exception() is None and self.followers:
+            self.data = copy.deepcopy(self.task.result()[1])
+
+
+class _SingleFlightBase:
+    """
+    State and counters of a single-flight group. Joining requests is implemented in the sync and async subclasses
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, Any] = {}
+        #: number of requests that didn't go to the network because they joined an identical request in flight
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        """
+        number of distinct requests in flight
+        """
+        return len(self._flights)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(in_flight={self.in_flight}, shared={self.shared})'
+
+
+class SingleFlight(_SingleFlightBase):
+    """
+    Identical GET requests that are in flight at the same time share a single request.
+
+    The first caller (leader) sends the request; callers with the same key arriving while the request is in flight
+    (followers) wait for the leader's result. Each caller gets its own copy of the response body. If the request fails,
+    then the exception is raised for all callers.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = Lock()
+
+    def forget(self) -> None:
+        """
+        Requests started after this call don't join any request currently in flight. Called after updates.
+        """
+        with self._lock:
+            self._flights.clear()
+
+    def run(self, key: Hashable, func: Callable[[], tuple[Any, Any]]) -> tuple[Any, Any]:
+        """
+        Call func or join an identical call in flight
+
+        :param key: identifies identical requests
+        :param func: sends the request and returns response and parsed body
+        :return: response and parsed body
+        """
+        with self._lock:
+            flight: Optional[_Flight] = self._flights.get(key)
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+                leader = True
+            else:
+                flight.followers += 1
+                self.shared += 1
+                leader = False
+        if not leader:
+            flight.done.wait()
+            if flight.exception is not None:
+                raise flight.exception
+            return flight.response, copy.deepcopy(flight.data)
+        response = data = None
+        try:
+            response, data = func()
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            # no more followers can join; they get a copy of the body as received
+            if flight.followers and flight.exception is None:
+                flight.response = response
+                flight.data = copy.deepcopy(data)
+            flight.done.set()
+        return response, data
+
+
+class AsSingleFlight(_SingleFlightBase):
+    """
+    Identical GET requests that are in flight at the same time share a single request.
+
+    The request is sent in a separate task so that cancellation of one of the callers doesn't affect the other callers.
+    Each caller gets its own copy of the response body. If the request fails, then the exception is raised for all
+    callers.
+    """
+
+    def forget(self) -> None:
+        """
+        Requests started after this call don't join any request currently in flight. Called after updates.
+        """
+        self._flights.clear()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[tuple[Any, Any]]]) -> tuple[Any, Any]:
+        """
+        Await func or join an identical call in flight
+
+        :param key: identifies identical requests
+        :param func: sends the request and returns response and parsed body
+        :return: response and parsed body
+        """
+        flight: Optional[_AsFlight] = self._flights.get(key)
+        if flight is None:
+            flight = _AsFlight(asyncio.ensure_future(func()))
+            self._flights[key] = flight
+
+            def done(_: asyncio.Future[tuple[Any, Any]]) -> None:
+                # runs before any of the callers is resumed
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.finished()
+
+            flight.task.add_done_callback(done)
+            leader = True
+        else:
+            flight.followers += 1
+            self.shared += 1
+            leader = False
+        response, data = await asyncio.shield(flight.task)
+        if leader:
+            return response, data
+        return response, copy.deepcopy(flight.data)
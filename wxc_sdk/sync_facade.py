@@ -0,0 +1,291 @@
+"""
+Synchronous facade over the async API: :class:`SyncWebexSimpleApi` runs an :class:`wxc_sdk.as_api.AsWebexSimpleApi`
+on an event loop in a background thread and exposes the same child APIs as :class:`wxc_sdk.WebexSimpleApi` with
+blocking methods.
+
+Example:
+
+.. code-block:: python
+
+    with SyncWebexSimpleApi(concurrent_requests=40) as api:
+        queues = api.telephony.callqueue.list()
+        # get details for all queues concurrently on the event loop
+        details = api.telephony.callqueue.details.batch(
+            [dict(location_id=queue.location_id, queue_id=queue.id) for queue in queues]
+        )
+"""
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterable
+from threading import Thread, current_thread
+from typing import Any, Optional, Self, TypeVar, Union
+
+from .tokens import Tokens
+
+__all__ = ['SyncWebexSimpleApi']
+
+_T = TypeVar('_T')
+
+
+class _SyncMethod:
+    """
+    Blocking wrapper for a method of the async API: awaitables returned by the method are run on the event loop and
+    async iterators (like the ones returned by the `*_gen()` methods) are returned as sync generators
+    """
+
+    def __init__(self, facade: 'SyncWebexSimpleApi', method: Callable[..., Any]):
+        self._facade = facade
+        self._method = method
+        self.__doc__ = method.__doc__
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        # check before creating a coroutine which would never be awaited
+        self._facade._check_thread()
+        result = self._method(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return self._facade.run(result)
+        if isinstance(result, AsyncIterator):
+            return self._facade.iterate(result)
+        return result
+
+    def _call(self, arguments: Any) -> Any:
+        if isinstance(arguments, dict):
+            return self._method(**arguments)
+        if isinstance(arguments, tuple):
+            return self._method(*arguments)
+        return self._method(arguments)
+
+    def batch(self, calls: Iterable[Any], *, return_exceptions: bool = False, max_workers: int = None) -> list[Any]:
+        """
+        Call the method concurrently on the event loop; once for each element of `calls`
+
+        :param calls: arguments for each call: a dict of keyword arguments, a tuple of positional arguments, or a
+            single positional argument
+        :param return_exceptions: if True, then exceptions are returned in place of the results of failed calls; else
+            the exception of the first failed call is raised after all calls completed
+        :param max_workers: maximum number of concurrent calls; default: maximum number of concurrent requests of the
+            session
+        :return: results in the order of `calls`
+        """
+        return self._facade.batch(self._call, calls, return_exceptions=return_exceptions, max_workers=max_workers)
+
+
+class _SyncProxy:
+    """
+    Proxy for an object of the async API: coroutine methods become blocking methods, async generator methods return
+    sync generators, and child API objects are proxied as well
+    """
+
+    def __init__(self, facade: 'SyncWebexSimpleApi', target: Any):
+        self._facade = facade
+        self._target = target
+        self._wrapped: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._wrapped[name]
+        except KeyError:
+            pass
+        value = self._facade._wrap(getattr(self._target, name))
+        if not name.startswith('_'):
+            self._wrapped[name] = value
+        return value
+
+    def __dir__(self) -> Iterable[str]:
+        return dir(self._target)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._target.__class__.__name__})'
+
+
+class SyncWebexSimpleApi:
+    """
+    Blocking API object with the same child APIs as :class:`wxc_sdk.WebexSimpleApi`; all requests are sent by an
+    :class:`wxc_sdk.as_api.AsWebexSimpleApi` on an event loop in a background thread.
+
+    * methods of the child APIs block until the coroutine completed on the event loop
+    * the `*_gen()` methods return sync generators; the methods without `_gen` suffix return lists
+    * :meth:`batch` and the `batch()` method of each API method run many calls concurrently on the event loop; the
+      number of concurrent requests is bounded by the session's concurrency limit
+
+    With many concurrent requests this avoids one thread per concurrent request.
+
+    Methods can be called from multiple threads but not from the event loop thread.
+    """
+
+    #: async API object; use it to create coroutines for :meth:`run` and :meth:`batch`
+    async_api: Any
+    #: event loop running the async API
+    loop: asyncio.AbstractEventLoop
+
+    def __init__(
+        self,
+        *,
+        tokens: Union[str, Tokens, None] = None,
+        concurrent_requests: int = 10,
+        retry_429: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param tokens: token to be used by the API. Can be a :class:`tokens.Tokens` instance, a string or None. If
+            None then an access token is expected in the WEBEX_ACCESS_TOKEN environment variable.
+        :param concurrent_requests: maximum number of concurrent requests
+        :param retry_429: automatically retry for 429 throttling response
+        :param kwargs: additional arguments to be passed to the constructor of the
+            :class:`wxc_sdk.as_rest.AsRestSession` used for all requests
+        """
+        # late import: as_api is large and only needed if the facade is used
+        from .as_api import AsWebexSimpleApi
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self.loop.run_forever, name='SyncWebexSimpleApi', daemon=True)
+        self._thread.start()
+        self._proxy: Optional[_SyncProxy] = None
+
+        async def create() -> AsWebexSimpleApi:
+            # aiohttp client sessions need to be created in the context of the event loop
+            return AsWebexSimpleApi(
+                tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429, **kwargs
+            )
+
+        try:
+            self.async_api = self.run(create())
+        except BaseException:
+            self._stop_loop()
+            raise
+        self._proxy = _SyncProxy(self, self.async_api)
+
+    def __getattr__(self, name: str) -> Any:
+        # child APIs: api.people, api.telephony, ...
+        proxy = self.__dict__.get('_proxy')
+        if proxy is None or name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(proxy, name)
+
+    def _wrap(self, value: Any) -> Any:
+        """
+        Wrap an attribute value of an async API object
+
+        :meta private:
+        """
+        if inspect.ismethod(value) and type(value.__self__).__module__ == 'wxc_sdk.as_api':
+            return _SyncMethod(self, value)
+        if type(value).__module__ == 'wxc_sdk.as_api':
+            return _SyncProxy(self, value)
+        return value
+
+    def _check_thread(self) -> None:
+        """
+        Blocking calls from the event loop thread would deadlock
+
+        :meta private:
+        """
+        if current_thread() is self._thread:
+            raise RuntimeError('SyncWebexSimpleApi methods cannot be called from the event loop thread')
+
+    def run(self, awaitable: Awaitable[_T]) -> _T:
+        """
+        Run a coroutine on the event loop and wait for the result
+
+        :param awaitable: coroutine; for example `api.run(api.async_api.people.details(person_id=...))`
+        :return: result
+        """
+        try:
+            self._check_thread()
+        except RuntimeError:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+
+        async def wait() -> _T:
+            return await awaitable
+
+        future = asyncio.run_coroutine_threadsafe(wait(), self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            # for example KeyboardInterrupt: don't leave the coroutine running
+            future.cancel()
+            raise
+
+    def iterate(self, aiterator: AsyncIterator[_T]) -> Generator[_T, None, None]:
+        """
+        Iterate over an async iterator on the event loop
+
+        :param aiterator: async iterator; for example `api.async_api.people.list_gen()`
+        :return: yields the items
+        """
+        try:
+            while True:
+                try:
+                    item = self.run(anext(aiterator))
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            aclose = getattr(aiterator, 'aclose', None)
+            if aclose is not None and not self.loop.is_closed():
+                self.run(aclose())
+
+    def batch(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        *,
+        return_exceptions: bool = False,
+        max_workers: int = None,
+    ) -> list[Any]:
+        """
+        Call a coroutine function of the async API for each item concurrently on the event loop
+
+        Example:
+
+        .. code-block:: python
+
+            details = api.batch(lambda user: api.async_api.people.details(person_id=user.person_id,
+                                                                          calling_data=True),
+                                users)
+
+        :param func: called for each item; returns an awaitable
+        :param items: items
+        :param return_exceptions: if True, then exceptions are returned in place of the results of failed calls; else
+            the exception of the first failed call is raised after all calls completed
+        :param max_workers: maximum number of concurrent calls; default: maximum number of concurrent requests of the
+            session
+        :return: results in the order of the items
+        """
+
+        async def run_batch() -> list[Any]:
+            return [
+                result async for result in self.async_api.bulk.map(func, items, ordered=True, max_workers=max_workers)
+            ]
+
+        results = self.run(run_batch())
+        if not return_exceptions:
+            failed = next((result for result in results if not result.ok), None)
+            if failed is not None:
+                raise failed.exception
+        return [result.result if result.ok else result.exception for result in results]
+
+    def _stop_loop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def close(self) -> None:
+        """
+        Close the async API and stop the event loop
+        """
+        if self.loop.is_closed():
+            return
+        try:
+            self.run(self.async_api.close())
+        finally:
+            self._stop_loop()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -3,7 +3,6 @@ Jobs API
 """
 
 import builtins
-import json
 from collections.abc import Generator
 from dataclasses import dataclass
 from datetime import datetime
@@ -229,7 +228,9 @@ class DeviceSettingsJobsApi(ApiChild, base='telephony/config/jobs/devices/callDe
             body['locationId'] = location_id
             body['locationCustomizationsEnabled'] = customization.custom_enabled
         if customization.custom_enabled or not location_id:
-            body['customizations'] = json.loads(customization.customizations.model_dump_json())
+            body['customizations'] = customization.customizations.model_dump(
+                mode='json', by_alias=True, exclude_none=True
+            )
         data = self.post(url=url, params=params, json=body)
         return StartJobResponse.model_validate(data)
 
@@ -2,7 +2,6 @@
 Voice portal API
 """
 
-import json
 from collections.abc import Generator
 from typing import Optional
 
@@ -149,7 +148,9 @@ class VoicePortalApi(ApiChild, base='telephony/config/locations'):
         :param org_id: Organization to which the voice portal belongs.
         :type org_id: str
         """
-        data = json.loads(settings.model_dump_json(exclude={'portal_id': True, 'language': True}))
+        data = settings.model_dump(
+            mode='json', by_alias=True, exclude_none=True, exclude={'portal_id': True, 'language': True}
+        )
         if passcode is not None:
             data['passcode'] = {'newPasscode': passcode, 'confirmPasscode': passcode}
         params = org_id and {'orgId': org_id} or None
@@ -0,0 +1,433 @@
+"""
+Throttling helpers shared by :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Any, Optional
+
+__all__ = ['BackoffGate', 'AsBackoffGate', 'LimitChange', 'AdaptiveConcurrency', 'AsAdaptiveConcurrency']
+
+
+class _BackoffGateBase:
+    """
+    State and counters of a backoff gate. The actual waiting is implemented in the sync and async subclasses
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        # time.monotonic() timestamp at which the gate opens again
+        self._open_at = 0.0
+        self._throttled_responses = 0
+        self._throttled_seconds = 0.0
+        self._waited_seconds = 0.0
+        self._waiting = 0
+
+    @property
+    def is_open(self) -> bool:
+        """
+        True if requests can be sent right now
+        """
+        return self._open_at <= time.monotonic()
+
+    @property
+    def remaining(self) -> float:
+        """
+        seconds until the gate opens again; 0 if the gate is open
+        """
+        return max(0.0, self._open_at - time.monotonic())
+
+    @property
+    def throttled_responses(self) -> int:
+        """
+        number of 429 responses that closed (or extended) the gate
+        """
+        return self._throttled_responses
+
+    @property
+    def throttled_seconds(self) -> float:
+        """
+        total wall-clock time (in seconds) the gate was closed
+        """
+        with self._lock:
+            # don't count the part of the current backoff that is still ahead of us
+            return self._throttled_seconds - max(0.0, self._open_at - time.monotonic())
+
+    @property
+    def waited_seconds(self) -> float:
+        """
+        accumulated time (in seconds) requests spent waiting for the gate to open
+        """
+        return self._waited_seconds
+
+    @property
+    def waiting(self) -> int:
+        """
+        number of requests currently waiting for the gate to open
+        """
+        return self._waiting
+
+    def close_for(self, seconds: float) -> float:
+        """
+        Close the gate after a 429 response. The gate opens again after the given number of seconds. If the gate is
+        already closed for longer, then the existing backoff is kept
+
+        :param seconds: Retry-After value of the 429 response
+        :return: seconds until the gate opens again
+        """
+        with self._lock:
+            now = time.monotonic()
+            open_at = now + seconds
+            self._throttled_responses += 1
+            if open_at > self._open_at:
+                # only account for the part of the backoff not already covered by the current backoff
+                self._throttled_seconds += open_at - max(self._open_at, now)
+                self._open_at = open_at
+            return self._open_at - now
+
+    def _enter_wait(self) -> None:
+        with self._lock:
+            self._waiting += 1
+
+    def _exit_wait(self, waited: float) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self._waited_seconds += waited
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(is_open={self.is_open}, throttled_responses={self.throttled_responses}, '
+            f'throttled_seconds={self.throttled_seconds:.3f}, waited_seconds={self.waited_seconds:.3f})'
+        )
+
+
+class BackoffGate(_BackoffGateBase):
+    """
+    Gate shared by all threads using a :class:`wxc_sdk.rest.RestSession`.
+
+    The first 429 response closes the gate until the time given in the Retry-After header. Until then no new requests
+    are sent on the session. Requests waiting for the gate don't hold a slot of the session's concurrency limit.
+
+    The same instance can be passed to multiple sessions (see `backoff` parameter of
+    :class:`wxc_sdk.rest.RestSession`) to have all sessions back off together if they share the same rate limit, for
+    example because they work on the same org.
+    """
+
+    def wait(self) -> float:
+        """
+        Block until the gate is open
+
+        :return: seconds waited
+        """
+        if self.is_open:
+            return 0.0
+        self._enter_wait()
+        start = time.monotonic()
+        try:
+            # the gate can be closed for longer while we are sleeping -> check again after sleeping
+            while (remaining := self.remaining) > 0:
+                time.sleep(remaining)
+        finally:
+            waited = time.monotonic() - start
+            self._exit_wait(waited)
+        return waited
+
+
+class AsBackoffGate(_BackoffGateBase):
+    """
+    Gate shared by all tasks using a :class:`wxc_sdk.as_rest.AsRestSession`.
+
+    The first 429 response closes the gate until the time given in the Retry-After header. Until then no new requests
+    are sent on the session. Requests waiting for the gate don't hold a slot of the session's concurrency limit.
+    """
+
+    async def wait(self) -> float:
+        """
+        Wait until the gate is open
+
+        :return: seconds waited
+        """
+        if self.is_open:
+            return 0.0
+        self._enter_wait()
+        start = time.monotonic()
+        try:
+            while (remaining := self.remaining) > 0:
+                await asyncio.sleep(remaining)
+        finally:
+            waited = time.monotonic() - start
+            self._exit_wait(waited)
+        return waited
+
+
+@dataclass(frozen=True)
+class LimitChange:
+    """
+    Entry in the history of an adaptive concurrency limiter
+    """
+
+    #: time of the change (time.time())
+    timestamp: float
+    #: new concurrency limit
+    limit: int
+    #: reason for the change: 'initial', 'increase', 'throttled', or 'timeout'
+    reason: str
+
+
+class _AimdBase:
+    """
+    AIMD (additive increase, multiplicative decrease) state of an adaptive concurrency limiter.
+
+    Each successful request with healthy latency grows the limit by `increase` / limit; i.e. the limit grows by
+    `increase` after about one limit's worth of successful requests. The limit only grows while the limiter is
+    actually saturated. Each 429 response or timeout cuts the limit by `decrease_factor`; at most once per `cooldown`
+    seconds so that a burst of 429s for requests which were in flight at the same time only counts once.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+        history_size: int = 1000,
+    ) -> None:
+        """
+
+        :param initial_limit: concurrency limit to start with
+        :param min_limit: the limit never drops below this value
+        :param max_limit: the limit never grows beyond this value
+        :param increase: additive increase of the limit per round of successful requests
+        :param decrease_factor: factor applied to the limit on 429 responses and timeouts
+        :param latency_tolerance: don't increase the limit while the smoothed latency is more than this factor above
+            the lowest smoothed latency seen so far
+        :param cooldown: minimum time (in seconds) between two decreases of the limit
+        :param history_size: number of limit changes kept in :attr:`history`
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('limits have to satisfy 1 <= min_limit <= initial_limit <= max_limit')
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor has to be between 0 and 1')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._history: deque[LimitChange] = deque(maxlen=history_size)
+        self._history.append(LimitChange(timestamp=time.time(), limit=initial_limit, reason='initial'))
+        self._state_lock = Lock()
+
+    @property
+    def limit(self) -> int:
+        """
+        current concurrency limit
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        number of requests currently holding a slot
+        """
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        smoothed latency (in seconds) of successful requests
+        """
+        return self._latency
+
+    @property
+    def history(self) -> list[LimitChange]:
+        """
+        changes of the concurrency limit; oldest first
+        """
+        return list(self._history)
+
+    def _set_limit(self, limit: float, reason: str) -> bool:
+        """
+        Set new limit and record the change in the history
+
+        :return: True if the integer limit changed
+        """
+        limit = min(max(limit, float(self.min_limit)), float(self.max_limit))
+        changed = int(limit) != int(self._limit)
+        self._limit = limit
+        if changed:
+            self._history.append(LimitChange(timestamp=time.time(), limit=int(limit), reason=reason))
+        return changed
+
+    def _record_success(self, latency: float) -> bool:
+        """
+        Account for a successful request
+
+        :param latency: duration of the request in seconds
+        :return: True if the limit grew
+        """
+        with self._state_lock:
+            # exponentially weighted moving average of the latency and lowest average seen so far
+            self._latency = latency if self._latency is None else 0.9 * self._latency + 0.1 * latency
+            if self._baseline is None or self._latency < self._baseline:
+                self._baseline = self._latency
+            if self._latency > self._baseline * self.latency_tolerance:
+                # latency is getting worse -> don't push harder
+                return False
+            if self._in_flight < int(self._limit):
+                # we are not using the current limit -> no point in increasing it
+                return False
+            return self._set_limit(self._limit + self.increase / self._limit, reason='increase')
+
+    def _record_congestion(self, reason: str) -> bool:
+        """
+        Account for a 429 response or a timeout
+
+        :param reason: 'throttled' or 'timeout'
+        :return: True if the limit was decreased
+        """
+        with self._state_lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return False
+            self._last_decrease = now
+            return self._set_limit(self._limit * self.decrease_factor, reason=reason)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(limit={self.limit}, in_flight={self.in_flight}, latency={self.latency})'
+
+
+class AdaptiveConcurrency(_AimdBase):
+    """
+    Adaptive concurrency limiter for :class:`wxc_sdk.rest.RestSession`.
+
+    Used instead of a fixed size semaphore if the session is created with `adaptive_concurrency`. The limit grows
+    while the latency is healthy and no 429 responses are received and is cut sharply on 429 responses and timeouts.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._cond = Condition()
+
+    def acquire(self) -> None:
+        """
+        Wait for a free slot
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """
+        Release a slot
+        """
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    def record_success(self, latency: float) -> None:
+        """
+        Account for a successful request
+
+        :param latency: duration of the request in seconds
+        """
+        if self._record_success(latency):
+            with self._cond:
+                self._cond.notify_all()
+
+    def record_congestion(self, reason: str) -> None:
+        """
+        Account for a 429 response or a timeout
+
+        :param reason: 'throttled' or 'timeout'
+        """
+        self._record_congestion(reason)
+
+
+class AsAdaptiveConcurrency(_AimdBase):
+    """
+    Adaptive concurrency limiter for :class:`wxc_sdk.as_rest.AsRestSession`.
+
+    Used instead of a fixed size semaphore if the session is created with `adaptive_concurrency`. The limit grows
+    while the latency is healthy and no 429 responses are received and is cut sharply on 429 responses and timeouts.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot
+        """
+        while self._in_flight >= int(self._limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # pass on the wakeup we might have gotten
+                self._wake_up()
+                raise
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """
+        Release a slot
+        """
+        self._in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """
+        Wake up as many waiters as there are free slots
+        """
+        free = int(self._limit) - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.release()
+
+    def record_success(self, latency: float) -> None:
+        """
+        Account for a successful request
+
+        :param latency: duration of the request in seconds
+        """
+        if self._record_success(latency):
+            self._wake_up()
+
+    def record_congestion(self, reason: str) -> None:
+        """
+        Account for a 429 response or a timeout
+
+        :param reason: 'throttled' or 'timeout'
+        """
+        self._record_congestion(reason)
@@ -498,6 +498,34 @@ class WorkspacesApi(ApiChild, base='workspaces'):
         result = self.post(url, json=data)
         return Workspace.model_validate(result)
 
+    def by_name(self, name: str, org_id: str = None) -> Optional[Workspace]:
+        """
+        Get a workspace by display name
+
+        Uses the session's :class:`wxc_sdk.directory.EntityDirectory`, if any
+
+        :param name: display name of the workspace
+        :type name: str
+        :param org_id: search in this organization
+        :type org_id: str
+        :return: workspace or None if no workspace with this name exists
+        :rtype: Workspace
+        """
+        directory = self.session.directory
+        epoch = None
+        if directory is not None:
+            found, workspace = directory.get('workspaces', 'name', name, org_id=org_id)
+            if found and (workspace is None or isinstance(workspace, Workspace)):
+                return workspace
+            epoch = directory.epoch
+        workspace = next(
+            (workspace for workspace in self.list(display_name=name, org_id=org_id) if workspace.display_name == name),
+            None,
+        )
+        if directory is not None:
+            directory.put('workspaces', 'name', name, workspace, org_id=org_id, epoch=epoch)
+        return workspace
+
     def details(self, workspace_id: str, include_devices: bool = None) -> Workspace:
         """
         Get Workspace Details
@@ -505,6 +533,8 @@ class WorkspacesApi(ApiChild, base='workspaces'):
         Shows details for a workspace, by ID. The `locationId`, `workspaceLocationId`, `floorId`, `indoorNavigation`,
         `capacity`, `type` and `notes` fields will only be present if they have been set for the workspace.
 
+        Without `include_devices` the session's :class:`wxc_sdk.directory.EntityDirectory`, if any, is used
+
         :param workspace_id: A unique identifier for the workspace.
         :type workspace_id: str
         :param include_devices: Flag identifying whether to include the devices associated with the workspace in the
@@ -513,11 +543,22 @@ class WorkspacesApi(ApiChild, base='workspaces'):
         :return: workspace details
         :rtype: :class:`Workspace`
         """
+        # entities in the directory don't have devices
+        directory = None if include_devices is not None else self.session.directory
+        epoch = None
+        if directory is not None:
+            found, workspace = directory.get('workspaces', 'id', workspace_id)
+            if found and isinstance(workspace, Workspace):
+                return workspace
+            epoch = directory.epoch
         params = {}
         if include_devices is not None:
             params['includeDevices'] = str(include_devices).lower()
         url = self.ep(workspace_id)
-        return Workspace.model_validate(self.get(url, params=params))
+        workspace = Workspace.model_validate(self.get(url, params=params))
+        if directory is not None:
+            directory.put('workspaces', 'id', workspace_id, workspace, epoch=epoch)
+        return workspace
 
     def update(self, workspace_id: str, settings: Workspace) -> Workspace:
         """